@@ -0,0 +1,85 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\Console\Commands\ControlChannel;
+
+use App\Exceptions\ControlChannelTransportException;
+use App\Services\ControlChannelTransport;
+use Illuminate\Console\Command;
+use Illuminate\Support\Facades\Log;
+use Symfony\Component\Console\Command\SignalableCommandInterface;
+
+class WatchCommand extends Command implements SignalableCommandInterface
+{
+    protected $signature = 'control-channel:watch {--json : Vypisuje události jako NDJSON} {--reconnect-delay=2 : Prodleva před novým připojením (s)}';
+
+    protected $description = 'Vypisuje změny stavu control channel workeru (diagnostika); aplikace čte stav ze sdílené paměti.';
+
+    private bool $shouldExit = false;
+
+    public function handle(ControlChannelTransport $transport): int
+    {
+        $delay = max(1, (int) $this->option('reconnect-delay'));
+
+        while (!$this->shouldExit) {
+            try {
+                $ack = $transport->subscribe(
+                    fn (array $event): bool => $this->handleEvent($event),
+                    null,
+                    fn (): bool => $this->exitRequested(),
+                );
+                Log::debug('Control channel subscription ended', ['subscription' => $ack['details']['subscription'] ?? null]);
+            } catch (ControlChannelTransportException $exception) {
+                if ($this->shouldExit) {
+                    break;
+                }
+                $this->warn('Odběr control channelu selhal: ' . $exception->getMessage());
+                sleep($delay);
+            }
+        }
+
+        return self::SUCCESS;
+    }
+
+    public function getSubscribedSignals(): array
+    {
+        return [SIGINT, SIGTERM];
+    }
+
+    public function handleSignal(int $signal, int|false $previousExitCode = 0): int|false
+    {
+        $this->shouldExit = true;
+        return 0;
+    }
+
+    private function exitRequested(): bool
+    {
+        if (function_exists('pcntl_signal_dispatch')) {
+            pcntl_signal_dispatch();
+        }
+
+        return $this->shouldExit;
+    }
+
+    /**
+     * @param array<string, mixed> $event
+     */
+    private function handleEvent(array $event): bool
+    {
+        if ($this->option('json')) {
+            $this->line(json_encode($event, JSON_UNESCAPED_UNICODE));
+        } else {
+            $this->line(sprintf(
+                '[%s] #%d %s status=%s error=%s',
+                $event['ts'] ?? '-',
+                (int) ($event['seq'] ?? 0),
+                $event['state'] ?? 'UNKNOWN',
+                isset($event['statusRegister']) ? sprintf('0x%04X', (int) $event['statusRegister']) : '-',
+                isset($event['errorRegister']) ? sprintf('0x%04X', (int) $event['errorRegister']) : '-',
+            ));
+        }
+
+        return !$this->shouldExit;
+    }
+}
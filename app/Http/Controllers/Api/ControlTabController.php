@@ -81,6 +81,8 @@ public function handle(Request $request): JsonResponse
             }
         }
 
+        $response += $this->cacheDirectives($handledAs, $status);
+
         $this->recordTelemetry($event, $result + ['response' => $response]);
 
         Log::channel('control_tab')->info('Control Tab response prepared', [
@@ -144,6 +146,26 @@ private function handleButton(ControlTabEvent $event): array
         ];
     }
 
+    /**
+     * Tell the listener's response cache how long this answer may be reused and
+     * which cached answers a state-changing event made stale.
+     *
+     * @return array<string, mixed>
+     */
+    private function cacheDirectives(string $handledAs, string $status): array
+    {
+        if ($status !== 'ok') {
+            return ['cache' => ['ttl' => 0]];
+        }
+
+        return match ($handledAs) {
+            'panel_loaded' => ['cache' => ['ttl' => (float) config('control_tab.response_cache.panel_loaded_ttl', 300)]],
+            'text_field_request' => ['cache' => ['ttl' => (float) config('control_tab.response_cache.text_field_ttl', 10)]],
+            'button' => ['cache' => ['ttl' => 0], 'invalidate' => ['eventType' => 3]],
+            default => ['cache' => ['ttl' => 0]],
+        };
+    }
+
     private function recordTelemetry(ControlTabEvent $event, array $result): void
     {
         $payload = [
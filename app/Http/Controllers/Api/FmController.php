@@ -9,6 +9,7 @@
 use Illuminate\Http\JsonResponse;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\Validator;
+use RuntimeException;
 
 class FmController extends Controller
 {
@@ -38,4 +39,25 @@ public function update(Request $request): JsonResponse
             'requested_frequency_mhz' => $frequencyMHz,
         ]);
     }
+
+    public function stations(): JsonResponse
+    {
+        $result = $this->service->getStations();
+        if ($result === null) {
+            return response()->json(['message' => 'No FM station map yet; POST /api/fm/stations scans the band.'], 404);
+        }
+
+        return response()->json($result);
+    }
+
+    public function refreshStations(): JsonResponse
+    {
+        try {
+            $result = $this->service->refreshStations();
+        } catch (RuntimeException $exception) {
+            return response()->json(['message' => $exception->getMessage()], 503);
+        }
+
+        return response()->json($result);
+    }
 }
@@ -502,6 +502,27 @@ public function writeOggBitrate(int $value, ?int $unitId = null): array
         return $this->writeRegisterByName(ModbusRegister::OGG_BITRATE, $value, $unitId);
     }
 
+    /**
+     * -----------------------------------------------------------------
+     * FM tuner helpers
+     * -----------------------------------------------------------------
+     */
+    public function scanFmStations(
+        string $cachePath,
+        int $bus = 1,
+        string $address = '0x60',
+        ?float $timeout = null,
+        string $script = 'tools/tea5767.py',
+    ): array {
+        $arguments = array_merge(
+            $this->buildOptionArgumentList(['bus' => $bus, 'address' => $address]),
+            ['scan'],
+            $this->buildOptionArgumentList(['cache' => $cachePath, 'json' => true]),
+        );
+
+        return $this->call($script, $arguments, $timeout);
+    }
+
     /**
      * -----------------------------------------------------------------
      * JSVV helpers
@@ -592,6 +613,62 @@ public function listenJsvv(array $options = [], ?float $timeout = null): array
         return $this->runJsvv('listen', $options, $timeout);
     }
 
+    /**
+     * Run `listen --stream` and hand every captured frame to $onFrame as soon as it arrives.
+     * The callback may return false to stop listening early.
+     */
+    public function streamJsvvListen(callable $onFrame, array $options = [], ?float $timeout = null): array
+    {
+        $options['stream'] = true;
+        $arguments = $this->buildCommandArguments('listen', $options);
+        $scriptPath = $this->resolveScriptPath($this->jsvvScript);
+        $command = array_merge([$this->pythonBinary, $scriptPath], $arguments);
+
+        Log::info('Streaming python client command', [
+            'script' => $this->jsvvScript,
+            'arguments' => $arguments,
+            'timeout' => $timeout,
+        ]);
+
+        $process = new Process($command, $this->scriptsRoot, $this->buildProcessEnvironment(), null, $timeout);
+        $process->start();
+
+        $buffer = '';
+        $summary = null;
+        $frames = 0;
+        $stopped = false;
+        foreach ($process->getIterator(Process::ITER_SKIP_ERR) as $chunk) {
+            $buffer .= $chunk;
+            while (($newline = strpos($buffer, "\n")) !== false) {
+                $line = trim(substr($buffer, 0, $newline));
+                $buffer = substr($buffer, $newline + 1);
+                $decoded = $line === '' ? null : $this->decodeJson($line);
+                if ($decoded === null) {
+                    continue;
+                }
+                if (($decoded['event'] ?? null) !== 'frame') {
+                    $summary = $decoded;
+                    continue;
+                }
+                $frames++;
+                if ($onFrame($decoded['data'] ?? []) === false) {
+                    $stopped = true;
+                    $process->stop(1);
+                    break 2;
+                }
+            }
+        }
+        $process->wait();
+
+        return [
+            'success' => $stopped || $process->isSuccessful(),
+            'exitCode' => $process->getExitCode(),
+            'frames' => $frames,
+            'stderr' => $this->normalizeOutput($process->getErrorOutput()),
+            'json' => $summary ?? $this->decodeJson($buffer),
+        ];
+    }
+
     public function planJsvvSequence(array $sequence, array $options = [], ?float $timeout = null): array
     {
         try {
@@ -45,6 +45,7 @@ public function register(): void
                 (int) ($channelConfig['retry_attempts'] ?? 3),
                 (int) ($channelConfig['handshake_timeout_ms'] ?? 150),
                 $processManager,
+                filter_var($channelConfig['persistent'] ?? true, FILTER_VALIDATE_BOOLEAN),
             );
         });
 
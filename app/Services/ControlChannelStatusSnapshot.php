@@ -0,0 +1,127 @@
+<?php
+
+declare(strict_types=1);
+
+namespace App\Services;
+
+/**
+ * Reader for the shared-memory status snapshot published by
+ * python-client/daemons/control_channel_worker.py (layout in _status_shm.py).
+ *
+ * Reads never touch the control channel socket; a seqlock sequence number lets
+ * us detect and retry copies that raced with the writer.
+ */
+class ControlChannelStatusSnapshot
+{
+    private const SIZE = 256;
+    private const HEADER_SIZE = 42;
+    private const SEQUENCE_OFFSET = 8;
+    private const MAGIC = 'RZCS';
+    private const LAYOUT_VERSION = 1;
+    private const MAX_ATTEMPTS = 100;
+
+    private const STATES = [
+        0 => ControlChannelService::STATE_IDLE,
+        1 => ControlChannelService::STATE_TRANSMITTING,
+        2 => ControlChannelService::STATE_PAUSED,
+        3 => ControlChannelService::STATE_STOPPED,
+    ];
+
+    private const FLAG_DRY_RUN = 0x01;
+    private const FLAG_STATUS_VALID = 0x02;
+    private const FLAG_ERROR_VALID = 0x04;
+    private const FLAG_HAS_LAST_ERROR = 0x08;
+
+    private string $path;
+
+    public function __construct(?string $path = null)
+    {
+        $this->path = $path ?? self::defaultPath();
+    }
+
+    public static function defaultPath(): string
+    {
+        $configured = config('control_channel.status_file');
+        if (is_string($configured) && $configured !== '') {
+            return $configured;
+        }
+
+        $endpoint = (string) config('control_channel.endpoint', 'unix:///var/run/jsvv-control.sock');
+        $socket = str_starts_with($endpoint, 'unix://') ? substr($endpoint, strlen('unix://')) : $endpoint;
+        if ($socket !== '' && $socket[0] !== DIRECTORY_SEPARATOR) {
+            $socket = base_path($socket);
+        }
+
+        return preg_replace('/\.[^.\/]*$/', '', $socket) . '.status';
+    }
+
+    /**
+     * @return array<string, mixed>|null
+     */
+    public function read(): ?array
+    {
+        $handle = @fopen($this->path, 'rb');
+        if ($handle === false) {
+            return null;
+        }
+
+        try {
+            for ($attempt = 0; $attempt < self::MAX_ATTEMPTS; $attempt++) {
+                rewind($handle);
+                $raw = fread($handle, self::SIZE);
+                if ($raw === false || strlen($raw) < self::SIZE) {
+                    return null;
+                }
+
+                $before = unpack('V', $raw, self::SEQUENCE_OFFSET)[1];
+                if (($before & 1) === 1) {
+                    continue;
+                }
+
+                fseek($handle, self::SEQUENCE_OFFSET);
+                $after = fread($handle, 4);
+                if ($after === false || strlen($after) !== 4 || unpack('V', $after)[1] !== $before) {
+                    continue;
+                }
+
+                return $this->decode($raw);
+            }
+        } finally {
+            fclose($handle);
+        }
+
+        return null;
+    }
+
+    /**
+     * @return array<string, mixed>|null
+     */
+    private function decode(string $raw): ?array
+    {
+        $header = unpack(
+            'a4magic/vversion/vreserved/Vsequence/Cstate/Cflags/vreserved2/elastPoll/eupdatedAt/vstatus/verror/Vpid/verrorLength',
+            $raw
+        );
+        if ($header === false || $header['magic'] !== self::MAGIC || $header['version'] !== self::LAYOUT_VERSION) {
+            return null;
+        }
+
+        $flags = $header['flags'];
+        $lastError = null;
+        if (($flags & self::FLAG_HAS_LAST_ERROR) !== 0) {
+            $lastError = substr($raw, self::HEADER_SIZE, $header['errorLength']);
+        }
+
+        return [
+            'sequence' => $header['sequence'],
+            'state' => self::STATES[$header['state']] ?? 'UNKNOWN',
+            'dryRun' => ($flags & self::FLAG_DRY_RUN) !== 0,
+            'lastPollAt' => $header['lastPoll'] > 0 ? $header['lastPoll'] : null,
+            'updatedAt' => $header['updatedAt'],
+            'statusRegister' => ($flags & self::FLAG_STATUS_VALID) !== 0 ? $header['status'] : null,
+            'errorRegister' => ($flags & self::FLAG_ERROR_VALID) !== 0 ? $header['error'] : null,
+            'lastError' => $lastError,
+            'pid' => $header['pid'],
+        ];
+    }
+}
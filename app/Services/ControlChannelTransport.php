@@ -13,15 +13,28 @@
 
 class ControlChannelTransport
 {
+    private const PROTOCOL_VERSION = 2;
+
+    /** @var resource|null */
+    private $connection = null;
+    private bool $protocolUnsupported = false;
+    private int $sequence = 0;
+
     public function __construct(
         private readonly string $endpoint,
         private readonly int $timeoutMs,
         private readonly int $retryAttempts,
         private readonly int $handshakeTimeoutMs,
         private readonly ?ControlChannelProcessManager $processManager = null,
+        private readonly bool $persistent = true,
     ) {
     }
 
+    public function __destruct()
+    {
+        $this->disconnect();
+    }
+
     /**
      * @param array<string, mixed> $payload
      * @return array<string, mixed>
@@ -65,8 +78,349 @@ public function send(array $payload): array
      */
     private function performSend(array $payload): array
     {
+        if ($this->persistent && !$this->protocolUnsupported) {
+            $responses = $this->performPipelined([$payload]);
+            return $responses[0];
+        }
+
         $start = microtime(true);
         [$timeoutSeconds, $timeoutMicros] = $this->timeoutParts();
+        $resource = $this->connect();
+
+        stream_set_timeout($resource, $timeoutSeconds, $timeoutMicros);
+
+        $encoded = $this->encodeJson($payload) . "\n";
+        $written = fwrite($resource, $encoded);
+
+        if ($written === false || $written < strlen($encoded)) {
+            fclose($resource);
+            throw new ControlChannelTransportException('Failed to write control channel request payload');
+        }
+
+        $response = fgets($resource);
+        $meta = stream_get_meta_data($resource);
+        fclose($resource);
+
+        if ($response === false) {
+            if (Arr::get($meta, 'timed_out') === true) {
+                throw new ControlChannelTimeoutException('Control channel timed out while waiting for response');
+            }
+
+            throw new ControlChannelTransportException('Failed to read control channel response');
+        }
+
+        $decoded = $this->decodeResponse($response);
+
+        $durationMs = (int) round((microtime(true) - $start) * 1000);
+        Log::debug('Control channel response received', [
+            'endpoint' => $this->endpoint,
+            'duration_ms' => $durationMs,
+            'response' => $decoded,
+        ]);
+
+        return $decoded;
+    }
+
+    /**
+     * Send several requests over one persistent connection without waiting for
+     * each answer; responses are matched back by id and returned in input order.
+     *
+     * @param array<int, array<string, mixed>> $payloads
+     * @return array<int, array<string, mixed>>
+     *
+     * @throws ControlChannelTimeoutException
+     * @throws ControlChannelTransportException
+     */
+    public function sendMany(array $payloads): array
+    {
+        $payloads = array_values($payloads);
+        if ($payloads === []) {
+            return [];
+        }
+
+        if (!$this->persistent || $this->protocolUnsupported) {
+            return array_map(fn (array $payload): array => $this->send($payload), $payloads);
+        }
+
+        $attempts = max(1, $this->retryAttempts);
+        for ($attempt = 1; ; $attempt++) {
+            try {
+                return $this->performPipelined($payloads);
+            } catch (ControlChannelTimeoutException|ControlChannelTransportException $exception) {
+                Log::warning('Control channel pipelined send failed', [
+                    'attempt' => $attempt,
+                    'endpoint' => $this->endpoint,
+                    'error' => $exception->getMessage(),
+                ]);
+
+                if ($attempt >= $attempts) {
+                    throw $exception;
+                }
+
+                usleep($this->computeBackoffMicroseconds($attempt));
+            }
+        }
+    }
+
+    /**
+     * Stream `status_changed` events pushed by the worker until the callback
+     * returns false, `$shouldStop` returns true or the optional deadline
+     * passes. `$shouldStop` is checked after every read, including reads that
+     * time out without traffic. Uses its own connection so the shared request
+     * connection stays free.
+     *
+     * @param callable(array<string, mixed>): (bool|void) $onEvent
+     * @param (callable(): bool)|null $shouldStop
+     * @return array<string, mixed> Subscribe acknowledgement (includes the current state)
+     *
+     * @throws ControlChannelTimeoutException
+     * @throws ControlChannelTransportException
+     */
+    public function subscribe(callable $onEvent, ?float $timeout = null, ?callable $shouldStop = null): array
+    {
+        $resource = $this->connect();
+        $deadline = $timeout !== null ? microtime(true) + $timeout : null;
+
+        try {
+            [$timeoutSeconds, $timeoutMicros] = $this->timeoutParts();
+            stream_set_timeout($resource, $timeoutSeconds, $timeoutMicros);
+            $request = $this->encodeJson(['id' => sprintf('%d-%d', getmypid(), ++$this->sequence), 'command' => 'subscribe']) . "\n";
+            if (!$this->writeAll($resource, $request)) {
+                throw new ControlChannelTransportException('Failed to write control channel subscribe request');
+            }
+
+            $line = fgets($resource);
+            if ($line === false) {
+                throw new ControlChannelTransportException('Control channel closed before acknowledging subscribe');
+            }
+            $ack = $this->decodeResponse($line);
+            if (($ack['ok'] ?? false) !== true) {
+                throw new ControlChannelTransportException('Control channel rejected subscribe request');
+            }
+
+            while ($deadline === null || microtime(true) < $deadline) {
+                if ($shouldStop !== null && $shouldStop()) {
+                    break;
+                }
+
+                $line = fgets($resource);
+                if ($line === false) {
+                    $meta = stream_get_meta_data($resource);
+                    if (Arr::get($meta, 'timed_out') === true) {
+                        continue;
+                    }
+
+                    throw new ControlChannelTransportException('Control channel subscription closed');
+                }
+
+                $event = $this->decodeResponse($line);
+                if (($event['event'] ?? null) !== 'status_changed') {
+                    continue;
+                }
+                if ($onEvent($event) === false) {
+                    break;
+                }
+            }
+
+            return $ack;
+        } finally {
+            fclose($resource);
+        }
+    }
+
+    /**
+     * @param array<int, array<string, mixed>> $payloads
+     * @return array<int, array<string, mixed>>
+     *
+     * @throws ControlChannelTimeoutException
+     * @throws ControlChannelTransportException
+     */
+    private function performPipelined(array $payloads): array
+    {
+        $reused = $this->connection !== null;
+
+        try {
+            $resource = $this->persistentConnection();
+            if ($resource === null) {
+                return array_map(fn (array $payload): array => $this->performSend($payload), $payloads);
+            }
+
+            return $this->exchange($resource, $payloads);
+        } catch (ControlChannelTimeoutException $exception) {
+            $this->disconnect();
+            throw $exception;
+        } catch (ControlChannelTransportException $exception) {
+            $this->disconnect();
+            if (!$reused) {
+                throw $exception;
+            }
+
+            // The worker may have closed an idle connection; retry once on a fresh one.
+            $resource = $this->persistentConnection();
+            if ($resource === null) {
+                return array_map(fn (array $payload): array => $this->performSend($payload), $payloads);
+            }
+
+            return $this->exchange($resource, $payloads);
+        }
+    }
+
+    /**
+     * @param resource $resource
+     * @param array<int, array<string, mixed>> $payloads
+     * @return array<int, array<string, mixed>>
+     *
+     * @throws ControlChannelTimeoutException
+     * @throws ControlChannelTransportException
+     */
+    private function exchange($resource, array $payloads): array
+    {
+        $start = microtime(true);
+        [$timeoutSeconds, $timeoutMicros] = $this->timeoutParts();
+        stream_set_timeout($resource, $timeoutSeconds, $timeoutMicros);
+
+        $indexById = [];
+        $buffer = '';
+        foreach ($payloads as $index => $payload) {
+            $id = isset($payload['id']) ? (string) $payload['id'] : sprintf('%d-%d', getmypid(), ++$this->sequence);
+            $payload['id'] = $id;
+            $indexById[$id] = $index;
+            $buffer .= $this->encodeJson($payload) . "\n";
+        }
+
+        if (!$this->writeAll($resource, $buffer)) {
+            throw new ControlChannelTransportException('Failed to write control channel request payload');
+        }
+
+        $responses = [];
+        while (count($responses) < count($payloads)) {
+            $line = fgets($resource);
+            if ($line === false) {
+                $meta = stream_get_meta_data($resource);
+                if (Arr::get($meta, 'timed_out') === true) {
+                    throw new ControlChannelTimeoutException('Control channel timed out while waiting for response');
+                }
+
+                throw new ControlChannelTransportException('Failed to read control channel response');
+            }
+
+            $decoded = $this->decodeResponse($line);
+            $id = isset($decoded['id']) ? (string) $decoded['id'] : null;
+            if ($id === null || !array_key_exists($id, $indexById)) {
+                Log::debug('Ignoring unmatched control channel response', ['response' => $decoded]);
+                continue;
+            }
+
+            $responses[$indexById[$id]] = $decoded;
+        }
+        ksort($responses);
+
+        Log::debug('Control channel responses received', [
+            'endpoint' => $this->endpoint,
+            'duration_ms' => (int) round((microtime(true) - $start) * 1000),
+            'requests' => count($payloads),
+        ]);
+
+        return $responses;
+    }
+
+    /**
+     * Return the negotiated persistent connection, or null when the worker only
+     * speaks the one-shot protocol.
+     *
+     * @return resource|null
+     *
+     * @throws ControlChannelTimeoutException
+     * @throws ControlChannelTransportException
+     */
+    private function persistentConnection()
+    {
+        if ($this->connection !== null) {
+            return $this->connection;
+        }
+
+        $resource = $this->connect();
+        [$timeoutSeconds, $timeoutMicros] = $this->timeoutParts();
+        stream_set_timeout($resource, $timeoutSeconds, $timeoutMicros);
+
+        $hello = $this->encodeJson([
+            'id' => 'hello',
+            'command' => 'hello',
+            'protocol' => self::PROTOCOL_VERSION,
+        ]) . "\n";
+        if (!$this->writeAll($resource, $hello)) {
+            fclose($resource);
+            throw new ControlChannelTransportException('Failed to write control channel hello request');
+        }
+
+        $line = fgets($resource);
+        if ($line === false) {
+            // No answer says nothing about the protocol; only a reply may downgrade it.
+            $timedOut = Arr::get(stream_get_meta_data($resource), 'timed_out') === true;
+            fclose($resource);
+            if ($timedOut) {
+                throw new ControlChannelTimeoutException('Control channel timed out while negotiating protocol');
+            }
+
+            throw new ControlChannelTransportException('Control channel closed while negotiating protocol');
+        }
+
+        $response = json_decode($line, true);
+        if (!is_array($response) || ($response['ok'] ?? false) !== true
+            || (int) Arr::get($response, 'details.protocol', 1) < self::PROTOCOL_VERSION) {
+            fclose($resource);
+            $this->protocolUnsupported = true;
+            Log::info('Control channel worker does not support persistent connections; using one-shot requests', [
+                'endpoint' => $this->endpoint,
+            ]);
+
+            return null;
+        }
+
+        $this->connection = $resource;
+
+        return $resource;
+    }
+
+    /**
+     * Write the whole buffer. A peer that already closed the socket makes
+     * fwrite() raise a notice, which the framework would turn into an
+     * exception; it is suppressed so callers can reconnect instead.
+     *
+     * @param resource $resource
+     */
+    private function writeAll($resource, string $buffer): bool
+    {
+        $length = strlen($buffer);
+        $offset = 0;
+        while ($offset < $length) {
+            $written = @fwrite($resource, substr($buffer, $offset));
+            if ($written === false || $written === 0) {
+                return false;
+            }
+            $offset += $written;
+        }
+
+        return true;
+    }
+
+    private function disconnect(): void
+    {
+        if (is_resource($this->connection)) {
+            fclose($this->connection);
+        }
+        $this->connection = null;
+    }
+
+    /**
+     * @return resource
+     *
+     * @throws ControlChannelTimeoutException
+     * @throws ControlChannelTransportException
+     */
+    private function connect()
+    {
+        [$timeoutSeconds] = $this->timeoutParts();
         $attemptedAutoStart = false;
 
         connect:
@@ -94,42 +448,32 @@ private function performSend(array $payload): array
             ));
         }
 
-        $this->expectHandshake($resource);
-
-        stream_set_timeout($resource, $timeoutSeconds, $timeoutMicros);
-
-        $encoded = $this->encodeJson($payload) . "\n";
-        $written = fwrite($resource, $encoded);
-
-        if ($written === false || $written < strlen($encoded)) {
+        try {
+            $this->expectHandshake($resource);
+        } catch (ControlChannelTimeoutException|ControlChannelTransportException $exception) {
             fclose($resource);
-            throw new ControlChannelTransportException('Failed to write control channel request payload');
+            throw $exception;
         }
 
-        $response = fgets($resource);
-        $meta = stream_get_meta_data($resource);
-        fclose($resource);
-
-        if ($response === false) {
-            if (Arr::get($meta, 'timed_out') === true) {
-                throw new ControlChannelTimeoutException('Control channel timed out while waiting for response');
-            }
-
-            throw new ControlChannelTransportException('Failed to read control channel response');
-        }
+        return $resource;
+    }
 
+    /**
+     * @return array<string, mixed>
+     *
+     * @throws ControlChannelTransportException
+     */
+    private function decodeResponse(string $response): array
+    {
         try {
             $decoded = json_decode($response, true, 512, JSON_THROW_ON_ERROR);
         } catch (JsonException $exception) {
             throw new ControlChannelTransportException('Control channel returned invalid JSON response', 0, $exception);
         }
 
-        $durationMs = (int) round((microtime(true) - $start) * 1000);
-        Log::debug('Control channel response received', [
-            'endpoint' => $this->endpoint,
-            'duration_ms' => $durationMs,
-            'response' => $decoded,
-        ]);
+        if (!is_array($decoded)) {
+            throw new ControlChannelTransportException('Control channel returned invalid JSON response');
+        }
 
         return $decoded;
     }
@@ -5,6 +5,8 @@
 namespace App\Services;
 
 use App\Libraries\PythonClient;
+use Illuminate\Support\Arr;
+use RuntimeException;
 
 class FmRadioService extends Service
 {
@@ -34,4 +36,63 @@ public function setFrequency(float $frequency, ?int $unitId = null): array
             'python' => $response,
         ];
     }
+
+    /**
+     * Ranked station map from the last band scan, or null when the band was never scanned.
+     */
+    public function getStations(): ?array
+    {
+        $cached = $this->readStationMap($this->stationsCachePath());
+
+        return $cached !== null ? $cached + ['cached' => true] : null;
+    }
+
+    /**
+     * Scan the band and store a new station map. The scan retunes the tuner
+     * while it runs and restores the previous frequency afterwards.
+     */
+    public function refreshStations(): array
+    {
+        $config = config('audio.fm_tuner', []);
+        $response = $this->client->scanFmStations(
+            $this->stationsCachePath(),
+            (int) Arr::get($config, 'bus', 1),
+            (string) Arr::get($config, 'address', '0x60'),
+            (float) Arr::get($config, 'scan_timeout', 30),
+            (string) Arr::get($config, 'script', 'tools/tea5767.py'),
+        );
+
+        if (!($response['success'] ?? false)) {
+            $error = trim(implode("\n", $response['stderr'] ?? []));
+            throw new RuntimeException($error !== '' ? $error : 'FM band scan failed.');
+        }
+
+        $decoded = $response['json'] ?? null;
+        if (!is_array($decoded)) {
+            throw new RuntimeException('FM band scan returned invalid output.');
+        }
+
+        return $decoded + ['cached' => false];
+    }
+
+    private function stationsCachePath(): string
+    {
+        $cachePath = (string) config('audio.fm_tuner.stations_cache', '');
+
+        return $cachePath !== '' ? $cachePath : storage_path('app/fm-stations.json');
+    }
+
+    private function readStationMap(string $path): ?array
+    {
+        if (!is_file($path)) {
+            return null;
+        }
+
+        $decoded = json_decode((string) file_get_contents($path), true);
+        if (!is_array($decoded) || !isset($decoded['stations']) || !is_array($decoded['stations'])) {
+            return null;
+        }
+
+        return $decoded;
+    }
 }
@@ -104,6 +104,8 @@ public function overview(): array
         $broadcastDetails = $orchestrator->getStatusDetails();
         $currentSession = $this->resolveCurrentSession($broadcastDetails['session'] ?? null);
 
+        $controlChannel = (new ControlChannelStatusSnapshot())->read();
+
         $diagnosticsService = new DeviceDiagnosticsService();
         $diagnostics = $diagnosticsService->overview(refresh: true, triggerNotifications: true);
 
@@ -124,6 +126,7 @@ public function overview(): array
             'broadcast' => $currentSession,
             'broadcast_previous' => $currentSession ? null : $this->resolveLastCompletedSession(),
             'broadcast_raw' => $broadcastDetails,
+            'control_channel' => $controlChannel,
             'diagnostics' => $diagnostics,
         ];
     }
@@ -135,6 +135,18 @@
         ],
     ],
 
+    /*
+     * TEA5767 FM tuner helper. The band scan stores a ranked station map in
+     * stations_cache; tuning to a stored station is then a single I2C write.
+     */
+    'fm_tuner' => [
+        'script' => (string) env('FM_TUNER_SCRIPT', 'tools/tea5767.py'),
+        'bus' => (int) env('FM_TUNER_I2C_BUS', 1),
+        'address' => (string) env('FM_TUNER_I2C_ADDRESS', '0x60'),
+        'stations_cache' => (string) env('FM_STATIONS_CACHE', storage_path('app/fm-stations.json')),
+        'scan_timeout' => (float) env('FM_SCAN_TIMEOUT', 30),
+    ],
+
     /*
      * Input routing definitions. Each logical identifier can map to multiple
      * mixer controls which are applied in order. When alias_of is present the
@@ -8,6 +8,8 @@
     'retry_attempts' => (int) env('CONTROL_CHANNEL_RETRY', 3),
     'deadline_ms' => (int) env('CONTROL_CHANNEL_DEADLINE_MS', 500),
     'handshake_timeout_ms' => (int) env('CONTROL_CHANNEL_HANDSHAKE_TIMEOUT_MS', 150),
+    'persistent' => filter_var(env('CONTROL_CHANNEL_PERSISTENT', true), FILTER_VALIDATE_BOOLEAN),
+    'status_file' => env('CONTROL_CHANNEL_STATUS_FILE'),
     'auto_start' => filter_var(env('CONTROL_CHANNEL_AUTO_START', true), FILTER_VALIDATE_BOOLEAN),
     'startup_timeout_ms' => (int) env('CONTROL_CHANNEL_STARTUP_TIMEOUT_MS', 3000),
     'worker_python' => env('CONTROL_CHANNEL_WORKER_PYTHON', env('PYTHON_BINARY', 'python3')),
@@ -21,6 +23,11 @@
         'CONTROL_CHANNEL_HANDSHAKE_TIMEOUT_MS' => env('CONTROL_CHANNEL_HANDSHAKE_TIMEOUT_MS'),
         'CONTROL_CHANNEL_DRY_RUN' => env('CONTROL_CHANNEL_DRY_RUN'),
         'CONTROL_CHANNEL_POLL_INTERVAL' => env('CONTROL_CHANNEL_POLL_INTERVAL'),
+        'CONTROL_CHANNEL_POLL_IDLE_MAX' => env('CONTROL_CHANNEL_POLL_IDLE_MAX'),
+        'CONTROL_CHANNEL_POLL_FAST_WINDOW' => env('CONTROL_CHANNEL_POLL_FAST_WINDOW'),
+        'CONTROL_CHANNEL_IDLE_TIMEOUT' => env('CONTROL_CHANNEL_IDLE_TIMEOUT'),
+        'CONTROL_CHANNEL_STATUS_FILE' => env('CONTROL_CHANNEL_STATUS_FILE'),
+        'CONTROL_CHANNEL_SUBSCRIBER_BUFFER' => env('CONTROL_CHANNEL_SUBSCRIBER_BUFFER'),
         'MODBUS_PORT' => env('MODBUS_PORT'),
         'MODBUS_METHOD' => env('MODBUS_METHOD'),
         'MODBUS_BAUDRATE' => env('MODBUS_BAUDRATE'),
@@ -41,5 +48,7 @@
         'MODBUS_RS485_DRIVER_RTS_RX_HIGH' => env('MODBUS_RS485_DRIVER_RTS_RX_HIGH'),
         'MODBUS_RS485_DRIVER_LEAD_SECONDS' => env('MODBUS_RS485_DRIVER_LEAD_SECONDS'),
         'MODBUS_RS485_DRIVER_TAIL_SECONDS' => env('MODBUS_RS485_DRIVER_TAIL_SECONDS'),
+        'MODBUS_BUS_ARBITRATION' => env('MODBUS_BUS_ARBITRATION'),
+        'MODBUS_BUS_WAIT_TIMEOUT' => env('MODBUS_BUS_WAIT_TIMEOUT'),
     ], static fn ($value) => $value !== null),
 ];
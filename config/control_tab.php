@@ -25,6 +25,10 @@
     'graceful_timeout' => (float) env('CONTROL_TAB_GRACEFUL_TIMEOUT', 5.0),
     'retry_backoff_ms' => (int) env('CONTROL_TAB_RETRY_BACKOFF_MS', 250),
     'inter_message_delay_ms' => (int) env('CONTROL_TAB_INTER_MESSAGE_DELAY_MS', 5),
+    'response_cache' => [
+        'panel_loaded_ttl' => (float) env('CONTROL_TAB_CACHE_PANEL_TTL', 300),
+        'text_field_ttl' => (float) env('CONTROL_TAB_CACHE_TEXT_TTL', 10),
+    ],
     'default_location_group_id' => (int) env('CONTROL_TAB_DEFAULT_LOCATION_GROUP_ID', 1),
     'general_zone' => (int) env('CONTROL_TAB_GENERAL_ZONE', 0),
     'test_progress_field' => (int) env('CONTROL_TAB_TEST_PROGRESS_FIELD', 1),
@@ -3,11 +3,12 @@
 
 from __future__ import annotations
 
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
 
-from smbus2 import SMBus
+from smbus2 import SMBus, i2c_msg
 
 AIC_ADDR = 0x18
 PAGE_SEL = 0x00
@@ -19,6 +20,14 @@ REG_HP_ROUTE_RIGHT = 0x40
 LINE1_VALUE = 0x11
 LINE2_VALUE = 0x44
 
+# Register windows we touch, read back once after reset to seed the shadow.
+SHADOW_WINDOWS = ((REG_HP_ROUTE_LEFT, REG_HP_ROUTE_RIGHT - REG_HP_ROUTE_LEFT + 1), (REG_BYPASS_SWITCH, 1))
+MAX_BURST = 32
+# Unchanged registers up to this long are rewritten from the shadow to keep one burst.
+BURST_GAP = 3
+FADE_MIN_INTERVAL = 0.002
+SWITCH_FADE = 0.03
+
 
 class AICError(Exception):
     """Codec access failure."""
@@ -30,94 +39,324 @@ class _CodecState:
     routing_enabled: bool = False
 
 
+@dataclass(slots=True)
+class _RegisterShadow:
+    """Last value written to (or read from) each page 0 register."""
+
+    values: dict[int, int] = field(default_factory=dict)
+    page: Optional[int] = None
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.page = None
+
+
+def plan_bursts(
+    updates: Mapping[int, int], shadow: Mapping[int, int], gap: int = BURST_GAP, limit: int = MAX_BURST
+) -> list[tuple[int, list[int]]]:
+    """Group register updates into auto-increment bursts ``(start, values)``.
+
+    Registers whose shadow already holds the wanted value are dropped. Short
+    gaps between changed registers are bridged with their shadow value when
+    it is known, so e.g. the left and right HP route registers go out as one
+    write.
+    """
+
+    changed = sorted(reg for reg, value in updates.items() if shadow.get(reg) != value & 0xFF)
+    bursts: list[tuple[int, list[int]]] = []
+    for reg in changed:
+        value = updates[reg] & 0xFF
+        if bursts:
+            start, values = bursts[-1]
+            end = start + len(values)
+            bridge = range(end, reg)
+            if (
+                len(bridge) <= gap
+                and len(values) + len(bridge) < limit
+                and all(r in shadow or r in updates for r in bridge)
+            ):
+                values.extend(updates.get(r, shadow.get(r, 0)) & 0xFF for r in bridge)
+                values.append(value)
+                continue
+        bursts.append((reg, [value]))
+    return bursts
+
+
+def volume_ramp(start: int, target: int, duration: float, min_interval: float = FADE_MIN_INTERVAL) -> list[tuple[float, int]]:
+    """Ramp of ``(offset seconds, 7-bit value)`` steps from ``start`` to ``target``.
+
+    The register is linear in 0.5 dB units, so evenly spaced register steps
+    give an even fade in dB. Steps are thinned out to ``min_interval`` and the
+    codec's own output soft-stepping smooths between them.
+    """
+
+    delta = target - start
+    if delta == 0:
+        return []
+    if duration <= 0:
+        return [(0.0, target)]
+    steps = max(1, min(abs(delta), int(duration / min_interval)))
+    ramp: list[tuple[float, int]] = []
+    for index in range(1, steps + 1):
+        value = start + round(delta * index / steps)
+        if ramp and ramp[-1][1] == value:
+            continue
+        ramp.append((duration * index / steps, value))
+    return ramp
+
+
+class _FadeEngine:
+    """Plays precomputed register ramps on absolute deadlines from one worker thread.
+
+    A write failure ends the ramp; :meth:`wait` re-raises it to the caller
+    that started that ramp.
+    """
+
+    def __init__(self, codec: "AIC3107") -> None:
+        self._codec = codec
+        self._condition = threading.Condition()
+        self._job: Optional[tuple[int, list[tuple[float, dict[int, int]]], float]] = None
+        self._generation = 0
+        self._done = threading.Event()
+        self._done.set()
+        self._error: Optional[tuple[int, Exception]] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="aic3107-fade", daemon=True)
+        self._thread.start()
+
+    def start(self, steps: list[tuple[float, dict[int, int]]]) -> int:
+        """Queue a ramp, replacing any running one; returns its id for :meth:`wait`."""
+
+        with self._condition:
+            self._generation += 1
+            self._job = (self._generation, steps, time.monotonic())
+            self._done.clear()
+            self._condition.notify()
+            return self._generation
+
+    def wait(self, generation: int) -> None:
+        """Wait until the worker is idle and raise the error ramp ``generation`` ended with."""
+
+        self._done.wait()
+        with self._condition:
+            if self._error is not None and self._error[0] == generation:
+                error = self._error[1]
+                self._error = None
+                raise error
+
+    def cancel(self) -> None:
+        with self._condition:
+            self._generation += 1
+            self._job = None
+            self._condition.notify()
+        self._done.wait()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._generation += 1
+            self._job = None
+            self._condition.notify()
+        self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._job is None and not self._closed:
+                    self._done.set()
+                    self._condition.wait()
+                if self._closed:
+                    self._done.set()
+                    return
+                generation, steps, started = self._job  # type: ignore[misc]
+                self._job = None
+            try:
+                for offset, updates in steps:
+                    with self._condition:
+                        # Sleep on the condition so a newer fade or close() interrupts the wait.
+                        while generation == self._generation and (delay := started + offset - time.monotonic()) > 0:
+                            self._condition.wait(delay)
+                        if generation != self._generation:
+                            break
+                    self._codec._write_registers(updates)
+            except Exception as exc:
+                with self._condition:
+                    self._error = (generation, exc)
+            finally:
+                with self._condition:
+                    if self._job is None:
+                        self._done.set()
+
+
 class AIC3107:
     """Minimal controller for TLV320AIC3107 codec."""
 
-    def __init__(self, bus: int = 1, addr: int = AIC_ADDR) -> None:
+    def __init__(self, bus: int | SMBus = 1, addr: int = AIC_ADDR) -> None:
         self._addr = addr
         self._transfer_retries = 5
-        try:
-            self._bus = SMBus(bus)
-        except OSError as exc:
-            raise AICError(f"Failed to open I²C bus {bus}: {exc}") from exc
+        self._lock = threading.RLock()
+        self._shadow = _RegisterShadow()
+        self.transactions = 0
+        self.skipped_writes = 0
+        if isinstance(bus, int):
+            try:
+                self._bus = SMBus(bus)
+            except OSError as exc:
+                raise AICError(f"Failed to open I²C bus {bus}: {exc}") from exc
+        else:
+            self._bus = bus
         self._state = _CodecState()
+        self._fader = _FadeEngine(self)
         self._initialise()
 
     def _initialise(self) -> None:
         self._soft_reset()
-        self.set_input("line1")
+        self.sync_shadow()
+        self.set_input("line1", fade=0)
         self.set_volume(50)
         self.mute(False)
 
     def close(self) -> None:
+        if getattr(self, "_fader", None) is not None:
+            self._fader.close()
+            self._fader = None  # type: ignore[assignment]
         if getattr(self, "_bus", None) is not None:
             self._bus.close()
             self._bus = None  # type: ignore[assignment]
 
-    def __write(self, reg: int, val: int) -> None:
-        reg_masked = reg & 0xFF
-        val_masked = val & 0xFF
+    def _transfer(self, messages: list[i2c_msg], what: str) -> None:
+        """Send ``messages`` as one combined I²C transaction, holding the bus only for that."""
+
         last_error: Optional[OSError] = None
         for _ in range(self._transfer_retries):
             try:
-                self._bus.write_byte_data(self._addr, PAGE_SEL, 0x00)
-                self._bus.write_byte_data(self._addr, reg_masked, val_masked)
+                self._bus.i2c_rdwr(*messages)
+                self.transactions += 1
                 return
             except OSError as exc:
                 last_error = exc
+                # A failed transfer may have left the page register anywhere.
+                self._shadow.page = None
                 time.sleep(0.01)
-        raise AICError(f"I²C write failed at 0x{reg_masked:02X}: {last_error}") from last_error
+        raise AICError(f"I²C {what}: {last_error}") from last_error
 
-    def __read(self, reg: int) -> int:
-        reg_masked = reg & 0xFF
-        last_error: Optional[OSError] = None
-        for _ in range(self._transfer_retries):
-            try:
-                self._bus.write_byte_data(self._addr, PAGE_SEL, 0x00)
-                return self._bus.read_byte_data(self._addr, reg_masked)
-            except OSError as exc:
-                last_error = exc
-                time.sleep(0.01)
-        raise AICError(f"I²C read failed at 0x{reg_masked:02X}: {last_error}") from last_error
+    def _page_messages(self) -> list[i2c_msg]:
+        if self._shadow.page == 0:
+            return []
+        return [i2c_msg.write(self._addr, [PAGE_SEL, 0x00])]
+
+    def _write_registers(self, updates: Mapping[int, int], *, force: bool = False) -> int:
+        """Write page 0 registers, skipping values the shadow already holds; returns bursts sent."""
+
+        with self._lock:
+            shadow = {} if force else self._shadow.values
+            bursts = plan_bursts(updates, shadow)
+            self.skipped_writes += len(updates) - sum(1 for reg in updates if shadow.get(reg) != updates[reg] & 0xFF)
+            if not bursts:
+                return 0
+            messages = self._page_messages()
+            messages.extend(i2c_msg.write(self._addr, [start, *values]) for start, values in bursts)
+            first = bursts[0][0]
+            self._transfer(messages, f"write failed at 0x{first:02X}")
+            self._shadow.page = 0
+            for start, values in bursts:
+                for offset, value in enumerate(values):
+                    self._shadow.values[start + offset] = value
+            return len(bursts)
+
+    def read_registers(self, start: int, count: int) -> list[int]:
+        """Read ``count`` consecutive page 0 registers in one transaction and refresh the shadow."""
+
+        with self._lock:
+            read = i2c_msg.read(self._addr, count)
+            messages = self._page_messages()
+            messages.extend([i2c_msg.write(self._addr, [start & 0xFF]), read])
+            self._transfer(messages, f"read failed at 0x{start & 0xFF:02X}")
+            self._shadow.page = 0
+            values = list(read)
+            for offset, value in enumerate(values):
+                self._shadow.values[start + offset] = value
+            return values
+
+    def sync_shadow(self) -> None:
+        for start, count in SHADOW_WINDOWS:
+            self.read_registers(start, count)
 
     def _soft_reset(self) -> None:
-        self.__write(REG_SOFT_RESET, 0x01)
+        self._write_registers({REG_SOFT_RESET: 0x01}, force=True)
+        self._shadow.clear()
+        self._shadow.page = 0
         time.sleep(0.005)
 
-    def set_input(self, source: str) -> None:
+    def _route_updates(self, value: int, routed: bool) -> dict[int, int]:
+        reg_value = (0x80 if routed else 0x00) | (value & 0x7F)
+        return {REG_HP_ROUTE_LEFT: reg_value, REG_HP_ROUTE_RIGHT: reg_value}
+
+    def _fade(self, target: int, duration: float) -> None:
+        """Ramp the routed volume from its current value to ``target`` and wait for it."""
+
+        ramp = volume_ramp(self._state.volume_value, target, duration)
+        if not ramp:
+            return
+        steps = [(offset, self._route_updates(value, True)) for offset, value in ramp]
+        self._fader.wait(self._fader.start(steps))
+        self._state.volume_value = target
+
+    def set_input(self, source: str, fade: Optional[float] = None) -> None:
+        """Select the bypass source; while routed, the output dips briefly around the switch."""
+
         if source == "line1":
             value = LINE1_VALUE
         elif source == "line2":
             value = LINE2_VALUE
         else:
             raise ValueError(f"Unsupported source: {source!r}")
-        self.__write(REG_BYPASS_SWITCH, value)
+        if self._shadow.values.get(REG_BYPASS_SWITCH) == value:
+            return
+        duration = SWITCH_FADE if fade is None else fade
+        self._fader.cancel()
+        if duration <= 0 or not self._state.routing_enabled:
+            self._write_registers({REG_BYPASS_SWITCH: value})
+            return
+        restore = self._state.volume_value
+        self._fade(0, duration / 2)
+        self._write_registers({REG_BYPASS_SWITCH: value})
+        self._fade(restore, duration / 2)
 
-    def set_volume(self, percent: int) -> None:
+    def set_volume(self, percent: int, fade: float = 0.0) -> None:
         clamped = max(0, min(100, int(percent)))
         vol_value = round(clamped * 127 / 100) & 0x7F
         if self._state.volume_value == vol_value and self._state.routing_enabled:
             return
-        reg_value = 0x80 | vol_value
-        self.__write(REG_HP_ROUTE_LEFT, reg_value)
-        self.__write(REG_HP_ROUTE_RIGHT, reg_value)
+        self._fader.cancel()
+        if fade > 0 and self._state.routing_enabled:
+            self._fade(vol_value, fade)
+            return
+        self._write_registers(self._route_updates(vol_value, True))
         self._state.volume_value = vol_value
         self._state.routing_enabled = True
 
-    def mute(self, enable: bool) -> None:
+    def mute(self, enable: bool, fade: float = 0.0) -> None:
         payload = self._state.volume_value & 0x7F
+        self._fader.cancel()
         if enable:
             if not self._state.routing_enabled:
                 return
-            self.__write(REG_HP_ROUTE_LEFT, payload)
-            self.__write(REG_HP_ROUTE_RIGHT, payload)
+            if fade > 0:
+                self._fade(0, fade)
+                self._state.volume_value = payload
+            self._write_registers(self._route_updates(payload, False))
             self._state.routing_enabled = False
         else:
-            reg_value = 0x80 | payload
             if self._state.routing_enabled and self._state.volume_value == payload:
                 return
-            self.__write(REG_HP_ROUTE_LEFT, reg_value)
-            self.__write(REG_HP_ROUTE_RIGHT, reg_value)
+            if fade > 0:
+                self._write_registers(self._route_updates(0, True))
+                self._state.volume_value = 0
+                self._state.routing_enabled = True
+                self._fade(payload, fade)
+                return
+            self._write_registers(self._route_updates(payload, True))
             self._state.routing_enabled = True
             self._state.volume_value = payload
 
@@ -128,12 +367,13 @@ if __name__ == "__main__":
         codec = AIC3107()
         codec.set_input("line2")
         time.sleep(0.1)
-        codec.set_volume(30)
+        codec.set_volume(30, fade=0.2)
         time.sleep(0.1)
-        codec.mute(True)
+        codec.mute(True, fade=0.1)
         time.sleep(0.5)
-        codec.mute(False)
-        codec.set_volume(70)
+        codec.mute(False, fade=0.1)
+        codec.set_volume(70, fade=0.3)
+        print(f"I²C transactions: {codec.transactions}, skipped writes: {codec.skipped_writes}")
     except AICError as exc:
         print(f"AIC error: {exc}")
     finally:
@@ -4,13 +4,23 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import os
 import re
 import shlex
 import subprocess
-from dataclasses import dataclass
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Iterable, Optional, Sequence
 
+SRC_DIR = Path(__file__).resolve().parent / "src"
+if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from cache_paths import cache_path  # noqa: E402
+
 
 class AlsaControlError(RuntimeError):
     """Raised when ALSA control operations fail."""
@@ -52,6 +62,126 @@ class ControlMap:
     volume_switch: bool
 
 
+@dataclass(slots=True)
+class CardInfo:
+    index: int
+    card_id: str
+    driver: str
+    name: str
+
+
+CACHE_VERSION = 1
+CACHE_ENV_KEYS = (
+    "INPUT_LEFT_CONTROL",
+    "INPUT_RIGHT_CONTROL",
+    "VOL_CONTROL",
+    "MUTE_CONTROL",
+    "VOL_SWITCH_CONTROL",
+    "ALLOW_MISSING_MUX",
+)
+_PROC_CARD_RE = re.compile(r"^\s*(\d+)\s+\[([^\]]+?)\s*\]:\s*(\S+)\s+-\s+(.*)$")
+
+
+def parse_proc_cards(text: str) -> list[CardInfo]:
+    """Cards listed in the contents of ``/proc/asound/cards``."""
+    cards = []
+    for line in text.splitlines():
+        match = _PROC_CARD_RE.match(line)
+        if match:
+            cards.append(CardInfo(int(match.group(1)), match.group(2), match.group(3), match.group(4).strip()))
+    return cards
+
+
+def read_proc_cards(root: str | Path = "/proc/asound") -> list[CardInfo]:
+    """Parse ``/proc/asound/cards`` without forking ``aplay``."""
+    try:
+        text = (Path(root) / "cards").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    return parse_proc_cards(text)
+
+
+def card_fingerprint(info: CardInfo, root: str | Path = "/proc/asound") -> str:
+    """Fingerprint of a card's identity, its /proc entries and the detection overrides.
+
+    ALSA does not publish simple control names under /proc, so the card's
+    entries there (PCM streams, codec files) stand in for the control list;
+    a driver or overlay change renames or adds them.
+    """
+    card_dir = Path(root) / f"card{info.index}"
+    try:
+        entries = sorted(entry.name for entry in card_dir.iterdir())
+    except OSError:
+        entries = []
+    payload = {
+        "id": info.card_id,
+        "driver": info.driver,
+        "name": info.name,
+        "entries": entries,
+        "env": {key: os.environ.get(key, "") for key in CACHE_ENV_KEYS},
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def default_cache_path() -> Optional[Path]:
+    """``ALSA_CTRL_CACHE`` overrides the location; an empty value disables the cache."""
+    return cache_path("ALSA_CTRL_CACHE", "alsa_aic3107_ctrl.json")
+
+
+class ControlMapCache:
+    """Resolved ``ControlMap`` per card, persisted as JSON and keyed by ``id:driver``."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        cards = data.get("cards")
+        return cards if isinstance(cards, dict) else {}
+
+    def _save(self, cards: dict) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"version": CACHE_VERSION, "cards": cards}, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def key(info: CardInfo) -> str:
+        return f"{info.card_id}:{info.driver}"
+
+    def get(self, info: CardInfo, fingerprint: str) -> Optional[tuple[list[str], ControlMap]]:
+        entry = self._load().get(self.key(info))
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint or entry.get("index") != info.index:
+            return None
+        try:
+            return list(entry["scontrols"]), ControlMap(**entry["controls"])
+        except (KeyError, TypeError):
+            return None
+
+    def put(self, info: CardInfo, fingerprint: str, scontrols: Sequence[str], controls: ControlMap) -> None:
+        cards = self._load()
+        cards[self.key(info)] = {
+            "fingerprint": fingerprint,
+            "index": info.index,
+            "scontrols": list(scontrols),
+            "controls": asdict(controls),
+        }
+        self._save(cards)
+
+    def drop(self, info: CardInfo) -> None:
+        cards = self._load()
+        if cards.pop(self.key(info), None) is not None:
+            self._save(cards)
+
+
 DEFAULT_OVERRIDES = {
     "INPUT_LEFT_CONTROL": "Left Line1L Mux",
     "INPUT_RIGHT_CONTROL": "Right Line1R Mux",
@@ -110,6 +240,7 @@ class AlsaCard:
     ]
 
     CARD_NAME_KEYWORDS = ("aic3x", "aic3107", "tlv320", "soundcard")
+    PROC_ROOT = "/proc/asound"
     INPUT_PROFILES: dict[str, list[tuple[str, str]]] = {
         "line1": [
             ("Left Line1L Mux", "Line1L"),
@@ -181,24 +312,73 @@ class AlsaCard:
         *,
         verbose: bool = False,
         detect_controls: bool = True,
+        cache: Optional[ControlMapCache] = None,
+        use_cache: bool = True,
     ) -> None:
         env_card = os.environ.get("SOUND_CARD")
         if card is None and env_card:
             card = env_card
         self._verbose = verbose or os.environ.get("ALSA_CTRL_VERBOSE", "").lower() in {"1", "true", "yes", "on"}
-        self.card_index = self._detect_card_index(card)
-        self._controls_cache = self._list_scontrols()
         self._controls: Optional[ControlMap] = None
-        if detect_controls:
-            self._controls = self._detect_controls(self._controls_cache)
+        if cache is None and use_cache:
+            path = default_cache_path()
+            cache = ControlMapCache(path) if path is not None else None
+        self._cache = cache if use_cache else None
+        self._card_info = self._resolve_proc_card(card)
+        self._fingerprint: Optional[str] = None
+        self._cache_hit = False
+        cached = None
+        if self._card_info is not None:
+            # Fast path: the card index comes from /proc/asound, no aplay/amixer probe.
+            self.card_index = self._card_info.index
+            self._fingerprint = card_fingerprint(self._card_info, self.PROC_ROOT)
+            if self._cache is not None and detect_controls:
+                cached = self._cache.get(self._card_info, self._fingerprint)
+        else:
+            self.card_index = self._detect_card_index(card)
+        if cached is not None:
+            self._controls_cache, self._controls = cached
+            self._cache_hit = True
+        else:
+            self._controls_cache = self._list_scontrols()
+            if detect_controls:
+                self._controls = self._detect_controls(self._controls_cache)
+                self._store_controls()
         if self._verbose:
             print(
                 "Selected card index:",
                 self.card_index,
                 "\nControls:",
                 self._controls,
+                "\nControl map cache:",
+                "hit" if self._cache_hit else "miss",
             )
 
+    def _resolve_proc_card(self, card: str | int | None) -> Optional[CardInfo]:
+        cards = read_proc_cards(self.PROC_ROOT)
+        if card is not None:
+            try:
+                index = int(card)
+            except ValueError:
+                needle = str(card).lower()
+                return next((info for info in cards if needle in info.card_id.lower() or needle in info.name.lower()), None)
+            return next((info for info in cards if info.index == index), None)
+        for info in cards:
+            haystack = f"{info.card_id} {info.driver} {info.name}".lower()
+            if any(keyword in haystack for keyword in self.CARD_NAME_KEYWORDS):
+                return info
+        return None
+
+    def _store_controls(self) -> None:
+        if self._cache is None or self._card_info is None or self._fingerprint is None or self._controls is None:
+            return
+        self._cache.put(self._card_info, self._fingerprint, self._controls_cache, self._controls)
+
+    def _drop_cached_controls(self) -> None:
+        if self._cache_hit and self._cache is not None and self._card_info is not None:
+            self._cache.drop(self._card_info)
+            self._cache_hit = False
+
     def _run(self, args: list[str]) -> str:
         command = ["amixer", "-c", str(self.card_index), *args]
         if self._verbose:
@@ -215,6 +395,8 @@ class AlsaCard:
             raise AlsaControlError(f"Failed to execute {' '.join(shlex.quote(a) for a in command)}: {exc}") from exc
 
         if completed.returncode != 0:
+            # A map from the cache may point at controls that are gone; rebuild it next run.
+            self._drop_cached_controls()
             raise AlsaControlError(
                 f"amixer returned {completed.returncode} for {' '.join(shlex.quote(a) for a in command)}:\n{completed.stderr.strip()}"
             )
@@ -277,8 +459,9 @@ class AlsaCard:
                     best_match = control
         return best_match
 
-    def _detect_controls(self) -> ControlMap:
-        controls = self._list_scontrols()
+    def _detect_controls(self, controls: Optional[Sequence[str]] = None) -> ControlMap:
+        if controls is None:
+            controls = self._list_scontrols()
         left_override = os.environ.get("INPUT_LEFT_CONTROL")
         right_override = os.environ.get("INPUT_RIGHT_CONTROL")
         vol_override = os.environ.get("VOL_CONTROL")
@@ -362,7 +545,8 @@ class AlsaCard:
 
     def _ensure_controls(self) -> ControlMap:
         if self._controls is None:
-            self._controls = self._detect_controls()
+            self._controls = self._detect_controls(self._controls_cache)
+            self._store_controls()
         return self._controls
 
     def _control_supports_value(self, control: str, value: str) -> bool:
@@ -452,6 +636,7 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--list-controls", action="store_true", help="Show detected ALSA simple controls and exit.")
     parser.add_argument("--debug", action="store_true", help="Print detailed amixer commands.")
     parser.add_argument("--allow-missing-mux", action="store_true", help="Gracefully continue if only one mux control exists.")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the persisted control map cache.")
     return parser.parse_args()
 
 
@@ -460,11 +645,11 @@ def main() -> None:
     if args.allow_missing_mux:
         os.environ.setdefault("ALLOW_MISSING_MUX", "1")
     try:
-        card = AlsaCard(args.card, verbose=args.debug, detect_controls=not args.list_controls)
+        card = AlsaCard(args.card, verbose=args.debug, detect_controls=not args.list_controls, use_cache=not args.no_cache)
     except RuntimeError as exc:
         if not args.list_controls:
             raise
-        card = AlsaCard(args.card, verbose=args.debug, detect_controls=False)
+        card = AlsaCard(args.card, verbose=args.debug, detect_controls=False, use_cache=not args.no_cache)
         print(exc)
 
     if args.list_controls:
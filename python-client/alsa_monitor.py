@@ -5,10 +5,12 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 import select
 import subprocess
 import sys
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
@@ -19,14 +21,100 @@ if ROOT.exists() and str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 try:
-    from alsa_snapshot import snapshot  # type: ignore[import]
+    from alsa_snapshot import MixerModel, simple_control_name  # type: ignore[import]
 except Exception as exc:  # pragma: no cover - local import should succeed
     raise SystemExit(f"Unable to import alsa_snapshot helper: {exc}") from exc
 
 
+EVENT_RE = re.compile(
+    r"#(?P<numid>\d+)\s+\((?P<iface>\d+),(?P<device>\d+),(?P<subdevice>\d+),(?P<name>.+),(?P<index>\d+)\)\s*(?P<mask>.*)$"
+)
+STRUCTURAL_EVENTS = ("ADD", "REMOVE")
+
+
+@dataclass(slots=True)
+class MixerEvent:
+    numid: int
+    element: str
+    index: int
+    mask: str
+
+    @property
+    def control(self) -> str:
+        return simple_control_name(self.element)
+
+    @property
+    def structural(self) -> bool:
+        return any(flag in self.mask for flag in STRUCTURAL_EVENTS)
+
+
+def parse_event(line: str) -> MixerEvent | None:
+    """Parse one ``alsactl monitor`` line, e.g. ``node hw:0, #5 (2,0,0,HP DAC Playback Volume,0) VALUE``."""
+
+    match = EVENT_RE.search(line)
+    if match is None:
+        return None
+    return MixerEvent(
+        numid=int(match.group("numid")),
+        element=match.group("name"),
+        index=int(match.group("index")),
+        mask=match.group("mask").strip(),
+    )
+
+
+class EventCoalescer:
+    """Collects changed controls until the event burst pauses or ``max_latency`` passes.
+
+    The pause that ends a burst is twice the smoothed gap between recent
+    events, so a single click refreshes almost immediately while a knob drag
+    is folded into one refresh per ``max_latency``.
+    """
+
+    def __init__(self, max_latency: float, min_gap: float = 0.02) -> None:
+        self.max_latency = max(min_gap, max_latency)
+        self.min_gap = min_gap
+        self.pending: set[str] = set()
+        self.full = False
+        self.first_at: float | None = None
+        self.last_at: float | None = None
+        self.interval: float | None = None
+
+    def add(self, control: str | None, now: float) -> None:
+        """Queue ``control`` for a refresh; ``None`` asks for a full re-read."""
+
+        if self.last_at is not None:
+            gap = now - self.last_at
+            if gap > self.max_latency:
+                # An idle pause starts a new burst and says nothing about its event rate.
+                self.interval = None
+            else:
+                self.interval = gap if self.interval is None else 0.7 * self.interval + 0.3 * gap
+        if self.first_at is None:
+            self.first_at = now
+        self.last_at = now
+        if control is None:
+            self.full = True
+        else:
+            self.pending.add(control)
+
+    def deadline(self) -> float | None:
+        if self.first_at is None or self.last_at is None:
+            return None
+        gap = self.min_gap if self.interval is None else 2 * self.interval
+        gap = min(self.max_latency, max(self.min_gap, gap))
+        return min(self.last_at + gap, self.first_at + self.max_latency)
+
+    def take(self) -> tuple[bool, set[str]]:
+        full, pending = self.full, self.pending
+        self.full = False
+        self.pending = set()
+        self.first_at = None
+        return full, pending
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Continuously print ALSA mixer snapshots whenever controls change."
+        description="Continuously print ALSA mixer changes (deltas, with periodic full snapshots)."
     )
     parser.add_argument(
         "--card",
@@ -42,7 +130,13 @@ def build_parser() -> argparse.ArgumentParser:
         "--debounce",
         type=float,
         default=0.2,
-        help="Minimum seconds between snapshots to avoid flooding (default: 0.2).",
+        help="Longest time changes are held back while events keep arriving (default: 0.2).",
+    )
+    parser.add_argument(
+        "--full-interval",
+        type=float,
+        default=30.0,
+        help="Seconds between full snapshots; 0 prints only deltas (default: 30).",
     )
     parser.add_argument(
         "--quiet-events",
@@ -52,10 +146,10 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _spawn_monitor(card: str) -> subprocess.Popen[str]:
+def _spawn_monitor(card: str) -> subprocess.Popen[bytes]:
     command = ["alsactl", "monitor", card]
     try:
-        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     except FileNotFoundError as exc:
         raise SystemExit("alsactl executable not found; install alsa-utils.") from exc
     if process.stdout is None:
@@ -63,44 +157,89 @@ def _spawn_monitor(card: str) -> subprocess.Popen[str]:
     return process
 
 
-def _read_lines(process: subprocess.Popen[str]):
-    """Yield lines from alsactl stdout until the process stops."""
+def _read_available(fd: int, buffer: bytearray) -> list[str] | None:
+    """Drain what alsactl wrote so far; ``None`` once the pipe is closed."""
 
-    stdout = process.stdout
-    assert stdout is not None
-
-    poller = select.poll()
-    poller.register(stdout, select.POLLIN)
+    chunk = os.read(fd, 65536)
+    if not chunk:
+        return None
+    buffer.extend(chunk)
+    lines: list[str] = []
     while True:
-        if process.poll() is not None:
-            break
-        events = poller.poll(100)
-        if not events:
-            continue
-        line = stdout.readline()
-        if line == "":
-            break
-        yield line.rstrip()
-
-
-def monitor(card: str, controls: Iterable[str] | None, debounce: float, quiet_events: bool) -> None:
+        end = buffer.find(b"\n")
+        if end == -1:
+            return lines
+        lines.append(buffer[:end].decode("utf-8", errors="replace").rstrip())
+        del buffer[: end + 1]
+
+
+def _print_delta(model: MixerModel, changed: list[str]) -> None:
+    if not changed:
+        return
+    stamp = time.strftime("%H:%M:%S")
+    for name in changed:
+        print(f"[{stamp}] {model.compact(name)}")
+
+
+def monitor(
+    card: str,
+    controls: Iterable[str] | None,
+    debounce: float,
+    quiet_events: bool,
+    full_interval: float = 30.0,
+) -> None:
     process = _spawn_monitor(card)
+    assert process.stdout is not None
+    fd = process.stdout.fileno()
+    model = MixerModel(card, controls)
+    coalescer = EventCoalescer(debounce)
+    numids: dict[int, str] = {}
+    events = 0
     try:
         print(f"Watching ALSA card '{card}'. Press Ctrl+C to stop.\n")
-        last_snapshot = 0.0
         # Print initial snapshot.
-        print(snapshot(card, controls))
-        for line in _read_lines(process):
-            if not quiet_events:
-                print(f"[event] {line}")
+        model.refresh()
+        print(model.render())
+        next_full = time.monotonic() + full_interval if full_interval > 0 else None
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        buffer = bytearray()
+        while process.poll() is None:
+            now = time.monotonic()
+            wake = [at for at in (coalescer.deadline(), next_full) if at is not None]
+            timeout = 1000 if not wake else max(0, int((min(wake) - now) * 1000))
+            if poller.poll(timeout):
+                lines = _read_available(fd, buffer)
+                if lines is None:
+                    break
+                now = time.monotonic()
+                for line in lines:
+                    if not quiet_events:
+                        print(f"[event] {line}")
+                    event = parse_event(line)
+                    if event is None:
+                        continue
+                    events += 1
+                    control = numids.setdefault(event.numid, event.control)
+                    # Unknown names and added/removed elements need a full re-read.
+                    known = model.knows(control) or model.selected is not None
+                    coalescer.add(control if known and not event.structural else None, now)
             now = time.monotonic()
-            if now - last_snapshot < debounce:
-                continue
-            last_snapshot = now
-            print(snapshot(card, controls))
+            deadline = coalescer.deadline()
+            if next_full is not None and now >= next_full:
+                coalescer.take()
+                model.refresh()
+                print(model.render())
+                next_full = now + full_interval
+            elif deadline is not None and now >= deadline:
+                full, pending = coalescer.take()
+                if full:
+                    numids.clear()
+                _print_delta(model, model.refresh(None if full else sorted(pending)))
     except KeyboardInterrupt:
         print("\nStopping monitor...")
     finally:
+        print(f"{events} events, {model.reads} amixer reads.")
         try:
             process.terminate()
             process.wait(timeout=1)
@@ -111,7 +250,7 @@ def monitor(card: str, controls: Iterable[str] | None, debounce: float, quiet_ev
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
-    monitor(args.card, args.controls, args.debounce, args.quiet_events)
+    monitor(args.card, args.controls, args.debounce, args.quiet_events, args.full_interval)
 
 
 if __name__ == "__main__":  # pragma: no cover - CLI helper
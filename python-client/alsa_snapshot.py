@@ -11,6 +11,20 @@ import subprocess
 from typing import Iterable
 
 
+SIMPLE_HEADER_RE = re.compile(r"^Simple mixer control '(?P<name>.+)',(?P<index>\d+)\s*$")
+ELEMENT_SUFFIXES = (
+    " Playback Volume",
+    " Capture Volume",
+    " Playback Switch",
+    " Capture Switch",
+    " Playback Route",
+    " Capture Route",
+    " Volume",
+    " Switch",
+    " Route",
+)
+
+
 def _run_command(cmd: list[str]) -> str:
     try:
         completed = subprocess.run(cmd, check=True, capture_output=True, text=True)
@@ -27,21 +41,7 @@ def _list_cards() -> str:
     return _run_command(["aplay", "-l"])
 
 
-def _detect_controls(card: str) -> list[str]:
-    output = _run_command(["amixer", "-c", card, "scontrols"])
-    controls: list[str] = []
-    pattern = re.compile(r"Simple mixer control '(.+?)'")
-    for line in output.splitlines():
-        match = pattern.search(line)
-        if match:
-            controls.append(match.group(1))
-    if not controls:
-        raise SystemExit(f"No simple controls reported for card '{card}'.")
-    return controls
-
-
-def _summarize_control(card: str, control: str) -> str:
-    output = _run_command(["amixer", "-c", card, "sget", control])
+def _interesting_lines(output: str) -> list[str]:
     interesting: list[str] = []
     for raw_line in output.splitlines():
         line = raw_line.strip()
@@ -51,6 +51,11 @@ def _summarize_control(card: str, control: str) -> str:
             continue
         if any(keyword in line for keyword in ("Playback", "Capture", "Item0", "Item1", "Item2", "Item3")):
             interesting.append(f"  {line}")
+    return interesting
+
+
+def _summarize_output(control: str, output: str) -> str:
+    interesting = _interesting_lines(output)
     if not interesting:
         interesting.append("  (no playback/capture fields reported)")
     header = f"{control}"
@@ -58,16 +63,114 @@ def _summarize_control(card: str, control: str) -> str:
     return "\n".join((header, underline, *interesting))
 
 
+def parse_blocks(output: str) -> dict[str, str]:
+    """Split ``amixer scontents`` output into text per simple control.
+
+    Only index 0 is kept, which is what ``amixer sget NAME`` reports.
+    """
+
+    blocks: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in output.splitlines():
+        match = SIMPLE_HEADER_RE.match(line)
+        if match:
+            name = match.group("name")
+            current = None
+            if match.group("index") == "0" and name not in blocks:
+                current = blocks[name] = [line]
+            continue
+        if current is not None:
+            current.append(line)
+    return {name: "\n".join(lines) for name, lines in blocks.items()}
+
+
+def simple_control_name(element: str) -> str:
+    """Map a ctl element name (``HP DAC Playback Volume``) to its simple control (``HP DAC``)."""
+
+    for suffix in ELEMENT_SUFFIXES:
+        if element.endswith(suffix) and len(element) > len(suffix):
+            return element[: -len(suffix)]
+    return element
+
+
+def read_controls(card: str, controls: Iterable[str] | None = None) -> dict[str, str]:
+    """Read the given simple controls (default: all of them) with a single amixer process.
+
+    ``amixer --stdin`` only runs ``sset``/``cset``, so a subset is filtered
+    out of one ``scontents`` run; unknown names are simply missing.
+    """
+
+    wanted = None if controls is None else set(controls)
+    if wanted is not None and not wanted:
+        return {}
+    blocks = parse_blocks(_run_command(["amixer", "-c", card, "scontents"]))
+    if wanted is None:
+        return blocks
+    return {name: text for name, text in blocks.items() if name in wanted}
+
+
+class MixerModel:
+    """Cached per-control amixer output for one card, refreshed in full or per control."""
+
+    def __init__(self, card: str, controls: Iterable[str] | None = None) -> None:
+        self.card = card
+        self.selected = list(controls) if controls else None
+        self.blocks: dict[str, str] = {}
+        self.reads = 0
+
+    def refresh(self, names: Iterable[str] | None = None) -> list[str]:
+        """Re-read ``names`` (default: everything) and return the controls whose state changed."""
+
+        if names is None:
+            wanted = self.selected
+        else:
+            wanted = [name for name in names if self.selected is None or name in self.selected]
+            if not wanted:
+                return []
+        fresh = read_controls(self.card, wanted)
+        self.reads += 1
+        if names is None:
+            for name in set(self.blocks) - set(fresh):
+                del self.blocks[name]
+        changed: list[str] = []
+        for name, text in fresh.items():
+            if self.selected is not None and name not in self.selected:
+                continue
+            if self.blocks.get(name) != text:
+                self.blocks[name] = text
+                changed.append(name)
+        return changed
+
+    def knows(self, name: str) -> bool:
+        return name in self.blocks
+
+    def control_names(self) -> list[str]:
+        return list(self.selected) if self.selected is not None else list(self.blocks)
+
+    def summary(self, name: str) -> str:
+        return _summarize_output(name, self.blocks.get(name, ""))
+
+    def compact(self, name: str) -> str:
+        fields = [line.strip() for line in _interesting_lines(self.blocks.get(name, ""))]
+        return f"{name}: {' | '.join(fields) if fields else '(no playback/capture fields reported)'}"
+
+    def render(self) -> str:
+        lines = [f"# ALSA snapshot for card '{self.card}'", ""]
+        for control in self.control_names():
+            lines.append(self.summary(control))
+            lines.append("")
+        return "\n".join(lines).rstrip() + "\n"
+
+
 def snapshot(card: str, controls: Iterable[str] | None = None) -> str:
     if shutil.which("amixer") is None:
         raise SystemExit("amixer executable not found; install alsa-utils.")
 
-    control_list = list(controls) if controls else _detect_controls(card)
-    lines = [f"# ALSA snapshot for card '{card}'", ""]
-    for control in control_list:
-        lines.append(_summarize_control(card, control))
-        lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
+    model = MixerModel(card, controls)
+    model.refresh()
+    if not model.control_names():
+        raise SystemExit(f"No simple controls reported for card '{card}'.")
+    return model.render()
 
 
 def build_parser() -> argparse.ArgumentParser:
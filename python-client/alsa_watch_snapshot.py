@@ -11,8 +11,17 @@ import subprocess
 import sys
 import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable
 
+ROOT = Path(__file__).resolve().parent
+if ROOT.exists() and str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from alsa_snapshot import parse_blocks  # type: ignore[import]
+except Exception as exc:  # pragma: no cover - local import should succeed
+    raise SystemExit(f"Unable to import alsa_snapshot helper: {exc}") from exc
 
 CHANNEL_RE = re.compile(
     r"^(?P<name>[^:]+):\s*(?P<direction>Playback|Capture).*?\[(?P<pct>\d+%)\](?:.*?\[(?P<db>[-+0-9.]+dB)\])?.*?\[(?P<state>on|off)\]"
@@ -114,8 +123,7 @@ def _is_selector(control: str, keywords: tuple[str, ...]) -> bool:
     return any(keyword in lower for keyword in keywords)
 
 
-def _summarize_control(card: str | None, control: str) -> ControlReport:
-    output = _run(_build_amixer_command(card, "sget", control))
+def _summarize_control(control: str, output: str) -> ControlReport:
     channels: list[ChannelState] = []
     items: list[str] = []
 
@@ -183,27 +191,22 @@ def _select_controls(names: list[str], *, keywords: tuple[str, ...] = DEFAULT_CO
     return selected
 
 
-def _list_simple_controls(card: str | None, timeout: float = 2.0) -> list[str]:
-    cmd = _build_amixer_command(card, "scontrols")
+def _read_contents(card: str | None, controls: list[str] | None = None, timeout: float = 2.0) -> dict[str, str]:
+    """Read all simple controls, or just ``controls``, from one ``amixer scontents`` run."""
+
+    cmd = _build_amixer_command(card, "scontents")
     try:
         completed = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=timeout)
     except FileNotFoundError as exc:
         raise SystemExit(f"Command not found: {cmd[0]} (install alsa-utils?)") from exc
     except subprocess.TimeoutExpired:
-        return []
+        return {}
     except subprocess.CalledProcessError:
-        return []
-
-    names: list[str] = []
-    for line in completed.stdout.splitlines():
-        text = line.strip()
-        if not text or "Simple mixer control" not in text:
-            continue
-        start = text.find("'")
-        end = text.rfind("'")
-        if start != -1 and end != -1 and end > start:
-            names.append(text[start + 1 : end])
-    return names
+        return {}
+    blocks = parse_blocks(completed.stdout)
+    if controls is None:
+        return blocks
+    return {name: text for name, text in blocks.items() if name in controls}
 
 
 def _normalise_card(value: str | None) -> str | None:
@@ -234,7 +237,9 @@ def _candidate_cards(preferred: str | None) -> list[str | None]:
     return candidates
 
 
-def _resolve_card_and_controls(card: str | None, controls: Iterable[str] | None) -> tuple[str | None, list[str]]:
+def _resolve_card_and_controls(
+    card: str | None, controls: Iterable[str] | None
+) -> tuple[str | None, list[str], dict[str, str]]:
     controls_list = list(controls) if controls is not None else None
     last_error: str | None = None
     tried_cards: list[str | None] = []
@@ -243,16 +248,17 @@ def _resolve_card_and_controls(card: str | None, controls: Iterable[str] | None)
         if isinstance(candidate, str) and not candidate.isdigit():
             # Named cards often represent virtual devices (e.g. pulse); allow them even when no controls are reported.
             if controls_list is not None:
-                return candidate, controls_list
+                return candidate, controls_list, _read_contents(candidate, controls_list)
             continue
 
-        names = _list_simple_controls(candidate)
-        if not names:
+        # One amixer run both probes the card and returns the state of every control shown.
+        blocks = _read_contents(candidate, controls_list)
+        if not blocks:
             last_error = f"No ALSA simple controls reported for card '{_format_card_label(candidate)}'"
             continue
         if controls_list is not None:
-            return candidate, controls_list
-        return candidate, names
+            return candidate, controls_list, blocks
+        return candidate, list(blocks), blocks
 
     tried = ", ".join(_format_card_label(c) for c in tried_cards)
     message = last_error or "Unable to detect ALSA controls"
@@ -261,11 +267,11 @@ def _resolve_card_and_controls(card: str | None, controls: Iterable[str] | None)
 
 def snapshot(card: str | None, controls: Iterable[str] | None) -> str:
     _ensure_amixer()
-    effective_card, control_list = _resolve_card_and_controls(card, controls)
+    effective_card, control_list, blocks = _resolve_card_and_controls(card, controls)
     card_label = _format_card_label(effective_card)
     timestamp = time.strftime("%H:%M:%S")
     parts = [f"ALSA card {card_label} @ {timestamp}"]
-    reports = [_summarize_control(effective_card, control) for control in control_list]
+    reports = [_summarize_control(control, blocks.get(control, "")) for control in control_list]
     if not reports:
         parts.append("No ALSA controls found for the active card.")
         return "\n".join(parts)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import argparse, shlex, subprocess, sys
+import argparse, shlex, subprocess, sys, time
 from typing import Optional
 
 # ---------- shell helpers ----------
@@ -17,15 +17,166 @@ def sset(card, ctrl, *values):
     return run(cmd)
 
 def control_exists(card, ctrl):
-    try: sget(card, ctrl); return True
-    except Exception: return False
+    return snapshot(card).has(ctrl)
 
 def is_percent_fader(card, ctrl):
-    try:
-        out = sget(card, ctrl)
-        return "Capabilities:" in out and ("pvolume" in out or "volume" in out)
-    except Exception:
-        return False
+    return snapshot(card).is_percent_fader(ctrl)
+
+# ---------- control snapshot ----------
+SNAPSHOT_TTL = 2.0
+
+
+class MixerSnapshot:
+    """Všechny simple controly karty z jednoho `amixer scontents` čtení.
+
+    Pro každý control drží capabilities a řádky stavu ve stejném tvaru,
+    jaký vrací `amixer sget`, takže čtecí helpery nemusí nic spouštět.
+    """
+
+    def __init__(self, card: int, text: str, taken_at: Optional[float] = None):
+        self.card = card
+        self.taken_at = time.monotonic() if taken_at is None else taken_at
+        self.lines: dict[str, list[str]] = {}
+        self.caps: dict[str, set[str]] = {}
+        current = None
+        for line in text.splitlines():
+            if line.startswith("Simple mixer control "):
+                head = line[len("Simple mixer control "):]
+                name, _, index = head.rpartition(",")
+                name = name.strip().strip("'")
+                # `sget` podle jména vrací index 0, ostatní indexy ignorujeme.
+                current = name if index.strip() in {"", "0"} and name not in self.lines else None
+                if current is not None:
+                    self.lines[current] = []
+                    self.caps[current] = set()
+            elif current is not None:
+                self.lines[current].append(line)
+                if line.strip().startswith("Capabilities:"):
+                    self.caps[current].update(line.split(":", 1)[1].split())
+
+    @classmethod
+    def read(cls, card: int) -> "MixerSnapshot":
+        return cls(card, run(["amixer", "-c", str(card), "scontents"]))
+
+    def fresh(self, ttl: float = SNAPSHOT_TTL) -> bool:
+        return time.monotonic() - self.taken_at < ttl
+
+    def has(self, ctrl: str) -> bool:
+        return ctrl in self.lines
+
+    def is_percent_fader(self, ctrl: str) -> bool:
+        return any("volume" in cap for cap in self.caps.get(ctrl, ()))
+
+    def can_mute(self, ctrl: str) -> bool:
+        return any("switch" in cap for cap in self.caps.get(ctrl, ()))
+
+    def is_on(self, ctrl: str) -> bool:
+        return any("[on]" in line.lower() for line in self.lines.get(ctrl, ()))
+
+    def state(self, ctrl: str) -> Optional[str]:
+        lines = self.lines.get(ctrl)
+        if lines is None:
+            return None
+        state = None
+        for line in lines:
+            text = line.strip()
+            if text.startswith("Item0:"):
+                state = text
+                break
+            if "values=" in text or " : " in text:
+                state = text
+        if state is None and lines:
+            state = lines[-1].strip()
+        return state
+
+
+_SNAPSHOTS: dict[int, MixerSnapshot] = {}
+
+
+def snapshot(card: int) -> MixerSnapshot:
+    cached = _SNAPSHOTS.get(card)
+    if cached is None or not cached.fresh():
+        cached = _SNAPSHOTS[card] = MixerSnapshot.read(card)
+    return cached
+
+
+def invalidate(card: int) -> None:
+    _SNAPSHOTS.pop(card, None)
+
+# ---------- batched writes ----------
+def _stdin_quote(ctrl: str) -> str:
+    return "'" + ctrl.replace("'", "\\'") + "'"
+
+
+class MixerPlan:
+    """Seznam změn mixeru pro jednu akci, zapsaný jedním `amixer --stdin` během.
+
+    Existence a typ controlů se berou ze snapshotu karty, takže plánování
+    samo nic nespouští. Když batch selže, změny se zopakují po jedné přes
+    `sset`, aby chybová hlášení odpovídala dřívějšímu chování. `--stdin`
+    u neznámého controlu jen vypíše chybu a skončí s 0, proto se za selhání
+    bere i neprázdný stderr.
+    """
+
+    def __init__(self, card: int, controls: Optional[MixerSnapshot] = None):
+        self.card = card
+        self.controls = snapshot(card) if controls is None else controls
+        self.changes: list[tuple[str, tuple[str, ...]]] = []
+
+    def has(self, ctrl: str) -> bool:
+        return self.controls.has(ctrl)
+
+    def is_percent_fader(self, ctrl: str) -> bool:
+        return self.controls.is_percent_fader(ctrl)
+
+    def can_mute(self, ctrl: str) -> bool:
+        return self.controls.can_mute(ctrl)
+
+    def set(self, ctrl: str, *values: str) -> None:
+        if not values:
+            raise ValueError("sset vyžaduje alespoň jednu hodnotu.")
+        # Poslední změna téhož controlu vyhrává, pořadí zůstává podle prvního výskytu.
+        for index, (name, _values) in enumerate(self.changes):
+            if name == ctrl:
+                self.changes[index] = (ctrl, values)
+                return
+        self.changes.append((ctrl, values))
+
+    def off_all(self, ctrls) -> None:
+        for c in ctrls:
+            if self.has(c):
+                self.set(c, "off")
+
+    def require_on(self, ctrls) -> None:
+        for c in ctrls:
+            if not self.has(c):
+                raise RuntimeError(f"Chybí ovladač: {c}")
+            self.set(c, "on")
+
+    def commands(self) -> list[str]:
+        return [f"sset {_stdin_quote(ctrl)} {' '.join(values)}" for ctrl, values in self.changes]
+
+    def apply(self) -> int:
+        if not self.changes:
+            return 0
+        script = "\n".join(self.commands()) + "\n"
+        try:
+            p = subprocess.run(
+                ["amixer", "-q", "-c", str(self.card), "--stdin"],
+                input=script,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            if p.returncode != 0 or p.stderr.strip():
+                for ctrl, values in self.changes:
+                    sset(self.card, ctrl, *values)
+        finally:
+            # Snapshot už neodpovídá kartě, další čtení si ho načte znovu.
+            invalidate(self.card)
+        applied = len(self.changes)
+        self.changes = []
+        return applied
 
 # ---------- CLI helpers ----------
 INPUT_ALIASES = {
@@ -118,14 +269,14 @@ def _parse_simple_command(argv):
     return None
 
 # ---------- auto-choose output path ----------
-def detect_outputs(card: int) -> list[str]:
+def detect_outputs(plan: MixerPlan) -> list[str]:
     outputs = []
-    hp_probe = any(control_exists(card, c) for c in [
+    hp_probe = any(plan.has(c) for c in [
         "Left HP Mixer DACL1", "Right HP Mixer DACR1", "HP DAC"
     ])
     if hp_probe:
         outputs.append("hp")
-    line_probe = any(control_exists(card, c) for c in [
+    line_probe = any(plan.has(c) for c in [
         "Left Line Mixer DACL1", "Right Line Mixer DACR1", "Line DAC"
     ])
     if line_probe:
@@ -187,77 +338,64 @@ STATUS_CONTROLS = [
     "HPCOM PGA Bypass",
 ]
 
-def set_digital_volume(card: int, out: str, percent: int) -> bool:
+def set_digital_volume(plan: MixerPlan, out: str, percent: int) -> bool:
     percent = max(0, min(100, percent))
     applied = False
     for ctrl in VOLUME_CANDS[out]:
-        if control_exists(card, ctrl) and is_percent_fader(card, ctrl):
-            if percent <= 0:
-                try:
-                    sset(card, ctrl, "0%", "mute")
-                except RuntimeError:
-                    sset(card, ctrl, "0%")
-            else:
-                try:
-                    sset(card, ctrl, f"{percent}%", "unmute")
-                except RuntimeError:
-                    sset(card, ctrl, f"{percent}%")
+        if plan.has(ctrl) and plan.is_percent_fader(ctrl):
+            values = ["0%", "mute"] if percent <= 0 else [f"{percent}%", "unmute"]
+            if not plan.can_mute(ctrl):
+                values = values[:1]
+            plan.set(ctrl, *values)
             applied = True
     if not applied and percent > 0:
         raise RuntimeError(f"Nenašel jsem vhodný digitální fader pro {out.upper()} (zkusím HP/Line/PCM).")
     return applied
 
 
-def set_analog_volume(card: int, out: str, percent: int) -> bool:
+def set_analog_volume(plan: MixerPlan, out: str, percent: int) -> bool:
     percent = max(0, min(100, percent))
     controls = ANALOG_GAIN_CTRLS.get(out, [])
     found = False
     for ctrl in controls:
-        if control_exists(card, ctrl):
-            sset(card, ctrl, f"{percent}%")
+        if plan.has(ctrl):
+            plan.set(ctrl, f"{percent}%")
             found = True
     if not found and controls:
         raise RuntimeError(f"Nenašel jsem analogový gain pro {out.upper()} ({', '.join(controls)}).")
     return found
 
 # ---------- routing helpers (disable list if exists) ----------
-def _off_all(card, ctrls):
-    for c in ctrls:
-        if control_exists(card, c): sset(card, c, "off")
-
-def route_system_to(card: int, out: str):
+def _route_hpcom(plan: MixerPlan, off, on):
+    if any(plan.has(c) for c in HPCOM_DACL):
+        plan.off_all(off)
+        for ctrl in on:
+            if plan.has(ctrl):
+                plan.set(ctrl, "on")
+
+def route_system_to(plan: MixerPlan, out: str):
     # Systemový vstup = DAC (DACL1/DACR1) → HP/Line
     if out == "hp":
-        _off_all(card, [
+        plan.off_all([
             "Left HP Mixer Line2L Bypass","Left HP Mixer Line2R Bypass",
             "Left HP Mixer PGAL Bypass","Left HP Mixer PGAR Bypass",
             "Right HP Mixer Line2L Bypass","Right HP Mixer Line2R Bypass",
             "Right HP Mixer PGAL Bypass","Right HP Mixer PGAR Bypass",
         ])
-        for c in ["Left HP Mixer DACL1","Right HP Mixer DACR1"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
+        plan.require_on(["Left HP Mixer DACL1","Right HP Mixer DACR1"])
     else:
-        _off_all(card, [
+        plan.off_all([
             "Left Line Mixer Line2L Bypass","Left Line Mixer Line2R Bypass",
             "Left Line Mixer PGAL Bypass","Left Line Mixer PGAR Bypass",
             "Right Line Mixer Line2L Bypass","Right Line Mixer Line2R Bypass",
             "Right Line Mixer PGAL Bypass","Right Line Mixer PGAR Bypass",
         ])
-        for c in ["Left Line Mixer DACL1","Right Line Mixer DACR1"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
-    if any(control_exists(card, c) for c in HPCOM_DACL):
-        for ctrl in HPCOM_LINE_BYP + HPCOM_PGA_BYP:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "off")
-        for ctrl in HPCOM_DACL:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "on")
-
-def route_line2_to(card: int, out: str):
+        plan.require_on(["Left Line Mixer DACL1","Right Line Mixer DACR1"])
+    _route_hpcom(plan, HPCOM_LINE_BYP + HPCOM_PGA_BYP, HPCOM_DACL)
+
+def route_line2_to(plan: MixerPlan, out: str):
     if out == "hp":
-        _off_all(card, [
+        plan.off_all([
             "Left HP Mixer DACL1","Left HP Mixer DACR1",
             "Left HP Mixer PGAL Bypass","Left HP Mixer PGAR Bypass",
             "Left HP Mixer Line2R Bypass",
@@ -265,11 +403,9 @@ def route_line2_to(card: int, out: str):
             "Right HP Mixer PGAL Bypass","Right HP Mixer PGAR Bypass",
             "Right HP Mixer Line2L Bypass",
         ])
-        for c in ["Left HP Mixer Line2L Bypass","Right HP Mixer Line2R Bypass"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
+        plan.require_on(["Left HP Mixer Line2L Bypass","Right HP Mixer Line2R Bypass"])
     else:
-        _off_all(card, [
+        plan.off_all([
             "Left Line Mixer DACL1","Left Line Mixer DACR1",
             "Left Line Mixer PGAL Bypass","Left Line Mixer PGAR Bypass",
             "Left Line Mixer Line2R Bypass",
@@ -277,140 +413,94 @@ def route_line2_to(card: int, out: str):
             "Right Line Mixer PGAL Bypass","Right Line Mixer PGAR Bypass",
             "Right Line Mixer Line2L Bypass",
         ])
-        for c in ["Left Line Mixer Line2L Bypass","Right Line Mixer Line2R Bypass"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
-    if any(control_exists(card, c) for c in HPCOM_DACL):
-        for ctrl in HPCOM_DACL + HPCOM_LINE_BYP:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "off")
-        for ctrl in HPCOM_PGA_BYP:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "on")
-
-def route_line1_to(card: int, out: str):
-    # Line1 nejdřív do PGA, potom do HP/Line
-    for c in ["Left PGA Mixer Line1L","Right PGA Mixer Line1R"]:
-        if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-        sset(card, c, "on")
-    _off_all(card, [
-        "Left PGA Mixer Line1R","Left PGA Mixer Line2L","Left PGA Mixer Mic3L","Left PGA Mixer Mic3R",
-        "Right PGA Mixer Line1L","Right PGA Mixer Line2R","Right PGA Mixer Mic3L","Right PGA Mixer Mic3R",
-    ])
+        plan.require_on(["Left Line Mixer Line2L Bypass","Right Line Mixer Line2R Bypass"])
+    _route_hpcom(plan, HPCOM_DACL + HPCOM_LINE_BYP, HPCOM_PGA_BYP)
+
+def _route_pga_to(plan: MixerPlan, out: str):
     if out == "hp":
-        _off_all(card, [
+        plan.off_all([
             "Left HP Mixer DACL1","Left HP Mixer DACR1",
             "Left HP Mixer Line2L Bypass","Left HP Mixer Line2R Bypass","Left HP Mixer PGAR Bypass",
             "Right HP Mixer DACL1","Right HP Mixer DACR1",
             "Right HP Mixer Line2L Bypass","Right HP Mixer Line2R Bypass","Right HP Mixer PGAL Bypass",
         ])
-        for c in ["Left HP Mixer PGAL Bypass","Right HP Mixer PGAR Bypass"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
+        plan.require_on(["Left HP Mixer PGAL Bypass","Right HP Mixer PGAR Bypass"])
     else:
-        _off_all(card, [
+        plan.off_all([
             "Left Line Mixer DACL1","Left Line Mixer DACR1",
             "Left Line Mixer Line2L Bypass","Left Line Mixer Line2R Bypass","Left Line Mixer PGAR Bypass",
             "Right Line Mixer DACL1","Right Line Mixer DACR1",
             "Right Line Mixer Line2L Bypass","Right Line Mixer Line2R Bypass","Right Line Mixer PGAL Bypass",
         ])
-        for c in ["Left Line Mixer PGAL Bypass","Right Line Mixer PGAR Bypass"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
-    if any(control_exists(card, c) for c in HPCOM_DACL):
-        for ctrl in HPCOM_DACL + HPCOM_LINE_BYP:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "off")
-        for ctrl in HPCOM_PGA_BYP:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "on")
-
-def route_mic_to(card: int, out: str):
+        plan.require_on(["Left Line Mixer PGAL Bypass","Right Line Mixer PGAR Bypass"])
+    _route_hpcom(plan, HPCOM_DACL + HPCOM_LINE_BYP, HPCOM_PGA_BYP)
+
+def route_line1_to(plan: MixerPlan, out: str):
+    # Line1 nejdřív do PGA, potom do HP/Line
+    plan.require_on(["Left PGA Mixer Line1L","Right PGA Mixer Line1R"])
+    plan.off_all([
+        "Left PGA Mixer Line1R","Left PGA Mixer Line2L","Left PGA Mixer Mic3L","Left PGA Mixer Mic3R",
+        "Right PGA Mixer Line1L","Right PGA Mixer Line2R","Right PGA Mixer Mic3L","Right PGA Mixer Mic3R",
+    ])
+    _route_pga_to(plan, out)
+
+def route_mic_to(plan: MixerPlan, out: str):
     # Mic3L/Mic3R do PGA → HP/Line
-    for c in ["Left PGA Mixer Mic3L","Right PGA Mixer Mic3R"]:
-        if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-        sset(card, c, "on")
-    _off_all(card, [
+    plan.require_on(["Left PGA Mixer Mic3L","Right PGA Mixer Mic3R"])
+    plan.off_all([
         "Left PGA Mixer Line1L","Left PGA Mixer Line1R","Left PGA Mixer Line2L","Left PGA Mixer Mic3R",
         "Right PGA Mixer Line1L","Right PGA Mixer Line1R","Right PGA Mixer Line2R","Right PGA Mixer Mic3L",
     ])
-    if out == "hp":
-        _off_all(card, [
-            "Left HP Mixer DACL1","Left HP Mixer DACR1",
-            "Left HP Mixer Line2L Bypass","Left HP Mixer Line2R Bypass","Left HP Mixer PGAR Bypass",
-            "Right HP Mixer DACL1","Right HP Mixer DACR1",
-            "Right HP Mixer Line2L Bypass","Right HP Mixer Line2R Bypass","Right HP Mixer PGAL Bypass",
-        ])
-        for c in ["Left HP Mixer PGAL Bypass","Right HP Mixer PGAR Bypass"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
-    else:
-        _off_all(card, [
-            "Left Line Mixer DACL1","Left Line Mixer DACR1",
-            "Left Line Mixer Line2L Bypass","Left Line Mixer Line2R Bypass","Left Line Mixer PGAR Bypass",
-            "Right Line Mixer DACL1","Right Line Mixer DACR1",
-            "Right Line Mixer Line2L Bypass","Right Line Mixer Line2R Bypass","Right Line Mixer PGAL Bypass",
-        ])
-        for c in ["Left Line Mixer PGAL Bypass","Right Line Mixer PGAR Bypass"]:
-            if not control_exists(card, c): raise RuntimeError(f"Chybí ovladač: {c}")
-            sset(card, c, "on")
-    if any(control_exists(card, c) for c in HPCOM_DACL):
-        for ctrl in HPCOM_DACL + HPCOM_LINE_BYP:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "off")
-        for ctrl in HPCOM_PGA_BYP:
-            if control_exists(card, ctrl):
-                sset(card, ctrl, "on")
-
-def apply_input(card: int, src: str, volume: Optional[int]):
-    outs = detect_outputs(card)
-    if src not in {"line1", "line2", "mic", "system"}:
-        raise RuntimeError(f"Neznámý vstup '{src}'.")
-
-    target_volume = volume if volume is not None else (DEFAULT_DIGITAL_VOLUME if src == "system" else DEFAULT_ANALOG_VOLUME)
+    _route_pga_to(plan, out)
 
+def _plan_volume(plan: MixerPlan, outs: list[str], src: str, percent: int):
     for out in outs:
-        if src == "line2":
-            route_line2_to(card, out)
-        elif src == "line1":
-            route_line1_to(card, out)
-        elif src == "mic":
-            route_mic_to(card, out)
-        elif src == "system":
-            route_system_to(card, out)
         if src == "system":
             try:
-                set_digital_volume(card, out, target_volume)
+                set_digital_volume(plan, out, percent)
             except RuntimeError as exc:
                 if len(outs) == 1:
                     raise
                 print(f"VAROVÁNÍ: {exc}", file=sys.stderr)
-            set_analog_volume(card, out, 0)
+            set_analog_volume(plan, out, 0)
         else:
-            set_digital_volume(card, out, 0)
+            set_digital_volume(plan, out, 0)
             try:
-                set_analog_volume(card, out, target_volume)
+                set_analog_volume(plan, out, percent)
             except RuntimeError as exc:
                 if len(outs) == 1:
                     raise
                 print(f"VAROVÁNÍ: {exc}", file=sys.stderr)
 
+def apply_input(card: int, src: str, volume: Optional[int]):
+    if src not in {"line1", "line2", "mic", "system"}:
+        raise RuntimeError(f"Neznámý vstup '{src}'.")
+    plan = MixerPlan(card)
+    outs = detect_outputs(plan)
+
+    target_volume = volume if volume is not None else (DEFAULT_DIGITAL_VOLUME if src == "system" else DEFAULT_ANALOG_VOLUME)
+
+    for out in outs:
+        if src == "line2":
+            route_line2_to(plan, out)
+        elif src == "line1":
+            route_line1_to(plan, out)
+        elif src == "mic":
+            route_mic_to(plan, out)
+        elif src == "system":
+            route_system_to(plan, out)
+    _plan_volume(plan, outs, src, target_volume)
+    plan.apply()
+
     msg = f"OK: {src} → {', '.join(o.upper() for o in outs)}"
     if target_volume is not None:
         msg += f", hlasitost {max(0, min(100, target_volume))}%"
     print(msg)
 
 
-def _is_switch_on(card: int, ctrl: str) -> bool:
-    try:
-        out = sget(card, ctrl)
-    except RuntimeError:
-        return False
-    return "[on]" in out.lower()
-
-
-def detect_active_source(card: int) -> Optional[str]:
-    if any(_is_switch_on(card, c) for c in [
+def detect_active_source(card: int, controls: Optional[MixerSnapshot] = None) -> Optional[str]:
+    controls = snapshot(card) if controls is None else controls
+    if any(controls.is_on(c) for c in [
         "Left HP Mixer DACL1",
         "Right HP Mixer DACR1",
         "Left Line Mixer DACL1",
@@ -419,7 +509,7 @@ def detect_active_source(card: int) -> Optional[str]:
         "Right HPCOM Mixer DACR1",
     ]):
         return "system"
-    if any(_is_switch_on(card, c) for c in [
+    if any(controls.is_on(c) for c in [
         "Left HP Mixer Line2L Bypass",
         "Right HP Mixer Line2R Bypass",
         "Left Line Mixer Line2L Bypass",
@@ -428,12 +518,12 @@ def detect_active_source(card: int) -> Optional[str]:
         "Right HPCOM Mixer Line2R Bypass",
     ]):
         return "line2"
-    if any(_is_switch_on(card, c) for c in [
+    if any(controls.is_on(c) for c in [
         "Left PGA Mixer Mic3L",
         "Right PGA Mixer Mic3R",
     ]):
         return "mic"
-    if any(_is_switch_on(card, c) for c in [
+    if any(controls.is_on(c) for c in [
         "Left PGA Mixer Line1L",
         "Right PGA Mixer Line1R",
     ]):
@@ -442,61 +532,29 @@ def detect_active_source(card: int) -> Optional[str]:
 
 
 def apply_volume(card: int, percent: int):
-    outs = detect_outputs(card)
-    src = detect_active_source(card)
+    plan = MixerPlan(card)
+    outs = detect_outputs(plan)
+    src = detect_active_source(card, plan.controls)
     if src is None:
         raise RuntimeError("Nepodařilo se zjistit aktivní vstup, zkus nejprve přepnout konkrétní profil.")
     applied = max(0, min(100, percent))
-    for out in outs:
-        if src == "system":
-            try:
-                set_digital_volume(card, out, applied)
-            except RuntimeError as exc:
-                if len(outs) == 1:
-                    raise
-                print(f"VAROVÁNÍ: {exc}", file=sys.stderr)
-            set_analog_volume(card, out, 0)
-        else:
-            set_digital_volume(card, out, 0)
-            try:
-                set_analog_volume(card, out, applied)
-            except RuntimeError as exc:
-                if len(outs) == 1:
-                    raise
-                print(f"VAROVÁNÍ: {exc}", file=sys.stderr)
+    _plan_volume(plan, outs, src, applied)
+    plan.apply()
     print(f"OK: hlasitost {applied}% ({src}) na {', '.join(o.upper() for o in outs)}")
 
 
-def _summarize_ctrl(card: int, ctrl: str) -> Optional[str]:
-    if not control_exists(card, ctrl):
-        return None
-    out = sget(card, ctrl)
-    state = None
-    for line in out.splitlines():
-        text = line.strip()
-        if text.startswith("Item0:"):
-            state = text
-            break
-        if "values=" in text or " : " in text:
-            state = text
-    if state is None:
-        lines = out.splitlines()
-        if lines:
-            state = lines[-1].strip()
-    return f"{ctrl}: {state}" if state else f"{ctrl}: {out.strip()}"
-
-
 def print_status(card: int):
-    outs = detect_outputs(card)
+    controls = snapshot(card)
+    outs = detect_outputs(MixerPlan(card, controls))
     print(f"Karta {card}, dostupné výstupy: {', '.join(o.upper() for o in outs)}")
     seen = set()
     for ctrl in STATUS_CONTROLS + VOLUME_CANDS["hp"] + VOLUME_CANDS["line"]:
         if ctrl in seen:
             continue
         seen.add(ctrl)
-        summary = _summarize_ctrl(card, ctrl)
-        if summary:
-            print(" -", summary)
+        state = controls.state(ctrl)
+        if state is not None:
+            print(" -", f"{ctrl}: {state}")
 
 # ---------- public command ----------
 def main():
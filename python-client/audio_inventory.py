@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Audio device inventory read from /proc/asound and the ALSA control devices.
+
+Builds the playback/capture device list that ``aplay -l``/``arecord -l`` print
+and the control names ``amixer controls`` prints, without starting either.
+The result is cached on disk and reused until the card list changes.
+PulseAudio data still needs ``pactl`` and stays with the caller.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import fcntl
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+ROOT_DIR = Path(__file__).resolve().parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from alsa_aic3107_ctrl import parse_proc_cards  # noqa: E402
+from cache_paths import cache_path  # noqa: E402
+
+CACHE_VERSION = 1
+_PROC_PCM_RE = re.compile(r"^(\d+)-(\d+):\s*(.*?)\s*:\s*(.*?)\s*((?::\s*(?:playback|capture)\s+\d+\s*)+)$")
+
+
+class _ElemId(ctypes.Structure):
+    _fields_ = [
+        ("numid", ctypes.c_uint),
+        ("iface", ctypes.c_int),
+        ("device", ctypes.c_uint),
+        ("subdevice", ctypes.c_uint),
+        ("name", ctypes.c_char * 44),
+        ("index", ctypes.c_uint),
+    ]
+
+
+class _ElemList(ctypes.Structure):
+    _fields_ = [
+        ("offset", ctypes.c_uint),
+        ("space", ctypes.c_uint),
+        ("used", ctypes.c_uint),
+        ("count", ctypes.c_uint),
+        ("pids", ctypes.c_void_p),
+        ("reserved", ctypes.c_ubyte * 50),
+    ]
+
+
+# SNDRV_CTL_IOCTL_ELEM_LIST = _IOWR('U', 0x10, struct snd_ctl_elem_list)
+ELEM_LIST_IOCTL = (3 << 30) | (ctypes.sizeof(_ElemList) << 16) | (ord("U") << 8) | 0x10
+
+
+def read_control_names(device: str | Path) -> Optional[list[str]]:
+    """Control element names of one card via SNDRV_CTL_IOCTL_ELEM_LIST, or None if unavailable."""
+
+    try:
+        fd = os.open(device, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return None
+    try:
+        header = _ElemList()
+        fcntl.ioctl(fd, ELEM_LIST_IOCTL, header, True)
+        count = header.count
+        if count == 0:
+            return []
+        ids = (_ElemId * count)()
+        request = _ElemList(space=count, pids=ctypes.addressof(ids))
+        fcntl.ioctl(fd, ELEM_LIST_IOCTL, request, True)
+        return [ids[i].name.decode("utf-8", errors="replace") for i in range(min(request.used, count))]
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def parse_proc_pcm(text: str) -> list[dict[str, Any]]:
+    """Parse ``/proc/asound/pcm`` lines such as ``00-00: HiFi id : HiFi name : playback 1 : capture 1``."""
+
+    streams: list[dict[str, Any]] = []
+    for line in text.splitlines():
+        match = _PROC_PCM_RE.match(line.strip())
+        if not match:
+            continue
+        directions = dict(re.findall(r"(playback|capture)\s+(\d+)", match.group(5)))
+        streams.append(
+            {
+                "card": int(match.group(1)),
+                "device": int(match.group(2)),
+                "id": match.group(3),
+                "name": match.group(4),
+                "playback": int(directions.get("playback", 0)),
+                "capture": int(directions.get("capture", 0)),
+            }
+        )
+    return streams
+
+
+def default_cache_path() -> Optional[Path]:
+    """``AUDIO_INVENTORY_CACHE`` overrides the location; an empty value disables the cache."""
+
+    return cache_path("AUDIO_INVENTORY_CACHE", "audio_inventory.json")
+
+
+class AudioInventory:
+    """Playback/capture devices and mixer controls in the ``mixer_control.py devices`` format."""
+
+    def __init__(
+        self,
+        proc_root: str | Path = "/proc/asound",
+        dev_root: str | Path = "/dev/snd",
+        cache_path: Optional[Path] = None,
+        use_cache: bool = True,
+    ) -> None:
+        self.proc_root = Path(proc_root)
+        self.dev_root = Path(dev_root)
+        self.cache_path = (cache_path or default_cache_path()) if use_cache else None
+
+    def available(self) -> bool:
+        return (self.proc_root / "cards").is_file()
+
+    def _stamp(self, path: Path) -> list[int]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return [0, 0]
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def fingerprint(self, cards_text: str) -> str:
+        """Cache key from the mtimes of the /proc files and control nodes.
+
+        procfs keeps an entry's mtime across content changes, so the card list
+        itself is hashed as well; hot-plugging a card also adds a
+        ``controlC*`` node and bumps the mtime of ``/dev/snd``.
+        """
+
+        try:
+            controls = sorted(self.dev_root.glob("controlC*"))
+        except OSError:
+            controls = []
+        payload = {
+            "cards": self._stamp(self.proc_root / "cards"),
+            "pcm": self._stamp(self.proc_root / "pcm"),
+            "dev": self._stamp(self.dev_root),
+            "controls": {path.name: self._stamp(path) for path in controls},
+            "list": hashlib.sha1(cards_text.encode("utf-8")).hexdigest(),
+        }
+        return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _load_cache(self, fingerprint: str) -> Optional[dict[str, Any]]:
+        if self.cache_path is None:
+            return None
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or data.get("fingerprint") != fingerprint:
+            return None
+        alsa = data.get("alsa")
+        return alsa if isinstance(alsa, dict) else None
+
+    def _store_cache(self, fingerprint: str, alsa: dict[str, Any]) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_name(f".{self.cache_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps({"version": CACHE_VERSION, "fingerprint": fingerprint, "alsa": alsa}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    def alsa(self, controls_fallback: Optional[Callable[[int], list[str]]] = None) -> dict[str, Any]:
+        """``playback_devices``/``capture_devices`` with their card's control names.
+
+        ``controls_fallback`` is called for cards whose control device cannot
+        be opened (e.g. missing permissions); its result is not cached.
+        """
+
+        cards_text = (self.proc_root / "cards").read_text(encoding="utf-8", errors="replace")
+        fingerprint = self.fingerprint(cards_text)
+        cached = self._load_cache(fingerprint)
+        if cached is not None:
+            return cached
+
+        cards = {card.index: card for card in parse_proc_cards(cards_text)}
+        try:
+            pcm_text = (self.proc_root / "pcm").read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            pcm_text = ""
+        controls: dict[int, list[str]] = {}
+        complete = True
+        for index in cards:
+            names = read_control_names(self.dev_root / f"controlC{index}")
+            if names is None:
+                complete = False
+                names = controls_fallback(index) if controls_fallback is not None else []
+            controls[index] = names
+
+        playback: list[dict[str, Any]] = []
+        capture: list[dict[str, Any]] = []
+        for stream in parse_proc_pcm(pcm_text):
+            card = cards.get(stream["card"])
+            device = {
+                "card": stream["card"],
+                "device": stream["device"],
+                "card_name": card.card_id if card else "",
+                "card_description": card.name if card else "",
+                "device_name": stream["id"],
+                "device_description": stream["name"],
+                "controls": list(controls.get(stream["card"], [])),
+            }
+            if stream["playback"]:
+                playback.append(device)
+            if stream["capture"]:
+                capture.append(dict(device, controls=list(device["controls"])))
+
+        alsa = {"playback_devices": playback, "capture_devices": capture}
+        if complete:
+            self._store_cache(fingerprint, alsa)
+        return alsa
+
+
+if __name__ == "__main__":  # pragma: no cover - manual check
+    print(json.dumps(AudioInventory().alsa(), ensure_ascii=False, indent=2))
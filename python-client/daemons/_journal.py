@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+SEGMENT_PREFIX = "journal-"
+SEGMENT_SUFFIX = ".log"
+
+
+class DispatchJournal:
+    """Append-only, segment-based journal of pending dispatch entries.
+
+    Writes are handed to a background thread which batches everything queued
+    since its last pass into one write + ``fsync`` (group commit), so callers on
+    the frame-read path never block on disk I/O. Every entry is an ``add`` or an
+    ``ack`` line; segments are rotated by size and deleted from the oldest end
+    once every entry they hold has been acknowledged.
+
+    A batch whose write or ``fsync`` fails is not counted as committed: the
+    journal moves to a fresh segment and retries it every ``retry_interval``,
+    so :meth:`sync` only reports success once the entries are on disk.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_bytes: int = 1024 * 1024,
+        commit_interval: float = 0.005,
+        retry_interval: float = 0.5,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._directory = Path(directory)
+        self._segment_bytes = max(4096, segment_bytes)
+        self._commit_interval = max(0.0, commit_interval)
+        self._retry_interval = max(0.01, retry_interval)
+        self._logger = logger or logging.getLogger(__name__)
+        self._queue: "queue.Queue[dict[str, Any] | None]" = queue.Queue()
+        self._retry: list[dict[str, Any]] = []
+        self._segments: list[Path] = []
+        self._live: dict[Path, set[str]] = {}
+        self._owner: dict[str, Path] = {}
+        self._handle: Optional[Any] = None
+        self._thread: Optional[threading.Thread] = None
+        self._flushed = threading.Condition()
+        self._submitted = 0
+        self._committed = 0
+        self._dropped = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def open(self) -> list[dict[str, Any]]:
+        """Load existing segments and return unacknowledged entries in append order."""
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        pending: dict[str, dict[str, Any]] = {}
+        for segment in sorted(self._directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")):
+            self._segments.append(segment)
+            self._live[segment] = set()
+            for entry in self._read_segment(segment):
+                entry_id = entry.get("id")
+                if not isinstance(entry_id, str):
+                    continue
+                if entry.get("op") == "add":
+                    # A retried batch can repeat an add that a failed fsync had left behind.
+                    previous = self._owner.get(entry_id)
+                    if previous is not None:
+                        self._live[previous].discard(entry_id)
+                    pending[entry_id] = entry
+                    self._live[segment].add(entry_id)
+                    self._owner[entry_id] = segment
+                elif entry.get("op") == "ack":
+                    pending.pop(entry_id, None)
+                    owner = self._owner.pop(entry_id, None)
+                    if owner is not None:
+                        self._live[owner].discard(entry_id)
+
+        self._open_segment()
+        self._compact()
+        self._thread = threading.Thread(target=self._run, name="jsvv-journal", daemon=True)
+        self._thread.start()
+        return list(pending.values())
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout=5.0)
+        self._thread = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+    def append(self, entry_id: str, record: dict[str, Any]) -> None:
+        self._submit({**record, "op": "add", "id": entry_id})
+
+    def ack(self, entry_id: str) -> None:
+        self._submit({"op": "ack", "id": entry_id})
+
+    def sync(self, timeout: float = 5.0) -> bool:
+        """Block until everything submitted so far has been fsynced.
+
+        Returns False on timeout (e.g. while writes keep failing) or when an
+        entry submitted since the previous call could not be serialised.
+        """
+
+        with self._flushed:
+            target = self._submitted
+            done = self._flushed.wait_for(lambda: self._committed >= target, timeout=timeout)
+            dropped, self._dropped = self._dropped, 0
+            return done and not dropped
+
+    def _submit(self, entry: dict[str, Any]) -> None:
+        with self._flushed:
+            self._submitted += 1
+        self._queue.put(entry)
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        running = True
+        while running:
+            try:
+                entry = self._queue.get(timeout=self._retry_interval if self._retry else None)
+            except queue.Empty:
+                entry = {}
+            batch, self._retry = self._retry, []
+            if entry is None:
+                running = False
+            elif entry:
+                batch.append(entry)
+                if self._commit_interval:
+                    time.sleep(self._commit_interval)
+            while True:
+                try:
+                    extra = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    running = False
+                    continue
+                batch.append(extra)
+            if batch:
+                self._commit(batch)
+
+    def _commit(self, batch: list[dict[str, Any]]) -> None:
+        lines: list[str] = []
+        written: list[dict[str, Any]] = []
+        dropped = 0
+        for entry in batch:
+            try:
+                lines.append(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+            except (TypeError, ValueError) as exc:
+                self._logger.error("Journal entry %s not serialisable: %s", entry.get("id"), exc)
+                dropped += 1
+                continue
+            written.append(entry)
+        try:
+            if self._handle is None:
+                self._open_segment()
+            assert self._handle is not None
+            self._handle.write("".join(f"{line}\n" for line in lines))
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        except OSError as exc:
+            self._logger.error("Journal write failed, retrying %d entries: %s", len(written), exc)
+            self._retry = written + self._retry
+            self._abandon_segment()
+            if dropped:
+                with self._flushed:
+                    self._committed += dropped
+                    self._dropped += dropped
+                    self._flushed.notify_all()
+            return
+
+        active = self._segments[-1]
+        for entry in written:
+            entry_id = entry["id"]
+            if entry["op"] == "add":
+                self._live[active].add(entry_id)
+                self._owner[entry_id] = active
+            else:
+                owner = self._owner.pop(entry_id, None)
+                if owner is not None:
+                    self._live[owner].discard(entry_id)
+
+        try:
+            if self._handle is not None and self._handle.tell() >= self._segment_bytes:
+                self._handle.close()
+                self._open_segment()
+        except OSError as exc:
+            self._logger.error("Journal rotation failed: %s", exc)
+        self._compact()
+
+        with self._flushed:
+            self._committed += len(batch)
+            self._dropped += dropped
+            self._flushed.notify_all()
+
+    def _abandon_segment(self) -> None:
+        """Stop appending to a segment that may end in a torn line; the next commit opens a new one."""
+
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+    def _open_segment(self) -> None:
+        last_index = 0
+        if self._segments:
+            stem = self._segments[-1].name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+            last_index = int(stem) if stem.isdigit() else len(self._segments)
+        segment = self._directory / f"{SEGMENT_PREFIX}{last_index + 1:08d}{SEGMENT_SUFFIX}"
+        self._handle = open(segment, "a", encoding="utf-8")
+        self._segments.append(segment)
+        self._live[segment] = set()
+
+    def _compact(self) -> None:
+        # Only a fully acknowledged *prefix* may go: a later segment can hold acks
+        # for entries of an earlier one, so deleting it first would resurrect them.
+        while len(self._segments) > 1 and not self._live[self._segments[0]]:
+            segment = self._segments.pop(0)
+            self._live.pop(segment, None)
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                self._logger.warning("Unable to remove journal segment %s: %s", segment, exc)
+
+    def _read_segment(self, segment: Path) -> list[dict[str, Any]]:
+        entries: list[dict[str, Any]] = []
+        try:
+            with open(segment, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn tail from a crash mid-write; everything before it is intact.
+                        self._logger.warning("Skipping corrupt journal line in %s", segment.name)
+                        continue
+                    if isinstance(entry, dict):
+                        entries.append(entry)
+        except OSError as exc:
+            self._logger.error("Unable to read journal segment %s: %s", segment, exc)
+        return entries
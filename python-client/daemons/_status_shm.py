@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Fixed little-endian layout shared with App\Services\ControlChannelStatusSnapshot (PHP).
+#
+#   0  4s   magic "RZCS"
+#   4  H    layout version
+#   6  H    reserved
+#   8  I    sequence (odd while the writer is mid-update)
+#  12  B    state code (see STATE_CODES)
+#  13  B    flags (see FLAG_*)
+#  14  H    reserved
+#  16  d    last poll (unix time, 0 = never)
+#  24  d    updated at (unix time)
+#  32  H    STATUS register
+#  34  H    ERROR register
+#  36  I    writer pid
+#  40  H    length of last error in bytes
+#  42  ...  last error (UTF-8, truncated to MAX_ERROR_BYTES)
+MAGIC = b"RZCS"
+LAYOUT_VERSION = 1
+SNAPSHOT_SIZE = 256
+HEADER = struct.Struct("<4sHHIBBHddHHIH")
+SEQUENCE = struct.Struct("<I")
+SEQUENCE_OFFSET = 8
+BODY_OFFSET = 12
+MAX_ERROR_BYTES = SNAPSHOT_SIZE - HEADER.size
+
+STATE_CODES = {"IDLE": 0, "TRANSMITTING": 1, "PAUSED": 2, "STOPPED": 3}
+STATE_NAMES = {code: name for name, code in STATE_CODES.items()}
+
+FLAG_DRY_RUN = 0x01
+FLAG_STATUS_VALID = 0x02
+FLAG_ERROR_VALID = 0x04
+FLAG_HAS_LAST_ERROR = 0x08
+
+
+class StatusSnapshotWriter:
+    """Publish the worker status into a memory-mapped file guarded by a seqlock.
+
+    The writer bumps the sequence to an odd value, rewrites the body and bumps
+    it to the next even value; readers retry whenever the sequence was odd or
+    changed while they copied the body. There is a single writer (the event
+    loop), so no lock is needed on this side.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._mmap: Optional[mmap.mmap] = None
+        self._sequence = 0
+
+    def open(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            os.ftruncate(fd, SNAPSHOT_SIZE)
+            self._mmap = mmap.mmap(fd, SNAPSHOT_SIZE, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        finally:
+            os.close(fd)
+        self._sequence = SEQUENCE.unpack_from(self._mmap, SEQUENCE_OFFSET)[0] & ~1
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def publish(
+        self,
+        *,
+        state: str,
+        dry_run: bool,
+        last_poll: float | None,
+        status_register: int | None,
+        error_register: int | None,
+        last_error: str | None,
+    ) -> None:
+        if self._mmap is None:
+            return
+        flags = FLAG_DRY_RUN if dry_run else 0
+        if status_register is not None:
+            flags |= FLAG_STATUS_VALID
+        if error_register is not None:
+            flags |= FLAG_ERROR_VALID
+        error_bytes = b""
+        if last_error:
+            flags |= FLAG_HAS_LAST_ERROR
+            error_bytes = last_error.encode("utf-8")[:MAX_ERROR_BYTES]
+
+        header = HEADER.pack(
+            MAGIC,
+            LAYOUT_VERSION,
+            0,
+            0,
+            STATE_CODES.get(state.upper(), 0xFF),
+            flags,
+            0,
+            last_poll or 0.0,
+            time.time(),
+            (status_register or 0) & 0xFFFF,
+            (error_register or 0) & 0xFFFF,
+            os.getpid(),
+            len(error_bytes),
+        )
+        body = header[BODY_OFFSET:] + error_bytes
+
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        SEQUENCE.pack_into(self._mmap, SEQUENCE_OFFSET, self._sequence)
+        self._mmap[0:SEQUENCE_OFFSET] = header[0:SEQUENCE_OFFSET]
+        self._mmap[BODY_OFFSET:BODY_OFFSET + len(body)] = body
+        self._sequence = (self._sequence + 1) & 0xFFFFFFFF
+        SEQUENCE.pack_into(self._mmap, SEQUENCE_OFFSET, self._sequence)
+
+
+def read_status_snapshot(path: Path, *, attempts: int = 100) -> dict[str, Any] | None:
+    """Return a consistent copy of the published snapshot, or None if unavailable."""
+
+    try:
+        with open(path, "rb") as handle:
+            mapped = mmap.mmap(handle.fileno(), SNAPSHOT_SIZE, mmap.MAP_SHARED, mmap.PROT_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        for _ in range(max(1, attempts)):
+            before = SEQUENCE.unpack_from(mapped, SEQUENCE_OFFSET)[0]
+            if before & 1:
+                continue
+            raw = mapped[:SNAPSHOT_SIZE]
+            after = SEQUENCE.unpack_from(mapped, SEQUENCE_OFFSET)[0]
+            if before == after:
+                return _decode(raw)
+        return None
+    finally:
+        mapped.close()
+
+
+def _decode(raw: bytes) -> dict[str, Any] | None:
+    (
+        magic,
+        version,
+        _reserved,
+        sequence,
+        state_code,
+        flags,
+        _reserved2,
+        last_poll,
+        updated_at,
+        status_register,
+        error_register,
+        pid,
+        error_length,
+    ) = HEADER.unpack_from(raw)
+    if magic != MAGIC or version != LAYOUT_VERSION:
+        return None
+    last_error = None
+    if flags & FLAG_HAS_LAST_ERROR:
+        last_error = raw[HEADER.size:HEADER.size + error_length].decode("utf-8", errors="replace")
+    return {
+        "sequence": sequence,
+        "state": STATE_NAMES.get(state_code, "UNKNOWN"),
+        "dryRun": bool(flags & FLAG_DRY_RUN),
+        "lastPollAt": last_poll or None,
+        "updatedAt": updated_at,
+        "statusRegister": status_register if flags & FLAG_STATUS_VALID else None,
+        "errorRegister": error_register if flags & FLAG_ERROR_VALID else None,
+        "lastError": last_error,
+        "pid": pid,
+    }
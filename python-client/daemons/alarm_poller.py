@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""Poll Modbus alarm buffer and forward entries to Laravel artisan."""
+"""Poll Modbus alarm buffer and forward entries to Laravel artisan.
+
+The port is shared with ``modbus_control.py`` and the other daemons: every
+read is arbitrated per transaction at background priority instead of holding
+a lock for the whole process lifetime.
+"""
 
 from __future__ import annotations
 
@@ -10,7 +15,6 @@ import signal
 import subprocess
 import sys
 import time
-from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
@@ -20,13 +24,11 @@ if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 try:
-    from modbus_audio import ModbusAudioClient, ModbusAudioError, SerialSettings  # type: ignore
+    from modbus_audio import PRIORITY_BACKGROUND, ModbusAudioClient, ModbusAudioError, SerialSettings  # type: ignore
     from modbus_audio import constants as modbus_constants  # type: ignore
 except Exception as exc:  # pragma: no cover - optional dependency
     raise SystemExit(f"pymodbus/modbus_audio not available: {exc}")
 
-from _locks import PortLock
-
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Modbus alarm buffer poller daemon")
@@ -40,6 +42,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--unit", type=int, default=int(os.getenv("MODBUS_UNIT_ID", modbus_constants.DEFAULT_UNIT_ID)))
     parser.add_argument("--interval", type=float, default=float(os.getenv("ALARM_POLL_INTERVAL", 2.0)))
     parser.add_argument("--once", action="store_true", help="Proveď jedno čtení a ukonči se")
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=float(os.getenv("ALARM_POLL_STATS_INTERVAL", 300.0)),
+        help="Interval výpisu statistik čekání na sběrnici v sekundách (0 = vypnuto)",
+    )
     parser.add_argument("--artisan-bin", default=os.getenv("ARTISAN_BIN", "php"))
     parser.add_argument("--artisan-path", default=os.getenv("ARTISAN_PATH", "artisan"))
     parser.add_argument("--artisan-command", default=os.getenv("ALARM_ARTISAN_COMMAND", "alarm:poll"))
@@ -83,37 +91,36 @@ def main() -> None:
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
 
-    lock_context = nullcontext()
-    if args.port:
-        lock_context = PortLock(args.port)
-
     try:
-        with lock_context:
-            with ModbusAudioClient(settings, unit_id=args.unit) as client:
-                while not stop_event:
-                    try:
-                        entry = client.read_alarm_buffer()
-                    except ModbusAudioError as exc:
-                        print(json.dumps({"error": str(exc)}), flush=True)
-                        if args.once:
-                            break
-                        time.sleep(args.interval)
-                        continue
-
-                    if entry.get("nest_address") or entry.get("repeat") or any(entry.get("data", [])):
-                        payload = {
-                            "source_address": entry.get("nest_address", 0),
-                            "repeat": entry.get("repeat", 0),
-                            "frames": entry.get("data", []),
-                            "raw": entry,
-                            "priority": "polling",
-                        }
-                        call_artisan(args.artisan_bin, args.artisan_path, args.artisan_command, payload, project_root)
-
+        with ModbusAudioClient(settings, unit_id=args.unit, priority=PRIORITY_BACKGROUND) as client:
+            stats_due = time.monotonic() + args.stats_interval
+            while not stop_event:
+                if args.stats_interval > 0 and time.monotonic() >= stats_due:
+                    print(json.dumps({"bus": client.bus_stats()}), flush=True)
+                    stats_due = time.monotonic() + args.stats_interval
+                try:
+                    entry = client.read_alarm_buffer()
+                except ModbusAudioError as exc:
+                    print(json.dumps({"error": str(exc)}), flush=True)
                     if args.once:
                         break
-
-                    time.sleep(max(0.1, args.interval))
+                    time.sleep(args.interval)
+                    continue
+
+                if entry.get("nest_address") or entry.get("repeat") or any(entry.get("data", [])):
+                    payload = {
+                        "source_address": entry.get("nest_address", 0),
+                        "repeat": entry.get("repeat", 0),
+                        "frames": entry.get("data", []),
+                        "raw": entry,
+                        "priority": "polling",
+                    }
+                    call_artisan(args.artisan_bin, args.artisan_path, args.artisan_command, payload, project_root)
+
+                if args.once:
+                    break
+
+                time.sleep(max(0.1, args.interval))
     except ModbusAudioError as exc:
         raise SystemExit(f"Unable to open Modbus port: {exc}") from exc
 
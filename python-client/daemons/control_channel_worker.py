@@ -18,6 +18,8 @@ import os
 import signal
 import sys
 import time
+import uuid
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -29,18 +31,26 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 try:  # pragma: no cover - runtime dependency may be missing during dry runs
-    from modbus_audio import ModbusAudioClient, ModbusAudioError, SerialSettings, constants
+    from modbus_audio import PRIORITY_BACKGROUND, ModbusAudioClient, ModbusAudioError, SerialSettings, constants
 except Exception:  # pragma: no cover - fall back to dry run mode automatically
+    PRIORITY_BACKGROUND = 2  # type: ignore[assignment]
     ModbusAudioClient = None  # type: ignore[assignment]
     ModbusAudioError = RuntimeError  # type: ignore[assignment]
     SerialSettings = object  # type: ignore[assignment]
     constants = None  # type: ignore[assignment]
 
+from _status_shm import StatusSnapshotWriter
+
 STATE_IDLE = "IDLE"
 STATE_TRANSMITTING = "TRANSMITTING"
 STATE_PAUSED = "PAUSED"
 STATE_STOPPED = "STOPPED"
 
+# Protocol 1: READY, one request, one response, close. Protocol 2 is negotiated
+# with a ``hello`` request and keeps the connection open for pipelined requests.
+PROTOCOL_VERSION = 2
+PROTOCOL_FEATURES = ["persistent", "pipelining", "out_of_order", "subscribe"]
+
 
 @dataclass(slots=True)
 class ModbusConfig:
@@ -54,6 +64,8 @@ class ModbusConfig:
     unit_id: int
     poll_interval: float
     dry_run: bool
+    poll_idle_max: float = 4.0
+    poll_fast_window: float = 5.0
 
 
 @dataclass(slots=True)
@@ -64,6 +76,9 @@ class WorkerConfig:
     log_level: str
     heartbeat_interval: float
     modbus: ModbusConfig
+    idle_timeout: float = 60.0
+    status_file: Path | None = None
+    subscriber_buffer: int = 32
 
 
 def _bool_env(name: str, default: bool) -> bool:
@@ -79,12 +94,88 @@ def _ts_iso(timestamp: float | None) -> str | None:
     return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
 
 
+class ChangeSubscriber:
+    """Bounded mailbox of change events for one subscriber.
+
+    ``offer`` never blocks: once ``capacity`` events are pending the newest
+    event replaces the last pending one, so a slow consumer skips intermediate
+    states but always ends up on the current one.
+    """
+
+    def __init__(self, subscription_id: str, capacity: int) -> None:
+        self.id = subscription_id
+        self._capacity = max(1, capacity)
+        self._events: deque[dict[str, Any]] = deque()
+        self._ready = asyncio.Event()
+        self.coalesced = 0
+
+    def offer(self, event: dict[str, Any]) -> None:
+        if len(self._events) >= self._capacity:
+            self._events[-1] = event
+            self.coalesced += 1
+        else:
+            self._events.append(event)
+        self._ready.set()
+
+    async def drain(self) -> list[dict[str, Any]]:
+        await self._ready.wait()
+        self._ready.clear()
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+
+class ChangeNotifier:
+    """Fan out FSM/register changes to subscribers without slowing the poll loop."""
+
+    def __init__(self, capacity: int = 32) -> None:
+        self._capacity = capacity
+        self._subscribers: dict[str, ChangeSubscriber] = {}
+        self._last_key: tuple[Any, ...] | None = None
+        self._current: dict[str, Any] | None = None
+        self._sequence = 0
+
+    def subscribe(self) -> ChangeSubscriber:
+        subscriber = ChangeSubscriber(uuid.uuid4().hex, self._capacity)
+        self._subscribers[subscriber.id] = subscriber
+        return subscriber
+
+    def unsubscribe(self, subscription_id: str) -> bool:
+        return self._subscribers.pop(subscription_id, None) is not None
+
+    def current(self) -> dict[str, Any] | None:
+        return dict(self._current) if self._current is not None else None
+
+    def observe(self, view: dict[str, Any]) -> None:
+        key = (view.get("state"), view.get("statusRegister"), view.get("errorRegister"), view.get("lastError"))
+        if key == self._last_key:
+            return
+        self._last_key = key
+        self._sequence += 1
+        self._current = {
+            "event": "status_changed",
+            "seq": self._sequence,
+            **view,
+            "ts": datetime.now(timezone.utc).isoformat(),
+        }
+        for subscriber in self._subscribers.values():
+            subscriber.offer(self._current)
+
+
 class ModbusManager:
     """Bridge between async control channel commands and the Modbus client."""
 
-    def __init__(self, config: ModbusConfig, logger: logging.Logger) -> None:
+    def __init__(
+        self,
+        config: ModbusConfig,
+        logger: logging.Logger,
+        publisher: StatusSnapshotWriter | None = None,
+        notifier: ChangeNotifier | None = None,
+    ) -> None:
         self._config = config
         self._logger = logger
+        self._publisher = publisher
+        self.notifier = notifier or ChangeNotifier()
         self._dry_run = config.dry_run or ModbusAudioClient is None
         self._state = STATE_IDLE
         self._state_lock = asyncio.Lock()
@@ -96,58 +187,81 @@ class ModbusManager:
         self._last_poll: float | None = None
         self._last_error: str | None = None
         self._last_snapshot: dict[str, Any] = {}
+        self._bus_lock = asyncio.Lock()
+        self._commands_pending = 0
+        self._poll_wakeup = asyncio.Event()
+        self._poll_waiters: list[asyncio.Future[None]] = []
+        self._fast_until = 0.0
+        self._poll_stats: dict[str, Any] = {
+            "polls": 0,
+            "transactions": 0,
+            "immediate": 0,
+            "yielded": 0,
+            "busSeconds": 0.0,
+            "activeSeconds": 0.0,
+        }
 
         if self._dry_run:
             self._logger.warning("Control channel worker running in dry-run mode (no Modbus hardware detected).")
+        self._publish()
 
     async def resume(self, reason: str | None = None) -> tuple[bool, dict[str, Any], str]:
-        async with self._state_lock:
-            if self._state == STATE_TRANSMITTING:
-                return True, {"note": "Already transmitting"}, self._state
-            previous = self._state
+        async with self._bus_command():
+            async with self._state_lock:
+                if self._state == STATE_TRANSMITTING:
+                    return True, {"note": "Already transmitting"}, self._state
+                previous = self._state
 
-        try:
-            await self._ensure_client()
-        except Exception as exc:
-            self._logger.error("Failed to initialise Modbus client: %s", exc)
-            return False, {"error": str(exc)}, self._state
+            try:
+                await self._ensure_client()
+            except Exception as exc:
+                self._logger.error("Failed to initialise Modbus client: %s", exc)
+                return False, {"error": str(exc)}, self._state
 
-        await self._ensure_poll_task()
-        self._stop_event.clear()
-        self._pause_event.set()
+            await self._ensure_poll_task()
+            self._stop_event.clear()
+            self._pause_event.set()
 
-        async with self._state_lock:
-            self._state = STATE_TRANSMITTING
+            async with self._state_lock:
+                self._state = STATE_TRANSMITTING
+            self._fast_until = time.monotonic() + self._config.poll_fast_window
+            self._publish()
 
         return True, {"previous": previous, "reason": reason}, STATE_TRANSMITTING
 
     async def pause(self, reason: str | None = None) -> tuple[bool, dict[str, Any], str]:
-        async with self._state_lock:
-            if self._state == STATE_STOPPED:
-                return False, {"error": "Channel already stopped"}, self._state
-            if self._state == STATE_PAUSED:
-                return True, {"note": "Already paused"}, self._state
-            previous = self._state
-            self._state = STATE_PAUSED
-            self._pause_event.clear()
+        async with self._bus_command():
+            async with self._state_lock:
+                if self._state == STATE_STOPPED:
+                    return False, {"error": "Channel already stopped"}, self._state
+                if self._state == STATE_PAUSED:
+                    return True, {"note": "Already paused"}, self._state
+                previous = self._state
+                self._state = STATE_PAUSED
+                self._pause_event.clear()
+            self._publish()
 
         return True, {"previous": previous, "reason": reason}, STATE_PAUSED
 
     async def stop(self, reason: str | None = None) -> tuple[bool, dict[str, Any], str]:
-        async with self._state_lock:
-            if self._state == STATE_STOPPED:
-                return True, {"note": "Already stopped"}, STATE_STOPPED
-            previous = self._state
-            self._state = STATE_STOPPED
-            self._stop_event.set()
-            self._pause_event.set()
-
-        await self._drain_poll_task()
-        await self._close_client()
+        async with self._bus_command():
+            async with self._state_lock:
+                if self._state == STATE_STOPPED:
+                    return True, {"note": "Already stopped"}, STATE_STOPPED
+                previous = self._state
+                self._state = STATE_STOPPED
+                self._stop_event.set()
+                self._pause_event.set()
+
+            await self._drain_poll_task()
+            await self._close_client()
+            self._publish()
 
         return True, {"previous": previous, "reason": reason}, STATE_STOPPED
 
-    async def status(self) -> tuple[bool, dict[str, Any], str]:
+    async def status(self, fresh: bool = False) -> tuple[bool, dict[str, Any], str]:
+        if fresh:
+            await self.request_poll()
         async with self._snapshot_lock:
             snapshot = dict(self._last_snapshot)
             last_error = self._last_error
@@ -160,9 +274,42 @@ class ModbusManager:
             "dryRun": self._dry_run,
             "lastPollAt": _ts_iso(last_poll),
             "lastError": last_error,
+            "poller": self.poll_stats(),
         }
         return True, payload, state
 
+    async def request_poll(self, timeout: float | None = None) -> bool:
+        """Wake the poll loop for an immediate poll and wait until it has finished."""
+
+        task = self._poll_task
+        if task is None or task.done() or not self._pause_event.is_set():
+            return False
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._poll_waiters.append(waiter)
+        self._poll_stats["immediate"] += 1
+        self._poll_wakeup.set()
+        try:
+            await asyncio.wait_for(waiter, timeout=timeout or self._config.timeout * 2 + self._config.poll_interval)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def poll_stats(self) -> dict[str, Any]:
+        stats = dict(self._poll_stats)
+        # What the previous fixed-rate poller would have spent: two single-register
+        # reads every poll_interval for the same active time.
+        baseline = int(stats["activeSeconds"] / self._config.poll_interval) * 2
+        stats["busSeconds"] = round(stats["busSeconds"], 4)
+        stats["activeSeconds"] = round(stats["activeSeconds"], 3)
+        stats["baselineTransactions"] = baseline
+        stats["transactionsSaved"] = max(0, baseline - stats["transactions"])
+        stats["busUtilization"] = round(stats["busSeconds"] / stats["activeSeconds"], 4) if stats["activeSeconds"] else 0.0
+        client = self._client
+        if client is not None:
+            stats["ioQueue"] = client.io_stats()
+            stats["bus"] = client.bus_stats()
+        return stats
+
     async def apply_initial_state(self, target_state: str) -> None:
         normalized = target_state.upper()
         if normalized == STATE_TRANSMITTING:
@@ -177,6 +324,8 @@ class ModbusManager:
         await self.stop("shutdown")
 
     async def _ensure_client(self) -> None:
+        """Connect the Modbus client; the caller holds ``_bus_command``."""
+
         if self._dry_run:
             return
         if self._client is not None:
@@ -196,6 +345,8 @@ class ModbusManager:
         def _connect() -> ModbusAudioClient:
             client = ModbusAudioClient(settings=settings, unit_id=self._config.unit_id)
             client.connect()
+            # Shared by the poll loop and future in-process users through one I/O thread.
+            client.start_io_thread()
             return client
 
         try:
@@ -213,13 +364,31 @@ class ModbusManager:
         self._poll_task = asyncio.create_task(self._poll_loop(), name="modbus-poll-loop")
 
     async def _poll_loop(self) -> None:
+        """Poll STATUS/ERROR on an adaptive cadence.
+
+        Polls run at ``poll_interval`` while the FSM is TRANSMITTING or ERROR
+        is non-zero, and for ``poll_fast_window`` seconds after a state
+        transition or register change; otherwise they back off exponentially
+        up to ``poll_idle_max`` while nothing changes. ``request_poll`` cuts
+        any wait short, and a poll is deferred while a user command holds or
+        waits for the bus.
+        """
+
         self._logger.debug("Starting Modbus poll loop (dry_run=%s).", self._dry_run)
+        interval = self._config.poll_interval
         try:
             while not self._stop_event.is_set():
                 await self._pause_event.wait()
                 if self._stop_event.is_set():
                     break
+                started = time.monotonic()
 
+                if self._commands_pending:
+                    self._poll_stats["yielded"] += 1
+                    await asyncio.sleep(self._config.poll_interval)
+                    continue
+
+                previous = self._last_snapshot
                 try:
                     snapshot = await self._poll_once()
                     async with self._snapshot_lock:
@@ -230,26 +399,102 @@ class ModbusManager:
                     self._logger.warning("Modbus polling failed: %s", exc)
                     async with self._snapshot_lock:
                         self._last_error = str(exc)
-
-                await asyncio.sleep(self._config.poll_interval)
+                    snapshot = previous
+                self._publish()
+                self._resolve_poll_waiters()
+
+                now = time.monotonic()
+                if self._registers_changed(previous, snapshot) or self._last_error or snapshot.get("errorRegister"):
+                    self._fast_until = now + self._config.poll_fast_window
+                if now < self._fast_until or self._state == STATE_TRANSMITTING:
+                    interval = self._config.poll_interval
+                else:
+                    interval = min(self._config.poll_idle_max, interval * 2)
+
+                self._poll_wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._poll_wakeup.wait(), timeout=interval)
+                self._poll_stats["activeSeconds"] += time.monotonic() - started
         finally:
+            self._resolve_poll_waiters()
             self._logger.debug("Modbus poll loop stopped.")
 
+    @staticmethod
+    def _registers_changed(previous: dict[str, Any], current: dict[str, Any]) -> bool:
+        keys = ("statusRegister", "errorRegister")
+        return any(previous.get(key) != current.get(key) for key in keys)
+
+    def _resolve_poll_waiters(self) -> None:
+        waiters, self._poll_waiters = self._poll_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def _bus_command(self):  # noqa: ANN202
+        """Hold the bus for a whole user command; the poller yields while one is pending.
+
+        Not reentrant: helpers called from a command must not enter it again.
+        """
+
+        self._commands_pending += 1
+        try:
+            async with self._bus_lock:
+                yield
+        finally:
+            self._commands_pending -= 1
+
     async def _poll_once(self) -> dict[str, Any]:
+        self._poll_stats["polls"] += 1
         if self._dry_run:
+            self._poll_stats["transactions"] += 1
             return {"statusRegister": "DRY_RUN", "timestamp": _ts_iso(time.time())}
 
         assert self._client is not None
         assert constants is not None
+        client = self._client
 
-        def _read_status() -> tuple[int, int]:
-            status = self._client.read_register(constants.STATUS_REGISTER)
-            error = self._client.read_register(constants.ERROR_REGISTER)
-            return status, error
-
-        status_value, error_value = await asyncio.to_thread(_read_status)
+        async with self._bus_lock:
+            started = time.monotonic()
+            try:
+                # STATUS (0x4036) and ERROR (0x4037) are adjacent: one FC03 transaction.
+                future = client.submit_read(constants.STATUS_REGISTER, 2, priority=PRIORITY_BACKGROUND)
+                status_value, error_value = await asyncio.wrap_future(future)
+            finally:
+                self._poll_stats["transactions"] += 1
+                self._poll_stats["busSeconds"] += time.monotonic() - started
         return {"statusRegister": status_value, "errorRegister": error_value}
 
+    def _publish(self) -> None:
+        """Notify subscribers of changes and mirror the state into the shared-memory snapshot."""
+
+        status_value = self._last_snapshot.get("statusRegister")
+        error_value = self._last_snapshot.get("errorRegister")
+        status_register = status_value if isinstance(status_value, int) else None
+        error_register = error_value if isinstance(error_value, int) else None
+        self.notifier.observe(
+            {
+                "state": self._state,
+                "statusRegister": status_register,
+                "errorRegister": error_register,
+                "lastError": self._last_error,
+                "lastPollAt": _ts_iso(self._last_poll),
+            }
+        )
+        if self._publisher is None:
+            return
+        try:
+            self._publisher.publish(
+                state=self._state,
+                dry_run=self._dry_run,
+                last_poll=self._last_poll,
+                status_register=status_register,
+                error_register=error_register,
+                last_error=self._last_error,
+            )
+        except (OSError, ValueError) as exc:  # pragma: no cover - filesystem dependent
+            self._logger.warning("Failed to publish status snapshot: %s", exc)
+
     async def _drain_poll_task(self) -> None:
         task = self._poll_task
         self._poll_task = None
@@ -259,6 +504,8 @@ class ModbusManager:
                 await task
 
     async def _close_client(self) -> None:
+        """Close the Modbus client; the caller holds ``_bus_command``."""
+
         if self._client is None:
             return
 
@@ -289,6 +536,10 @@ class ModbusSupervisor:
     def state(self) -> str:
         return self._state
 
+    @property
+    def notifier(self) -> ChangeNotifier:
+        return self._manager.notifier
+
     def last_transition_iso(self) -> str:
         return datetime.fromtimestamp(self._last_transition, tz=timezone.utc).isoformat()
 
@@ -307,8 +558,8 @@ class ModbusSupervisor:
         self._update_state(new_state, reason if ok else None)
         return ok, details
 
-    async def status(self) -> tuple[bool, dict[str, Any]]:
-        ok, details, new_state = await self._manager.status()
+    async def status(self, fresh: bool = False) -> tuple[bool, dict[str, Any]]:
+        ok, details, new_state = await self._manager.status(fresh)
         self._update_state(new_state, None)
         details = dict(details)
         details.setdefault("state", self._state)
@@ -341,6 +592,7 @@ class ControlChannelServer:
         self._logger = logger
         self._server: asyncio.AbstractServer | None = None
         self._stopping = asyncio.Event()
+        self._connections: set[asyncio.StreamWriter] = set()
 
     async def start(self) -> None:
         path = self._config.socket_path
@@ -359,6 +611,8 @@ class ControlChannelServer:
         self._stopping.set()
         if self._server is not None:
             self._server.close()
+            for writer in list(self._connections):
+                writer.close()
             await self._server.wait_closed()
             self._server = None
         if self._config.socket_path.exists():
@@ -391,26 +645,205 @@ class ControlChannelServer:
             await self._write_response(writer, self._build_response(False, self._supervisor.state, {"error": "unexpected_error"}, start))
             return
 
+        if self._is_upgrade(request) or self._is_subscribe(request):
+            await self._serve_persistent(reader, writer, request, start)
+            return
+
         response = await self._apply_request(request, time.monotonic() - start)
         await self._write_response(writer, response)
 
+    @staticmethod
+    def _is_upgrade(request: Any) -> bool:
+        if not isinstance(request, dict) or str(request.get("command") or "").lower() != "hello":
+            return False
+        try:
+            return int(request.get("protocol", 1)) >= PROTOCOL_VERSION
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _is_subscribe(request: Any) -> bool:
+        return isinstance(request, dict) and str(request.get("command") or "").lower() == "subscribe"
+
+    async def _serve_persistent(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        first: dict[str, Any],
+        start: float,
+    ) -> None:
+        """Serve newline-delimited requests until the peer hangs up or goes idle.
+
+        Every request runs in its own task and answers as soon as it finishes, so
+        a status query is not stuck behind a slow ``stop_modbus``; clients match
+        responses to requests by ``id``. ``subscribe`` adds pushed
+        ``status_changed`` events to the stream; a connection whose first
+        request is ``subscribe`` is upgraded implicitly.
+        """
+
+        write_lock = asyncio.Lock()
+        pending: set[asyncio.Task[None]] = set()
+        subscriptions: dict[str, asyncio.Task[None]] = {}
+        self._connections.add(writer)
+
+        try:
+            if self._is_subscribe(first):
+                response = self._subscribe(first, writer, write_lock, subscriptions, time.monotonic() - start)
+            else:
+                details = {
+                    "protocol": PROTOCOL_VERSION,
+                    "features": PROTOCOL_FEATURES,
+                    "idleTimeout": self._config.idle_timeout,
+                }
+                response = self._build_response(True, self._supervisor.state, details, time.monotonic() - start)
+                response["id"] = first.get("id")
+            await self._send(writer, response, write_lock)
+            while not self._stopping.is_set():
+                # A subscriber may only listen, so the idle timeout is suspended while subscribed.
+                idle_timeout = None if subscriptions else self._config.idle_timeout
+                try:
+                    data = await asyncio.wait_for(reader.readline(), timeout=idle_timeout)
+                except asyncio.TimeoutError:
+                    self._logger.debug("Persistent client idle, closing.")
+                    break
+                if not data:
+                    break
+                received = time.monotonic()
+                try:
+                    request = json.loads(data.decode("utf-8"))
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be an object")
+                except (UnicodeDecodeError, ValueError) as exc:
+                    self._logger.error("Invalid JSON from client: %s", exc)
+                    failure = self._build_response(False, self._supervisor.state, {"error": "invalid_json"}, 0.0)
+                    await self._send(writer, failure, write_lock)
+                    continue
+
+                command = str(request.get("command") or "").lower()
+                if command == "subscribe":
+                    response = self._subscribe(request, writer, write_lock, subscriptions, time.monotonic() - received)
+                    await self._send(writer, response, write_lock)
+                    continue
+                if command == "unsubscribe":
+                    response = self._unsubscribe(request, subscriptions, time.monotonic() - received)
+                    await self._send(writer, response, write_lock)
+                    continue
+
+                task = asyncio.create_task(self._serve_pipelined(request, received, writer, write_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError) as exc:
+            self._logger.debug("Persistent client dropped: %s", exc)
+        finally:
+            for subscription_id, pump in subscriptions.items():
+                self._supervisor.notifier.unsubscribe(subscription_id)
+                pump.cancel()
+            if subscriptions:
+                await asyncio.gather(*subscriptions.values(), return_exceptions=True)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            self._connections.discard(writer)
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    def _subscribe(
+        self,
+        request: dict[str, Any],
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+        subscriptions: dict[str, asyncio.Task[None]],
+        duration: float,
+    ) -> dict[str, Any]:
+        notifier = self._supervisor.notifier
+        subscriber = notifier.subscribe()
+        subscriptions[subscriber.id] = asyncio.create_task(
+            self._pump_events(subscriber, writer, write_lock),
+            name=f"control-channel-subscriber-{subscriber.id}",
+        )
+        self._logger.info("Subscriber %s attached", subscriber.id)
+        details = {"subscription": subscriber.id, "current": notifier.current()}
+        response = self._build_response(True, self._supervisor.state, details, duration)
+        if request.get("id") is not None:
+            response["id"] = request["id"]
+        return response
+
+    def _unsubscribe(
+        self,
+        request: dict[str, Any],
+        subscriptions: dict[str, asyncio.Task[None]],
+        duration: float,
+    ) -> dict[str, Any]:
+        subscription_id = str(request.get("subscription") or "")
+        pump = subscriptions.pop(subscription_id, None)
+        if pump is not None:
+            self._supervisor.notifier.unsubscribe(subscription_id)
+            pump.cancel()
+            ok, details = True, {"subscription": subscription_id}
+        else:
+            ok, details = False, {"error": f"Unknown subscription {subscription_id or '<empty>'}"}
+        response = self._build_response(ok, self._supervisor.state, details, duration)
+        if request.get("id") is not None:
+            response["id"] = request["id"]
+        return response
+
+    async def _pump_events(
+        self,
+        subscriber: ChangeSubscriber,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+    ) -> None:
+        try:
+            while True:
+                for event in await subscriber.drain():
+                    await self._send(writer, {**event, "subscription": subscriber.id}, write_lock)
+        except ConnectionError:
+            self._logger.debug("Subscriber %s disconnected", subscriber.id)
+
+    async def _serve_pipelined(
+        self,
+        request: dict[str, Any],
+        received: float,
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+    ) -> None:
+        response = await self._apply_request(request, time.monotonic() - received)
+        with contextlib.suppress(ConnectionError):
+            await self._send(writer, response, write_lock)
+
     async def _apply_request(self, request: dict[str, Any], duration: float) -> dict[str, Any]:
         command = (request.get("command") or "").lower()
         reason = request.get("reason")
         self._logger.info("Control command %s reason=%s", command, reason)
 
-        if command == "pause_modbus":
+        if command == "hello":
+            ok, details = True, {"protocol": PROTOCOL_VERSION, "features": PROTOCOL_FEATURES}
+        elif command == "pause_modbus":
             ok, details = await self._supervisor.pause(reason)
         elif command == "resume_modbus":
             ok, details = await self._supervisor.resume(reason)
         elif command == "stop_modbus":
             ok, details = await self._supervisor.stop(reason)
         elif command == "status_modbus":
-            ok, details = await self._supervisor.status()
+            ok, details = await self._supervisor.status(bool(request.get("fresh")))
         else:
             ok, details = False, {"error": f"Unknown command {command or '<empty>'}"}
 
-        return self._build_response(ok, self._supervisor.state, details, duration)
+        response = self._build_response(ok, self._supervisor.state, details, duration)
+        if request.get("id") is not None:
+            response["id"] = request["id"]
+        return response
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        response: dict[str, Any],
+        write_lock: asyncio.Lock,
+    ) -> None:
+        encoded = json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+        async with write_lock:
+            writer.write(encoded)
+            await writer.drain()
 
     async def _write_response(self, writer: asyncio.StreamWriter, response: dict[str, Any]) -> None:
         encoded = json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
@@ -459,6 +892,18 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--endpoint", default=os.getenv("CONTROL_CHANNEL_ENDPOINT"))
     parser.add_argument("--socket", default=os.getenv("CONTROL_CHANNEL_SOCKET"))
     parser.add_argument("--timeout", type=float, default=float(os.getenv("CONTROL_CHANNEL_TIMEOUT", "0.5")))
+    parser.add_argument("--idle-timeout", type=float, default=float(os.getenv("CONTROL_CHANNEL_IDLE_TIMEOUT", "60")))
+    parser.add_argument(
+        "--subscriber-buffer",
+        type=int,
+        default=int(os.getenv("CONTROL_CHANNEL_SUBSCRIBER_BUFFER", "32")),
+        help="Pending change events kept per subscriber before they are coalesced",
+    )
+    parser.add_argument(
+        "--status-file",
+        default=os.getenv("CONTROL_CHANNEL_STATUS_FILE"),
+        help="Shared-memory status snapshot path (default: socket path with .status suffix, 'none' to disable)",
+    )
     parser.add_argument("--log-file", default=os.getenv("CONTROL_CHANNEL_LOG"))
     parser.add_argument("--log-level", default=os.getenv("CONTROL_CHANNEL_LOG_LEVEL", "INFO"))
     parser.add_argument("--heartbeat-interval", type=float, default=float(os.getenv("CONTROL_CHANNEL_HEARTBEAT", "5")))
@@ -476,6 +921,18 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--modbus-timeout", type=float, default=float(os.getenv("MODBUS_TIMEOUT", getattr(constants, "DEFAULT_TIMEOUT", 1.0))))
     parser.add_argument("--modbus-unit-id", type=int, default=int(os.getenv("MODBUS_UNIT_ID", getattr(constants, "DEFAULT_UNIT_ID", 1))))
     parser.add_argument("--poll-interval", type=float, default=default_poll)
+    parser.add_argument(
+        "--poll-idle-max",
+        type=float,
+        default=float(os.getenv("CONTROL_CHANNEL_POLL_IDLE_MAX", "4")),
+        help="Upper bound of the poll back-off while registers do not change",
+    )
+    parser.add_argument(
+        "--poll-fast-window",
+        type=float,
+        default=float(os.getenv("CONTROL_CHANNEL_POLL_FAST_WINDOW", "5")),
+        help="Seconds of fast polling after a state transition or register change",
+    )
     parser.add_argument("--dry-run", dest="dry_run", action="store_true", default=default_dry_run)
     parser.add_argument("--no-dry-run", dest="dry_run", action="store_false")
 
@@ -501,6 +958,9 @@ async def heartbeat(logger: logging.Logger, supervisor: ModbusSupervisor, interv
 async def run_worker(args: argparse.Namespace) -> None:
     endpoint = args.socket or args.endpoint
     socket_path = parse_endpoint(endpoint)
+    status_file: Path | None = socket_path.with_suffix(".status")
+    if args.status_file:
+        status_file = None if args.status_file.lower() == "none" else Path(args.status_file).expanduser()
 
     modbus_config = ModbusConfig(
         port=args.modbus_port,
@@ -513,6 +973,8 @@ async def run_worker(args: argparse.Namespace) -> None:
         unit_id=args.modbus_unit_id,
         poll_interval=max(0.1, args.poll_interval),
         dry_run=args.dry_run,
+        poll_idle_max=max(0.1, args.poll_interval, args.poll_idle_max),
+        poll_fast_window=max(0.0, args.poll_fast_window),
     )
 
     worker_config = WorkerConfig(
@@ -522,10 +984,27 @@ async def run_worker(args: argparse.Namespace) -> None:
         log_level=args.log_level,
         heartbeat_interval=max(0.5, args.heartbeat_interval),
         modbus=modbus_config,
+        idle_timeout=max(1.0, args.idle_timeout),
+        status_file=status_file,
+        subscriber_buffer=max(1, args.subscriber_buffer),
     )
 
     logger = configure_logging(worker_config)
-    manager = ModbusManager(modbus_config, logger)
+    publisher: StatusSnapshotWriter | None = None
+    if worker_config.status_file is not None:
+        publisher = StatusSnapshotWriter(worker_config.status_file)
+        try:
+            publisher.open()
+            logger.info("Publishing status snapshot to %s", worker_config.status_file)
+        except OSError as exc:
+            logger.warning("Status snapshot disabled (%s): %s", worker_config.status_file, exc)
+            publisher = None
+    manager = ModbusManager(
+        modbus_config,
+        logger,
+        publisher=publisher,
+        notifier=ChangeNotifier(worker_config.subscriber_buffer),
+    )
     supervisor = ModbusSupervisor(manager, logger)
     server = ControlChannelServer(worker_config, supervisor, logger)
 
@@ -554,6 +1033,8 @@ async def run_worker(args: argparse.Namespace) -> None:
 
     await server.stop()
     await server_task
+    if publisher is not None:
+        publisher.close()
 
 
 def main() -> None:
@@ -12,6 +12,8 @@ emits synthetic events for development purposes.
 from __future__ import annotations
 
 import argparse
+import heapq
+import itertools
 import json
 import logging
 import os
@@ -21,11 +23,12 @@ import subprocess
 import threading
 import time
 import uuid
+from collections import OrderedDict, deque
 from contextlib import nullcontext
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
 
 import requests
 
@@ -43,6 +46,16 @@ EVENT_TYPE_BUTTON = 2
 EVENT_TYPE_TEXT = 3
 EVENT_TYPE_PANEL = 1
 
+FRAME_START = b"<<<:"
+FRAME_END = b"<<<"
+
+TX_PRIORITY_ACK = 0
+TX_PRIORITY_TEXT = 1
+
+ORIGIN_BACKEND = "backend"
+ORIGIN_CACHE = "cache"
+ORIGIN_OPTIMISTIC = "optimistic"
+
 
 def _env_flag(name: str, default: bool = False) -> bool:
     value = os.getenv(name)
@@ -71,6 +84,7 @@ class ControlTabFrame:
     crc_provided: Optional[str]
     crc_calculated: Optional[str]
     crc_valid: bool
+    received_at: float = 0.0
 
     def to_event_payload(self) -> dict[str, Any]:
         data: dict[str, Any] = {
@@ -124,6 +138,436 @@ def build_text_frame(field_id: int, text: str) -> str:
     return f'\n>>>TEXT:{field_id}:"{safe_text}">>{crc}<<<\n'
 
 
+class FrameExtractor:
+    """Byte-level ``<<<:…<<<`` frame extractor over a fixed buffer.
+
+    Serial data is read straight into :meth:`writable` and frames come back as
+    ``memoryview`` slices of the same buffer, so nothing is copied until the
+    caller decodes a frame. Unread bytes are moved to the front only when the
+    free tail gets too small, which keeps extraction linear in the input size
+    however noisy the line is. Bytes outside any frame and frames longer than
+    ``max_frame`` are discarded and counted in :attr:`dropped`.
+    """
+
+    def __init__(self, capacity: int = 4096, max_frame: int = 512) -> None:
+        self._max_frame = max(len(FRAME_START) + len(FRAME_END), max_frame)
+        self._buffer = bytearray(max(capacity, 2 * self._max_frame))
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self._scan = 0
+        self.dropped = 0
+        self.frames = 0
+
+    def writable(self, minimum: int = 256) -> memoryview:
+        """Return the free tail of the buffer, compacting first if it is shorter than ``minimum``."""
+
+        if len(self._buffer) - self._end < minimum and self._start > 0:
+            pending = self._end - self._start
+            self._view[:pending] = self._view[self._start:self._end]
+            self._scan -= self._start
+            self._start = 0
+            self._end = pending
+        return self._view[self._end:]
+
+    def commit(self, count: int) -> None:
+        self._end += count
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Copy ``data`` into the buffer and return every complete frame it finished."""
+
+        frames: list[bytes] = []
+        offset = 0
+        while offset < len(data):
+            target = self.writable()
+            count = min(len(target), len(data) - offset)
+            target[:count] = data[offset:offset + count]
+            self.commit(count)
+            offset += count
+            frames.extend(bytes(frame) for frame in self.frames_ready())
+        return frames
+
+    def frames_ready(self) -> Iterator[memoryview]:
+        """Yield complete frames; each view is only valid until the next :meth:`writable`."""
+
+        buffer = self._buffer
+        while True:
+            begin = buffer.find(FRAME_START, self._start, self._end)
+            if begin == -1:
+                # Keep a possible partial start marker at the tail, drop the rest.
+                keep = min(self._end - self._start, len(FRAME_START) - 1)
+                self.dropped += self._end - self._start - keep
+                self._start = self._scan = self._end - keep
+                return
+            if begin > self._start:
+                self.dropped += begin - self._start
+                self._start = begin
+
+            scan_from = max(self._scan, begin + len(FRAME_START))
+            stop = buffer.find(FRAME_END, scan_from, self._end)
+            if stop == -1:
+                if self._end - begin > self._max_frame:
+                    self.dropped += len(FRAME_START)
+                    self._start = self._scan = begin + len(FRAME_START)
+                    continue
+                # Resume the end-marker search where this pass stopped.
+                self._scan = max(scan_from, self._end - len(FRAME_END) + 1)
+                return
+
+            finish = stop + len(FRAME_END)
+            self._start = self._scan = finish
+            if finish - begin > self._max_frame:
+                self.dropped += finish - begin
+                continue
+            self.frames += 1
+            yield self._view[begin:finish]
+
+
+@dataclass(order=True, slots=True)
+class TxEntry:
+    priority: int
+    sequence: int
+    message: str = field(compare=False)
+    due: float = field(compare=False, default=0.0)
+    enqueued: float = field(compare=False, default=0.0)
+    field_id: Optional[int] = field(compare=False, default=None)
+    generation: int = field(compare=False, default=0)
+    since: Optional[float] = field(compare=False, default=None)
+    path: Optional[str] = field(compare=False, default=None)
+
+
+class TxScheduler:
+    """Single writer thread for everything sent to the panel.
+
+    ACK/NACK frames always go out before texts. Texts are coalesced per field:
+    queuing a text or an animation for a field cancels everything still
+    pending for it, and when several frames of one field are due at once only
+    the newest is written. Animation frames are timed entries, not threads.
+    ACKs sent with a ``path`` also record the end-to-end latency since
+    ``since`` (frame receipt) under that path name.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str], None],
+        logger: Optional[logging.Logger] = None,
+        latency_samples: int = 512,
+    ) -> None:
+        self._write = write
+        self._logger = logger or LOGGER
+        self._condition = threading.Condition()
+        self._ready: list[TxEntry] = []
+        self._timers: list[tuple[float, int, TxEntry]] = []
+        self._sequence = itertools.count()
+        self._generations: dict[int, int] = {}
+        self._newest_ready: dict[int, int] = {}
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._latency_samples = max(1, latency_samples)
+        self._ack_latency: deque[float] = deque(maxlen=self._latency_samples)
+        self._path_latency: dict[str, deque[float]] = {}
+        self._stats = {"acks": 0, "texts": 0, "coalesced": 0, "errors": 0, "ackMaxMs": 0.0}
+
+    def start(self) -> None:
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="control-tab-tx", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush ready frames, drop pending animation frames and join the writer."""
+
+        with self._condition:
+            self._running = False
+            self._timers.clear()
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def send_ack(self, message: str, *, since: Optional[float] = None, path: Optional[str] = None) -> None:
+        self._push(TX_PRIORITY_ACK, message, since=since, path=path)
+
+    def send_text(self, field_id: int, message: str) -> None:
+        with self._condition:
+            generation = self._next_generation(field_id)
+            self._push(TX_PRIORITY_TEXT, message, field_id=field_id, generation=generation)
+
+    def schedule_animation(self, field_id: int, frames: list[tuple[float, str]]) -> None:
+        """Queue ``(delay_seconds, message)`` frames for one field, superseding its pending texts."""
+
+        base = time.monotonic()
+        with self._condition:
+            generation = self._next_generation(field_id)
+            for delay, message in frames:
+                self._push(
+                    TX_PRIORITY_TEXT,
+                    message,
+                    due=base + max(0.0, delay),
+                    field_id=field_id,
+                    generation=generation,
+                )
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            samples = sorted(self._ack_latency)
+            stats: dict[str, Any] = dict(self._stats)
+            stats["pending"] = len(self._ready) + len(self._timers)
+            paths = {name: sorted(values) for name, values in self._path_latency.items()}
+        if samples:
+            stats["ackMeanMs"] = round(sum(samples) / len(samples), 3)
+            stats["ackP95Ms"] = round(_percentile(samples, 0.95), 3)
+        stats["ackMaxMs"] = round(stats["ackMaxMs"], 3)
+        stats["paths"] = {
+            name: {
+                "count": len(values),
+                "meanMs": round(sum(values) / len(values), 3),
+                "p95Ms": round(_percentile(values, 0.95), 3),
+                "maxMs": round(values[-1], 3),
+            }
+            for name, values in paths.items()
+            if values
+        }
+        return stats
+
+    def _next_generation(self, field_id: int) -> int:
+        generation = self._generations.get(field_id, 0) + 1
+        self._generations[field_id] = generation
+        return generation
+
+    def _push(
+        self,
+        priority: int,
+        message: str,
+        *,
+        due: float = 0.0,
+        field_id: Optional[int] = None,
+        generation: int = 0,
+        since: Optional[float] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        entry = TxEntry(
+            priority=priority,
+            sequence=next(self._sequence),
+            message=message,
+            due=due,
+            enqueued=time.monotonic(),
+            field_id=field_id,
+            generation=generation,
+            since=since,
+            path=path,
+        )
+        with self._condition:
+            if entry.due > entry.enqueued:
+                heapq.heappush(self._timers, (entry.due, entry.sequence, entry))
+            else:
+                self._make_ready(entry)
+            self._condition.notify()
+
+    def _make_ready(self, entry: TxEntry) -> None:
+        heapq.heappush(self._ready, entry)
+        if entry.field_id is not None:
+            self._newest_ready[entry.field_id] = entry.sequence
+
+    def _next_entry(self) -> Optional[TxEntry]:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._timers and self._timers[0][0] <= now:
+                    self._make_ready(heapq.heappop(self._timers)[2])
+                while self._ready:
+                    entry = heapq.heappop(self._ready)
+                    if entry.field_id is None:
+                        return entry
+                    stale = (
+                        entry.generation != self._generations.get(entry.field_id)
+                        or entry.sequence != self._newest_ready.get(entry.field_id)
+                    )
+                    if stale:
+                        self._stats["coalesced"] += 1
+                        continue
+                    del self._newest_ready[entry.field_id]
+                    return entry
+                if not self._running:
+                    return None
+                timeout = self._timers[0][0] - now if self._timers else None
+                self._condition.wait(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            entry = self._next_entry()
+            if entry is None:
+                return
+            try:
+                self._write(entry.message)
+            except Exception as exc:  # pragma: no cover - depends on serial hardware
+                self._logger.error("Control Tab TX failed: %s", exc)
+                with self._condition:
+                    self._stats["errors"] += 1
+                continue
+            written = time.monotonic()
+            latency_ms = (written - entry.enqueued) * 1000.0
+            with self._condition:
+                if entry.priority == TX_PRIORITY_ACK:
+                    self._stats["acks"] += 1
+                    self._ack_latency.append(latency_ms)
+                    self._stats["ackMaxMs"] = max(self._stats["ackMaxMs"], latency_ms)
+                    if entry.path is not None and entry.since is not None:
+                        samples = self._path_latency.setdefault(entry.path, deque(maxlen=self._latency_samples))
+                        samples.append((written - entry.since) * 1000.0)
+                else:
+                    self._stats["texts"] += 1
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class OptimisticAckRules:
+    """Which button events are ACKed before the backend answers.
+
+    Rules are ``screen:panel`` pairs separated by commas, either side may be
+    ``*`` (``"3:*,1:2"``); ``"*"`` enables every panel, an empty string none.
+    """
+
+    def __init__(self, spec: str = "") -> None:
+        self._rules: list[tuple[Optional[int], Optional[int]]] = []
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            screen, _, panel = item.partition(":")
+            self._rules.append((self._parse(screen), self._parse(panel or "*")))
+
+    @staticmethod
+    def _parse(value: str) -> Optional[int]:
+        value = value.strip()
+        if value in {"", "*"}:
+            return None
+        return int(value)
+
+    def __bool__(self) -> bool:
+        return bool(self._rules)
+
+    def applies(self, frame: ControlTabFrame) -> bool:
+        if frame.event_type != EVENT_TYPE_BUTTON:
+            return False
+        return any(
+            (screen is None or screen == frame.screen) and (panel is None or panel == frame.panel)
+            for screen, panel in self._rules
+        )
+
+
+CacheKey = tuple[int, int, int, str]
+
+
+class ResponseCache:
+    """Backend responses that the backend marked as reusable, keyed by frame identity.
+
+    A response is stored only when it carries ``"cache": {"ttl": seconds}`` (or
+    the webhook answered with ``Cache-Control: max-age``) and the event type is
+    in ``event_types``. Any response may carry ``"invalidate"``: ``true`` or
+    ``"all"`` flushes everything, a dict or list of dicts with optional
+    ``screen``/``panel``/``eventType``/``payload`` drops the matching entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        event_types: frozenset[int] = frozenset({EVENT_TYPE_PANEL, EVENT_TYPE_TEXT}),
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        self._event_types = event_types
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._refreshing: set[CacheKey] = set()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "invalidated": 0}
+
+    @staticmethod
+    def key(frame: ControlTabFrame) -> CacheKey:
+        return (frame.screen, frame.panel, frame.event_type, frame.payload)
+
+    @staticmethod
+    def ttl_of(response: dict[str, Any]) -> float:
+        directive = response.get("cache")
+        if not isinstance(directive, dict):
+            return 0.0
+        try:
+            return max(0.0, float(directive.get("ttl", 0)))
+        except (TypeError, ValueError):
+            return 0.0
+
+    def get(self, key: CacheKey) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry[1]
+
+    def store(self, key: CacheKey, response: dict[str, Any]) -> bool:
+        ttl = self.ttl_of(response)
+        with self._lock:
+            if ttl <= 0 or key[2] not in self._event_types:
+                self._entries.pop(key, None)
+                return False
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._stats["stores"] += 1
+            return True
+
+    def invalidate(self, directive: Any) -> int:
+        if directive in (None, False, [], {}):
+            return 0
+        with self._lock:
+            if directive is True or directive == "all":
+                dropped = list(self._entries)
+            else:
+                specs = directive if isinstance(directive, list) else [directive]
+                specs = [spec for spec in specs if isinstance(spec, dict)]
+                dropped = [key for key in self._entries if any(self._matches(key, spec) for spec in specs)]
+            for key in dropped:
+                del self._entries[key]
+            self._stats["invalidated"] += len(dropped)
+            return len(dropped)
+
+    def begin_refresh(self, key: CacheKey) -> bool:
+        """Claim the background refresh for ``key``; False if one is already in flight."""
+
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: CacheKey) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    @staticmethod
+    def _matches(key: CacheKey, spec: dict[str, Any]) -> bool:
+        for index, name in enumerate(("screen", "panel", "eventType", "payload")):
+            if name not in spec:
+                continue
+            expected = spec[name]
+            actual = key[index]
+            if str(actual) != str(expected):
+                return False
+        return True
+
+
 class BackendSink:
     def __init__(
         self,
@@ -190,10 +634,28 @@ class BackendSink:
         )
         response.raise_for_status()
         try:
-            return response.json()
+            body = response.json()
         except ValueError:  # pragma: no cover - backend always returns JSON
             self._logger.warning("Backend response was not JSON; returning generic ACK.")
             return {"action": "ack", "ack": {"status": 1}}
+        if isinstance(body, dict) and "cache" not in body:
+            max_age = self._max_age(response.headers.get("Cache-Control", ""))
+            if max_age is not None:
+                body["cache"] = {"ttl": max_age}
+        return body
+
+    @staticmethod
+    def _max_age(header: str) -> Optional[float]:
+        directives = [part.strip().lower() for part in header.split(",") if part.strip()]
+        if "no-store" in directives or "no-cache" in directives:
+            return 0.0
+        for directive in directives:
+            if directive.startswith("max-age="):
+                try:
+                    return max(0.0, float(directive.split("=", 1)[1]))
+                except ValueError:
+                    return None
+        return None
 
 
 class ControlTabSerial:
@@ -235,16 +697,16 @@ class ControlTabSerial:
             self._serial.close()
         self._serial = None
 
-    def readline(self) -> Optional[str]:
+    def read_into(self, buffer: memoryview) -> Optional[int]:
+        """Read everything already waiting (or block up to ``timeout`` for one byte) into ``buffer``."""
+
         if self._serial is None or not self._serial.is_open:
             return None
         try:
-            data = self._serial.readline()
+            size = min(len(buffer), max(1, self._serial.in_waiting))
+            return self._serial.readinto(buffer[:size])
         except Exception:
             return None
-        if not data:
-            return None
-        return data.decode("utf-8", errors="ignore")
 
     def write(self, payload: str) -> None:
         if self._serial is None or not self._serial.is_open:
@@ -297,8 +759,13 @@ class ControlTabListener:
         retry_backoff: float,
         once: bool = False,
         logger: Optional[logging.Logger] = None,
+        cache: Optional[ResponseCache] = None,
+        optimistic_ack: Optional[OptimisticAckRules] = None,
     ) -> None:
         self._sink = sink
+        self._cache = cache
+        self._optimistic = optimistic_ack or OptimisticAckRules()
+        self._optimistic_stats = {"sent": 0, "corrected": 0}
         self._transport = transport
         self._poll_interval = max(0.01, poll_interval)
         self._graceful_timeout = graceful_timeout
@@ -306,15 +773,22 @@ class ControlTabListener:
         self._once = once
         self._logger = logger or LOGGER
 
-        self._queue: queue.Queue[tuple[ControlTabFrame, dict[str, Any]]] = queue.Queue()
+        # Items are (frame, payload, origin, served): origin says whether the panel
+        # was already answered ("cache", "optimistic") or waits for the backend,
+        # served is the cached response it got.
+        self._queue: queue.Queue[
+            tuple[ControlTabFrame, dict[str, Any], str, Optional[dict[str, Any]]]
+        ] = queue.Queue()
         self._stop_event = threading.Event()
         self._dispatcher = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._tx = TxScheduler(self._write, logger=self._logger)
         self._simulation = transport is None
-        self._buffer = ""
+        self._extractor = FrameExtractor()
 
     def start(self) -> None:
         self._logger.info("Control Tab listener starting (simulation=%s)", self._simulation)
         self._dispatcher.start()
+        self._tx.start()
 
         if self._simulation:
             self._logger.warning("Control Tab listener running in simulation mode; no serial port configured.")
@@ -333,25 +807,43 @@ class ControlTabListener:
 
         try:
             while not self._stop_event.is_set():
-                line = self._transport.readline()
-                if line is None:
+                count = self._transport.read_into(self._extractor.writable())
+                if count is None:
                     time.sleep(self._poll_interval)
                     continue
-                self._ingest(line)
+                if count == 0:
+                    continue
+                self._extractor.commit(count)
+                self._drain_frames()
         finally:
             self._transport.close()
             self.stop()
 
     def stop(self) -> None:
-        self._logger.info("Control Tab listener stopping")
+        self._logger.info(
+            "Control Tab listener stopping (frames=%d, dropped_noise_bytes=%d)",
+            self._extractor.frames,
+            self._extractor.dropped,
+        )
         self._stop_event.set()
         if self._dispatcher.is_alive():
             self._dispatcher.join(timeout=self._graceful_timeout)
+        self._tx.stop(timeout=self._graceful_timeout)
+        self._logger.info("Control Tab TX stats: %s", json.dumps(self._tx.stats()))
+        if self._cache is not None:
+            self._logger.info("Control Tab response cache stats: %s", json.dumps(self._cache.stats()))
+        if self._optimistic:
+            self._logger.info("Control Tab optimistic ACK stats: %s", json.dumps(self._optimistic_stats))
+
+    def clear_cache(self) -> None:
+        if self._cache is not None:
+            dropped = self._cache.invalidate("all")
+            self._logger.info("Control Tab response cache cleared (%d entries)", dropped)
 
     def _dispatch_loop(self) -> None:
         while not self._stop_event.is_set():
             try:
-                frame, payload = self._queue.get(timeout=0.2)
+                frame, payload, origin, served = self._queue.get(timeout=0.2)
             except queue.Empty:
                 continue
 
@@ -369,113 +861,156 @@ class ControlTabListener:
             except Exception as exc:  # pragma: no cover - protects runtime
                 self._logger.error("Backend dispatch failed: %s", exc)
                 print(json.dumps({"error": str(exc), "payload": payload}), flush=True)
+                if origin == ORIGIN_OPTIMISTIC:
+                    self._correct_optimistic(frame, {"action": "error"})
                 time.sleep(self._retry_backoff)
                 continue
+            finally:
+                if origin == ORIGIN_CACHE and self._cache is not None:
+                    self._cache.end_refresh(ResponseCache.key(frame))
+
+            if self._cache is not None:
+                self._cache.invalidate(response.get("invalidate"))
+                self._cache.store(ResponseCache.key(frame), response)
+            if origin == ORIGIN_CACHE and served is not None and self._panel_output(served) == self._panel_output(response):
+                # The panel already got this answer from the cache; this was only a refresh.
+                continue
+            if origin == ORIGIN_OPTIMISTIC:
+                self._settle_optimistic(frame, response)
+                continue
 
-            self._handle_response(frame, response)
-
-    def _ingest(self, chunk: str) -> None:
-        data = chunk
-        if not data:
-            return
-        self._buffer += data
-        while True:
-            start = self._buffer.find("<<<")
-            if start == -1:
-                # keep buffer from growing uncontrollably; retain last few characters in case of partial frame
-                if len(self._buffer) > 128:
-                    self._buffer = self._buffer[-128:]
-                break
-            if start > 0:
-                noise = self._buffer[:start]
-                if noise.strip():
-                    _debug_log({"noise": noise})
-                self._buffer = self._buffer[start:]
-
-            if len(self._buffer) < 7:
-                # not enough data yet for even the smallest frame
-                break
-
-            end = self._buffer.find("<<<", 3)
-            if end == -1:
-                # wait for the rest of the frame
-                break
-
-            frame_str = self._buffer[: end + 3]
-            remainder = self._buffer[end + 3 :]
-            # When frames end with newline, keep the remainder (including newline) for the next iteration
-            self._buffer = remainder
+            self._handle_response(frame, response, path=origin)
 
-            frame_str = frame_str.strip()
-            if not frame_str:
-                continue
+    def _drain_frames(self) -> None:
+        for raw in self._extractor.frames_ready():
+            if not self._handle_frame(bytes(raw).decode("utf-8", errors="replace")):
+                return
 
-            _debug_log({"incoming_raw": frame_str})
-            frame = self._parse_frame(frame_str)
-            if frame is None:
-                _debug_log({"dropped": frame_str})
-                self._logger.debug("Dropped unparsable frame: %s", frame_str)
-                continue
+    def _handle_frame(self, frame_str: str) -> bool:
+        """Validate and enqueue one frame; returns False once the listener should stop reading."""
+
+        _debug_log({"incoming_raw": frame_str})
+        frame = self._parse_frame(frame_str)
+        if frame is None:
+            _debug_log({"dropped": frame_str})
+            self._logger.debug("Dropped unparsable frame: %s", frame_str)
+            return True
+
+        self._logger.info(
+            "RX frame screen=%d panel=%d event=%d payload=%s crc=%s",
+            frame.screen,
+            frame.panel,
+            frame.event_type,
+            frame.payload,
+            "ok" if frame.crc_valid else "invalid",
+        )
 
-            self._logger.info(
-                "RX frame screen=%d panel=%d event=%d payload=%s crc=%s",
-                frame.screen,
-                frame.panel,
-                frame.event_type,
-                frame.payload,
-                "ok" if frame.crc_valid else "invalid",
+        if not frame.crc_valid:
+            self._logger.warning(
+                "CRC mismatch (provided=%s calculated=%s) for frame: %s",
+                frame.crc_provided,
+                frame.crc_calculated,
+                frame.raw,
             )
+            self._tx.send_ack(self._build_ack(frame, 0))
+            return True
+
+        if frame.event_type == EVENT_TYPE_BUTTON and ControlTabFrame._parse_int(frame.payload) is None:
+            self._logger.warning("Invalid button payload '%s' – sending NACK", frame.payload)
+            self._tx.send_ack(self._build_ack(frame, 0))
+            return True
+
+        if frame.event_type == EVENT_TYPE_TEXT and ControlTabFrame._parse_int(frame.payload.strip("?")) is None:
+            self._logger.warning("Invalid text field payload '%s' – sending NACK", frame.payload)
+            self._tx.send_ack(self._build_ack(frame, 0))
+            return True
+
+        payload = self._build_event_payload(frame)
+        _debug_log({"parsed": payload})
+        self._logger.debug("Event payload: %s", json.dumps(payload, ensure_ascii=False))
+        if self._optimistic.applies(frame):
+            self._tx.send_ack(self._build_ack(frame, 1), since=frame.received_at, path=ORIGIN_OPTIMISTIC)
+            self._optimistic_stats["sent"] += 1
+            self._queue.put((frame, payload, ORIGIN_OPTIMISTIC, None))
+        else:
+            served = self._answer_from_cache(frame)
+            if served is None:
+                self._queue.put((frame, payload, ORIGIN_BACKEND, None))
+            elif self._cache is not None and self._cache.begin_refresh(ResponseCache.key(frame)):
+                self._queue.put((frame, payload, ORIGIN_CACHE, served))
+        if self._once:
+            self.stop()
+            return False
+        return True
 
-            if not frame.crc_valid:
-                self._logger.warning(
-                    "CRC mismatch (provided=%s calculated=%s) for frame: %s",
-                    frame.crc_provided,
-                    frame.crc_calculated,
-                    frame.raw,
-                )
-                nack = self._build_ack(frame, 0)
-                self._write(nack)
-                continue
+    def _answer_from_cache(self, frame: ControlTabFrame) -> Optional[dict[str, Any]]:
+        if self._cache is None:
+            return None
+        cached = self._cache.get(ResponseCache.key(frame))
+        if cached is None:
+            return None
+        self._logger.debug("Answering screen=%d panel=%d event=%d from cache", frame.screen, frame.panel, frame.event_type)
+        self._handle_response(frame, cached, path=ORIGIN_CACHE)
+        return cached
 
-            if frame.event_type == EVENT_TYPE_BUTTON and ControlTabFrame._parse_int(frame.payload) is None:
-                self._logger.warning("Invalid button payload '%s' – sending NACK", frame.payload)
-                nack = self._build_ack(frame, 0)
-                self._write(nack)
-                continue
+    def _settle_optimistic(self, frame: ControlTabFrame, response: dict[str, Any]) -> None:
+        """Reconcile the backend answer with the ACK the panel already received."""
 
-            if frame.event_type == EVENT_TYPE_TEXT and ControlTabFrame._parse_int(frame.payload.strip("?")) is None:
-                self._logger.warning("Invalid text field payload '%s' – sending NACK", frame.payload)
-                nack = self._build_ack(frame, 0)
-                self._write(nack)
-                continue
+        action = response.get("action", "ack")
+        accepted = action == "ack" and bool((response.get("ack") or {}).get("status", True))
+        if not accepted:
+            self._correct_optimistic(frame, response)
+            return
+        control_data = response.get("control")
+        if control_data:
+            self._handle_control_data(control_data)
 
-            payload = self._build_event_payload(frame)
-            _debug_log({"parsed": payload})
-            self._logger.debug("Event payload: %s", json.dumps(payload, ensure_ascii=False))
-            self._queue.put((frame, payload))
-            if self._once:
-                self.stop()
-                return
+    def _correct_optimistic(self, frame: ControlTabFrame, response: dict[str, Any]) -> None:
+        self._optimistic_stats["corrected"] += 1
+        self._logger.warning(
+            "Backend rejected optimistically ACKed event screen=%d panel=%d payload=%s (%s)",
+            frame.screen,
+            frame.panel,
+            frame.payload,
+            response.get("action", "ack"),
+        )
+        self._handle_response(frame, response)
 
-    def _handle_response(self, frame: ControlTabFrame, response: dict[str, Any]) -> None:
+    @staticmethod
+    def _panel_output(response: dict[str, Any]) -> tuple[Any, ...]:
+        action = response.get("action", "ack")
+        ack = response.get("ack") or {}
+        text = response.get("text") or {}
+        return (
+            action,
+            int(bool(ack.get("status", True))) if action == "ack" else None,
+            text.get("fieldId") if action == "text" else None,
+            text.get("text") if action == "text" else None,
+            json.dumps(response.get("control"), sort_keys=True, default=str),
+        )
+
+    def _handle_response(
+        self,
+        frame: ControlTabFrame,
+        response: dict[str, Any],
+        path: Optional[str] = None,
+    ) -> None:
         action = response.get("action", "ack")
         self._logger.debug("Backend response (%s): %s", action, json.dumps(response, ensure_ascii=False))
         if action == "ack":
             ack = response.get("ack", {})
             status = int(bool(ack.get("status", True)))
-            message = self._build_ack(frame, status)
-            self._write(message)
+            self._tx.send_ack(self._build_ack(frame, status), since=frame.received_at or None, path=path)
         elif action == "text":
             text_payload = response.get("text", {})
             field_id = text_payload.get("fieldId")
             text = text_payload.get("text", "")
             if field_id is None and frame.event_type == EVENT_TYPE_TEXT:
                 field_id = ControlTabFrame._parse_int(frame.payload.strip("?"))
-            message = self._build_text(field_id or 0, str(text))
-            self._write(message)
+            field_id = field_id or 0
+            self._tx.send_text(field_id, self._build_text(field_id, str(text)))
         elif action == "error":
-            message = self._build_ack(frame, 0)
-            self._write(message)
+            self._tx.send_ack(self._build_ack(frame, 0))
 
         control_data = response.get("control")
         if control_data:
@@ -498,10 +1033,9 @@ class ControlTabListener:
         for animation in animations:
             animation_type = animation.get("type")
             if animation_type == "progress_text":
-                worker = threading.Thread(target=self._run_progress_animation, args=(animation,), daemon=True)
-                worker.start()
+                self._schedule_progress_animation(animation)
 
-    def _run_progress_animation(self, animation: dict[str, Any]) -> None:
+    def _schedule_progress_animation(self, animation: dict[str, Any]) -> None:
         try:
             field_id_raw = animation.get("fieldId")
             field_id = int(field_id_raw) if field_id_raw is not None else None
@@ -512,7 +1046,7 @@ class ControlTabListener:
         if field_id is None or field_id < 0 or not frames:
             return
 
-        base_time = time.monotonic()
+        scheduled: list[tuple[float, str]] = []
         for frame in frames:
             delay_ms = frame.get("delay_ms", 0)
             try:
@@ -520,16 +1054,13 @@ class ControlTabListener:
             except (TypeError, ValueError):
                 delay = 0.0
 
-            target_time = base_time + max(0.0, delay)
-            remaining = target_time - time.monotonic()
-            if remaining > 0:
-                time.sleep(remaining)
-
             text = str(frame.get("text", ""))
             if not text:
                 continue
-            message = self._build_text(field_id, text)
-            self._write(message)
+            scheduled.append((delay, self._build_text(field_id, text)))
+
+        if scheduled:
+            self._tx.schedule_animation(field_id, scheduled)
 
     def _parse_frame(self, line: str) -> Optional[ControlTabFrame]:
         line = line.strip()
@@ -584,6 +1115,7 @@ class ControlTabListener:
             crc_provided=crc_provided.upper() if crc_provided else None,
             crc_calculated=crc_calculated,
             crc_valid=crc_valid,
+            received_at=time.monotonic(),
         )
 
     def _build_event_payload(self, frame: ControlTabFrame) -> dict[str, Any]:
@@ -631,7 +1163,7 @@ class ControlTabListener:
         for frame in frames:
             payload = self._build_event_payload(frame)
             self._logger.debug("Simulation enqueue: %s", json.dumps(payload, ensure_ascii=False))
-            self._queue.put((frame, payload))
+            self._queue.put((frame, payload, ORIGIN_BACKEND, None))
             time.sleep(1.0)
             if self._once:
                 break
@@ -660,6 +1192,22 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--project-root", default=str(Path(__file__).resolve().parents[2]))
     parser.add_argument("--log-file", default=os.getenv("CONTROL_TAB_LOG_FILE"))
     parser.add_argument("--once", action="store_true", help="Zpracuj první událost a ukonči se")
+    parser.add_argument(
+        "--optimistic-ack",
+        default=os.getenv("CONTROL_TAB_OPTIMISTIC_ACK", ""),
+        help="Pravidla screen:panel (např. '3:*,1:2', '*' = vše) pro okamžité ACK tlačítek před odpovědí backendu",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=int(os.getenv("CONTROL_TAB_CACHE_SIZE", "256")),
+        help="Počet odpovědí backendu držených v cache (0 = vypnuto)",
+    )
+    parser.add_argument(
+        "--cache-event-types",
+        default=os.getenv("CONTROL_TAB_CACHE_EVENT_TYPES", f"{EVENT_TYPE_PANEL},{EVENT_TYPE_TEXT}"),
+        help="Typy událostí, jejichž odpovědi smí být cachovány (čárkou oddělené)",
+    )
     return parser
 
 
@@ -708,6 +1256,16 @@ def main() -> None:
             write_timeout=args.write_timeout,
         )
 
+    cache: Optional[ResponseCache] = None
+    if args.cache_size > 0:
+        event_types = frozenset(int(item) for item in str(args.cache_event_types).split(",") if item.strip().isdigit())
+        cache = ResponseCache(max_entries=args.cache_size, event_types=event_types)
+
+    try:
+        optimistic_ack = OptimisticAckRules(args.optimistic_ack)
+    except ValueError:
+        parser.error(f"Neplatná pravidla --optimistic-ack: {args.optimistic_ack}")
+
     listener = ControlTabListener(
         sink=sink,
         transport=transport,
@@ -716,6 +1274,8 @@ def main() -> None:
         retry_backoff=float(args.retry_backoff),
         once=bool(args.once),
         logger=logger,
+        cache=cache,
+        optimistic_ack=optimistic_ack,
     )
 
     def handle_signal(signum, _frame):  # noqa: ANN001
@@ -723,8 +1283,13 @@ def main() -> None:
         print(json.dumps({"signal": signum, "note": "Shutting down"}), flush=True)
         listener.stop()
 
+    def handle_reload(signum, _frame):  # noqa: ANN001
+        logger.info("Received signal %s – clearing Control Tab response cache", signum)
+        listener.clear_cache()
+
     signal.signal(signal.SIGINT, handle_signal)
     signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGHUP, handle_reload)
 
     lock_context = nullcontext()
     if not args.simulate and args.port:
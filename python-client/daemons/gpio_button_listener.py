@@ -1,211 +1,436 @@
 #!/usr/bin/env python3
-"""Poll a GPIO line and trigger a JSVV sequence when a button is pressed."""
+"""Wait for GPIO button edges and trigger the JSVV sequence bound to each button."""
 
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import logging
 import os
+import queue
+import re
+import selectors
 import signal
 import subprocess
 import sys
 import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 PYTHON_CLIENT_ROOT = PROJECT_ROOT / "python-client"
 DEFAULT_CONSUMER = "gpio-button-listener"
+DISPATCH_MODES = ("subprocess", "inprocess")
+LATENCY_SAMPLES = 256
 
 
 class ButtonReaderError(RuntimeError):
     """Raised when the GPIO backend encounters an unrecoverable error."""
 
 
-class ButtonReader:
-    """Abstract reader that returns the current button value (0 or 1)."""
+def _gpio_pool() -> Any:
+    src_dir = str(PYTHON_CLIENT_ROOT / "src")
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+    import gpio_pool  # type: ignore[import]
 
-    def read(self) -> int:
-        raise NotImplementedError
+    return gpio_pool
 
-    def close(self) -> None:  # pragma: no cover - backends may not require cleanup
-        pass
 
+@dataclass(slots=True)
+class EdgeEvent:
+    """Level change of one line; ``value`` is the raw level after the edge."""
 
-def _extend_sys_path_with_site_packages(base_dir: Path) -> None:
-    venv_dir = base_dir / ".venv"
-    if not venv_dir.exists():
-        return
-    for pattern in ("lib/python*/site-packages", "lib64/python*/site-packages"):
-        for candidate in venv_dir.glob(pattern):
-            candidate_path = str(candidate)
-            if candidate.is_dir() and candidate_path not in sys.path:
-                sys.path.insert(0, candidate_path)
+    line: int
+    value: int
+    timestamp: float
 
 
-def _import_gpiod() -> Optional[object]:
-    try:
-        import gpiod  # type: ignore[import]
-        return gpiod
-    except ModuleNotFoundError:
-        pass
+@dataclass(slots=True)
+class ButtonPress:
+    line: int
+    sequence: str
+    edge_at: float
+    detected_at: float
 
-    _extend_sys_path_with_site_packages(PYTHON_CLIENT_ROOT)
+    @property
+    def detect_latency(self) -> float:
+        return max(0.0, self.detected_at - self.edge_at)
 
-    extra_paths: list[str] = []
-    env_extra = os.environ.get("MODBUS_RS485_GPIO_PYTHONPATH", "")
-    if env_extra:
-        extra_paths.extend(path for path in env_extra.split(":") if path)
 
-    env_extra = os.environ.get("GPIO_BUTTON_PYTHONPATH", "")
-    if env_extra:
-        extra_paths.extend(path for path in env_extra.split(":") if path)
+class EdgeEventSource:
+    """Delivers level changes of a set of lines.
 
-    appended = False
-    for path_str in extra_paths:
-        if not path_str or path_str in sys.path:
-            continue
-        path_obj = Path(path_str)
-        if path_obj.exists():
-            sys.path.insert(0, path_str)
-            appended = True
+    Event-driven sources expose file descriptors that become readable when the
+    kernel queued an edge; polling sources set ``poll_interval`` instead and
+    synthesise edges by comparing consecutive reads.
+    """
 
-    if appended:
-        try:
-            import gpiod  # type: ignore[import]
-            return gpiod
-        except ModuleNotFoundError:
-            return None
+    name = "abstract"
+    kernel_debounce = False
+    poll_interval: Optional[float] = None
 
-    return None
+    def filenos(self) -> list[int]:
+        return []
 
+    def read_values(self) -> dict[int, int]:
+        raise NotImplementedError
 
-class GpiodButtonReader(ButtonReader):
-    """GPIO reader using Python bindings for libgpiod."""
+    def read_events(self, ready: list[int]) -> list[EdgeEvent]:
+        raise NotImplementedError
 
-    def __init__(self, chip_name: str, line_offset: int, consumer: str) -> None:
-        gpiod_module = _import_gpiod()
-        if gpiod_module is None:
-            raise ButtonReaderError("gpiod module not available")
+    def close(self) -> None:  # pragma: no cover - backends may not require cleanup
+        pass
 
-        self._chip_name = chip_name
-        self._line_offset = line_offset
 
-        if hasattr(gpiod_module, "request_lines"):
-            from gpiod import line as line_mod  # type: ignore[import]
+class GpiodEdgeEventSource(EdgeEventSource):
+    """Edge events through the process-wide GPIO pool (libgpiod Python bindings).
 
-            try:
-                config = {
-                    line_offset: gpiod_module.LineSettings(direction=line_mod.Direction.INPUT)
-                }
-                self._request = gpiod_module.request_lines(
-                    chip_name,
-                    consumer=consumer,
-                    config=config,
-                )
-            except Exception as exc:  # pragma: no cover - environment specific
-                raise ButtonReaderError(str(exc)) from exc
+    With libgpiod v2 the lines share the pool's request for the chip, with
+    kernel debounce; the fds become readable only when an edge of these lines
+    was queued and stay valid while other users re-request the chip.
+    The v1 fallback requests both-edge events per line and debounces in user
+    space.
+    """
 
-            self._reader = lambda: int(self._request.get_value(line_offset))
-            self._closer = self._request.release
-        else:  # pragma: no cover - legacy libgpiod v1 fallback
-            try:
-                chip = gpiod_module.Chip(chip_name)
-                line_obj = chip.get_line(line_offset)
-                line_obj.request(consumer=consumer, type=gpiod_module.LINE_REQ_DIR_IN)
-            except Exception as exc:
-                raise ButtonReaderError(str(exc)) from exc
+    name = "gpiod"
 
-            def closer() -> None:
-                try:
-                    line_obj.release()
-                finally:
-                    chip.close()
+    def __init__(self, chip_name: str, lines: Iterable[int], consumer: str, debounce_seconds: float) -> None:
+        gpio_pool = _gpio_pool()
+        try:
+            pool = gpio_pool.shared_pool(consumer)
+            self._lines = pool.claim_inputs(chip_name, list(lines), edge="both", debounce=max(0.0, debounce_seconds))
+        except gpio_pool.GpioPoolError as exc:
+            raise ButtonReaderError(str(exc)) from exc
+        self._error = gpio_pool.GpioPoolError
+        self.kernel_debounce = pool.kernel_debounce and debounce_seconds > 0
 
-            self._request = None
-            self._reader = lambda: int(line_obj.get_value())
-            self._closer = closer
+    def filenos(self) -> list[int]:
+        return self._lines.filenos()
 
-    def read(self) -> int:
+    def read_values(self) -> dict[int, int]:
         try:
-            value = self._reader()
-        except OSError as exc:
+            return self._lines.read()
+        except self._error as exc:
             raise ButtonReaderError(str(exc)) from exc
 
-        if value not in (0, 1):
-            raise ButtonReaderError(f"Unexpected GPIO value: {value}")
-        return value
+    def read_events(self, ready: list[int]) -> list[EdgeEvent]:
+        try:
+            edges = self._lines.read_edges()
+        except self._error as exc:
+            raise ButtonReaderError(str(exc)) from exc
+        return [EdgeEvent(line=edge.line, value=edge.value, timestamp=edge.timestamp) for edge in edges]
 
     def close(self) -> None:  # pragma: no cover - backend cleanup
         try:
-            self._closer()
+            self._lines.close()
         except Exception:
             pass
 
 
-class GpiogetButtonReader(ButtonReader):
-    """GPIO reader that shells out to the gpioget binary."""
+def _tool_major_version(binary: str) -> int:
+    """Return the libgpiod major version of a gpio* tool (1 when unknown)."""
 
-    def __init__(self, chip_name: str, line_offset: int) -> None:
-        self._chip_name = chip_name
-        self._line_offset = line_offset
-
-    def read(self) -> int:
-        command = ["gpioget", self._chip_name, str(self._line_offset)]
+    try:
         completed = subprocess.run(
-            command,
+            [binary, "--version"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             check=False,
             text=True,
         )
-        if completed.returncode != 0:
-            message = completed.stderr.strip() or completed.stdout.strip() or "unknown error"
-            raise ButtonReaderError(f"gpioget returned {completed.returncode}: {message}")
+    except FileNotFoundError as exc:
+        raise ButtonReaderError(f"{binary} binary not found in PATH") from exc
+    match = re.search(r"v(\d+)\.", completed.stdout + completed.stderr)
+    return int(match.group(1)) if match else 1
 
-        value_str = completed.stdout.strip()
-        if value_str not in {"0", "1"}:
-            raise ButtonReaderError(f"Unexpected gpioget output: {value_str!r}")
-        return int(value_str)
 
+def gpioget_command(chip_name: str, lines: Iterable[int], version: int) -> list[str]:
+    offsets = [str(line) for line in lines]
+    if version >= 2:
+        return ["gpioget", "--numeric", "-c", chip_name, *offsets]
+    return ["gpioget", chip_name, *offsets]
 
-class DebouncedEdgeDetector:
-    """Detect a rising edge that remains active for the configured debounce window."""
 
-    def __init__(self, active_value: int, debounce_seconds: float, initial_value: Optional[int] = None) -> None:
-        self._active_value = 1 if active_value else 0
-        self._debounce_seconds = max(0.0, debounce_seconds)
-        self._press_started_at: float | None = None
-        self._armed = True
-        if initial_value == self._active_value:
-            # Prevent immediately treating a steady active level as a new press
-            self._armed = False
-
-    def update(self, value: int, now: Optional[float] = None) -> bool:
-        now = now if now is not None else time.monotonic()
-
-        if value == self._active_value:
-            if not self._armed:
-                return False
-            if self._press_started_at is None:
-                self._press_started_at = now
-                return False
-            if now - self._press_started_at >= self._debounce_seconds:
-                self._armed = False
-                return True
-            return False
+def read_lines_with_gpioget(chip_name: str, lines: list[int], version: int) -> dict[int, int]:
+    """Read every line with a single gpioget call."""
 
-        self._press_started_at = None
-        self._armed = True
-        return False
+    completed = subprocess.run(
+        gpioget_command(chip_name, lines, version),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=False,
+        text=True,
+    )
+    if completed.returncode != 0:
+        message = completed.stderr.strip() or completed.stdout.strip() or "unknown error"
+        raise ButtonReaderError(f"gpioget returned {completed.returncode}: {message}")
 
-    def reset(self) -> None:
-        self._press_started_at = None
-        self._armed = True
+    values = completed.stdout.split()
+    if len(values) != len(lines) or any(value not in {"0", "1"} for value in values):
+        raise ButtonReaderError(f"Unexpected gpioget output: {completed.stdout.strip()!r}")
+    return {line: int(value) for line, value in zip(lines, values)}
+
+
+def parse_gpiomon_line(text: str) -> Optional[tuple[int, int]]:
+    """Parse one ``"<offset> <edge>"`` line printed by gpiomon with our format.
+
+    libgpiod v1 prints ``%e`` as 1/0, v2 prints ``%E`` as rising/falling.
+    """
+
+    parts = text.split()
+    if len(parts) < 2 or not parts[0].isdigit():
+        return None
+    edge = parts[1].lower()
+    if edge in {"1", "rising"}:
+        return int(parts[0]), 1
+    if edge in {"0", "falling"}:
+        return int(parts[0]), 0
+    return None
+
+
+class GpiomonEdgeEventSource(EdgeEventSource):
+    """Edge events streamed by one long-lived gpiomon process.
+
+    Used when the Python bindings are missing: a single fork at start-up
+    instead of one gpioget per poll. gpiomon v2 debounces in the kernel,
+    v1 output is debounced in user space.
+    """
+
+    name = "gpiomon"
+
+    def __init__(self, chip_name: str, lines: Iterable[int], debounce_seconds: float) -> None:
+        self._chip_name = chip_name
+        self._lines = list(lines)
+        self._version = _tool_major_version("gpiomon")
+        offsets = [str(line) for line in self._lines]
+        if self._version >= 2:
+            command = ["gpiomon", "-c", chip_name, "-F", "%o %E"]
+            if debounce_seconds > 0:
+                command.extend(["-p", f"{int(round(debounce_seconds * 1000))}ms"])
+                self.kernel_debounce = True
+        else:
+            command = ["gpiomon", "-F", "%o %e", chip_name]
+        command.extend(offsets)
+
+        # Initial levels come from gpioget; failing here means the chip/lines are unusable.
+        self._initial = read_lines_with_gpioget(chip_name, self._lines, self._version)
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+            )
+        except OSError as exc:
+            raise ButtonReaderError(f"Unable to start gpiomon: {exc}") from exc
+        assert self._process.stdout is not None
+        self._stdout = self._process.stdout.fileno()
+        self._buffer = b""
+
+    def filenos(self) -> list[int]:
+        return [self._stdout]
+
+    def read_values(self) -> dict[int, int]:
+        return dict(self._initial)
+
+    def read_events(self, ready: list[int]) -> list[EdgeEvent]:
+        chunk = os.read(self._stdout, 4096)
+        if not chunk:
+            stderr = b""
+            if self._process.stderr is not None:
+                stderr = self._process.stderr.read() or b""
+            raise ButtonReaderError(f"gpiomon exited: {stderr.decode(errors='replace').strip() or 'no output'}")
+        now = time.monotonic()
+        self._buffer += chunk
+        *complete, self._buffer = self._buffer.split(b"\n")
+        events: list[EdgeEvent] = []
+        for raw in complete:
+            parsed = parse_gpiomon_line(raw.decode(errors="replace"))
+            if parsed is not None:
+                events.append(EdgeEvent(line=parsed[0], value=parsed[1], timestamp=now))
+        return events
+
+    def close(self) -> None:  # pragma: no cover - backend cleanup
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+
+class GpiogetPollingSource(EdgeEventSource):
+    """Last-resort polling through gpioget; one fork per poll covers all lines."""
+
+    name = "gpioget"
+
+    def __init__(self, chip_name: str, lines: Iterable[int], poll_interval: float) -> None:
+        completed = subprocess.run(
+            ["which", "gpioget"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise ButtonReaderError("gpioget binary not found in PATH")
+        self._chip_name = chip_name
+        self._lines = list(lines)
+        self._version = _tool_major_version("gpioget")
+        self.poll_interval = poll_interval
+        self._last = self.read_values()
+
+    def read_values(self) -> dict[int, int]:
+        return read_lines_with_gpioget(self._chip_name, self._lines, self._version)
+
+    def read_events(self, ready: list[int]) -> list[EdgeEvent]:
+        values = self.read_values()
+        now = time.monotonic()
+        events = [
+            EdgeEvent(line=line, value=value, timestamp=now)
+            for line, value in values.items()
+            if self._last.get(line) != value
+        ]
+        self._last = values
+        return events
+
+
+class _LineState:
+    __slots__ = ("armed", "pending_since", "edge_at")
+
+    def __init__(self, armed: bool) -> None:
+        self.armed = armed
+        self.pending_since: float | None = None
+        self.edge_at = 0.0
+
+
+class ButtonEventEngine:
+    """Turn edge events of many lines into debounced button presses.
+
+    The thread blocks in ``selectors`` on the source descriptors plus a wake-up
+    pipe, so an idle listener does not wake at all. Each line is armed again
+    only after its inactive edge, i.e. holding a button fires once.
+    """
+
+    def __init__(
+        self,
+        source: EdgeEventSource,
+        buttons: dict[int, str],
+        active_value: int,
+        debounce_seconds: float,
+        on_press: Callable[[ButtonPress], None],
+        logger: logging.Logger,
+    ) -> None:
+        self._source = source
+        self._buttons = dict(buttons)
+        self._active_value = 1 if active_value else 0
+        self._debounce = 0.0 if source.kernel_debounce else max(0.0, debounce_seconds)
+        self._on_press = on_press
+        self._logger = logger
+        self._states: dict[int, _LineState] = {}
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self.wakeups = 0
+        self.presses = 0
+
+    def arm(self, levels: dict[int, int]) -> list[int]:
+        """Initialise line states; returns lines that start held (not armed)."""
+
+        held: list[int] = []
+        for line in self._buttons:
+            active = levels.get(line, 1 - self._active_value) == self._active_value
+            self._states[line] = _LineState(armed=not active)
+            if active:
+                held.append(line)
+        return held
+
+    def feed(self, events: Iterable[EdgeEvent], now: float) -> list[ButtonPress]:
+        presses: list[ButtonPress] = []
+        for event in events:
+            state = self._states.get(event.line)
+            if state is None:
+                continue
+            if event.value != self._active_value:
+                state.armed = True
+                state.pending_since = None
+                continue
+            if not state.armed or state.pending_since is not None:
+                continue
+            state.edge_at = event.timestamp
+            if self._debounce <= 0:
+                presses.append(self._fire(event.line, state, now))
+            else:
+                state.pending_since = now
+        return presses + self.expire(now)
+
+    def expire(self, now: float) -> list[ButtonPress]:
+        presses: list[ButtonPress] = []
+        for line, state in self._states.items():
+            if state.pending_since is not None and now - state.pending_since >= self._debounce:
+                presses.append(self._fire(line, state, now))
+        return presses
+
+    def next_timeout(self, now: float) -> Optional[float]:
+        deadlines = [
+            state.pending_since + self._debounce
+            for state in self._states.values()
+            if state.pending_since is not None
+        ]
+        timeout = max(0.0, min(deadlines) - now) if deadlines else None
+        poll = self._source.poll_interval
+        if poll is not None:
+            timeout = poll if timeout is None else min(timeout, poll)
+        return timeout
+
+    def _fire(self, line: int, state: _LineState, now: float) -> ButtonPress:
+        state.armed = False
+        state.pending_since = None
+        self.presses += 1
+        return ButtonPress(line=line, sequence=self._buttons[line], edge_at=state.edge_at, detected_at=now)
+
+    def wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def run(self, stop_event: threading.Event) -> None:
+        selector = selectors.DefaultSelector()
+        fds = self._source.filenos()
+        for fd in fds:
+            selector.register(fd, selectors.EVENT_READ)
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        try:
+            while not stop_event.is_set():
+                ready = [key.fd for key, _mask in selector.select(self.next_timeout(time.monotonic()))]
+                self.wakeups += 1
+                if self._wake_r in ready:
+                    try:
+                        os.read(self._wake_r, 64)
+                    except BlockingIOError:
+                        pass
+                    ready.remove(self._wake_r)
+                events: list[EdgeEvent] = []
+                if ready or self._source.poll_interval is not None:
+                    events = self._source.read_events(ready)
+                for press in self.feed(events, time.monotonic()):
+                    self._on_press(press)
+        finally:
+            selector.close()
+
+    def close(self) -> None:
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
 
 @dataclass(slots=True)
@@ -227,6 +452,8 @@ class ButtonConfig:
     python_path: str | None
     log_level: int
     consumer: str = DEFAULT_CONSUMER
+    buttons: dict[int, str] = field(default_factory=dict)
+    dispatch: str = "subprocess"
 
     @property
     def modbus_control(self) -> Path:
@@ -261,6 +488,27 @@ def parse_targets(value: Optional[str]) -> list[str]:
     return parts
 
 
+def parse_button_map(value: Optional[str]) -> dict[int, str]:
+    """Parse ``LINE=SEQUENCE`` bindings separated by commas, semicolons or spaces."""
+
+    buttons: dict[int, str] = {}
+    if not value:
+        return buttons
+    normalised = value.replace(",", " ").replace(";", " ")
+    for entry in normalised.split():
+        line_str, sep, sequence = entry.replace(":", "=", 1).partition("=")
+        if not sep or not sequence:
+            raise SystemExit(f"Invalid GPIO button binding (expected LINE=SEQUENCE): {entry}")
+        try:
+            line = int(line_str, 0)
+        except ValueError as exc:
+            raise SystemExit(f"Invalid GPIO line in binding: {entry}") from exc
+        if line in buttons:
+            raise SystemExit(f"GPIO line {line} bound more than once")
+        buttons[line] = sequence
+    return buttons
+
+
 def parse_log_level(value: Optional[str]) -> int:
     default_level = logging.INFO
     if not value:
@@ -280,13 +528,20 @@ def load_config(args: argparse.Namespace) -> ButtonConfig:
 
     chip_hint = args.chip_hint or env.get("GPIO_BUTTON_CHIP_HINT")
 
+    if args.buttons:
+        buttons = parse_button_map(" ".join(args.buttons))
+    else:
+        buttons = parse_button_map(env.get("GPIO_BUTTON_MAP"))
+
     line_value = args.line if args.line is not None else env.get("GPIO_BUTTON_LINE")
-    if line_value is None:
-        raise SystemExit("GPIO_BUTTON_LINE must be configured (env or CLI).")
-    try:
-        line = int(line_value, 0)
-    except ValueError as exc:
-        raise SystemExit(f"Invalid GPIO_BUTTON_LINE value: {line_value}") from exc
+    if line_value is None and not buttons:
+        raise SystemExit("GPIO_BUTTON_LINE or GPIO_BUTTON_MAP must be configured (env or CLI).")
+    line: Optional[int] = None
+    if line_value is not None:
+        try:
+            line = line_value if isinstance(line_value, int) else int(line_value, 0)
+        except ValueError as exc:
+            raise SystemExit(f"Invalid GPIO_BUTTON_LINE value: {line_value}") from exc
 
     debounce_ms = args.debounce_ms if args.debounce_ms is not None else env.get("GPIO_BUTTON_DEBOUNCE_MS", "75")
     try:
@@ -304,8 +559,14 @@ def load_config(args: argparse.Namespace) -> ButtonConfig:
     backend = (args.backend or env.get("GPIO_BUTTON_BACKEND") or "auto").strip().lower()
 
     sequence = args.sequence or env.get("GPIO_BUTTON_SEQUENCE")
-    if not sequence:
-        raise SystemExit("GPIO_BUTTON_SEQUENCE must be configured (env or CLI).")
+    if not buttons:
+        if not sequence:
+            raise SystemExit("GPIO_BUTTON_SEQUENCE must be configured (env or CLI).")
+        assert line is not None
+        buttons = {line: sequence}
+    if line is None or line not in buttons:
+        line = next(iter(buttons))
+    sequence = buttons[line]
 
     priority = args.priority if args.priority is not None else parse_optional_int(env.get("GPIO_BUTTON_PRIORITY"))
     remote = args.remote if args.remote is not None else parse_optional_int(env.get("GPIO_BUTTON_REMOTE"))
@@ -330,6 +591,10 @@ def load_config(args: argparse.Namespace) -> ButtonConfig:
 
     log_level = parse_log_level(args.log_level or env.get("GPIO_BUTTON_LOG_LEVEL"))
 
+    dispatch = (args.dispatch or env.get("GPIO_BUTTON_DISPATCH") or "subprocess").strip().lower()
+    if dispatch not in DISPATCH_MODES:
+        raise SystemExit(f"Invalid GPIO_BUTTON_DISPATCH value: {dispatch} (expected {', '.join(DISPATCH_MODES)})")
+
     active_value: int
     if args.active_value is not None:
         active_value = 1 if args.active_value else 0
@@ -358,6 +623,8 @@ def load_config(args: argparse.Namespace) -> ButtonConfig:
         python_bin=python_bin,
         python_path=python_path,
         log_level=log_level,
+        buttons=buttons,
+        dispatch=dispatch,
     )
 
 
@@ -369,11 +636,11 @@ def setup_logging(level: int) -> logging.Logger:
     return logging.getLogger("gpio_button_listener")
 
 
-def build_reader(config: ButtonConfig, logger: logging.Logger) -> ButtonReader:
+def build_event_source(config: ButtonConfig, logger: logging.Logger) -> EdgeEventSource:
     backends: list[str]
     backend = config.backend.lower()
     if backend == "auto":
-        backends = ["gpiod", "gpioget"]
+        backends = ["gpiod", "gpiomon", "gpioget"]
     else:
         backends = [backend]
 
@@ -381,42 +648,38 @@ def build_reader(config: ButtonConfig, logger: logging.Logger) -> ButtonReader:
     if config.chip_hint and config.chip_hint not in chip_candidates:
         chip_candidates.append(config.chip_hint)
 
+    lines = list(config.buttons)
+    lines_desc = ",".join(str(line) for line in lines)
     last_error: Optional[Exception] = None
 
     for backend_name in backends:
         for candidate_chip in chip_candidates:
             try:
+                source: EdgeEventSource
                 if backend_name == "gpiod":
-                    reader = GpiodButtonReader(candidate_chip, config.line, config.consumer)
-                    if candidate_chip != config.chip:
-                        logger.warning("Primary chip %s unavailable, using hint %s", config.chip, candidate_chip)
-                    return reader
-                if backend_name == "gpioget":
-                    completed = subprocess.run(
-                        ["which", "gpioget"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        check=False,
-                        text=True,
-                    )
-                    if completed.returncode != 0:
-                        raise ButtonReaderError("gpioget binary not found in PATH")
-                    reader = GpiogetButtonReader(candidate_chip, config.line)
-                    if candidate_chip != config.chip:
-                        logger.warning("Primary chip %s unavailable, using hint %s", config.chip, candidate_chip)
-                    return reader
-                raise SystemExit(f"Unsupported GPIO backend: {backend_name}")
+                    source = GpiodEdgeEventSource(candidate_chip, lines, config.consumer, config.debounce_seconds)
+                elif backend_name == "gpiomon":
+                    source = GpiomonEdgeEventSource(candidate_chip, lines, config.debounce_seconds)
+                elif backend_name == "gpioget":
+                    source = GpiogetPollingSource(candidate_chip, lines, config.poll_interval)
+                else:
+                    raise SystemExit(f"Unsupported GPIO backend: {backend_name}")
+                if candidate_chip != config.chip:
+                    logger.warning("Primary chip %s unavailable, using hint %s", config.chip, candidate_chip)
+                return source
+            except SystemExit:
+                raise
             except Exception as exc:
                 last_error = exc
-                logger.warning("Failed to initialise %s backend on %s:%d: %s", backend_name, candidate_chip, config.line, exc)
+                logger.warning("Failed to initialise %s backend on %s:%s: %s", backend_name, candidate_chip, lines_desc, exc)
 
     if last_error is None:
         raise SystemExit("Unable to initialise any GPIO backend.")
     raise SystemExit(f"Unable to initialise GPIO backend ({config.backend}): {last_error}")
 
 
-def build_jsvv_command(config: ButtonConfig) -> list[str]:
-    command = [config.python_bin, str(config.modbus_control), "jsvv-send", "--sequence", config.sequence]
+def build_jsvv_command(config: ButtonConfig, sequence: Optional[str] = None) -> list[str]:
+    command = [config.python_bin, str(config.modbus_control), "jsvv-send", "--sequence", sequence or config.sequence]
     if config.priority is not None:
         command.extend(["--priority", str(config.priority)])
     if config.remote is not None:
@@ -478,112 +741,373 @@ def dispatch_jsvv(command: Iterable[str], python_path: Optional[str], logger: lo
     return status == "ok"
 
 
-def wait_for_release(
-    reader: ButtonReader,
-    detector: DebouncedEdgeDetector,
-    config: ButtonConfig,
-    stop_event: threading.Event,
-    logger: logging.Logger,
-) -> None:
-    release_logged = False
-    while not stop_event.is_set():
+class PressDispatcher:
+    """Run JSVV dispatches off the event thread so other buttons stay responsive.
+
+    A press whose sequence is already queued or running is dropped instead of
+    stacking duplicate broadcasts.
+    """
+
+    def __init__(self, config: ButtonConfig, logger: logging.Logger, on_fatal: Callable[[], None]) -> None:
+        self._config = config
+        self._logger = logger
+        self._on_fatal = on_fatal
+        self._commands = {line: build_jsvv_command(config, sequence) for line, sequence in config.buttons.items()}
+        self._queue: "queue.Queue[Optional[ButtonPress]]" = queue.Queue()
+        self._busy: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="gpio-button-dispatch", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def submit(self, press: ButtonPress) -> bool:
+        with self._lock:
+            if press.sequence in self._busy:
+                self._logger.info("Sequence %s already pending, ignoring press on line %d.", press.sequence, press.line)
+                return False
+            self._busy.add(press.sequence)
+        self._queue.put(press)
+        return True
+
+    def _release(self, sequence: str) -> None:
+        with self._lock:
+            self._busy.discard(sequence)
+
+    def _run(self) -> None:
+        while True:
+            press = self._queue.get()
+            if press is None:
+                return
+            try:
+                dispatch_jsvv(self._commands[press.line], self._config.python_path, self._logger)
+            except SystemExit:
+                self._on_fatal()
+            except Exception:  # pragma: no cover - defensive
+                self._logger.exception("JSVV dispatch for line %d failed", press.line)
+            finally:
+                self._release(press.sequence)
+
+
+def _import_modbus_control() -> Any:
+    if str(PYTHON_CLIENT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PYTHON_CLIENT_ROOT))
+    import modbus_control  # type: ignore[import]
+
+    return modbus_control
+
+
+def build_jsvv_plans(config: ButtonConfig) -> dict[int, dict[str, Any]]:
+    """Resolve route payload and command words of every bound sequence once."""
+
+    modbus_control = _import_modbus_control()
+    plans: dict[int, dict[str, Any]] = {}
+    for line, sequence in config.buttons.items():
+        try:
+            plans[line] = modbus_control.plan_jsvv_send(
+                sequence,
+                priority=config.priority if config.priority is not None else 1,
+                remote=config.remote,
+                targets=config.targets or None,
+                repeat=config.repeat,
+                repeat_delay=config.repeat_delay,
+            )
+        except ValueError as exc:
+            raise SystemExit(f"Invalid JSVV sequence {sequence} for line {line}: {exc}") from exc
+    return plans
+
+
+def modbus_client_factory() -> Callable[[], Any]:
+    """Return a connect function using the same MODBUS_* settings as modbus_control.py."""
+
+    modbus_control = _import_modbus_control()
+    defaults = argparse.Namespace(
+        port=None,
+        method=None,
+        parity=None,
+        baudrate=None,
+        stopbits=None,
+        bytesize=None,
+        timeout=None,
+        unit_id=None,
+    )
+    settings, unit_id = modbus_control.resolve_serial_settings(defaults)
+
+    def _connect() -> Any:
+        client = modbus_control.ModbusAudioClient(settings=settings, unit_id=unit_id, priority=modbus_control.PRIORITY_URGENT)
+        client.connect()
+        return client
+
+    return _connect
+
+
+class ModbusPressDispatcher(PressDispatcher):
+    """Write precomputed JSVV plans through a Modbus client kept open in-process.
+
+    The I/O thread owns the client and a heap of due writes: a press queues the
+    first attempt immediately and every repeat at its own due time, so waiting
+    for a repeat never blocks another button. The first attempt writes the
+    route and the command word burst in one bus transaction, so no other bus
+    user can re-route in between; repeats only resend the command words.
+    Press-to-air latency is measured from the GPIO edge to the completed first
+    command write.
+    """
+
+    def __init__(
+        self,
+        config: ButtonConfig,
+        logger: logging.Logger,
+        on_fatal: Callable[[], None],
+        plans: dict[int, dict[str, Any]],
+        connect: Callable[[], Any],
+        route_register: int,
+    ) -> None:
+        super().__init__(config, logger, on_fatal)
+        self._plans = plans
+        self._connect = connect
+        self._route_register = route_register
+        self._client: Any = None
+        self._order = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.writes = 0
+        self.errors = 0
+
+    def start(self) -> None:
+        # Pre-arm: open the port before the first press; failures are retried on press.
+        self._ensure_client()
+        super().start()
+
+    def _ensure_client(self) -> Any:
+        if self._client is None:
+            try:
+                self._client = self._connect()
+                self._logger.info("Modbus client opened for in-process JSVV dispatch.")
+            except Exception as exc:
+                self.errors += 1
+                self._logger.warning("Unable to open Modbus client: %s", exc)
+        return self._client
+
+    def _drop_client(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            try:
+                client.close()
+            except Exception:  # pragma: no cover - defensive
+                pass
+
+    def _send(self, client: Any, address: int, values: list[int], unit: Optional[int] = None) -> bool:
+        """One register write; a failure is counted and logged, the caller drops the client."""
+
         try:
-            value = reader.read()
-        except ButtonReaderError as exc:
-            logger.warning("GPIO read failed while waiting for release: %s", exc)
-            stop_event.wait(config.poll_interval)
-            continue
-        if value != config.active_value:
-            detector.reset()
-            if not release_logged:
-                logger.debug("Button released, ready for next trigger.")
-                release_logged = True
-            return
-        stop_event.wait(config.poll_interval)
-
-
-def run_loop(config: ButtonConfig, reader: ButtonReader, logger: logging.Logger) -> None:
+            client.write_registers(address, values, unit=unit)
+        except Exception as exc:
+            self.errors += 1
+            self._logger.warning("Modbus write to 0x%04X failed: %s", address, exc)
+            return False
+        self.writes += 1
+        return True
+
+    def _write(self, address: int, values: list[int], unit: Optional[int] = None) -> bool:
+        client = self._ensure_client()
+        if client is None:
+            return False
+        if not self._send(client, address, values, unit):
+            self._drop_client()
+            return False
+        return True
+
+    def _schedule(self, heap: list[tuple[float, int, ButtonPress, int]], press: ButtonPress) -> None:
+        plan = self._plans[press.line]
+        now = time.monotonic()
+        for attempt in range(plan["repeat"]):
+            due = now + attempt * plan["repeatDelay"]
+            self._order += 1
+            heapq.heappush(heap, (due, self._order, press, attempt))
+
+    def _write_routed(self, plan: dict[str, Any]) -> bool:
+        client = self._ensure_client()
+        if client is None:
+            return False
+        try:
+            with client.transaction():
+                ok = self._send(client, self._route_register, plan["routePayload"]) and self._send(
+                    client, plan["register"], plan["commandWords"], unit=plan["remoteUnit"]
+                )
+        except Exception as exc:  # bus arbitration timeout
+            self.errors += 1
+            self._logger.warning("Unable to take the Modbus bus for JSVV dispatch: %s", exc)
+            return False
+        if not ok:
+            # Only now that the transaction has released the bus.
+            self._drop_client()
+        return ok
+
+    def _execute(self, press: ButtonPress, attempt: int) -> None:
+        plan = self._plans[press.line]
+        if attempt == 0:
+            ok = self._write_routed(plan)
+            latency = time.monotonic() - press.edge_at
+            self._latencies.append(latency)
+            self._logger.info(
+                "JSVV sequence %s %s %.1f ms after button edge (line %d).",
+                press.sequence,
+                "on air" if ok else "failed",
+                latency * 1000,
+                press.line,
+            )
+        else:
+            self._write(plan["register"], plan["commandWords"], unit=plan["remoteUnit"])
+        if attempt + 1 >= plan["repeat"]:
+            self._release(press.sequence)
+
+    def _run(self) -> None:
+        heap: list[tuple[float, int, ButtonPress, int]] = []
+        while True:
+            timeout = max(0.0, heap[0][0] - time.monotonic()) if heap else None
+            try:
+                press = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            else:
+                if press is None:
+                    break
+                self._schedule(heap, press)
+            while heap and heap[0][0] <= time.monotonic():
+                _due, _order, due_press, attempt = heapq.heappop(heap)
+                self._execute(due_press, attempt)
+        if heap:
+            self._logger.info("Dropping %d pending JSVV repeat writes on shutdown.", len(heap))
+        self._drop_client()
+
+    def stats(self) -> dict[str, Any]:
+        samples = sorted(self._latencies)
+
+        def _ms(fraction: float) -> Optional[float]:
+            if not samples:
+                return None
+            return round(samples[min(len(samples) - 1, int(fraction * len(samples)))] * 1000, 1)
+
+        return {
+            "presses": len(samples),
+            "writes": self.writes,
+            "errors": self.errors,
+            "pressToAirMs": {"p50": _ms(0.5), "p95": _ms(0.95), "max": _ms(1.0)},
+        }
+
+
+def build_dispatcher(config: ButtonConfig, logger: logging.Logger, on_fatal: Callable[[], None]) -> PressDispatcher:
+    if config.dispatch == "inprocess":
+        try:
+            plans = build_jsvv_plans(config)
+            connect = modbus_client_factory()
+            route_register = _import_modbus_control().constants.NUM_ADDR_RAM
+        except SystemExit:
+            raise
+        except Exception as exc:
+            logger.warning("In-process JSVV dispatch unavailable (%s), falling back to jsvv-send subprocess.", exc)
+        else:
+            for line, plan in plans.items():
+                logger.debug("Line %d plan: route=%s words=%s", line, plan["routePayload"], plan["commandWords"])
+            return ModbusPressDispatcher(config, logger, on_fatal, plans, connect, route_register)
+    return PressDispatcher(config, logger, on_fatal)
+
+
+def run_loop(config: ButtonConfig, source: EdgeEventSource, logger: logging.Logger) -> None:
     stop_event = threading.Event()
+    engine: Optional[ButtonEventEngine] = None
+
+    def _stop() -> None:
+        stop_event.set()
+        if engine is not None:
+            engine.wake()
 
     def _handle_signal(signum: int, _frame: object) -> None:
         logger.info("Received signal %s, shutting down.", signum)
-        stop_event.set()
+        _stop()
 
     for sig in (signal.SIGTERM, signal.SIGINT):
         signal.signal(sig, _handle_signal)
 
+    dispatcher = build_dispatcher(config, logger, _stop)
+
+    def _on_press(press: ButtonPress) -> None:
+        logger.info(
+            "Detected button press on %s:%d (edge-to-detect %.1f ms). Dispatching JSVV sequence %s",
+            config.chip,
+            press.line,
+            press.detect_latency * 1000,
+            press.sequence,
+        )
+        dispatcher.submit(press)
+
+    engine = ButtonEventEngine(
+        source,
+        config.buttons,
+        config.active_value,
+        config.debounce_seconds,
+        _on_press,
+        logger,
+    )
+
     try:
-        initial_value = reader.read()
+        levels = source.read_values()
     except ButtonReaderError as exc:
         logger.warning("Unable to read initial GPIO state: %s (assuming inactive)", exc)
-        initial_value = 1 - config.active_value
-
-    detector = DebouncedEdgeDetector(config.active_value, config.debounce_seconds, initial_value)
-    if initial_value == config.active_value:
+        levels = {}
+    for line in engine.arm(levels):
         logger.info(
-            "GPIO button initialised in active state (%d); waiting for release before enabling triggers.",
+            "GPIO button %d initialised in active state (%d); waiting for release before enabling triggers.",
+            line,
             config.active_value,
         )
-    else:
-        logger.debug(
-            "GPIO button initialised in inactive state (%d).",
-            1 - config.active_value,
-        )
-    poll_seconds = config.poll_interval
-    command = build_jsvv_command(config)
 
+    if source.poll_interval is None:
+        mode_desc = "edge events" + (", kernel debounce" if source.kernel_debounce else "")
+    else:
+        mode_desc = f"polling every {int(source.poll_interval * 1000)} ms"
     logger.info(
-        "Listening for GPIO button presses on %s:%d (active=%d, debounce=%d ms, poll=%d ms).",
+        "Listening for GPIO button presses on %s lines %s via %s (%s, active=%d, debounce=%d ms).",
         config.chip,
-        config.line,
+        ",".join(str(line) for line in config.buttons),
+        source.name,
+        mode_desc,
         config.active_value,
         int(config.debounce_seconds * 1000),
-        int(poll_seconds * 1000),
     )
-    targets_desc = config.targets if config.targets else ["default"]
     priority_desc = "default" if config.priority is None else str(config.priority)
     remote_desc = "default" if config.remote is None else str(config.remote)
     repeat_desc = "default" if config.repeat is None else str(config.repeat)
     delay_desc = "default" if config.repeat_delay is None else str(config.repeat_delay)
+    targets_desc = config.targets if config.targets else ["default"]
+    for line, sequence in config.buttons.items():
+        logger.info(
+            "Line %d -> JSVV sequence %s (priority=%s, remote=%s, repeat=%s, delay=%s, targets=%s)",
+            line,
+            sequence,
+            priority_desc,
+            remote_desc,
+            repeat_desc,
+            delay_desc,
+            targets_desc,
+        )
 
-    logger.info(
-        "Configured JSVV sequence: %s (priority=%s, remote=%s, repeat=%s, delay=%s, targets=%s)",
-        config.sequence,
-        priority_desc,
-        remote_desc,
-        repeat_desc,
-        delay_desc,
-        targets_desc,
-    )
-
-    value = initial_value
-    while not stop_event.is_set():
-        if detector.update(value):
-            logger.info(
-                "Detected button press on %s:%d. Dispatching JSVV sequence %s",
-                config.chip,
-                config.line,
-                config.sequence,
-            )
-            try:
-                dispatch_jsvv(command, config.python_path, logger)
-            except SystemExit:
-                stop_event.set()
-                break
-            wait_for_release(reader, detector, config, stop_event, logger)
-
-        if stop_event.wait(poll_seconds):
-            break
-
-        try:
-            value = reader.read()
-        except ButtonReaderError as exc:
-            logger.error("Stopping due to GPIO error: %s", exc)
-            stop_event.set()
-            break
-
-    reader.close()
-    logger.info("GPIO button listener stopped.")
+    dispatcher.start()
+    try:
+        engine.run(stop_event)
+    except ButtonReaderError as exc:
+        logger.error("Stopping due to GPIO error: %s", exc)
+    finally:
+        stop_event.set()
+        dispatcher.stop()
+        engine.close()
+        source.close()
+    if isinstance(dispatcher, ModbusPressDispatcher):
+        logger.info("In-process JSVV dispatch stats: %s", json.dumps(dispatcher.stats()))
+    logger.info("GPIO button listener stopped (%d presses, %d wake-ups).", engine.presses, engine.wakeups)
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -591,10 +1115,17 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--chip", help="GPIO chip name (env: GPIO_BUTTON_CHIP)")
     parser.add_argument("--chip-hint", help="Optional fallback chip name (env: GPIO_BUTTON_CHIP_HINT)")
     parser.add_argument("--line", type=lambda value: int(value, 0), help="GPIO line offset (env: GPIO_BUTTON_LINE)")
+    parser.add_argument(
+        "--button",
+        dest="buttons",
+        action="append",
+        metavar="LINE=SEQUENCE",
+        help="Bind a GPIO line to its own JSVV sequence, repeatable (env: GPIO_BUTTON_MAP, e.g. 0=28A9,3=1B)",
+    )
     parser.add_argument("--active-value", type=int, choices=[0, 1], help="Button active value (env: GPIO_BUTTON_ACTIVE_VALUE / GPIO_BUTTON_ACTIVE_HIGH)")
     parser.add_argument("--debounce-ms", type=float, help="Debounce window in milliseconds (env: GPIO_BUTTON_DEBOUNCE_MS)")
-    parser.add_argument("--poll-interval", type=float, help="Polling interval in seconds (env: GPIO_BUTTON_POLL_INTERVAL)")
-    parser.add_argument("--backend", help="GPIO backend (auto, gpiod, gpioget) (env: GPIO_BUTTON_BACKEND)")
+    parser.add_argument("--poll-interval", type=float, help="Polling interval in seconds for the gpioget backend (env: GPIO_BUTTON_POLL_INTERVAL)")
+    parser.add_argument("--backend", help="GPIO backend (auto, gpiod, gpiomon, gpioget) (env: GPIO_BUTTON_BACKEND)")
     parser.add_argument("--sequence", help="JSVV sequence to send (env: GPIO_BUTTON_SEQUENCE)")
     parser.add_argument("--priority", type=lambda value: int(value, 0), help="Priority register value (env: GPIO_BUTTON_PRIORITY)")
     parser.add_argument("--remote", type=lambda value: int(value, 0), help="Remote device address (env: GPIO_BUTTON_REMOTE)")
@@ -603,6 +1134,11 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument("--targets", nargs="+", help="Target nest addresses (env: GPIO_BUTTON_TARGETS)")
     parser.add_argument("--python-bin", help="Python interpreter for modbus_control.py (env: PYTHON_BIN / GPIO_BUTTON_PYTHON_BIN)")
     parser.add_argument("--python-path", help="PYTHONPATH while invoking modbus_control.py (env: PYTHONPATH / GPIO_BUTTON_PYTHONPATH)")
+    parser.add_argument(
+        "--dispatch",
+        choices=DISPATCH_MODES,
+        help="subprocess = modbus_control.py jsvv-send per press, inprocess = keep the Modbus port open (env: GPIO_BUTTON_DISPATCH)",
+    )
     parser.add_argument("--log-level", help="Logging level (env: GPIO_BUTTON_LOG_LEVEL)")
     return parser
 
@@ -614,8 +1150,8 @@ def main(argv: Optional[list[str]] = None) -> int:
     config = load_config(args)
     logger = setup_logging(config.log_level)
 
-    reader = build_reader(config, logger)
-    run_loop(config, reader, logger)
+    source = build_event_source(config, logger)
+    run_loop(config, source, logger)
     return 0
 
 
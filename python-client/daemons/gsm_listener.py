@@ -17,12 +17,15 @@ import argparse
 import json
 import os
 import queue
+import re
 import signal
 import subprocess
 import threading
 import time
 import uuid
-from dataclasses import dataclass, asdict
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
@@ -40,6 +43,36 @@ except Exception:  # pragma: no cover - graceful fallback
 from _locks import PortLock
 
 
+DEFAULT_COMMAND_TIMEOUT = 2.0
+FINAL_OK = {"OK", "CONNECT"}
+FINAL_ERROR_PREFIXES = ("ERROR", "+CME ERROR", "+CMS ERROR")
+CALL_RESULT_CODES = {"NO CARRIER", "BUSY", "NO ANSWER", "NO DIALTONE"}
+URC_PREFIXES = (
+    "RING",
+    "+CRING",
+    "+CLIP:",
+    "+CLCC:",
+    "+COLP:",
+    "+CIEV:",
+    "VOICE CALL:",
+    "MISSED_CALL",
+    "+CMTI:",
+    "+CREG:",
+    "+CGREG:",
+    "+CPIN:",
+    "SMS DONE",
+    "PB DONE",
+)
+# Prefixes a command reply shares with a URC, and the shape only the reply has:
+# ``AT+CLIP?`` answers ``+CLIP: <n>,<m>`` while the caller ID URC starts with a number
+# in quotes; ``AT+CREG?`` answers ``+CREG: <n>,<stat>`` while the URC is ``+CREG: <stat>[,"<lac>"...]``.
+REPLY_SHAPES = {
+    "+CLIP:": re.compile(r"^\+CLIP: *\d+ *, *\d+$"),
+    "+CREG:": re.compile(r"^\+CREG: *\d+ *, *\d+"),
+    "+CGREG:": re.compile(r"^\+CGREG: *\d+ *, *\d+"),
+}
+
+
 class CallState(Enum):
     RINGING = "ringing"
     ACCEPTED = "accepted"
@@ -126,7 +159,62 @@ class BackendSink:
             return {"status": "ok"}
 
 
+@dataclass(slots=True)
+class AtResponse:
+    command: str
+    ok: bool
+    lines: list[str]
+    final: Optional[str] = None
+    timed_out: bool = False
+
+
+@dataclass(slots=True)
+class _PendingCommand:
+    command: str
+    timeout: float
+    future: "Future[AtResponse]"
+    prefix: Optional[str]
+    lines: list[str] = field(default_factory=list)
+    deadline: float = 0.0
+
+
+def _expected_prefix(command: str) -> Optional[str]:
+    """``AT+CSQ`` / ``AT+CPIN?`` / ``AT+CLIP=1`` answer with ``+CSQ:`` / ``+CPIN:`` / ``+CLIP:``."""
+
+    upper = command.strip().upper()
+    if not upper.startswith("AT+"):
+        return None
+    name = upper[2:]
+    for separator in ("=", "?"):
+        name = name.split(separator, 1)[0]
+    return f"{name}:"
+
+
+def _is_urc(line: str) -> bool:
+    return line in CALL_RESULT_CODES or line.startswith(URC_PREFIXES)
+
+
+def _is_reply(line: str, prefix: Optional[str]) -> bool:
+    """Whether ``line`` is the information response of a command answering with ``prefix``."""
+
+    if prefix is None or not line.startswith(prefix):
+        return False
+    shape = REPLY_SHAPES.get(prefix)
+    return shape is None or shape.match(line) is not None
+
+
 class Sim7600ATClient:
+    """AT client that owns the modem port through a single reader thread.
+
+    Every line read is routed either to the command in flight (echo, its
+    ``+XXX:`` information lines and the final result code) or to the
+    unsolicited result queue returned by :meth:`read_urc`, so RING/+CLIP
+    cannot be swallowed by a command and command replies never reach the
+    call state machine. Commands are queued and written one at a time; each
+    returns a future resolved with an :class:`AtResponse` or a timeout
+    measured on the monotonic clock.
+    """
+
     def __init__(
         self,
         port: str,
@@ -147,6 +235,12 @@ class Sim7600ATClient:
         self._write_timeout = write_timeout
         self._serial: Optional[Serial] = None
         self._sim_pin = sim_pin.strip() if sim_pin and sim_pin.strip() else None
+        self._urc: queue.Queue[str] = queue.Queue()
+        self._commands: deque[_PendingCommand] = deque()
+        self._active: Optional[_PendingCommand] = None
+        self._mux_lock = threading.RLock()
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()
 
     def open(self) -> None:
         if serial is None:
@@ -161,6 +255,7 @@ class Sim7600ATClient:
             timeout=self._timeout,
             write_timeout=self._write_timeout,
         )
+        self._start_reader()
 
         self._send_command("AT")
         self._send_command("ATE0")  # disable echo
@@ -171,34 +266,62 @@ class Sim7600ATClient:
         self._ensure_sim_ready()
 
     def close(self) -> None:
+        self._reader_stop.set()
+        if self._reader is not None:
+            self._reader.join(timeout=max(1.0, self._timeout * 2))
+            self._reader = None
+        with self._mux_lock:
+            pending = ([self._active] if self._active else []) + list(self._commands)
+            self._active = None
+            self._commands.clear()
+        for command in pending:
+            self._resolve(command, AtResponse(command.command, False, command.lines, final="CLOSED"))
         if self._serial and self._serial.is_open:
             self._serial.close()
         self._serial = None
 
-    def readline(self) -> Optional[str]:
-        if self._serial is None or not self._serial.is_open:
-            return None
+    def read_urc(self, timeout: float) -> Optional[str]:
+        """Return the next unsolicited result line, or None after ``timeout`` seconds."""
+
         try:
-            raw = self._serial.readline()
-        except Exception:
-            return None
-        if not raw:
+            return self._urc.get(timeout=timeout)
+        except queue.Empty:
             return None
-        return raw.decode("utf-8", errors="ignore").strip()
+
+    def submit(self, command: str, timeout: float = DEFAULT_COMMAND_TIMEOUT) -> "Future[AtResponse]":
+        future: Future[AtResponse] = Future()
+        if self._serial is None or not self._serial.is_open:
+            future.set_result(AtResponse(command, False, [], final="CLOSED"))
+            return future
+        pending = _PendingCommand(command, max(0.1, timeout), future, _expected_prefix(command))
+        with self._mux_lock:
+            self._commands.append(pending)
+            if self._active is None:
+                self._start_next()
+        return future
+
+    def execute(self, command: str, timeout: float = DEFAULT_COMMAND_TIMEOUT) -> AtResponse:
+        future = self.submit(command, timeout)
+        try:
+            # The reader thread enforces the deadline; the margin covers one serial read timeout.
+            return future.result(timeout=timeout + self._timeout + 1.0)
+        except FutureTimeoutError:
+            return AtResponse(command, False, [], timed_out=True)
 
     def answer(self) -> bool:
-        ok, _ = self._send_command("ATA", expect_response=True)
-        return ok
+        return self.execute("ATA", timeout=5.0).ok
 
     def hangup(self) -> bool:
-        ok, _ = self._send_command("ATH", expect_response=True)
-        return ok
+        return self.execute("ATH", timeout=3.0).ok
 
     def signal_quality(self) -> Optional[int]:
-        ok, response = self._send_command("AT+CSQ", expect_response=True)
-        if not ok or response is None:
+        return self.parse_signal_quality(self.execute("AT+CSQ"))
+
+    @staticmethod
+    def parse_signal_quality(response: AtResponse) -> Optional[int]:
+        if not response.ok:
             return None
-        for line in response:
+        for line in response.lines:
             if line.startswith("+CSQ:"):
                 try:
                     value = int(line.split(":")[1].split(",")[0].strip())
@@ -210,32 +333,87 @@ class Sim7600ATClient:
         return None
 
     def _send_command(self, command: str, expect_response: bool = False) -> tuple[bool, Optional[list[str]]]:
-        if self._serial is None or not self._serial.is_open:
-            return False, None
-        try:
-            self._serial.write((command + "\r").encode("utf-8"))
-            self._serial.flush()
-        except Exception:
-            return False, None
-
         if not expect_response:
-            return True, None
+            # Still routed through the multiplexer so the reply is consumed, just not awaited.
+            self.submit(command)
+            return self._serial is not None, None
+        response = self.execute(command)
+        return response.ok, response.lines or None
 
-        lines: list[str] = []
-        deadline = time.time() + 2.0
-        while time.time() < deadline:
-            line = self.readline()
-            if line is None:
-                continue
-            if line == "":
-                continue
-            if line in {"AT", command}:
+    # ------------------------------------------------------------------
+    # Multiplexer
+    # ------------------------------------------------------------------
+    def _start_reader(self) -> None:
+        self._reader_stop.clear()
+        self._reader = threading.Thread(target=self._read_loop, name="gsm-at-reader", daemon=True)
+        self._reader.start()
+
+    def _read_loop(self) -> None:
+        while not self._reader_stop.is_set():
+            serial_port = self._serial
+            if serial_port is None:
+                return
+            try:
+                raw = serial_port.readline()
+            except Exception:
+                raw = b""
+                self._reader_stop.wait(self._timeout)
+            line = raw.decode("utf-8", errors="ignore").strip() if raw else ""
+            with self._mux_lock:
+                if line:
+                    self._route(line)
+                self._expire()
+
+    def _route(self, line: str) -> None:
+        active = self._active
+        if active is not None:
+            if line in {"AT", active.command}:
+                return  # echo (before ATE0 takes effect)
+            if line in FINAL_OK or line.startswith(FINAL_ERROR_PREFIXES):
+                self._complete(AtResponse(active.command, line in FINAL_OK, active.lines, final=line))
+                return
+            if line in CALL_RESULT_CODES and active.command.upper().startswith(("ATA", "ATD")):
+                # Final result of the call command, but the call state machine needs it too.
+                self._complete(AtResponse(active.command, False, active.lines, final=line))
+                self._urc.put(line)
+                return
+            if _is_reply(line, active.prefix):
+                active.lines.append(line)
+                return
+            if not _is_urc(line):
+                active.lines.append(line)
+                return
+        self._urc.put(line)
+
+    def _expire(self) -> None:
+        active = self._active
+        if active is not None and time.monotonic() >= active.deadline:
+            self._complete(AtResponse(active.command, False, active.lines, timed_out=True))
+
+    def _complete(self, response: AtResponse) -> None:
+        active = self._active
+        self._active = None
+        if active is not None:
+            self._resolve(active, response)
+        self._start_next()
+
+    def _start_next(self) -> None:
+        while self._active is None and self._commands:
+            pending = self._commands.popleft()
+            try:
+                assert self._serial is not None
+                self._serial.write((pending.command + "\r").encode("utf-8"))
+                self._serial.flush()
+            except Exception as exc:
+                self._resolve(pending, AtResponse(pending.command, False, [], final=str(exc)))
                 continue
-            lines.append(line)
-            if line in {"OK", "ERROR"}:
-                break
-        ok = any(line == "OK" for line in lines)
-        return ok, lines if lines else None
+            pending.deadline = time.monotonic() + pending.timeout
+            self._active = pending
+
+    @staticmethod
+    def _resolve(pending: _PendingCommand, response: AtResponse) -> None:
+        if not pending.future.done():
+            pending.future.set_result(response)
 
     def _query_sim_status(self) -> Optional[str]:
         ok, response = self._send_command("AT+CPIN?", expect_response=True)
@@ -302,6 +480,8 @@ class GSMListener:
 
         self._current_session: Optional[dict[str, Any]] = None
         self._last_signal_check = 0.0
+        self._signal_quality: Optional[int] = None
+        self._signal_pending = False
         self._ring_count = 0
 
         self._simulation = client is None
@@ -324,9 +504,9 @@ class GSMListener:
 
         try:
             while not self._stop_event.is_set():
-                line = self._client.readline()
+                line = self._client.read_urc(self._poll_interval)
+                self._maybe_poll_signal()
                 if line is None:
-                    self._maybe_poll_signal()
                     continue
                 self._handle_modem_line(line)
         finally:
@@ -428,14 +608,20 @@ class GSMListener:
         self._reset_session()
 
     def _maybe_poll_signal(self) -> None:
-        if self._client is None or self._simulation:
+        if self._client is None or self._simulation or self._signal_pending:
             return
-        if (time.time() - self._last_signal_check) < self._signal_interval:
+        if (time.monotonic() - self._last_signal_check) < self._signal_interval:
             return
-        self._last_signal_check = time.time()
-        quality = self._client.signal_quality()
-        if quality is not None and self._current_session is not None:
-            self._current_session.setdefault("metadata", {})["signal_quality"] = quality
+        self._last_signal_check = time.monotonic()
+        self._signal_pending = True
+        # Asynchronous so RING/+CLIP handling never waits behind AT+CSQ.
+        self._client.submit("AT+CSQ").add_done_callback(self._on_signal_quality)
+
+    def _on_signal_quality(self, future: "Future[AtResponse]") -> None:
+        self._signal_pending = False
+        quality = Sim7600ATClient.parse_signal_quality(future.result())
+        if quality is not None:
+            self._signal_quality = quality
 
     # ------------------------------------------------------------------
     # Helpers
@@ -462,6 +648,8 @@ class GSMListener:
         if self._current_session is None:
             return {}
         metadata = dict(self._current_session.get("metadata", {}))
+        if self._signal_quality is not None:
+            metadata.setdefault("signal_quality", self._signal_quality)
         if self._current_session.get("started_at"):
             metadata.setdefault("started_at", self._current_session["started_at"])
         return metadata
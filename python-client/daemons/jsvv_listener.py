@@ -17,6 +17,7 @@ import signal
 import subprocess
 import threading
 import time
+import uuid
 from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -24,6 +25,7 @@ from typing import Any
 
 from jsvv import JSVVClient, JSVVError, SerialSettings  # type: ignore
 
+from _journal import DispatchJournal
 from _locks import PortLock
 
 PRIORITY_MAP = {"P1": 0, "P2": 1, "P3": 2}
@@ -46,6 +48,9 @@ class ListenerConfig:
     log_level: str
     audio_root: Path | None
     run_once: bool = False
+    journal_dir: Path | None = None
+    journal_max_age: float = 3600.0
+    journal_park_delay: float = 30.0
 
 
 @dataclass(slots=True)
@@ -58,6 +63,8 @@ class DispatchTask:
     attempts: int = 0
     max_attempts: int = 3
     next_attempt_at: float = field(default_factory=time.monotonic)
+    journal_id: str | None = None
+    queued_at: float = field(default_factory=time.time)
 
     def priority_value(self) -> int:
         return PRIORITY_MAP.get(self.priority.upper(), DEFAULT_PRIORITY_VALUE)
@@ -67,6 +74,28 @@ class DispatchTask:
         delay = backoff * (2 ** max(0, self.attempts - 1))
         self.next_attempt_at = time.monotonic() + delay
 
+    def to_journal(self) -> dict[str, Any]:
+        return {
+            "payload": self.payload,
+            "rawMessage": self.raw_message,
+            "priority": self.priority,
+            "duplicate": self.duplicate,
+            "maxAttempts": self.max_attempts,
+            "queuedAt": self.queued_at,
+        }
+
+    @classmethod
+    def from_journal(cls, entry: dict[str, Any]) -> "DispatchTask":
+        return cls(
+            payload=dict(entry.get("payload") or {}),
+            raw_message=str(entry.get("rawMessage", "")),
+            priority=str(entry.get("priority", "P3")),
+            duplicate=bool(entry.get("duplicate", False)),
+            max_attempts=max(1, int(entry.get("maxAttempts", 3))),
+            journal_id=str(entry["id"]),
+            queued_at=float(entry.get("queuedAt", time.time())),
+        )
+
 
 class PriorityScheduler:
     """A minimal thread-safe priority scheduler with delayed retry support."""
@@ -94,13 +123,17 @@ class PriorityScheduler:
                 if not self._queue:
                     self._condition.wait(timeout=0.5)
                     continue
-                priority_value, available_at, _, task = self._queue[0]
-                delay = available_at - time.monotonic()
-                if delay > 0:
+                # Entries waiting out a retry delay must not hold back ready ones behind them.
+                now = time.monotonic()
+                ready_index = next(
+                    (index for index, entry in enumerate(self._queue) if entry[1] <= now),
+                    None,
+                )
+                if ready_index is None:
+                    delay = min(entry[1] for entry in self._queue) - now
                     self._condition.wait(timeout=delay)
                     continue
-                self._queue.pop(0)
-                return task
+                return self._queue.pop(ready_index)[3]
 
     def stop(self) -> None:
         with self._condition:
@@ -147,12 +180,14 @@ class DispatchWorker(threading.Thread):
         invoker: ArtisanInvoker,
         config: ListenerConfig,
         logger: logging.Logger,
+        journal: DispatchJournal | None = None,
     ) -> None:
         super().__init__(daemon=True)
         self._scheduler = scheduler
         self._invoker = invoker
         self._config = config
         self._logger = logger
+        self._journal = journal
         self._stop_event = threading.Event()
 
     def run(self) -> None:
@@ -201,6 +236,8 @@ class DispatchWorker(threading.Thread):
                     task.priority,
                     task.duplicate,
                 )
+                if self._journal is not None and task.journal_id is not None:
+                    self._journal.ack(task.journal_id)
                 continue
 
             self._handle_failure(task, completed.returncode)
@@ -211,6 +248,8 @@ class DispatchWorker(threading.Thread):
 
     def _handle_failure(self, task: DispatchTask, reason: Any) -> None:
         if task.attempts + 1 >= task.max_attempts:
+            if self._park(task, reason):
+                return
             self._logger.error(
                 "[FAILED] %s priority=%s attempts=%d reason=%s",
                 task.payload.get("command"),
@@ -232,6 +271,29 @@ class DispatchWorker(threading.Thread):
         )
         self._scheduler.put(task)
 
+    def _park(self, task: DispatchTask, reason: Any) -> bool:
+        """Keep a journaled task alive across a backend outage until it expires."""
+
+        if self._journal is None or task.journal_id is None:
+            return False
+        age = time.time() - task.queued_at
+        if 0 < self._config.journal_max_age <= age:
+            self._journal.ack(task.journal_id)
+            return False
+
+        task.attempts = 0
+        task.next_attempt_at = time.monotonic() + self._config.journal_park_delay
+        self._logger.warning(
+            "[PARKED] %s priority=%s reason=%s next_in=%.2fs age=%.0fs",
+            task.payload.get("command"),
+            task.priority,
+            reason,
+            self._config.journal_park_delay,
+            age,
+        )
+        self._scheduler.put(task)
+        return True
+
 
 class ParserDaemon:
     def __init__(self, client: JSVVClient, config: ListenerConfig, logger: logging.Logger) -> None:
@@ -239,10 +301,19 @@ class ParserDaemon:
         self._config = config
         self._logger = logger
         self._scheduler = PriorityScheduler()
-        self._worker = DispatchWorker(self._scheduler, ArtisanInvoker(config, logger), config, logger)
+        self._journal = DispatchJournal(config.journal_dir, logger=logger) if config.journal_dir else None
+        self._worker = DispatchWorker(
+            self._scheduler,
+            ArtisanInvoker(config, logger),
+            config,
+            logger,
+            journal=self._journal,
+        )
         self._stop_event = threading.Event()
 
     def start(self) -> None:
+        if self._journal is not None:
+            self._replay_journal(self._journal)
         self._worker.start()
         self._logger.info("JSVV parser daemon started.")
 
@@ -286,6 +357,10 @@ class ParserDaemon:
             if duplicate:
                 self._logger.info("[DUPLICATE] %s priority=%s", frame.body(), priority)
 
+            if self._journal is not None:
+                task.journal_id = uuid.uuid4().hex
+                self._journal.append(task.journal_id, task.to_journal())
+
             self._logger.info("[QUEUED] %s priority=%s", frame.body(), priority)
             self._scheduler.put(task)
 
@@ -295,10 +370,29 @@ class ParserDaemon:
         self._logger.info("JSVV parser stopping ...")
         self._worker.stop()
         self._worker.join(timeout=5.0)
+        if self._journal is not None:
+            self._journal.close()
 
     def stop(self) -> None:
         self._stop_event.set()
 
+    def _replay_journal(self, journal: DispatchJournal) -> None:
+        now = time.time()
+        tasks: list[DispatchTask] = []
+        for entry in journal.open():
+            task = DispatchTask.from_journal(entry)
+            age = now - task.queued_at
+            if 0 < self._config.journal_max_age <= age:
+                self._logger.warning("[EXPIRED] %s priority=%s age=%.0fs", task.payload.get("command"), task.priority, age)
+                journal.ack(entry["id"])
+                continue
+            tasks.append(task)
+
+        tasks.sort(key=lambda item: (item.priority_value(), item.queued_at))
+        for task in tasks:
+            self._logger.info("[REPLAYED] %s priority=%s", task.payload.get("command"), task.priority)
+            self._scheduler.put(task)
+
     def _resolve_priority(self, frame) -> str:
         spec_priority = frame.spec.priority if frame.spec else None
         if spec_priority and spec_priority in PRIORITY_MAP:
@@ -329,6 +423,23 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--log-level", default=os.getenv("JSVV_LOG_LEVEL", "INFO"))
     parser.add_argument("--audio-root", default=os.getenv("JSVV_AUDIO_ROOT"))
     parser.add_argument("--once", action="store_true", help="Zpracuj pouze jeden rámec a ukonči se")
+    parser.add_argument(
+        "--journal-dir",
+        default=os.getenv("JSVV_JOURNAL_DIR"),
+        help="Adresář perzistentního žurnálu nedoručených aktivací (prázdné = vypnuto)",
+    )
+    parser.add_argument(
+        "--journal-max-age",
+        type=float,
+        default=float(os.getenv("JSVV_JOURNAL_MAX_AGE", "3600")),
+        help="Aktivace starší než N sekund se po restartu znovu neodesílají (0 = bez limitu)",
+    )
+    parser.add_argument(
+        "--journal-park-delay",
+        type=float,
+        default=float(os.getenv("JSVV_JOURNAL_PARK_DELAY", "30")),
+        help="Prodleva před dalším pokusem o doručení aktivace po vyčerpání --max-retries",
+    )
     return parser
 
 
@@ -387,6 +498,9 @@ def main() -> None:
         log_level=args.log_level,
         audio_root=audio_root,
         run_once=bool(args.once),
+        journal_dir=Path(args.journal_dir).expanduser() if args.journal_dir else None,
+        journal_max_age=max(0.0, args.journal_max_age),
+        journal_park_delay=max(1.0, args.journal_park_delay),
     )
 
     logger = configure_logging(config)
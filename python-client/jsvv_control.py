@@ -8,7 +8,7 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, TextIO
 
 
 ROOT_DIR = Path(__file__).resolve().parent
@@ -94,6 +94,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Ignore timeout errors and exit cleanly when no data is received",
     )
+    listen_cmd.add_argument(
+        "--stream",
+        action="store_true",
+        help="Emit every frame as an NDJSON line as soon as it arrives (use --max-frames 0 for unbounded sessions)",
+    )
 
     sequence_cmd = sub.add_parser("plan-sequence", help="Resolve assets for a planned verbal sequence")
     sequence_cmd.add_argument(
@@ -356,42 +361,51 @@ def command_trigger(args: argparse.Namespace) -> dict[str, Any]:
     }
 
 
+def iter_listen_frames(client: JSVVClient, args: argparse.Namespace) -> Iterator[dict[str, Any]]:
+    """Yield captured frames one by one so callers never hold more than a single record."""
+
+    frames_captured = 0
+    while args.max_frames <= 0 or frames_captured < args.max_frames:
+        try:
+            frame = client.receive_frame(timeout=args.timeout, validate_crc=not args.skip_crc)
+        except JSVVError:
+            if args.until_timeout:
+                return
+            raise
+        payload = client.build_json_payload(
+            frame,
+            network_id=args.network_id,
+            vyc_id=args.vyc_id,
+            kpps_address=args.kpps_address,
+            operator_id=args.operator_id,
+        )
+        duplicate = not client.validate_and_track(
+            frame,
+            network_id=args.network_id,
+            vyc_id=args.vyc_id,
+            kpps_address=args.kpps_address,
+            operator_id=args.operator_id,
+        )
+        yield {
+            "raw": frame.raw,
+            "payload": payload,
+            "crcOk": frame.crc_ok(),
+            "duplicate": duplicate,
+        }
+        frames_captured += 1
+
+
+def write_ndjson(record: dict[str, Any], stream: TextIO | None = None) -> None:
+    target = stream if stream is not None else sys.stdout
+    target.write(json.dumps(record, ensure_ascii=False) + "\n")
+    target.flush()
+
+
 def command_listen(args: argparse.Namespace) -> dict[str, Any]:
     settings = resolve_serial_settings(args)
     dedup_window = args.dedup_window if args.dedup_window is not None else constants.DEFAULT_DEDUP_WINDOW_SECONDS
-    captured: list[dict[str, Any]] = []
     with JSVVClient(settings=settings, dedup_window=dedup_window) as client:
-        frames_captured = 0
-        while args.max_frames <= 0 or frames_captured < args.max_frames:
-            try:
-                frame = client.receive_frame(timeout=args.timeout, validate_crc=not args.skip_crc)
-            except JSVVError as exc:
-                if args.until_timeout:
-                    break
-                raise
-            payload = client.build_json_payload(
-                frame,
-                network_id=args.network_id,
-                vyc_id=args.vyc_id,
-                kpps_address=args.kpps_address,
-                operator_id=args.operator_id,
-            )
-            duplicate = not client.validate_and_track(
-                frame,
-                network_id=args.network_id,
-                vyc_id=args.vyc_id,
-                kpps_address=args.kpps_address,
-                operator_id=args.operator_id,
-            )
-            captured.append(
-                {
-                    "raw": frame.raw,
-                    "payload": payload,
-                    "crcOk": frame.crc_ok(),
-                    "duplicate": duplicate,
-                }
-            )
-            frames_captured += 1
+        captured = list(iter_listen_frames(client, args))
     return {
         "frames": captured,
         "count": len(captured),
@@ -399,6 +413,27 @@ def command_listen(args: argparse.Namespace) -> dict[str, Any]:
     }
 
 
+def command_listen_stream(args: argparse.Namespace) -> dict[str, Any]:
+    """Stream frames as NDJSON lines; the closing summary line is printed by ``output_success``."""
+
+    settings = resolve_serial_settings(args)
+    dedup_window = args.dedup_window if args.dedup_window is not None else constants.DEFAULT_DEDUP_WINDOW_SECONDS
+    count = 0
+    with JSVVClient(settings=settings, dedup_window=dedup_window) as client:
+        for record in iter_listen_frames(client, args):
+            try:
+                write_ndjson({"status": "ok", "command": "listen", "event": "frame", "data": record})
+            except BrokenPipeError:
+                # Consumer went away; nothing left to report to.
+                raise SystemExit(0)
+            count += 1
+    return {
+        "count": count,
+        "port": settings.port,
+        "stream": True,
+    }
+
+
 def command_plan_sequence(args: argparse.Namespace) -> dict[str, Any]:
     sequence = resolve_sequence(args)
     root = resolve_audio_root(args)
@@ -469,6 +504,8 @@ def dispatch(args: argparse.Namespace) -> dict[str, Any]:
     if args.command == "trigger":
         return command_trigger(args)
     if args.command == "listen":
+        if args.stream:
+            return command_listen_stream(args)
         return command_listen(args)
     if args.command == "plan-sequence":
         return command_plan_sequence(args)
@@ -479,7 +516,7 @@ def output_success(command: str, data: dict[str, Any] | None = None) -> None:
     payload: dict[str, Any] = {"status": "ok", "command": command}
     if data is not None:
         payload["data"] = data
-    print(json.dumps(payload, ensure_ascii=False))
+    print(json.dumps(payload, ensure_ascii=False), flush=True)
     raise SystemExit(0)
 
 
@@ -489,7 +526,7 @@ def output_error(command: str | None, message: str, *, error_type: str | None =
         payload["command"] = command
     if error_type:
         payload["errorType"] = error_type
-    print(json.dumps(payload, ensure_ascii=False))
+    print(json.dumps(payload, ensure_ascii=False), flush=True)
     raise SystemExit(1)
 
 
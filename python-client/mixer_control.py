@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
 from subprocess import CalledProcessError, Popen
-from typing import Any
+from typing import Any, Optional
+
+ROOT = Path(__file__).resolve().parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from audio_inventory import AudioInventory  # noqa: E402
 
 DEFAULT_EXIT_CODES = {
     'missing_args': 1,
@@ -20,6 +29,14 @@ DEFAULT_EXIT_CODES = {
     'binary': 5,
 }
 
+# Control types `amixer cset` can write from the values stored by `alsactl store`.
+CSET_TYPES = {'BOOLEAN', 'INTEGER', 'INTEGER64', 'ENUMERATED'}
+PLAN_CACHE_FILE = '.transitions.json'
+PLAN_CACHE_LIMIT = 32
+_STATE_TOKEN = re.compile(
+    r"""\s+|#[^\n]*|'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|[{}\[\];,=]|[^\s{}\[\];,='"#]+"""
+)
+
 
 def project_root() -> Path:
     return Path(__file__).resolve().parent.parent
@@ -62,6 +79,311 @@ def run_command(command: list[str]) -> tuple[int, str, str]:
     return result.returncode, result.stdout, result.stderr
 
 
+@dataclass(frozen=True)
+class MixerControl:
+    numid: int
+    iface: str
+    name: str
+    index: int
+    device: int
+    subdevice: int
+    values: tuple[str, ...]
+    type: str
+    writable: bool
+
+    @property
+    def key(self) -> tuple[str, str, int, int, int]:
+        return (self.iface, self.name, self.index, self.device, self.subdevice)
+
+    @property
+    def label(self) -> str:
+        return self.name if self.index == 0 else f'{self.name},{self.index}'
+
+
+def _tokenize_state(text: str) -> list[str]:
+    tokens: list[str] = []
+    for match in _STATE_TOKEN.finditer(text):
+        token = match.group(0)
+        if token[0].isspace() or token[0] == '#' or token in {';', ',', '='}:
+            continue
+        tokens.append(token)
+    return tokens
+
+
+def _unquote(token: str) -> str:
+    if token[:1] in {"'", '"'}:
+        return re.sub(r'\\(.)', r'\1', token[1:-1])
+    return token
+
+
+def _parse_state_block(tokens: list[str], position: int) -> tuple[dict[str, Any], int]:
+    block: dict[str, Any] = {}
+    while position < len(tokens):
+        raw = tokens[position]
+        position += 1
+        if raw == '}':
+            break
+        key = _unquote(raw)
+        if position >= len(tokens):
+            break
+        if tokens[position] == '{':
+            value, position = _parse_state_block(tokens, position + 1)
+        elif tokens[position] == '[':
+            items: list[str] = []
+            position += 1
+            while position < len(tokens) and tokens[position] != ']':
+                items.append(_unquote(tokens[position]))
+                position += 1
+            value, position = items, position + 1
+        else:
+            value, position = _unquote(tokens[position]), position + 1
+        # Dotted keys (`control.3`, `value.1`) nest like their `control { 3 ... }` spelling.
+        target = block
+        parts = key.split('.')
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = value
+    return block, position
+
+
+def parse_state(text: str) -> dict[tuple[str, str, int, int, int], MixerControl]:
+    """Parse an `alsactl store` file into controls keyed by (iface, name, index, device, subdevice)."""
+    tree, _ = _parse_state_block(_tokenize_state(text), 0)
+    controls: dict[tuple[str, str, int, int, int], MixerControl] = {}
+    for card in (tree.get('state') or {}).values():
+        if not isinstance(card, dict):
+            continue
+        for numid, entry in (card.get('control') or {}).items():
+            if not isinstance(entry, dict) or 'name' not in entry:
+                continue
+            raw = entry.get('value')
+            if isinstance(raw, dict):
+                values = tuple(str(raw[k]) for k in sorted(raw, key=lambda k: int(k) if k.isdigit() else 0))
+            elif raw is None:
+                values = ()
+            else:
+                values = (str(raw),)
+            comment = entry.get('comment') if isinstance(entry.get('comment'), dict) else {}
+            control = MixerControl(
+                numid=int(numid) if str(numid).isdigit() else 0,
+                iface=str(entry.get('iface', 'MIXER')),
+                name=str(entry['name']),
+                index=int(entry.get('index', 0)),
+                device=int(entry.get('device', 0)),
+                subdevice=int(entry.get('subdevice', 0)),
+                values=values,
+                type=str(comment.get('type', '')).upper(),
+                writable='write' in str(comment.get('access', 'read write')),
+            )
+            controls[control.key] = control
+    return controls
+
+
+def read_card_state(alsactl: str, card: str) -> Optional[str]:
+    """Current card state in `alsactl store` format, or None when it cannot be read."""
+    try:
+        code, stdout, _ = run_command([alsactl, '--file', '-', 'store', card])
+    except FileNotFoundError:
+        return None
+    return stdout if code == 0 and 'state.' in stdout else None
+
+
+def diff_states(
+    current: dict[tuple[str, str, int, int, int], MixerControl],
+    target: dict[tuple[str, str, int, int, int], MixerControl],
+) -> tuple[list[tuple[MixerControl, MixerControl]], list[MixerControl]]:
+    """Return (changes as (current, wanted) pairs, preset controls that cannot be applied by cset)."""
+    changes: list[tuple[MixerControl, MixerControl]] = []
+    unsupported: list[MixerControl] = []
+    for key, wanted in target.items():
+        present = current.get(key)
+        if present is None or not present.writable or not wanted.values:
+            continue
+        if present.values == wanted.values:
+            continue
+        if (present.type or wanted.type) not in CSET_TYPES:
+            unsupported.append(wanted)
+            continue
+        changes.append((present, wanted))
+    return changes, unsupported
+
+
+def _cset_value(value: str, control_type: str) -> str:
+    if control_type == 'BOOLEAN':
+        return {'true': 'on', 'false': 'off'}.get(value.lower(), value)
+    if control_type == 'ENUMERATED' and not re.fullmatch(r'-?\d+', value):
+        return "'" + value.replace("'", "\\'") + "'"
+    return value
+
+
+def cset_commands(changes: list[tuple[MixerControl, MixerControl]]) -> list[str]:
+    lines = []
+    for present, wanted in changes:
+        control_type = present.type or wanted.type
+        values = ','.join(_cset_value(value, control_type) for value in wanted.values)
+        # Address by the card's own numid: no name quoting, and stable for this boot.
+        lines.append(f'cset numid={present.numid} "{values}"')
+    return lines
+
+
+def apply_commands(amixer: str, card: str, lines: list[str]) -> tuple[int, str]:
+    if not lines:
+        return 0, ''
+    try:
+        result = subprocess.run(
+            [amixer, '-q', '-c', card, '--stdin'],
+            input='\n'.join(lines) + '\n',
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except FileNotFoundError:
+        return DEFAULT_EXIT_CODES['binary'], f'Binary not found: {amixer}'
+    error = result.stderr.strip()
+    # `amixer --stdin` reports a control it cannot set on stderr but still exits 0.
+    return result.returncode or (1 if error else 0), error
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _state_digest(controls: dict[tuple[str, str, int, int, int], MixerControl]) -> str:
+    return _digest(json.dumps(sorted((list(c.key), c.numid, list(c.values)) for c in controls.values())))
+
+
+def load_plan(state_dir: Path, key: str) -> Optional[dict[str, Any]]:
+    try:
+        plans = json.loads((state_dir / PLAN_CACHE_FILE).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    plan = plans.get(key) if isinstance(plans, dict) else None
+    return plan if isinstance(plan, dict) and isinstance(plan.get('commands'), list) else None
+
+
+def store_plan(state_dir: Path, key: str, plan: dict[str, Any]) -> None:
+    path = state_dir / PLAN_CACHE_FILE
+    try:
+        plans = json.loads(path.read_text(encoding='utf-8'))
+        if not isinstance(plans, dict):
+            plans = {}
+    except (OSError, ValueError):
+        plans = {}
+    plans.pop(key, None)
+    plans[key] = plan
+    while len(plans) > PLAN_CACHE_LIMIT:
+        plans.pop(next(iter(plans)))
+    try:
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps(plans, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def plan_preset(
+    state_dir: Path,
+    state_file: Path,
+    current_text: str,
+    use_cache: bool = True,
+) -> dict[str, Any]:
+    """Differential plan taking the card from `current_text` to the preset in `state_file`.
+
+    Plans are cached per (current state, preset content) pair, so switching back
+    and forth between the usual broadcast profiles skips parsing and diffing.
+    """
+    preset_text = state_file.read_text(encoding='utf-8', errors='replace')
+    current = parse_state(current_text)
+    key = f'{_state_digest(current)}:{_digest(preset_text)}'
+    if use_cache:
+        cached = load_plan(state_dir, key)
+        if cached is not None:
+            return {**cached, 'cached': True}
+    target = parse_state(preset_text)
+    changes, unsupported = diff_states(current, target)
+    plan = {
+        'preset': state_file.stem,
+        'controls': len(target),
+        'commands': cset_commands(changes),
+        'diff': [
+            {'control': wanted.label, 'from': list(present.values), 'to': list(wanted.values)}
+            for present, wanted in changes
+        ],
+        'unsupported': [control.label for control in unsupported],
+    }
+    if use_cache:
+        store_plan(state_dir, key, plan)
+    return {**plan, 'cached': False}
+
+
+def apply_preset(
+    alsactl: str,
+    amixer: str,
+    card: str,
+    state_dir: Path,
+    state_file: Path,
+    *,
+    dry_run: bool = False,
+    use_cache: bool = True,
+    timing: bool = False,
+) -> int:
+    started = time.perf_counter()
+    current_text = read_card_state(alsactl, card)
+    read_done = time.perf_counter()
+    if current_text is None:
+        if dry_run:
+            print('Unable to read the current card state; cannot compute a diff.', file=sys.stderr)
+            return 1
+        return stream_process([alsactl, '--file', str(state_file), 'restore', card])
+
+    plan = plan_preset(state_dir, state_file, current_text, use_cache)
+    planned = time.perf_counter()
+
+    if dry_run:
+        for change in plan['diff']:
+            print(f"{change['control']}: {','.join(change['from'])} -> {','.join(change['to'])}")
+        for label in plan['unsupported']:
+            print(f'{label}: needs full restore (unsupported control type)')
+        if not plan['diff'] and not plan['unsupported']:
+            print(f"Preset {plan['preset']} already matches card {card}.")
+        return 0
+
+    if plan['unsupported']:
+        # Byte/IEC958 controls cannot go through cset; keep the old behaviour for such presets.
+        exit_code = stream_process([alsactl, '--file', str(state_file), 'restore', card])
+    else:
+        exit_code, error = apply_commands(amixer, card, plan['commands'])
+        if exit_code != 0:
+            if error:
+                print(error, file=sys.stderr)
+            exit_code = stream_process([alsactl, '--file', str(state_file), 'restore', card])
+    applied = time.perf_counter()
+
+    if timing:
+        full_started = time.perf_counter()
+        stream_process([alsactl, '--file', str(state_file), 'restore', card])
+        full_ms = (time.perf_counter() - full_started) * 1000
+        differential_ms = (applied - started) * 1000
+        print(
+            json.dumps(
+                {
+                    'preset': plan['preset'],
+                    'controls': plan['controls'],
+                    'changed': len(plan['commands']),
+                    'planCached': plan['cached'],
+                    'readMs': round((read_done - started) * 1000, 2),
+                    'planMs': round((planned - read_done) * 1000, 2),
+                    'applyMs': round((applied - planned) * 1000, 2),
+                    'differentialMs': round(differential_ms, 2),
+                    'fullRestoreMs': round(full_ms, 2),
+                    'speedup': round(full_ms / differential_ms, 2) if differential_ms else None,
+                }
+            ),
+            file=sys.stderr,
+        )
+    return exit_code
+
+
 def list_presets(state_dir: Path) -> list[str]:
     return sorted(file.stem for file in state_dir.glob('*.state'))
 
@@ -139,7 +461,23 @@ def list_pulse_devices() -> dict[str, list[dict[str, Any]]]:
     return {'sinks': sinks, 'sources': sources}
 
 
-def detect_audio_devices() -> dict[str, Any]:
+def detect_audio_devices(include_pulse: bool = True) -> dict[str, Any]:
+    inventory = AudioInventory()
+    if inventory.available():
+        devices = inventory.alsa(controls_fallback=list_controls_for_card)
+    else:
+        devices = detect_alsa_devices_with_tools()
+
+    if include_pulse:
+        devices['pulse'] = list_pulse_devices()
+        code, stdout, _ = run_command(['amixer', '-D', 'pulse', 'scontrols'])
+        devices['pulse_controls'] = [line.strip() for line in stdout.splitlines() if line.strip()] if code == 0 else []
+
+    devices['timestamp'] = datetime.now(timezone.utc).isoformat()
+    return devices
+
+
+def detect_alsa_devices_with_tools() -> dict[str, Any]:
     playback_devices: list[dict[str, Any]] = []
     capture_devices: list[dict[str, Any]] = []
 
@@ -167,17 +505,9 @@ def detect_audio_devices() -> dict[str, Any]:
             continue
         device['controls'] = list_controls_for_card(int(card))
 
-    pulse = list_pulse_devices()
-
-    code, stdout, _ = run_command(['amixer', '-D', 'pulse', 'scontrols'])
-    simple_controls = [line.strip() for line in stdout.splitlines() if line.strip()] if code == 0 else []
-
     return {
         'playback_devices': playback_devices,
         'capture_devices': capture_devices,
-        'pulse': pulse,
-        'pulse_controls': simple_controls,
-        'timestamp': datetime.now(timezone.utc).isoformat(),
     }
 
 
@@ -209,6 +539,22 @@ def parse_arguments() -> argparse.Namespace:
         'name', nargs='?', default='default', help='Preset name to restore (default: default)'
     )
 
+    for apply_parser in (preset_parser, reset_parser):
+        apply_parser.add_argument(
+            '--dry-run', action='store_true', help='Print the controls that would change and exit'
+        )
+        apply_parser.add_argument(
+            '--full', action='store_true', help='Rewrite every control with alsactl restore (no diff)'
+        )
+        apply_parser.add_argument(
+            '--no-plan-cache', action='store_true', help='Do not read or store cached transition plans'
+        )
+        apply_parser.add_argument(
+            '--timing',
+            action='store_true',
+            help='Report differential vs. full restore timings on stderr (runs a full restore afterwards)',
+        )
+
     save_parser = subparsers.add_parser('save', help='Capture current ALSA state')
     save_parser.add_argument('name', help='Preset name to store')
     save_parser.add_argument(
@@ -216,7 +562,12 @@ def parse_arguments() -> argparse.Namespace:
     )
 
     subparsers.add_parser('list', help='List available presets')
-    subparsers.add_parser('devices', help='List available playback/capture devices and mixer controls')
+    devices_parser = subparsers.add_parser(
+        'devices', help='List available playback/capture devices and mixer controls'
+    )
+    devices_parser.add_argument(
+        '--no-pulse', action='store_true', help='Skip PulseAudio sinks/sources (no pactl/amixer calls)'
+    )
 
     return parser.parse_args()
 
@@ -231,7 +582,7 @@ def main() -> None:
     ensure_state_dir(state_dir)
 
     if args.command == 'devices':
-        devices = detect_audio_devices()
+        devices = detect_audio_devices(include_pulse=not args.no_pulse)
         print(json.dumps(devices, ensure_ascii=False))
         sys.exit(0)
 
@@ -248,7 +599,20 @@ def main() -> None:
                 print('Available presets: ' + ', '.join(available), file=sys.stderr)
             sys.exit(DEFAULT_EXIT_CODES['missing_preset'])
 
-        exit_code = stream_process([alsactl, '--file', str(state_file), 'restore', card])
+        if args.full:
+            sys.exit(stream_process([alsactl, '--file', str(state_file), 'restore', card]))
+
+        amixer = ensure_binary(os.getenv('ALSAMIXER_WRAPPER_AMIXER', 'amixer'))
+        exit_code = apply_preset(
+            alsactl,
+            amixer,
+            card,
+            state_dir,
+            state_file,
+            dry_run=args.dry_run,
+            use_cache=not args.no_plan_cache,
+            timing=args.timing,
+        )
         sys.exit(exit_code)
 
     if args.command == 'save':
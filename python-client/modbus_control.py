@@ -48,7 +48,16 @@ def load_env_file(path: Path) -> None:
 
 load_env_file(ROOT_DIR.parent / ".env")
 
-from modbus_audio import ModbusAudioClient, ModbusAudioError, SerialSettings, constants  # noqa: E402
+from modbus_audio import (  # noqa: E402
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_URGENT,
+    BusArbiter,
+    ModbusAudioClient,
+    ModbusAudioError,
+    SerialSettings,
+    constants,
+)
 
 
 JSVV_SAMPLE_REGISTER_BASE = 0x0011
@@ -99,6 +108,20 @@ DEFAULT_JSVV_REPEAT_DELAY = 0.5
 JSVV_COMMAND_REGISTER = 0x0010
 JSVV_MAX_COMMAND_WORDS = 5
 
+# Bus arbitration class per command: broadcasts overtake queued reads and polls.
+COMMAND_PRIORITIES = {
+    "start-stream": PRIORITY_URGENT,
+    "stop-stream": PRIORITY_URGENT,
+    "play-sequence": PRIORITY_URGENT,
+    "jsvv-send": PRIORITY_URGENT,
+    "jsvv-stop": PRIORITY_URGENT,
+    "read-alarms": PRIORITY_BACKGROUND,
+}
+
+
+def command_priority(args: argparse.Namespace) -> int:
+    return COMMAND_PRIORITIES.get(getattr(args, "command", None) or "", PRIORITY_INTERACTIVE)
+
 
 def int_from_string(value: str) -> int:
     """Parse decimal or ``0x`` prefixed integers from CLI arguments."""
@@ -445,7 +468,7 @@ def gather_serial_context(args: argparse.Namespace) -> dict[str, Any]:
         settings, unit_id = resolve_serial_settings(args)
     except Exception:
         return _fallback_serial_context(args)
-    return {
+    context: dict[str, Any] = {
         "port": settings.port,
         "method": settings.method,
         "baudrate": settings.baudrate,
@@ -455,6 +478,11 @@ def gather_serial_context(args: argparse.Namespace) -> dict[str, Any]:
         "timeout": settings.timeout,
         "unitId": unit_id,
     }
+    if constants.BUS_ARBITRATION and settings.port:
+        bus_stats = BusArbiter.for_port(settings.port, timeout=constants.BUS_WAIT_TIMEOUT).stats()
+        if bus_stats:
+            context["bus"] = bus_stats
+    return context
 
 
 def merge_serial_payload(data: Any, serial_context: dict[str, Any]) -> dict[str, Any]:
@@ -657,7 +685,7 @@ def command_start_stream(args: argparse.Namespace) -> dict[str, Any]:
         },
     )
 
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.start_stream(applied_route, zones=zones, configure_route=args.update_route)
 
     return response
@@ -672,7 +700,7 @@ def command_stop_stream(args: argparse.Namespace) -> dict[str, Any]:
             "unitId": unit_id,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.stop_stream()
 
     return response
@@ -688,7 +716,7 @@ def command_read_alarm_buffer(args: argparse.Namespace) -> dict[str, Any]:
             "alarm": None,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         alarm = client.read_alarm_buffer()
 
     response["alarm"] = alarm
@@ -712,7 +740,7 @@ def command_read_nest_status(args: argparse.Namespace) -> dict[str, Any]:
         },
     )
 
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         status_payload = client.read_nest_status(nest_address, route=route_prefix)
 
     response["route"] = status_payload.get("route", default_route)
@@ -750,10 +778,11 @@ def command_read_bidirectional(args: argparse.Namespace) -> dict[str, Any]:
         },
     )
 
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         route_values = [len(route)] + route + [0] * (constants.MAX_ADDR_ENTRIES - len(route))
-        client.write_registers(constants.NUM_ADDR_RAM, route_values)
-        values = client.read_registers(register_address, register_count, unit=remote_unit)
+        with client.transaction():
+            client.write_registers(constants.NUM_ADDR_RAM, route_values)
+            values = client.read_registers(register_address, register_count, unit=remote_unit)
 
     response["values"] = values
     return response
@@ -763,64 +792,97 @@ JSVV_COMMAND_REGISTER = 0x0010
 JSVV_MAX_COMMAND_WORDS = 5
 
 
-def command_jsvv_send(args: argparse.Namespace) -> dict[str, Any]:
-    settings, unit_id = resolve_serial_settings(args)
-    targets = _parse_jsvv_targets(args.targets)
-    route_entries, route_payload = _build_jsvv_route_payload(targets)
-    remote_unit, remote_base = _resolve_jsvv_remote(getattr(args, "remote", None))
-
-    priority_value = int(args.priority)
-    sample_codes = _parse_sequence_string(args.sequence)
+def plan_jsvv_send(
+    sequence: str,
+    *,
+    priority: int = 1,
+    remote: Optional[int] = None,
+    targets: Iterable[str] | None = None,
+    repeat: Optional[int] = None,
+    repeat_delay: Optional[float] = None,
+) -> dict[str, Any]:
+    """Resolve everything ``jsvv-send`` writes, without touching the bus.
+
+    Long-running callers (e.g. the GPIO button daemon) compute the plan once at
+    start-up and replay ``routePayload`` and ``commandWords`` on demand.
+    """
+
+    parsed_targets = _parse_jsvv_targets(targets)
+    route_entries, route_payload = _build_jsvv_route_payload(parsed_targets)
+    remote_unit, remote_base = _resolve_jsvv_remote(remote)
+
+    priority_value = int(priority)
+    sample_codes = _parse_sequence_string(sequence)
     command_words = _pad_sequence([priority_value] + sample_codes, JSVV_MAX_COMMAND_WORDS, fill=0)
 
-    repeat_input = args.repeat if getattr(args, "repeat", None) is not None else env_int(
-        "MODBUS_JSVV_REPEAT",
-        DEFAULT_JSVV_REPEAT,
-    )
-    repeat = max(1, int(repeat_input))
-    delay_input = (
-        args.repeat_delay
-        if getattr(args, "repeat_delay", None) is not None
-        else env_float("MODBUS_JSVV_REPEAT_DELAY", DEFAULT_JSVV_REPEAT_DELAY)
-    )
+    repeat_input = repeat if repeat is not None else env_int("MODBUS_JSVV_REPEAT", DEFAULT_JSVV_REPEAT)
+    delay_input = repeat_delay if repeat_delay is not None else env_float("MODBUS_JSVV_REPEAT_DELAY", DEFAULT_JSVV_REPEAT_DELAY)
     delay = float(delay_input)
     if delay < 0:
         raise ValueError("Repeat delay must be non-negative.")
 
+    return {
+        "route": route_entries,
+        "routePayload": route_payload,
+        "remoteUnit": remote_unit,
+        "remoteBase": remote_base,
+        "priority": priority_value,
+        "sequence": sample_codes,
+        "commandWords": command_words,
+        "repeat": max(1, int(repeat_input)),
+        "repeatDelay": delay,
+        "register": JSVV_COMMAND_REGISTER,
+    }
+
+
+def command_jsvv_send(args: argparse.Namespace) -> dict[str, Any]:
+    settings, unit_id = resolve_serial_settings(args)
+    plan = plan_jsvv_send(
+        args.sequence,
+        priority=args.priority,
+        remote=getattr(args, "remote", None),
+        targets=args.targets,
+        repeat=getattr(args, "repeat", None),
+        repeat_delay=getattr(args, "repeat_delay", None),
+    )
+    route_payload = plan["routePayload"]
+    remote_unit = plan["remoteUnit"]
+    command_words = plan["commandWords"]
+    repeat = plan["repeat"]
+    delay = plan["repeatDelay"]
+
     response = remember_response_data(
         args,
         {
             "port": settings.port,
             "unitId": unit_id,
-            "route": route_entries,
-            "routePayload": route_payload,
-            "remoteUnit": remote_unit,
-            "remoteBase": remote_base,
-            "priority": priority_value,
-            "sequence": sample_codes,
-            "commandWords": command_words,
-            "repeat": repeat,
-            "repeatDelay": delay,
-            "register": JSVV_COMMAND_REGISTER,
+            **plan,
         },
     )
 
     ignored_errors: list[str] = []
 
     try:
-        with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
-            try:
-                client.write_registers(constants.NUM_ADDR_RAM, route_payload)
-            except ModbusAudioError as exc:
-                ignored_errors.append(f"route: {exc}")
+        with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
+            # Route and first command go out as one batch; the bus is free again during repeat delays.
+            with client.transaction():
+                try:
+                    client.write_registers(constants.NUM_ADDR_RAM, route_payload)
+                except ModbusAudioError as exc:
+                    ignored_errors.append(f"route: {exc}")
 
-            for attempt in range(repeat):
                 try:
                     client.write_registers(JSVV_COMMAND_REGISTER, command_words, unit=remote_unit)
                 except ModbusAudioError as exc:
-                    ignored_errors.append(f"attempt {attempt + 1}: {exc}")
-                if attempt + 1 < repeat and delay > 0:
+                    ignored_errors.append(f"attempt 1: {exc}")
+
+            for attempt in range(1, repeat):
+                if delay > 0:
                     time.sleep(delay)
+                try:
+                    client.write_registers(JSVV_COMMAND_REGISTER, command_words, unit=remote_unit)
+                except ModbusAudioError as exc:
+                    ignored_errors.append(f"attempt {attempt + 1}: {exc}")
     except ModbusAudioError as exc:
         ignored_errors.append(f"connect: {exc}")
 
@@ -841,7 +903,7 @@ def command_device_info(args: argparse.Namespace) -> dict[str, Any]:
             "info": None,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         info = client.get_device_info()
 
     response["info"] = info
@@ -862,7 +924,7 @@ def command_status(args: argparse.Namespace) -> dict[str, Any]:
             },
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         tx_control = client.read_register(constants.TX_CONTROL)
         status_reg = client.read_register(constants.STATUS_REGISTER)
         error_reg = client.read_register(constants.ERROR_REGISTER)
@@ -885,7 +947,7 @@ def command_probe(args: argparse.Namespace) -> dict[str, Any]:
             "value": None,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         value = client.read_register(register)
 
     response["value"] = value
@@ -906,7 +968,7 @@ def command_read_register(args: argparse.Namespace) -> dict[str, Any]:
             "values": None,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         values = client.read_registers(address, count)
 
     response["values"] = values
@@ -927,7 +989,7 @@ def command_write_register(args: argparse.Namespace) -> dict[str, Any]:
             "values": [value],
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.write_register(address, value)
 
     return response
@@ -948,7 +1010,7 @@ def command_write_registers(args: argparse.Namespace) -> dict[str, Any]:
             "values": values,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.write_registers(address, values)
 
     return response
@@ -996,7 +1058,7 @@ def command_play_sequence(args: argparse.Namespace) -> dict[str, Any]:
         },
     )
 
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.write_registers(priority_address, combined_values)
 
     return response
@@ -1012,7 +1074,7 @@ def command_read_frequency(args: argparse.Namespace) -> dict[str, Any]:
             "frequency": None,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         value = client.read_frequency()
 
     response["frequency"] = value
@@ -1030,7 +1092,7 @@ def command_set_frequency(args: argparse.Namespace) -> dict[str, Any]:
             "frequency": value,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.write_frequency(value=value)
 
     return response
@@ -1048,7 +1110,7 @@ def command_set_route(args: argparse.Namespace) -> dict[str, Any]:
             "count": len(addresses),
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.configure_route(addresses)
 
     return response
@@ -1066,7 +1128,7 @@ def command_set_zones(args: argparse.Namespace) -> dict[str, Any]:
             "count": len(zones),
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         client.set_destination_zones(zones)
 
     return response
@@ -1083,7 +1145,7 @@ def command_read_route(args: argparse.Namespace) -> dict[str, Any]:
             "zones": None,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         info = client.get_device_info()
 
     route = info.get("configured_route")
@@ -1150,7 +1212,7 @@ def command_read_block(args: argparse.Namespace) -> dict[str, Any]:
             "values": None,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         values = client.read_registers(block.start, block.quantity)
 
     response["values"] = values
@@ -1197,12 +1259,14 @@ def command_jsvv_stop(args: argparse.Namespace) -> dict[str, Any]:
         },
     )
 
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
-        client.write_registers(constants.NUM_ADDR_RAM, route_payload)
-        for attempt in range(repeat):
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
+        with client.transaction():
+            client.write_registers(constants.NUM_ADDR_RAM, route_payload)
             client.write_registers(JSVV_COMMAND_REGISTER, command_words, unit=remote_unit)
-            if attempt + 1 < repeat and delay > 0:
+        for _attempt in range(1, repeat):
+            if delay > 0:
                 time.sleep(delay)
+            client.write_registers(JSVV_COMMAND_REGISTER, command_words, unit=remote_unit)
 
     return response
 
@@ -1228,7 +1292,7 @@ def command_write_block(args: argparse.Namespace) -> dict[str, Any]:
             "values": values,
         },
     )
-    with ModbusAudioClient(settings=settings, unit_id=unit_id) as client:
+    with ModbusAudioClient(settings=settings, unit_id=unit_id, priority=command_priority(args)) as client:
         if block.quantity == 1:
             client.write_register(block.start, values[0])
         else:
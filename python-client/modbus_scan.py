@@ -1,14 +1,29 @@
 #!/usr/bin/env python3
-"""Brute-force Modbus RTU probe for /dev/ttyAMA3 with configurable scans."""
+"""Modbus RTU discovery for one or more serial ports.
+
+Each port is opened once and reconfigured in place for every serial format.
+An optional passive listen phase looks for CRC-valid frames in existing bus
+traffic to pick the baud rate and parity (and the unit ids in use) without
+sending anything. Probes are raw RTU read requests whose reply timeout is
+derived from the character time at the probed baud rate (3.5 character
+silence plus the expected reply length on top of the device turnaround);
+reading stops as soon as a frame with a valid CRC is complete. Unit ids are
+probed in order of the priors from ``constants`` and the environment, ports
+are scanned concurrently and results are streamed as NDJSON with ``--json``.
+"""
 
 from __future__ import annotations
 
 import argparse
-import itertools
 import json
 import os
+import select
 import sys
-from typing import Iterable
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable, Optional
 
 from pathlib import Path
 
@@ -17,40 +32,434 @@ SRC_DIR = ROOT_DIR / "src"
 if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from modbus_audio import ModbusAudioClient, ModbusAudioError, SerialSettings, constants
+from modbus_audio import PRIORITY_BACKGROUND, BusArbiter, constants
 
 
 DEFAULT_BAUDRATES: tuple[int, ...] = (9600, 19200, 38400, 57600, 115200)
 DEFAULT_PARITIES: tuple[str, ...] = ("N", "E", "O")
 DEFAULT_UNITS: tuple[int, ...] = tuple(range(1, 57))
 DEFAULT_READ_MODES: tuple[str, ...] = ("holding", "input")
+FUNCTION_CODES = {"holding": 0x03, "input": 0x04}
+# Env variables other parts of the system use for unit ids; their values are probed first.
+UNIT_PRIOR_ENV = ("MODBUS_UNIT_ID", "CONTROL_TAB_MODBUS_UNIT_ID", "RF_UNIT_ID")
+CONTROL_TAB_DEFAULT_UNIT = 55
+
+
+def _crc_table() -> list[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = _crc_table()
+
+
+def crc16(data: bytes) -> int:
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def with_crc(payload: bytes) -> bytes:
+    return payload + crc16(payload).to_bytes(2, "little")
+
+
+def crc_ok(frame: bytes) -> bool:
+    return len(frame) >= 4 and crc16(frame[:-2]) == int.from_bytes(frame[-2:], "little")
+
+
+def build_read_request(unit: int, function: int, address: int, count: int) -> bytes:
+    return with_crc(bytes((unit, function)) + address.to_bytes(2, "big") + count.to_bytes(2, "big"))
+
+
+@dataclass(frozen=True)
+class SerialFormat:
+    baudrate: int
+    parity: str
+    stopbits: int
+    bytesize: int
+
+    @property
+    def char_time(self) -> float:
+        bits = 1 + self.bytesize + (0 if self.parity == "N" else 1) + self.stopbits
+        return bits / self.baudrate
+
+    @property
+    def silent_interval(self) -> float:
+        """Inter-frame silence t3.5; the RTU spec fixes it at 1.75 ms above 19200 Bd."""
+
+        return 0.00175 if self.baudrate > 19200 else 3.5 * self.char_time
+
+    def reply_timeout(self, reply_bytes: int, turnaround: float) -> float:
+        return turnaround + (8 + reply_bytes) * self.char_time + 2 * self.silent_interval
+
+
+def split_frames(chunks: Iterable[tuple[float, bytes]], gap: float, char_time: float) -> list[bytes]:
+    """Join timestamped reads into frames, splitting where the line was silent for ``gap``.
+
+    A read returns when its last byte arrived, so the line went quiet before a
+    chunk only if the time since the previous read exceeds ``gap`` plus the
+    chunk's own transmission time.
+    """
+
+    frames: list[bytes] = []
+    current = bytearray()
+    last: Optional[float] = None
+    for stamp, data in chunks:
+        if current and last is not None and stamp - last > gap + len(data) * char_time:
+            frames.append(bytes(current))
+            current.clear()
+        current.extend(data)
+        last = stamp
+    if current:
+        frames.append(bytes(current))
+    return frames
+
+
+def _frame_lengths(data: bytes, offset: int) -> list[int]:
+    function = data[offset + 1]
+    if function & 0x80:
+        return [5]
+    lengths = [8]  # read requests, single/multiple write replies
+    if function in (0x01, 0x02, 0x03, 0x04) and offset + 2 < len(data):
+        lengths.insert(0, 5 + data[offset + 2])
+    return lengths
+
+
+def extract_frames(data: bytes) -> list[bytes]:
+    """CRC-valid frames in ``data``, skipping bytes that do not start one.
+
+    A request and its reply often arrive in one read, so a gap-delimited frame
+    may hold several; only lengths that the function code allows are checked.
+    """
+
+    frames: list[bytes] = []
+    offset = 0
+    while offset + 4 <= len(data):
+        for length in _frame_lengths(data, offset):
+            candidate = data[offset : offset + length]
+            if len(candidate) == length and crc_ok(candidate):
+                frames.append(candidate)
+                offset += length
+                break
+        else:
+            offset += 1
+    return frames
+
+
+def parse_reply(frame: bytes, unit: int, function: int) -> Optional[dict[str, Any]]:
+    """Registers (or the exception code) of a valid reply to a read request, else None."""
+
+    if not crc_ok(frame) or frame[0] != unit:
+        return None
+    if frame[1] == function | 0x80 and len(frame) == 5:
+        return {"exception": frame[2]}
+    if frame[1] != function or len(frame) != 5 + frame[2] or frame[2] % 2:
+        return None
+    payload = frame[3:-2]
+    return {"registers": [int.from_bytes(payload[i : i + 2], "big") for i in range(0, len(payload), 2)]}
+
+
+def find_reply(data: bytes, unit: int, function: int) -> Optional[dict[str, Any]]:
+    """First valid reply of ``unit`` to ``function`` anywhere in ``data``."""
+
+    for offset in range(len(data) - 4):
+        if data[offset] != unit:
+            continue
+        code = data[offset + 1]
+        if code == function | 0x80:
+            length = 5
+        elif code == function:
+            length = 5 + data[offset + 2]
+        else:
+            continue
+        reply = parse_reply(data[offset : offset + length], unit, function)
+        if reply is not None:
+            return reply
+    return None
+
+
+def unit_order(units: Iterable[int], observed: Iterable[int] = ()) -> list[int]:
+    """Units seen on the bus first, then configured/default unit ids, then the rest ascending."""
+
+    candidates = list(dict.fromkeys(units))
+    priors: list[int] = list(observed)
+    for name in UNIT_PRIOR_ENV:
+        value = os.environ.get(name, "").strip()
+        if value:
+            try:
+                priors.append(int(value, 0))
+            except ValueError:
+                pass
+    priors.extend((constants.DEFAULT_UNIT_ID, CONTROL_TAB_DEFAULT_UNIT))
+    first = [unit for unit in dict.fromkeys(priors) if unit in candidates]
+    return first + sorted(unit for unit in candidates if unit not in first)
+
+
+def format_order(
+    baudrates: Iterable[int], parities: Iterable[str], stopbits: Iterable[int], bytesizes: Iterable[int]
+) -> list[SerialFormat]:
+    """Serial formats with the configured defaults (``constants``/env) first."""
+
+    def prefer(values: Iterable[Any], preferred: Any) -> list[Any]:
+        values = list(dict.fromkeys(values))
+        return sorted(values, key=lambda value: value != preferred)
+
+    return [
+        SerialFormat(int(baud), str(parity), int(stop), int(size))
+        for baud in prefer(baudrates, constants.DEFAULT_BAUDRATE)
+        for parity in prefer(parities, constants.DEFAULT_PARITY)
+        for stop in prefer(stopbits, constants.DEFAULT_STOPBITS)
+        for size in prefer(bytesizes, constants.DEFAULT_BYTESIZE)
+    ]
+
+
+def _open_serial(port: str) -> Any:
+    import serial  # type: ignore[import]
+
+    return serial.Serial(port=port, timeout=0)
+
+
+class PortScanner:
+    """Discovers Modbus RTU devices on one serial port."""
+
+    def __init__(
+        self,
+        port: str,
+        formats: list[SerialFormat],
+        units: list[int],
+        functions: list[int],
+        *,
+        register: int,
+        count: int,
+        turnaround: float,
+        listen: float,
+        emit: Callable[[dict[str, Any]], None],
+        all_settings: bool = False,
+        first_only: bool = False,
+        serial_factory: Callable[[str], Any] = _open_serial,
+        arbiter: Optional[BusArbiter] = None,
+    ) -> None:
+        self.port = port
+        self.formats = formats
+        self.units = units
+        self.functions = functions
+        self.register = register
+        self.count = count
+        self.turnaround = turnaround
+        self.listen_seconds = listen
+        self.emit = emit
+        self.all_settings = all_settings
+        self.first_only = first_only
+        self._serial_factory = serial_factory
+        self._arbiter = arbiter
+        self._serial: Any = None
+        self._current: Optional[SerialFormat] = None
+        self.probes = 0
+        self.found = 0
+
+    def _apply(self, fmt: SerialFormat) -> None:
+        handle = self._serial
+        handle.apply_settings(
+            {"baudrate": fmt.baudrate, "parity": fmt.parity, "stopbits": fmt.stopbits, "bytesize": fmt.bytesize}
+        )
+        handle.reset_input_buffer()
+
+    def _configure(self, fmt: SerialFormat) -> bool:
+        # termios.error is not an OSError, so any failure counts as an unsupported format.
+        try:
+            self._apply(fmt)
+        except Exception as exc:
+            self._event("unsupported", fmt, error=str(exc))
+            # pyserial keeps the rejected value and would fail every later reconfigure.
+            try:
+                self._serial.close()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+            self._serial = self._serial_factory(self.port)
+            if self._current is not None:
+                self._apply(self._current)
+            return False
+        self._current = fmt
+        return True
+
+    def _event(self, event: str, fmt: Optional[SerialFormat] = None, **fields: Any) -> None:
+        payload: dict[str, Any] = {"event": event, "port": self.port}
+        if fmt is not None:
+            payload.update(asdict(fmt))
+        payload.update(fields)
+        self.emit(payload)
+
+    def _read_available(self, timeout: float) -> bytes:
+        """Whatever the port has buffered, waiting up to ``timeout`` for the first byte.
+
+        The port stays non-blocking (timeout 0); waiting in select() avoids the
+        termios update pyserial does on every ``timeout`` change.
+        """
+
+        handle = self._serial
+        if not handle.in_waiting:
+            ready, _, _ = select.select([handle], [], [], timeout)
+            if not ready:
+                return b""
+        return handle.read(handle.in_waiting or 1)
+
+    def listen(self, fmt: SerialFormat) -> tuple[int, list[int]]:
+        """Valid frames and the unit ids seen in them while listening at ``fmt``."""
+
+        if not self._configure(fmt):
+            return 0, []
+        chunks: list[tuple[float, bytes]] = []
+        deadline = time.monotonic() + self.listen_seconds
+        while (remaining := deadline - time.monotonic()) > 0:
+            data = self._read_available(min(remaining, fmt.silent_interval))
+            if data:
+                chunks.append((time.monotonic(), data))
+        frames = split_frames(chunks, fmt.silent_interval, fmt.char_time)
+        valid = [frame for chunk in frames for frame in extract_frames(chunk)]
+        units = sorted({frame[0] for frame in valid if 1 <= frame[0] <= 247})
+        if chunks:
+            self._event(
+                "listen",
+                fmt,
+                bytes=sum(len(data) for _, data in chunks),
+                frames=len(frames),
+                validFrames=len(valid),
+                units=units,
+            )
+        return len(valid), units
+
+    def _read_reply(self, unit: int, function: int, timeout: float) -> Optional[dict[str, Any]]:
+        """Read until a valid reply from ``unit`` arrives, returning as soon as its CRC checks out.
+
+        Bytes ahead of it (an adapter echoing the request, other masters' traffic,
+        line noise) are skipped.
+        """
+
+        deadline = time.monotonic() + timeout
+        buffer = bytearray()
+        while (remaining := deadline - time.monotonic()) > 0:
+            data = self._read_available(remaining)
+            if not data:
+                break
+            buffer.extend(data)
+            reply = find_reply(bytes(buffer), unit, function)
+            if reply is not None:
+                return reply
+        return None
+
+    def probe(self, fmt: SerialFormat, unit: int, function: int) -> Optional[dict[str, Any]]:
+        request = build_read_request(unit, function, self.register, self.count)
+        timeout = fmt.reply_timeout(5 + 2 * self.count, self.turnaround)
+        handle = self._serial
+        self.probes += 1
+        started = time.monotonic()
+        if self._arbiter is not None:
+            self._arbiter.acquire(PRIORITY_BACKGROUND)
+        try:
+            handle.reset_input_buffer()
+            handle.write(request)
+            reply = self._read_reply(unit, function, timeout)
+        finally:
+            if self._arbiter is not None:
+                self._arbiter.release()
+        if reply is not None:
+            reply["latencyMs"] = round((time.monotonic() - started) * 1000, 2)
+        return reply
+
+    def scan_format(self, fmt: SerialFormat, observed: Iterable[int] = ()) -> int:
+        found = 0
+        if not self._configure(fmt):
+            return found
+        for unit in unit_order(self.units, observed):
+            for index, function in enumerate(self.functions):
+                reply = self.probe(fmt, unit, function)
+                if reply is None:
+                    if index == 0:
+                        # A unit that ignores the first function will not answer the next one either.
+                        break
+                    continue
+                found += 1
+                self.found += 1
+                self._event("found", fmt, unit=unit, function=function, register=self.register, **reply)
+                if self.first_only:
+                    return found
+        return found
+
+    def _scan(self) -> None:
+        formats = list(self.formats)
+        observed: list[int] = []
+        if self.listen_seconds > 0:
+            scores = []
+            for fmt in formats:
+                valid, units = self.listen(fmt)
+                if valid:
+                    scores.append((valid, fmt, units))
+            if scores:
+                valid, best, observed = max(scores, key=lambda item: item[0])
+                self._event("detected", best, validFrames=valid, units=observed)
+                formats = [best] + [fmt for fmt in formats if fmt != best]
+        for fmt in formats:
+            hits = self.scan_format(fmt, observed if fmt == formats[0] else ())
+            # All devices on one bus share the serial format.
+            if hits and (self.first_only or not self.all_settings):
+                break
+
+    def run(self) -> dict[str, Any]:
+        started = time.monotonic()
+        try:
+            self._serial = self._serial_factory(self.port)
+        except Exception as exc:
+            self._event("error", error=str(exc))
+            return {"port": self.port, "found": 0, "error": str(exc)}
+        try:
+            self._scan()
+        except Exception as exc:
+            self._event("error", error=str(exc))
+        finally:
+            try:
+                self._serial.close()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+        summary = {"found": self.found, "probes": self.probes, "elapsedMs": round((time.monotonic() - started) * 1000, 1)}
+        self._event("done", **summary)
+        return {"port": self.port, **summary}
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Scan Modbus RTU settings and report successful responses.",
+        description="Discover Modbus RTU devices and their serial settings.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
-    parser.add_argument("--port", default=os.environ.get("MODBUS_PORT", "/dev/ttyAMA3"), help="Serial port path")
-    parser.add_argument("--method", default=os.environ.get("MODBUS_METHOD", "rtu"), help="Modbus method")
     parser.add_argument(
-        "--baudrate",
-        type=int,
-        nargs="*",
-        default=[int(os.environ.get("MODBUS_BAUDRATE", b)) for b in DEFAULT_BAUDRATES],
-        help="Baud rates to try",
+        "--port",
+        nargs="+",
+        default=[os.environ.get("MODBUS_PORT", constants.DEFAULT_SERIAL_PORT)],
+        help="Serial port path(s); several ports are scanned concurrently",
     )
-    parser.add_argument("--parity", nargs="*", default=[os.environ.get("MODBUS_PARITY", p) for p in DEFAULT_PARITIES])
+    parser.add_argument("--method", default=os.environ.get("MODBUS_METHOD", "rtu"), help="Modbus method (only rtu)")
+    parser.add_argument("--baudrate", type=int, nargs="*", default=list(DEFAULT_BAUDRATES), help="Baud rates to try")
+    parser.add_argument("--parity", nargs="*", default=list(DEFAULT_PARITIES))
     parser.add_argument("--stopbits", type=int, nargs="*", default=[int(os.environ.get("MODBUS_STOPBITS", 1))])
     parser.add_argument("--bytesize", type=int, nargs="*", default=[int(os.environ.get("MODBUS_BYTESIZE", 8))])
-    parser.add_argument("--timeout", type=float, default=float(os.environ.get("MODBUS_TIMEOUT", 1.0)))
     parser.add_argument(
-        "--unit",
-        type=int,
-        nargs="*",
-        default=[int(os.environ.get("MODBUS_UNIT_ID", unit)) for unit in DEFAULT_UNITS],
-        help="Unit IDs to probe",
+        "--timeout",
+        type=float,
+        default=float(os.environ.get("MODBUS_SCAN_TIMEOUT", 0.1)),
+        help="Device turnaround budget per probe in seconds; the frame time at the probed baud rate is added",
     )
+    parser.add_argument(
+        "--listen",
+        type=float,
+        default=float(os.environ.get("MODBUS_SCAN_LISTEN", 0.3)),
+        help="Seconds of passive listening per serial format before probing (0 disables)",
+    )
+    parser.add_argument("--unit", type=int, nargs="*", default=list(DEFAULT_UNITS), help="Unit IDs to probe")
     parser.add_argument(
         "--register",
         type=lambda value: int(value, 0),
@@ -64,137 +473,90 @@ def parse_args() -> argparse.Namespace:
         default="both",
         help="Which Modbus function(s) to exercise",
     )
+    parser.add_argument(
+        "--all-settings",
+        action="store_true",
+        help="Keep probing other serial formats after devices were found",
+    )
+    parser.add_argument("--first", action="store_true", help="Stop each port after the first device found")
+    parser.add_argument("--no-arbiter", action="store_true", help="Do not take the Modbus bus arbiter per probe")
     parser.add_argument(
         "--json",
         action="store_true",
-        help="Render machine-readable JSON output instead of text summary",
+        help="Stream machine-readable NDJSON events instead of a text summary",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.method.lower() != "rtu":
+        parser.error("Only the rtu method can be scanned.")
+    return args
 
 
-def unique(values: Iterable[int | str]) -> tuple[int | str, ...]:
-    seen = []
-    for value in values:
-        if value not in seen:
-            seen.append(value)
-    return tuple(seen)
+def render_text(event: dict[str, Any]) -> Optional[str]:
+    kind = event["event"]
+    settings = "baud={baudrate} parity={parity} stopbits={stopbits} bytesize={bytesize}"
+    if kind == "found":
+        result = f"exception={event['exception']}" if "exception" in event else f"registers={event['registers']}"
+        return (
+            f"[{event['port']}] {settings.format(**event)} unit={event['unit']} "
+            f"fc={event['function']} → {result} ({event['latencyMs']} ms)"
+        )
+    if kind == "detected":
+        return f"[{event['port']}] traffic detected at {settings.format(**event)}, units {event['units']}"
+    if kind == "error":
+        return f"[{event['port']}] error: {event['error']}"
+    if kind == "done":
+        return f"[{event['port']}] {event['found']} responses, {event['probes']} probes in {event['elapsedMs'] / 1000:.1f} s"
+    return None
 
 
-def read_input_registers(client: ModbusAudioClient, address: int, count: int, unit: int | None = None) -> list[int]:
-    response = client._call_with_unit(  # type: ignore[attr-defined]
-        client._client.read_input_registers,  # type: ignore[attr-defined]
-        address=address,
-        count=count,
-        unit=unit,
+def main() -> None:
+    args = parse_args()
+
+    formats = format_order(
+        args.baudrate or DEFAULT_BAUDRATES,
+        [parity.upper() for parity in (args.parity or DEFAULT_PARITIES)],
+        args.stopbits or (1,),
+        args.bytesize or (8,),
     )
-    if getattr(response, "isError", lambda: False)():
-        raise ModbusAudioError(f"Modbus error reading input registers 0x{address:04X}")
-    if not hasattr(response, "registers"):
-        raise ModbusAudioError("Unexpected payload from read_input_registers")
-    return list(response.registers)
+    modes = DEFAULT_READ_MODES if args.mode == "both" else (args.mode,)
+    functions = [FUNCTION_CODES[mode] for mode in modes]
+    units = list(dict.fromkeys(args.unit or DEFAULT_UNITS))
 
+    lock = threading.Lock()
 
-def main() -> None:
-    args = parse_args()
+    def emit(event: dict[str, Any]) -> None:
+        line = json.dumps(event) if args.json else render_text(event)
+        if line is None:
+            return
+        with lock:
+            print(line, flush=True)
 
-    baudrates = unique(args.baudrate or DEFAULT_BAUDRATES)
-    parities = tuple(p.upper() for p in unique(args.parity or DEFAULT_PARITIES))
-    stopbits = unique(args.stopbits or (1,))
-    bytesizes = unique(args.bytesize or (8,))
-    units = unique(args.unit or DEFAULT_UNITS)
-    modes = {
-        "holding": args.mode in {"holding", "both"},
-        "input": args.mode in {"input", "both"},
-    }
-
-    results: list[dict[str, object]] = []
-
-    total = len(baudrates) * len(parities) * len(stopbits) * len(bytesizes) * len(units)
-    processed = 0
-    successes: list[dict[str, object]] = []
-
-    for baudrate, parity, stopbit, bytesize in itertools.product(baudrates, parities, stopbits, bytesizes):
-        settings = SerialSettings(
-            port=args.port,
-            method=args.method,
-            baudrate=int(baudrate),
-            parity=str(parity),
-            stopbits=int(stopbit),
-            bytesize=int(bytesize),
-            timeout=float(args.timeout),
-        )
+    def scan(port: str) -> dict[str, Any]:
+        arbiter = None
+        if constants.BUS_ARBITRATION and not args.no_arbiter:
+            arbiter = BusArbiter.for_port(port, timeout=constants.BUS_WAIT_TIMEOUT)
+        return PortScanner(
+            port,
+            formats,
+            units,
+            functions,
+            register=args.register,
+            count=args.count,
+            turnaround=args.timeout,
+            listen=args.listen,
+            emit=emit,
+            all_settings=args.all_settings,
+            first_only=args.first,
+            arbiter=arbiter,
+        ).run()
 
-        for unit in units:
-            outcome: dict[str, object] = {
-                "baudrate": baudrate,
-                "parity": parity,
-                "stopbits": stopbit,
-                "bytesize": bytesize,
-                "unit": unit,
-            }
+    ports = list(dict.fromkeys(args.port))
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        summaries = list(executor.map(scan, ports))
 
-            try:
-                with ModbusAudioClient(settings, unit_id=unit) as client:
-                    if modes["holding"]:
-                        try:
-                            holding = client.read_registers(args.register, args.count, unit=unit)
-                            outcome["holding"] = holding
-                            successes.append(outcome.copy())
-                        except ModbusAudioError as exc:
-                            outcome["holding_error"] = str(exc)
-
-                    if modes["input"]:
-                        try:
-                            inputs = read_input_registers(client, args.register, args.count, unit=unit)
-                            outcome["input"] = inputs
-                            successes.append(outcome.copy())
-                        except ModbusAudioError as exc:
-                            outcome["input_error"] = str(exc)
-
-            except ModbusAudioError as exc:
-                outcome["connection_error"] = str(exc)
-
-            results.append(outcome)
-            processed += 1
-            if args.json:
-                processed += 1
-                continue
-
-            if "holding" in outcome or "input" in outcome:
-                prefix = (
-                    f"[{processed}/{total}] baud={baudrate} parity={parity} "
-                    f"stopbits={stopbit} bytesize={bytesize} unit={unit}"
-                )
-                ok_parts = []
-                if "holding" in outcome:
-                    ok_parts.append(f"holding={outcome['holding']}")
-                if "input" in outcome:
-                    ok_parts.append(f"input={outcome['input']}")
-                print(prefix + " → success: " + ", ".join(ok_parts))
-
-            processed += 1
-
-    if args.json:
-        json.dump(results, sys.stdout, indent=2)
-        sys.stdout.write("\n")
-        return
-
-    print("-" * 60)
-    if successes:
-        print(f"Successful combinations ({len(successes)} total):")
-        for entry in successes:
-            details = (
-                f"baud={entry['baudrate']} parity={entry['parity']} "
-                f"stopbits={entry['stopbits']} bytesize={entry['bytesize']} unit={entry['unit']}"
-            )
-            if "holding" in entry:
-                details += f" holding={entry['holding']}"
-            if "input" in entry:
-                details += f" input={entry['input']}"
-            print("  - " + details)
-    else:
+    if not args.json and not any(summary.get("found") for summary in summaries):
         print("No working Modbus combination found.")
-    print(f"Tried {total} combinations.")
+
 
 if __name__ == "__main__":  # pragma: no cover
     try:
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Measure control channel throughput over the Unix socket.
+
+Sends ``status_modbus`` requests to a running ``control_channel_worker.py`` in
+three modes and prints requests per second for each:
+
+* ``legacy``     – protocol 1, a new connection + READY handshake per request,
+* ``persistent`` – protocol 2, one connection, one request in flight,
+* ``pipelined``  – protocol 2, one connection, ``--window`` requests in flight.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+
+def parse_endpoint(value: str | None) -> Path:
+    if not value:
+        return Path("/var/run/jsvv-control.sock")
+    if value.startswith("unix://"):
+        return Path(value.replace("unix://", "", 1))
+    return Path(value)
+
+
+class Connection:
+    def __init__(self, path: Path, timeout: float) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(str(path))
+        self._stream = self._sock.makefile("rwb")
+        handshake = self._stream.readline().strip()
+        if handshake != b"READY":
+            raise RuntimeError(f"Unexpected handshake: {handshake!r}")
+
+    def send(self, payload: dict) -> None:
+        self._stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def receive(self) -> dict:
+        line = self._stream.readline()
+        if not line:
+            raise RuntimeError("Connection closed by worker")
+        return json.loads(line)
+
+    def close(self) -> None:
+        self._stream.close()
+        self._sock.close()
+
+    def upgrade(self) -> None:
+        self.send({"id": "hello", "command": "hello", "protocol": 2})
+        self.flush()
+        response = self.receive()
+        if not response.get("ok") or int(response.get("details", {}).get("protocol", 1)) < 2:
+            raise RuntimeError("Worker does not support protocol 2")
+
+
+def request(index: int) -> dict:
+    return {"id": str(index), "command": "status_modbus", "reason": "load-test"}
+
+
+def run_legacy(path: Path, count: int, timeout: float) -> None:
+    for index in range(count):
+        connection = Connection(path, timeout)
+        connection.send(request(index))
+        connection.flush()
+        connection.receive()
+        connection.close()
+
+
+def run_persistent(path: Path, count: int, timeout: float) -> None:
+    connection = Connection(path, timeout)
+    connection.upgrade()
+    for index in range(count):
+        connection.send(request(index))
+        connection.flush()
+        connection.receive()
+    connection.close()
+
+
+def run_pipelined(path: Path, count: int, timeout: float, window: int) -> None:
+    connection = Connection(path, timeout)
+    connection.upgrade()
+    sent = 0
+    outstanding: set[str] = set()
+    while sent < count or outstanding:
+        while sent < count and len(outstanding) < window:
+            payload = request(sent)
+            connection.send(payload)
+            outstanding.add(payload["id"])
+            sent += 1
+        connection.flush()
+        response = connection.receive()
+        outstanding.discard(str(response.get("id")))
+    connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint", default=os.getenv("CONTROL_CHANNEL_ENDPOINT"))
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per mode")
+    parser.add_argument("--window", type=int, default=16, help="In-flight requests for pipelined mode")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Socket timeout in seconds")
+    parser.add_argument(
+        "--modes",
+        nargs="*",
+        default=["legacy", "persistent", "pipelined"],
+        choices=["legacy", "persistent", "pipelined"],
+    )
+    args = parser.parse_args()
+
+    path = parse_endpoint(args.endpoint)
+    results: dict[str, dict[str, float]] = {}
+    for mode in args.modes:
+        start = time.perf_counter()
+        try:
+            if mode == "legacy":
+                run_legacy(path, args.requests, args.timeout)
+            elif mode == "persistent":
+                run_persistent(path, args.requests, args.timeout)
+            else:
+                run_pipelined(path, args.requests, args.timeout, max(1, args.window))
+        except (OSError, RuntimeError, ValueError) as exc:
+            print(json.dumps({"status": "error", "mode": mode, "message": str(exc)}))
+            sys.exit(1)
+        elapsed = time.perf_counter() - start
+        results[mode] = {
+            "requests": args.requests,
+            "seconds": round(elapsed, 4),
+            "requestsPerSecond": round(args.requests / elapsed, 1) if elapsed else 0.0,
+        }
+
+    print(json.dumps({"status": "ok", "endpoint": str(path), "results": results}, indent=2))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
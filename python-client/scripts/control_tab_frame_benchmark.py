@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Replay a burst of Control Tab traffic through the old and new receive paths.
+
+Feeds either a captured raw UART dump (``--capture``) or a synthetic burst of
+``--presses`` button frames with line noise between them, split into random
+write sizes. Two comparisons are printed:
+
+* ``serial``: end to end over a pseudo-terminal opened with pyserial, the way
+  the listener runs. The old path called ``Serial.readline()`` (which reads
+  one byte per call) and parsed strings; the new path is
+  ``ControlTabSerial.read_into()`` plus ``FrameExtractor``. Read calls and
+  wall time are reported.
+* ``parser``: the two frame parsers alone on in-memory chunks. The string
+  loop is faster per byte here; the extractor pays for bounded buffering and
+  noise accounting, which only matters against the read path above.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pty
+import random
+import sys
+import threading
+import time
+import tty
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "daemons"))
+
+from control_tab_listener import ControlTabSerial, FrameExtractor, xor_crc  # noqa: E402
+
+try:
+    import serial  # type: ignore[import]
+except ImportError:  # pragma: no cover - optional for the parser comparison
+    serial = None
+
+
+def synthesize(presses: int, noise: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    chunks: list[bytes] = []
+    for index in range(presses):
+        body = f"{1 + index % 4}:{1 + index % 8}:2={1 + index % 20}"
+        chunks.append(f"<<<:{body}>>{xor_crc(body)}<<<\n".encode("utf-8"))
+        if noise:
+            chunks.append(bytes(rng.choice(b"\r\n .#~xyz0123456789") for _ in range(rng.randint(0, noise))))
+    return b"".join(chunks)
+
+
+def split_reads(data: bytes, max_read: int, seed: int) -> list[bytes]:
+    rng = random.Random(seed)
+    reads: list[bytes] = []
+    offset = 0
+    while offset < len(data):
+        size = rng.randint(1, max_read)
+        reads.append(data[offset:offset + size])
+        offset += size
+    return reads
+
+
+class LegacyParser:
+    """The previous ``_ingest``: decode with errors="ignore", str find/slice, 128 char tail."""
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self.frames = 0
+
+    def ingest(self, chunk: str) -> None:
+        buffer = self.buffer + chunk
+        while True:
+            start = buffer.find("<<<")
+            if start == -1:
+                if len(buffer) > 128:
+                    buffer = buffer[-128:]
+                break
+            if start > 0:
+                buffer = buffer[start:]
+            if len(buffer) < 7:
+                break
+            end = buffer.find("<<<", 3)
+            if end == -1:
+                break
+            frame = buffer[: end + 3].strip()
+            buffer = buffer[end + 3 :]
+            if frame.startswith("<<<:"):
+                self.frames += 1
+        self.buffer = buffer
+
+
+def run_legacy(reads: list[bytes]) -> tuple[int, int | None]:
+    parser = LegacyParser()
+    for read in reads:
+        parser.ingest(read.decode("utf-8", errors="ignore"))
+    return parser.frames, None
+
+
+def run_extractor(reads: list[bytes]) -> tuple[int, int | None]:
+    extractor = FrameExtractor()
+    for read in reads:
+        target = extractor.writable()
+        offset = 0
+        while offset < len(read):
+            count = min(len(target), len(read) - offset)
+            target[:count] = read[offset:offset + count]
+            extractor.commit(count)
+            offset += count
+            for frame in extractor.frames_ready():
+                bytes(frame).decode("utf-8", errors="replace")
+            target = extractor.writable()
+    return extractor.frames, extractor.dropped
+
+
+def _pump(master: int, writes: list[bytes]) -> None:
+    for chunk in writes:
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(master, view):]
+
+
+def run_serial(name: str, writes: list[bytes], expected: int) -> dict[str, float | int]:
+    """Receive ``writes`` through a pty with the old or new read path until ``expected`` frames arrived."""
+
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    transport = ControlTabSerial(os.ttyname(slave), 115200, 8, "N", 1, 0.2, 1.0)
+    transport.open()
+    port = transport._serial
+    assert port is not None
+    writer = threading.Thread(target=_pump, args=(master, writes), daemon=True)
+    calls = 0
+    started = time.perf_counter()
+    writer.start()
+    try:
+        if name == "legacy":
+            parser = LegacyParser()
+            while parser.frames < expected:
+                line = port.readline()
+                calls += 1
+                if not line:
+                    break
+                parser.ingest(line.decode("utf-8", errors="ignore"))
+            frames = parser.frames
+        else:
+            extractor = FrameExtractor()
+            while extractor.frames < expected:
+                count = transport.read_into(extractor.writable())
+                calls += 1
+                if not count:
+                    break
+                extractor.commit(count)
+                for frame in extractor.frames_ready():
+                    bytes(frame).decode("utf-8", errors="replace")
+            frames = extractor.frames
+        elapsed = time.perf_counter() - started
+    finally:
+        writer.join(timeout=5)
+        transport.close()
+        os.close(slave)
+        os.close(master)
+    return {
+        "frames": frames,
+        "readCalls": calls,
+        "seconds": round(elapsed, 4),
+        "framesPerSecond": round(frames / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--capture", type=Path, help="Raw UART capture to replay instead of a synthetic burst")
+    parser.add_argument("--presses", type=int, default=10_000, help="Button presses in the synthetic burst")
+    parser.add_argument("--noise", type=int, default=24, help="Max noise bytes between synthetic frames")
+    parser.add_argument("--max-read", type=int, default=256, help="Max bytes returned by one simulated UART read")
+    parser.add_argument("--rounds", type=int, default=5, help="Replays per extractor (best time wins)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.capture:
+        data = args.capture.read_bytes()
+    else:
+        data = synthesize(max(1, args.presses), max(0, args.noise), args.seed)
+    reads = split_reads(data, max(1, args.max_read), args.seed)
+
+    expected = run_extractor(reads)[0]
+    serial_results: dict[str, dict[str, float | int]] = {}
+    if serial is not None:
+        for name in ("legacy", "extractor"):
+            serial_results[name] = run_serial(name, reads, expected)
+
+    results: dict[str, dict[str, float | None]] = {}
+    for name, runner in (("legacy", run_legacy), ("extractor", run_extractor)):
+        best = float("inf")
+        frames, dropped = 0, None
+        for _ in range(max(1, args.rounds)):
+            start = time.perf_counter()
+            frames, dropped = runner(reads)
+            best = min(best, time.perf_counter() - start)
+        results[name] = {
+            "frames": frames,
+            "droppedBytes": dropped,
+            "seconds": round(best, 4),
+            "framesPerSecond": round(frames / best, 1) if best else 0.0,
+            "megabytesPerSecond": round(len(data) / best / 1e6, 2) if best else 0.0,
+        }
+
+    print(json.dumps({"bytes": len(data), "writes": len(reads), "serial": serial_results, "parser": results}, indent=2))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,23 @@
+"""Locations of the on-disk caches shared by the python-client tools."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+
+def cache_dir() -> Path:
+    """``$XDG_CACHE_HOME/rozhlas``, falling back to ``~/.cache/rozhlas``."""
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "rozhlas"
+
+
+def cache_path(env_name: str, filename: str) -> Optional[Path]:
+    """``env_name`` overrides the location and an empty value disables the cache; else ``cache_dir() / filename``."""
+
+    configured = os.environ.get(env_name)
+    if configured is not None:
+        return Path(configured) if configured.strip() else None
+    return cache_dir() / filename
@@ -0,0 +1,708 @@
+"""Process-wide pool of GPIO line requests.
+
+gpiod is resolved once per process. Every line the process uses on a chip is
+held in a single libgpiod v2 request that stays open until the pool is
+closed, so drive/read calls cost one ioctl and several outputs of one chip
+change together. Edge events of the shared request are buffered per line, so
+independent users can wait on different lines of the same chip. The request's
+fd is watched through an epoll fd that outlives re-requests, so a selector
+registered on it keeps working when another user claims or releases a line of
+the chip. libgpiod v1 falls back to one request per line.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import select
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+
+PYTHON_CLIENT_ROOT = Path(__file__).resolve().parents[1]
+GPIO_PYTHONPATH_ENV = ("MODBUS_RS485_GPIO_PYTHONPATH", "GPIO_BUTTON_PYTHONPATH")
+DEFAULT_CONSUMER = "rozhlas"
+EDGES = ("none", "rising", "falling", "both")
+PENDING_EVENTS = 256
+
+_UNRESOLVED = object()
+_gpiod: Any = _UNRESOLVED
+_gpiod_lock = threading.Lock()
+
+
+class GpioPoolError(RuntimeError):
+    """Raised when a line cannot be requested or accessed."""
+
+
+def _site_packages_candidates() -> list[str]:
+    paths: list[str] = []
+    for name in GPIO_PYTHONPATH_ENV:
+        paths.extend(part for part in os.environ.get(name, "").split(":") if part)
+    venv_dir = PYTHON_CLIENT_ROOT / ".venv"
+    if venv_dir.exists():
+        for pattern in ("lib/python*/site-packages", "lib64/python*/site-packages"):
+            paths.extend(str(candidate) for candidate in venv_dir.glob(pattern))
+    return paths
+
+
+def import_gpiod() -> Optional[Any]:
+    """Return the gpiod module, or None when it is not installed.
+
+    The lookup (including extending sys.path with the local virtualenv and the
+    ``*_GPIO_PYTHONPATH`` directories) runs once; later calls return the cached
+    result.
+    """
+
+    global _gpiod
+    with _gpiod_lock:
+        if _gpiod is not _UNRESOLVED:
+            return _gpiod
+        try:
+            import gpiod  # type: ignore[import]
+        except ModuleNotFoundError:
+            gpiod = None
+            appended = False
+            for path_str in _site_packages_candidates():
+                if path_str not in sys.path and Path(path_str).exists():
+                    sys.path.insert(0, path_str)
+                    appended = True
+            if appended:
+                try:
+                    import gpiod  # type: ignore[import]  # noqa: F811
+                except ImportError:  # also a binary extension built for another platform
+                    gpiod = None
+        _gpiod = gpiod
+        return _gpiod
+
+
+@dataclass(slots=True)
+class LatencyStats:
+    """Wall time spent in one kind of GPIO operation."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "meanMs": round(self.mean * 1000, 4),
+            "maxMs": round(self.max * 1000, 4),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class LineSpec:
+    output: bool = False
+    edge: str = "none"
+    debounce: float = 0.0
+    active_low: bool = False
+
+
+@dataclass(slots=True)
+class GpioEdge:
+    """Level change of one line; ``value`` is the level after the edge."""
+
+    line: int
+    value: int
+    timestamp: float
+
+
+@dataclass(slots=True)
+class _EdgeWaker:
+    """Self-pipe of one input handle, written when another caller buffers edges of its lines."""
+
+    chip: str
+    offsets: frozenset[int]
+    read_fd: int
+    write_fd: int
+
+
+def _level(value: object) -> int:
+    raw = getattr(value, "value", value)
+    return 1 if int(raw) else 0  # type: ignore[call-overload]
+
+
+class _ChipRequest:
+    """All lines the pool holds on one chip, as a single libgpiod v2 request.
+
+    libgpiod v2 cannot add lines to an existing request, so growing the set
+    re-requests the chip with the union; outputs are passed their current
+    level so they do not glitch. :meth:`filenos` returns an epoll fd that
+    watches whichever request is current.
+    """
+
+    def __init__(self, gpiod: Any, chip: str, consumer: str) -> None:
+        self._gpiod = gpiod
+        self._line = gpiod.line
+        self.chip = chip
+        self._consumer = consumer
+        self.specs: dict[int, LineSpec] = {}
+        self.levels: dict[int, bool] = {}
+        self.pending: dict[int, deque[GpioEdge]] = {}
+        self._request: Any = None
+        self._epoll = select.epoll()
+        self._watched: set[int] = set()
+        self._active = self._line.Value.ACTIVE
+        self._inactive = self._line.Value.INACTIVE
+        self._rising = gpiod.EdgeEvent.Type.RISING_EDGE
+
+    def _settings(self, spec: LineSpec) -> Any:
+        line = self._line
+        if spec.output:
+            return self._gpiod.LineSettings(direction=line.Direction.OUTPUT, active_low=spec.active_low)
+        edge = {
+            "none": line.Edge.NONE,
+            "rising": line.Edge.RISING,
+            "falling": line.Edge.FALLING,
+            "both": line.Edge.BOTH,
+        }[spec.edge]
+        return self._gpiod.LineSettings(
+            direction=line.Direction.INPUT,
+            edge_detection=edge,
+            active_low=spec.active_low,
+            debounce_period=timedelta(seconds=max(0.0, spec.debounce)),
+        )
+
+    def _watch(self, fds: Iterable[int]) -> None:
+        """Make the epoll fd watch exactly ``fds``; call before closing a watched fd."""
+
+        wanted = set(fds)
+        for fd in self._watched - wanted:
+            self._epoll.unregister(fd)
+        for fd in wanted - self._watched:
+            self._epoll.register(fd, select.EPOLLIN)
+        self._watched = wanted
+
+    def configure(self, specs: Mapping[int, LineSpec], levels: Mapping[int, bool]) -> None:
+        groups: dict[LineSpec, list[int]] = {}
+        for offset, spec in sorted(specs.items()):
+            groups.setdefault(spec, []).append(offset)
+        if self._request is not None:
+            self.drain()
+            self._watch(())
+            self._request.release()
+            self._request = None
+        if groups:
+            try:
+                self._request = self._gpiod.request_lines(
+                    self.chip,
+                    consumer=self._consumer,
+                    config={tuple(offsets): self._settings(spec) for spec, offsets in groups.items()},
+                    output_values={
+                        offset: self._active if level else self._inactive for offset, level in levels.items() if offset in specs
+                    },
+                )
+            except OSError as exc:
+                if self.specs and dict(specs) != self.specs:
+                    # Put back the lines this request held before the failed change.
+                    try:
+                        self.configure(self.specs, self.levels)
+                    except GpioPoolError:
+                        pass
+                raise GpioPoolError(f"Cannot request {self.chip}:{','.join(map(str, sorted(specs)))}: {exc}") from exc
+        self.specs = dict(specs)
+        self.levels = {offset: levels[offset] for offset in levels if offset in specs}
+        for offset, spec in specs.items():
+            if spec.edge != "none":
+                self.pending.setdefault(offset, deque(maxlen=PENDING_EVENTS))
+        for offset in list(self.pending):
+            if offset not in specs:
+                del self.pending[offset]
+        self._watch([self._request.fd] if self._request is not None and self.pending else [])
+
+    def set_values(self, levels: Mapping[int, bool]) -> None:
+        self._request.set_values({offset: self._active if level else self._inactive for offset, level in levels.items()})
+
+    def get_values(self, offsets: list[int]) -> list[int]:
+        return [_level(value) for value in self._request.get_values(offsets)]
+
+    def filenos(self) -> list[int]:
+        return [self._epoll.fileno()] if self._watched else []
+
+    def drain(self) -> int:
+        """Move queued kernel edge events into the per-line buffers without blocking."""
+
+        if self._request is None or not self.pending:
+            return 0
+        moved = 0
+        while self._request.wait_edge_events(0):
+            for event in self._request.read_edge_events():
+                queue = self.pending.get(int(event.line_offset))
+                if queue is None:
+                    continue
+                # Event timestamps use CLOCK_MONOTONIC, same as time.monotonic().
+                queue.append(
+                    GpioEdge(
+                        line=int(event.line_offset),
+                        value=1 if event.event_type == self._rising else 0,
+                        timestamp=event.timestamp_ns / 1e9,
+                    )
+                )
+                moved += 1
+        return moved
+
+    def close(self) -> None:
+        try:
+            self._watch(())
+            if self._request is not None:
+                self._request.release()
+        finally:
+            self._request = None
+            self._epoll.close()
+
+
+class _ChipRequestV1(_ChipRequest):  # pragma: no cover - legacy libgpiod v1 fallback
+    """libgpiod v1: one request per line, all on one open chip handle."""
+
+    def __init__(self, gpiod: Any, chip: str, consumer: str) -> None:
+        self._gpiod = gpiod
+        self.chip = chip
+        self._consumer = consumer
+        self.specs = {}
+        self.levels = {}
+        self.pending = {}
+        self._chip = gpiod.Chip(chip)
+        self._lines: dict[int, Any] = {}
+        self._epoll = select.epoll()
+        self._watched = set()
+
+    def configure(self, specs: Mapping[int, LineSpec], levels: Mapping[int, bool]) -> None:
+        gpiod = self._gpiod
+        self._watch(self._lines[offset].event_get_fd() for offset in self.pending if offset in specs)
+        for offset in [offset for offset in self._lines if offset not in specs]:
+            self._lines.pop(offset).release()
+            self.pending.pop(offset, None)
+        for offset, spec in specs.items():
+            if offset in self._lines:
+                continue
+            line_obj = self._chip.get_line(offset)
+            try:
+                if spec.output:
+                    line_obj.request(consumer=self._consumer, type=gpiod.LINE_REQ_DIR_OUT, default_vals=[int(levels.get(offset, False))])
+                elif spec.edge != "none":
+                    edge_type = {
+                        "rising": gpiod.LINE_REQ_EV_RISING_EDGE,
+                        "falling": gpiod.LINE_REQ_EV_FALLING_EDGE,
+                        "both": gpiod.LINE_REQ_EV_BOTH_EDGES,
+                    }[spec.edge]
+                    line_obj.request(consumer=self._consumer, type=edge_type)
+                    self.pending[offset] = deque(maxlen=PENDING_EVENTS)
+                else:
+                    line_obj.request(consumer=self._consumer, type=gpiod.LINE_REQ_DIR_IN)
+            except OSError as exc:
+                self._watch(self._lines[offset].event_get_fd() for offset in self.pending if offset in self._lines)
+                raise GpioPoolError(f"Cannot request {self.chip}:{offset}: {exc}") from exc
+            self._lines[offset] = line_obj
+        self.specs = dict(specs)
+        self.levels = {offset: levels[offset] for offset in levels if offset in specs}
+        self._watch(self._lines[offset].event_get_fd() for offset in self.pending)
+
+    def set_values(self, levels: Mapping[int, bool]) -> None:
+        for offset, level in levels.items():
+            self._lines[offset].set_value(1 if level else 0)
+
+    def get_values(self, offsets: list[int]) -> list[int]:
+        return [int(self._lines[offset].get_value()) for offset in offsets]
+
+    def drain(self) -> int:
+        moved = 0
+        for offset, queue in self.pending.items():
+            line_obj = self._lines[offset]
+            while line_obj.event_wait(timedelta(0)):
+                event = line_obj.event_read()
+                queue.append(GpioEdge(offset, 1 if event.type == self._gpiod.LineEvent.RISING_EDGE else 0, time.monotonic()))
+                moved += 1
+        return moved
+
+    def close(self) -> None:
+        try:
+            self._watch(())
+            for line_obj in self._lines.values():
+                line_obj.release()
+        finally:
+            self._lines.clear()
+            self._chip.close()
+            self._epoll.close()
+
+
+class GpioPool:
+    """Keeps GPIO line requests open and groups the lines of each chip.
+
+    ``drive``/``read``/``wait_edges`` take a chip and line offsets; the
+    ``claim_*`` helpers return small handles bound to a set of lines. Each
+    operation's wall time is recorded in :meth:`stats`, edge events also
+    record the delay from the kernel timestamp to delivery.
+
+    Whoever drains a chip's kernel queue may buffer edges meant for another
+    user, so every drain notifies ``wait_edges`` callers through a condition
+    variable and writes to the self-pipe of each input handle whose lines got
+    edges; the handle's :meth:`InputLines.filenos` includes that pipe.
+    """
+
+    def __init__(self, consumer: str = DEFAULT_CONSUMER, gpiod_module: Any = None) -> None:
+        self._gpiod = gpiod_module if gpiod_module is not None else import_gpiod()
+        if self._gpiod is None:
+            raise GpioPoolError(
+                "gpiod module not available; install it or point MODBUS_RS485_GPIO_PYTHONPATH to it"
+            )
+        self._consumer = consumer
+        self._legacy = not hasattr(self._gpiod, "request_lines")
+        self._chips: dict[str, _ChipRequest] = {}
+        self._lock = threading.RLock()
+        self._edges = threading.Condition(self._lock)
+        self._selecting: dict[str, int] = {}
+        self._wakers: dict[int, _EdgeWaker] = {}
+        self._next_waker = 0
+        self._stats = {name: LatencyStats() for name in ("request", "drive", "read", "edge")}
+        self.skipped_drives = 0
+
+    @property
+    def kernel_debounce(self) -> bool:
+        """Whether ``debounce`` is applied by the kernel (libgpiod v2 only)."""
+
+        return not self._legacy
+
+    def _chip(self, chip: str) -> _ChipRequest:
+        request = self._chips.get(chip)
+        if request is None:
+            factory = _ChipRequestV1 if self._legacy else _ChipRequest
+            request = factory(self._gpiod, chip, self._consumer)
+            self._chips[chip] = request
+        return request
+
+    def _held(self, chip: str, offsets: Iterable[int]) -> _ChipRequest:
+        request = self._chips.get(chip)
+        missing = [offset for offset in offsets if request is None or offset not in request.specs]
+        if request is None or missing:
+            raise GpioPoolError(f"Lines {chip}:{','.join(map(str, missing))} are not held by the pool")
+        return request
+
+    def claim(self, chip: str, specs: Mapping[int, LineSpec], initial: Optional[Mapping[int, bool]] = None) -> None:
+        """Add lines to the chip's request; re-claiming a line with the same spec is a no-op."""
+
+        with self._lock:
+            request = self._chip(chip)
+            merged = dict(request.specs)
+            for offset, spec in specs.items():
+                held = merged.get(offset)
+                if held is not None and held != spec:
+                    raise GpioPoolError(f"Line {chip}:{offset} is already held with different settings")
+                merged[offset] = spec
+            if merged == request.specs:
+                return
+            levels = dict(request.levels)
+            for offset, spec in specs.items():
+                if spec.output and offset not in levels:
+                    levels[offset] = bool((initial or {}).get(offset, False))
+            started = time.perf_counter()
+            try:
+                request.configure(merged, levels)
+            finally:
+                # Re-requesting drained the kernel queue into the line buffers.
+                self._announce(chip, request)
+            self._stats["request"].record(time.perf_counter() - started)
+
+    def release(self, chip: str, offsets: Iterable[int], *, waker: Optional[int] = None) -> None:
+        with self._lock:
+            if waker is not None:
+                self._drop_waker(waker)
+            request = self._chips.get(chip)
+            if request is None:
+                return
+            dropped = set(offsets)
+            remaining = {offset: spec for offset, spec in request.specs.items() if offset not in dropped}
+            if remaining == request.specs:
+                return
+            if not remaining:
+                del self._chips[chip]
+                try:
+                    request.close()
+                finally:
+                    self._announce(chip, request)
+                return
+            try:
+                request.configure(remaining, request.levels)
+            finally:
+                self._announce(chip, request)
+
+    def claim_outputs(self, chip: str, initial: Mapping[int, bool], *, active_low: bool = False) -> "OutputLines":
+        self.claim(chip, {offset: LineSpec(output=True, active_low=active_low) for offset in initial}, initial)
+        return OutputLines(self, chip, list(initial))
+
+    def claim_inputs(
+        self,
+        chip: str,
+        offsets: Iterable[int],
+        *,
+        edge: str = "both",
+        debounce: float = 0.0,
+        active_low: bool = False,
+    ) -> "InputLines":
+        if edge not in EDGES:
+            raise ValueError(f"Unsupported edge {edge!r}")
+        lines = list(offsets)
+        self.claim(chip, {offset: LineSpec(edge=edge, debounce=debounce, active_low=active_low) for offset in lines})
+        read_fd, write_fd = os.pipe()
+        for fd in (read_fd, write_fd):
+            os.set_blocking(fd, False)
+        with self._lock:
+            self._next_waker += 1
+            self._wakers[self._next_waker] = _EdgeWaker(chip, frozenset(lines), read_fd, write_fd)
+            return InputLines(self, chip, lines, self._next_waker)
+
+    def drive(self, chip: str, levels: Mapping[int, bool], *, force: bool = False) -> None:
+        """Set output levels in one ioctl; lines already at the level are skipped unless ``force``."""
+
+        with self._lock:
+            request = self._held(chip, levels)
+            if force:
+                changed = {offset: bool(level) for offset, level in levels.items()}
+            else:
+                changed = {offset: bool(level) for offset, level in levels.items() if request.levels.get(offset) is not bool(level)}
+                self.skipped_drives += len(levels) - len(changed)
+            if not changed:
+                return
+            started = time.perf_counter()
+            try:
+                request.set_values(changed)
+            except OSError as exc:
+                raise GpioPoolError(f"Cannot drive {chip}: {exc}") from exc
+            self._stats["drive"].record(time.perf_counter() - started)
+            request.levels.update(changed)
+
+    def read(self, chip: str, offsets: Iterable[int]) -> dict[int, int]:
+        lines = list(offsets)
+        with self._lock:
+            request = self._held(chip, lines)
+            started = time.perf_counter()
+            try:
+                values = request.get_values(lines)
+            except OSError as exc:
+                raise GpioPoolError(f"Cannot read {chip}: {exc}") from exc
+            self._stats["read"].record(time.perf_counter() - started)
+        return dict(zip(lines, values))
+
+    def filenos(self, chip: str, *, waker: Optional[int] = None) -> list[int]:
+        """Descriptors that become readable when edges of ``chip`` are queued.
+
+        The chip's fd stays the same while lines are claimed and released;
+        ``waker`` adds the self-pipe of an input handle.
+        """
+
+        with self._lock:
+            request = self._chips.get(chip)
+            fds = request.filenos() if request is not None else []
+            handle = self._wakers.get(waker) if waker is not None else None
+            if handle is not None:
+                fds.append(handle.read_fd)
+            return fds
+
+    def _drop_waker(self, waker: int) -> None:
+        handle = self._wakers.pop(waker, None)
+        if handle is not None:
+            os.close(handle.read_fd)
+            os.close(handle.write_fd)
+
+    def _announce(self, chip: str, request: _ChipRequest) -> None:
+        """Wake everyone who may now find buffered edges of ``chip``; caller holds the lock."""
+
+        self._edges.notify_all()
+        if chip in self._selecting:
+            _signal(self._selecting[chip])
+        for handle in self._wakers.values():
+            if handle.chip == chip and any(request.pending.get(offset) for offset in handle.offsets):
+                _signal(handle.write_fd)
+
+    def _take(self, chip: str, lines: list[int], waker: Optional[int] = None) -> list[GpioEdge]:
+        """Drain the chip and pop the buffered edges of ``lines``; caller holds the lock."""
+
+        request = self._held(chip, lines)
+        try:
+            moved = request.drain()
+        except OSError as exc:
+            raise GpioPoolError(f"Cannot read edge events on {chip}: {exc}") from exc
+        if moved:
+            self._announce(chip, request)
+        handle = self._wakers.get(waker) if waker is not None else None
+        if handle is not None:
+            _clear(handle.read_fd)
+        events: list[GpioEdge] = []
+        for offset in lines:
+            queue = request.pending.get(offset)
+            if queue:
+                events.extend(queue)
+                queue.clear()
+        return events
+
+    def _delivered(self, events: list[GpioEdge]) -> list[GpioEdge]:
+        events.sort(key=lambda event: event.timestamp)
+        now = time.monotonic()
+        stats = self._stats["edge"]
+        for event in events:
+            stats.record(max(0.0, now - event.timestamp))
+        return events
+
+    def read_edges(self, chip: str, offsets: Iterable[int], *, waker: Optional[int] = None) -> list[GpioEdge]:
+        """Buffered edge events of ``offsets`` in arrival order, without blocking."""
+
+        lines = list(offsets)
+        with self._lock:
+            events = self._take(chip, lines, waker)
+        return self._delivered(events)
+
+    def wait_edges(self, chip: str, offsets: Iterable[int], timeout: Optional[float] = None) -> list[GpioEdge]:
+        """Block until an edge on ``offsets`` arrives (or ``timeout`` passes) and return the edges.
+
+        The buffer check and the wait happen under the pool's condition
+        variable. One caller per chip blocks on the chip's fd and a pipe that
+        is written if someone else drains the chip first; the others wait on
+        the condition, which every drain notifies.
+        """
+
+        lines = list(offsets)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._edges:
+            while True:
+                events = self._take(chip, lines)
+                if events:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return []
+                if chip in self._selecting:
+                    self._edges.wait(remaining)
+                    continue
+                fds = self._chips[chip].filenos()
+                if not fds:
+                    raise GpioPoolError(f"No edge detection requested on {chip}")
+                wake_r, wake_w = os.pipe()
+                os.set_blocking(wake_w, False)
+                self._selecting[chip] = wake_w
+                self._lock.release()
+                try:
+                    select.select([*fds, wake_r], [], [], remaining)
+                except (OSError, ValueError):
+                    pass  # the chip was closed meanwhile; _take reports it
+                finally:
+                    self._lock.acquire()
+                    del self._selecting[chip]
+                    os.close(wake_r)
+                    os.close(wake_w)
+                    self._edges.notify_all()
+        return self._delivered(events)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "chips": {chip: sorted(request.specs) for chip, request in self._chips.items()},
+                "skippedDrives": self.skipped_drives,
+                **{name: stats.as_dict() for name, stats in self._stats.items()},
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            chips, self._chips = self._chips, {}
+            for waker in list(self._wakers):
+                self._drop_waker(waker)
+        for request in chips.values():
+            try:
+                request.close()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+
+
+@dataclass(slots=True)
+class OutputLines:
+    """Output lines of one chip held by a :class:`GpioPool`."""
+
+    pool: GpioPool
+    chip: str
+    offsets: list[int] = field(default_factory=list)
+
+    def drive(self, level: bool | Mapping[int, bool], *, force: bool = False) -> None:
+        levels = level if isinstance(level, Mapping) else {offset: level for offset in self.offsets}
+        self.pool.drive(self.chip, levels, force=force)
+
+    def read(self) -> dict[int, int]:
+        return self.pool.read(self.chip, self.offsets)
+
+    def close(self) -> None:
+        self.pool.release(self.chip, self.offsets)
+
+
+@dataclass(slots=True)
+class InputLines:
+    """Input lines of one chip held by a :class:`GpioPool`.
+
+    :meth:`filenos` stay valid until :meth:`close`, whatever else the pool
+    claims or releases on the chip.
+    """
+
+    pool: GpioPool
+    chip: str
+    offsets: list[int] = field(default_factory=list)
+    waker: Optional[int] = None
+
+    def read(self) -> dict[int, int]:
+        return self.pool.read(self.chip, self.offsets)
+
+    def filenos(self) -> list[int]:
+        return self.pool.filenos(self.chip, waker=self.waker)
+
+    def read_edges(self) -> list[GpioEdge]:
+        return self.pool.read_edges(self.chip, self.offsets, waker=self.waker)
+
+    def wait_edges(self, timeout: Optional[float] = None) -> list[GpioEdge]:
+        return self.pool.wait_edges(self.chip, self.offsets, timeout)
+
+    def close(self) -> None:
+        self.pool.release(self.chip, self.offsets, waker=self.waker)
+
+
+def _signal(fd: int) -> None:
+    try:
+        os.write(fd, b"\0")
+    except BlockingIOError:
+        pass  # already readable
+
+
+def _clear(fd: int) -> None:
+    try:
+        while os.read(fd, 4096):
+            pass
+    except BlockingIOError:
+        pass
+
+
+_shared: Optional[GpioPool] = None
+_shared_lock = threading.Lock()
+
+
+def shared_pool(consumer: str = DEFAULT_CONSUMER) -> GpioPool:
+    """The process-wide pool; created on first use and closed at interpreter exit.
+
+    ``consumer`` only applies to the call that creates the pool.
+    """
+
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = GpioPool(consumer)
+            atexit.register(_shared.close)
+        return _shared
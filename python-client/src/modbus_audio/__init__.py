@@ -1,11 +1,26 @@
 """Public package interface for the Modbus audio helper library."""
 
+from .arbiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_URGENT,
+    BusArbiter,
+    BusArbitrationTimeout,
+)
 from .client import ModbusAudioClient, ModbusAudioError, SerialSettings
+from .transactions import TransactionQueue, TransactionQueueFull
 from . import constants
 
 __all__ = [
+    "BusArbiter",
+    "BusArbitrationTimeout",
+    "PRIORITY_BACKGROUND",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_URGENT",
     "ModbusAudioClient",
     "ModbusAudioError",
     "SerialSettings",
+    "TransactionQueue",
+    "TransactionQueueFull",
     "constants",
 ]
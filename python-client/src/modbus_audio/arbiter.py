@@ -0,0 +1,346 @@
+"""Cross-process arbitration of one serial bus at Modbus transaction granularity.
+
+Every waiter registers a ticket - a named pipe - in a per-port directory.
+Tickets sort by priority class first and arrival time second, so JSVV and
+stream writes overtake queued background polls while equal priorities are
+served FIFO. Only the head ticket takes the ``flock``; on release the holder
+writes one byte into the pipe of the next head, so waiters sleep in
+``select`` instead of retrying on a timer. Tickets of dead processes are
+removed whenever the queue is inspected.
+
+The daemons and the web application run as different users, so the queue
+directory is created sticky and shared (``DIR_MODE``) and the lock file and
+tickets get the matching read/write bits regardless of the umask.
+"""
+
+from __future__ import annotations
+
+import errno
+import fcntl
+import hashlib
+import itertools
+import os
+import select
+import stat
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+PRIORITY_URGENT = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_BACKGROUND = 2
+PRIORITY_NAMES = {
+    PRIORITY_URGENT: "urgent",
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_BACKGROUND: "background",
+}
+
+# Safety net for lost wake-ups (crashed holder, foreign flock user).
+STALE_CHECK_INTERVAL = 0.5
+HEAD_RETRY_INTERVAL = 0.01
+TICKET_SUFFIX = ".fifo"
+# Sticky like /tmp: every user may queue, only the owner removes a live ticket.
+DIR_MODE = 0o1777
+
+
+class BusArbitrationTimeout(TimeoutError):
+    """Raised when the bus could not be obtained within the wait timeout."""
+
+
+@dataclass
+class _WaitStats:
+    transactions: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    timeouts: int = 0
+
+    def as_dict(self) -> dict[str, float | int]:
+        average = self.wait_total / self.transactions if self.transactions else 0.0
+        return {
+            "transactions": self.transactions,
+            "waitAvgMs": round(average * 1000, 2),
+            "waitMaxMs": round(self.wait_max * 1000, 2),
+            "timeouts": self.timeouts,
+        }
+
+
+class _Held:
+    __slots__ = ("depth", "ticket", "reader", "keeper", "handle")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.ticket: Path | None = None
+        self.reader = -1
+        self.keeper = -1
+        self.handle = None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class BusArbiter:
+    """Priority/FIFO lock for one serial port, held per transaction or short batch.
+
+    ``transaction()`` is re-entrant within a thread, so a batch (route write
+    followed by a remote read) can wrap several single-request transactions.
+    """
+
+    _instances: dict[tuple[str, Path], "BusArbiter"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        port: str,
+        *,
+        timeout: float = 5.0,
+        base_dir: Path | None = None,
+        mode: int = DIR_MODE,
+    ) -> None:
+        if not port:
+            raise ValueError("BusArbiter requires a non-empty port identifier.")
+        self.port = port
+        digest = hashlib.sha256(port.encode("utf-8")).hexdigest()[:16]
+        self._dir = Path(base_dir or tempfile.gettempdir()) / f"rozhlas-bus-{digest}"
+        self._lock_path = self._dir / "bus.lock"
+        self._dir_mode = mode
+        self._file_mode = 0o600 | (mode & 0o066)
+        self.timeout = max(0.1, timeout)
+        self._local = threading.local()
+        self._counter = itertools.count()
+        self._stats = {priority: _WaitStats() for priority in PRIORITY_NAMES}
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def for_port(
+        cls,
+        port: str,
+        *,
+        timeout: float = 5.0,
+        base_dir: Path | None = None,
+        mode: int = DIR_MODE,
+    ) -> "BusArbiter":
+        """Return the process-wide arbiter of ``port`` so statistics aggregate."""
+
+        key = (port, Path(base_dir or tempfile.gettempdir()))
+        with cls._instances_lock:
+            arbiter = cls._instances.get(key)
+            if arbiter is None:
+                arbiter = cls(port, timeout=timeout, base_dir=base_dir, mode=mode)
+                cls._instances[key] = arbiter
+            return arbiter
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @contextmanager
+    def transaction(self, priority: int = PRIORITY_INTERACTIVE, timeout: float | None = None) -> Iterator[None]:
+        self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, priority: int = PRIORITY_INTERACTIVE, timeout: float | None = None) -> float:
+        """Block until this thread owns the bus; returns the time spent waiting."""
+
+        held = self._held()
+        if held.depth:
+            held.depth += 1
+            return 0.0
+
+        priority = min(max(int(priority), 0), 9)
+        started = time.monotonic()
+        deadline = started + (self.timeout if timeout is None else max(0.0, timeout))
+
+        self._prepare_dir()
+        name = f"{priority}-{time.time_ns():020d}-{os.getpid()}-{next(self._counter):06d}{TICKET_SUFFIX}"
+        ticket = self._dir / name
+        os.mkfifo(ticket, self._file_mode)
+        reader = keeper = -1
+        try:
+            os.chmod(ticket, self._file_mode)
+            reader = os.open(ticket, os.O_RDONLY | os.O_NONBLOCK)
+            # Our own writer end keeps the pipe from reporting EOF once a notifier closes it.
+            keeper = os.open(ticket, os.O_WRONLY | os.O_NONBLOCK)
+            handle = self._open_lock()
+        except BaseException:
+            self._discard_ticket(ticket, reader, keeper)
+            raise
+
+        try:
+            while True:
+                head = self._head()
+                is_head = head == name
+                if is_head:
+                    try:
+                        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BusArbitrationTimeout(
+                        f"Port '{self.port}' busy for {time.monotonic() - started:.2f} s "
+                        f"({PRIORITY_NAMES.get(priority, priority)} priority)."
+                    )
+                interval = HEAD_RETRY_INTERVAL if is_head else STALE_CHECK_INTERVAL
+                readable, _, _ = select.select([reader], [], [], min(remaining, interval))
+                if readable:
+                    try:
+                        os.read(reader, 64)
+                    except BlockingIOError:
+                        pass
+        except BaseException as exc:
+            handle.close()
+            self._discard_ticket(ticket, reader, keeper)
+            if isinstance(exc, BusArbitrationTimeout):
+                with self._stats_lock:
+                    self._stats.setdefault(priority, _WaitStats()).timeouts += 1
+            self._notify_head()
+            raise
+
+        waited = time.monotonic() - started
+        with self._stats_lock:
+            stats = self._stats.setdefault(priority, _WaitStats())
+            stats.transactions += 1
+            stats.wait_total += waited
+            stats.wait_max = max(stats.wait_max, waited)
+
+        held.depth = 1
+        held.ticket = ticket
+        held.reader = reader
+        held.keeper = keeper
+        held.handle = handle
+        return waited
+
+    def release(self) -> None:
+        held = self._held()
+        if held.depth == 0:
+            return
+        held.depth -= 1
+        if held.depth:
+            return
+        handle, held.handle = held.handle, None
+        try:
+            if handle is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+                handle.close()
+        finally:
+            if held.ticket is not None:
+                self._discard_ticket(held.ticket, held.reader, held.keeper)
+            held.ticket = None
+            held.reader = held.keeper = -1
+            self._notify_head()
+
+    def owned(self) -> bool:
+        return self._held().depth > 0
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        with self._stats_lock:
+            return {
+                PRIORITY_NAMES.get(priority, str(priority)): stats.as_dict()
+                for priority, stats in sorted(self._stats.items())
+                if stats.transactions or stats.timeouts
+            }
+
+    def queue_depth(self) -> int:
+        return len(self._tickets())
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _prepare_dir(self) -> None:
+        """Create the queue directory shared by all users; fix its mode if we own it."""
+
+        try:
+            self._dir.mkdir(self._dir_mode & 0o777, parents=True)
+        except FileExistsError:
+            pass
+        info = os.stat(self._dir)
+        if info.st_uid == os.geteuid() and stat.S_IMODE(info.st_mode) != self._dir_mode:
+            os.chmod(self._dir, self._dir_mode)
+
+    def _open_lock(self) -> BinaryIO:
+        # flock needs no write access, so a lock file created by another user still works.
+        fd = os.open(self._lock_path, os.O_RDONLY | os.O_CREAT | os.O_CLOEXEC, self._file_mode)
+        try:
+            info = os.fstat(fd)
+            if info.st_uid == os.geteuid() and stat.S_IMODE(info.st_mode) != self._file_mode:
+                os.fchmod(fd, self._file_mode)
+        except BaseException:
+            os.close(fd)
+            raise
+        return os.fdopen(fd, "rb")
+
+    def _held(self) -> _Held:
+        held = getattr(self._local, "held", None)
+        if held is None:
+            held = _Held()
+            self._local.held = held
+        return held
+
+    def _tickets(self) -> list[str]:
+        try:
+            names = sorted(name for name in os.listdir(self._dir) if name.endswith(TICKET_SUFFIX))
+        except FileNotFoundError:
+            return []
+        alive: list[str] = []
+        for name in names:
+            try:
+                pid = int(name.split("-")[2])
+            except (IndexError, ValueError):
+                pid = -1
+            if pid > 0 and not _pid_alive(pid):
+                try:
+                    (self._dir / name).unlink()
+                except (FileNotFoundError, PermissionError):
+                    pass  # another user's ticket in the sticky directory; skipping it is enough
+                continue
+            alive.append(name)
+        return alive
+
+    def _head(self) -> str | None:
+        tickets = self._tickets()
+        return tickets[0] if tickets else None
+
+    def _notify_head(self) -> None:
+        head = self._head()
+        if head is None:
+            return
+        try:
+            fd = os.open(self._dir / head, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as exc:
+            # Gone, no reader, or a ticket of another user we may not write: it polls on its own.
+            if exc.errno not in (errno.ENXIO, errno.ENOENT, errno.EACCES, errno.EPERM):
+                raise
+            return
+        try:
+            os.write(fd, b"\0")
+        except BlockingIOError:
+            pass
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _discard_ticket(ticket: Path, reader: int, keeper: int) -> None:
+        try:
+            ticket.unlink()
+        except FileNotFoundError:
+            pass
+        for fd in (reader, keeper):
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
@@ -8,15 +8,20 @@ code can run on macOS or Linux (including Raspberry Pi).
 from __future__ import annotations
 
 import inspect
-import os
 import subprocess
 import sys
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, Mapping, MutableMapping
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, MutableMapping
 
 from . import constants
+from .arbiter import PRIORITY_INTERACTIVE, PRIORITY_URGENT, BusArbiter, BusArbitrationTimeout
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .transactions import TransactionQueue
 
 try:  # pragma: no cover - depends on installed pymodbus variant
     from pymodbus.client import ModbusSerialClient as _SerialClient
@@ -63,7 +68,14 @@ class ModbusAudioClient:
 
         return cls(SerialSettings(), unit_id=constants.DEFAULT_UNIT_ID)
 
-    def __init__(self, settings: SerialSettings, unit_id: int = 55) -> None:
+    def __init__(
+        self,
+        settings: SerialSettings,
+        unit_id: int = 55,
+        *,
+        priority: int = PRIORITY_INTERACTIVE,
+        arbiter: BusArbiter | None = None,
+    ) -> None:
         if _SerialClient is None:
             raise ModbusAudioError(
                 "pymodbus is not available. Install it with 'pip install pymodbus[serial]'."
@@ -75,6 +87,11 @@ class ModbusAudioClient:
         self._client = _SerialClient(**serial_kwargs)
         self._connected = False
         self._rs485_controller: _RS485Controller | None = None
+        self.priority = priority
+        if arbiter is None and constants.BUS_ARBITRATION and settings.port:
+            arbiter = BusArbiter.for_port(settings.port, timeout=constants.BUS_WAIT_TIMEOUT, mode=constants.BUS_DIR_MODE)
+        self._arbiter = arbiter
+        self._io_queue: TransactionQueue | None = None
 
     # ---------------------------------------------------------------------
     # Context manager helpers
@@ -102,6 +119,7 @@ class ModbusAudioClient:
             self._setup_rs485_direction_control()
 
     def close(self) -> None:
+        self.stop_io_thread()
         if self._connected:
             self._client.close()
             self._connected = False
@@ -109,6 +127,93 @@ class ModbusAudioClient:
             self._rs485_controller.close()
             self._rs485_controller = None
 
+    @contextmanager
+    def transaction(self, priority: int | None = None) -> Iterator[None]:
+        """Own the bus for a batch of dependent requests (e.g. route write + remote read).
+
+        Every single request is already arbitrated on its own; nesting is free.
+        In thread-safe mode only the I/O thread owns the bus, so other threads
+        get a no-op here and should use :meth:`submit` for atomic batches.
+        """
+
+        if self._arbiter is None or self._foreign_thread():
+            yield
+            return
+        try:
+            self._arbiter.acquire(self.priority if priority is None else priority)
+        except BusArbitrationTimeout as exc:
+            raise ModbusAudioError(str(exc)) from exc
+        except OSError as exc:
+            raise ModbusAudioError(f"Bus arbitration for {self.settings.port} failed: {exc}") from exc
+        try:
+            yield
+        finally:
+            try:
+                self._arbiter.release()
+            except OSError as exc:
+                raise ModbusAudioError(f"Bus arbitration for {self.settings.port} failed: {exc}") from exc
+
+    # ------------------------------------------------------------------
+    # Thread-safe mode
+    # ------------------------------------------------------------------
+    def start_io_thread(self, *, limit: int = 64, merge_reads: bool = True) -> None:
+        """Serve all requests from one I/O thread so several threads can share this client.
+
+        Once started, the blocking helpers called from other threads submit to
+        the :class:`~modbus_audio.transactions.TransactionQueue` and wait for
+        the result; ``submit_*`` return futures instead.
+        """
+
+        from .transactions import TransactionQueue
+
+        if self._io_queue is None:
+            self._io_queue = TransactionQueue(self, limit=limit, merge_reads=merge_reads)
+            self._io_queue.start()
+
+    def stop_io_thread(self, timeout: float = 5.0) -> None:
+        queue, self._io_queue = self._io_queue, None
+        if queue is not None:
+            queue.stop(timeout)
+
+    def submit_read(
+        self,
+        address: int,
+        quantity: int,
+        unit: int | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> Future:
+        return self._require_queue().submit_read(address, quantity, unit=unit, priority=priority)
+
+    def submit_write(
+        self,
+        address: int,
+        values: Iterable[int],
+        unit: int | None = None,
+        priority: int = PRIORITY_URGENT,
+    ) -> Future:
+        return self._require_queue().submit_write(address, values, unit=unit, priority=priority)
+
+    def submit(self, fn: Callable[["ModbusAudioClient"], Any], priority: int = PRIORITY_INTERACTIVE) -> Future:
+        """Run a batch ``fn(client)`` atomically on the I/O thread."""
+
+        return self._require_queue().submit_call(fn, priority=priority)
+
+    def io_stats(self) -> dict[str, Any] | None:
+        return self._io_queue.stats() if self._io_queue is not None else None
+
+    def _require_queue(self) -> "TransactionQueue":
+        if self._io_queue is None:
+            raise ModbusAudioError("Thread-safe mode is not active; call start_io_thread() first")
+        return self._io_queue
+
+    def _foreign_thread(self) -> bool:
+        return self._io_queue is not None and not self._io_queue.on_io_thread()
+
+    def bus_stats(self) -> dict[str, dict[str, float | int]] | None:
+        """Wait-time statistics of the bus arbiter in this process, per priority class."""
+
+        return self._arbiter.stats() if self._arbiter is not None else None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -179,18 +284,26 @@ class ModbusAudioClient:
         """
 
         addr_list = list(hop_addresses)
-        if configure_route and addr_list:
-            self.configure_route(addr_list)
-
         if zones is None:
             zone_values = list(constants.DEFAULT_DESTINATION_ZONES)
         else:
             zone_values = list(zones)
 
-        # Always push the provided zone set so empty selections clear previous
-        # configuration instead of reusing stale registers.
-        self.set_destination_zones(zone_values)
-        self._write_tx_control(2)
+        if self._foreign_thread():
+            self.submit(
+                lambda client: client.start_stream(addr_list, zone_values, configure_route=configure_route),
+                self.priority,
+            ).result()
+            return
+
+        with self.transaction():
+            if configure_route and addr_list:
+                self.configure_route(addr_list)
+
+            # Always push the provided zone set so empty selections clear previous
+            # configuration instead of reusing stale registers.
+            self.set_destination_zones(zone_values)
+            self._write_tx_control(2)
 
     def stop_stream(self) -> None:
         """Stop audio streaming by writing ``1`` into TxControl (0x4035)."""
@@ -211,6 +324,9 @@ class ModbusAudioClient:
     def write_register(self, address: int, value: int, unit: int | None = None) -> None:
         """Write a single holding register."""
 
+        if self._foreign_thread():
+            self.submit_write(address, (value,), unit=unit, priority=self.priority).result()
+            return
         try:
             response = self._call_with_unit(
                 self._client.write_register,
@@ -230,6 +346,9 @@ class ModbusAudioClient:
         """Write consecutive holding registers."""
 
         value_list = list(values)
+        if self._foreign_thread():
+            self.submit_write(address, value_list, unit=unit, priority=self.priority).result()
+            return
         try:
             response = self._call_with_unit(
                 self._client.write_registers,
@@ -257,8 +376,12 @@ class ModbusAudioClient:
             )
 
         padded = addr_list + [0] * (constants.MAX_ADDR_ENTRIES - len(addr_list))
-        self.write_register(constants.NUM_ADDR_RAM, len(addr_list))
-        self.write_registers(constants.ADDR_RAM_BASE, padded[: constants.MAX_ADDR_ENTRIES])
+        if self._foreign_thread():
+            self.submit(lambda client: client.configure_route(addr_list), self.priority).result()
+            return
+        with self.transaction():
+            self.write_register(constants.NUM_ADDR_RAM, len(addr_list))
+            self.write_registers(constants.ADDR_RAM_BASE, padded[: constants.MAX_ADDR_ENTRIES])
 
     def set_destination_zones(self, zones: Iterable[int]) -> None:
         """Configure the destination zone registers (0x4030..0x4034)."""
@@ -275,10 +398,16 @@ class ModbusAudioClient:
     def start_audio_stream(self, hop_addresses: Iterable[int], zones: Iterable[int] | None = None) -> None:
         """Send the sequence of writes needed to start broadcasting audio."""
 
-        self.configure_route(hop_addresses)
-        if zones is not None:
-            self.set_destination_zones(zones)
-        self._write_tx_control(2)
+        if self._foreign_thread():
+            hops = list(hop_addresses)
+            zone_list = list(zones) if zones is not None else None
+            self.submit(lambda client: client.start_audio_stream(hops, zone_list), self.priority).result()
+            return
+        with self.transaction():
+            self.configure_route(hop_addresses)
+            if zones is not None:
+                self.set_destination_zones(zones)
+            self._write_tx_control(2)
 
     def stop_audio_stream(self) -> None:
         """Stop the audio stream by clearing ``TxControl`` (0x4035)."""
@@ -302,11 +431,15 @@ class ModbusAudioClient:
         if nest_address not in route_list:
             route_list.append(nest_address)
 
-        if route_list:
-            self.configure_route(route_list)
+        if self._foreign_thread():
+            return self.submit(lambda client: client.read_nest_status(nest_address, route=route_list), self.priority).result()
+
+        with self.transaction():
+            if route_list:
+                self.configure_route(route_list)
 
-        status_value = self.read_register(constants.STATUS_REGISTER)
-        error_value = self.read_register(constants.ERROR_REGISTER)
+            status_value = self.read_register(constants.STATUS_REGISTER)
+            error_value = self.read_register(constants.ERROR_REGISTER)
 
         return {
             'status': status_value,
@@ -343,6 +476,8 @@ class ModbusAudioClient:
     # Internal helpers
     # ------------------------------------------------------------------
     def _read_registers(self, address: int, quantity: int, unit: int | None = None) -> list[int]:
+        if self._foreign_thread():
+            return self.submit_read(address, quantity, unit=unit, priority=self.priority).result()
         try:
             response = self._call_with_unit(
                 self._client.read_holding_registers,
@@ -438,7 +573,8 @@ class ModbusAudioClient:
             kwargs["unit"] = target_unit
         elif "slave" in signature.parameters:
             kwargs["slave"] = target_unit
-        return method(**kwargs)
+        with self.transaction():
+            return method(**kwargs)
 
 
     def _setup_rs485_driver(self) -> bool:
@@ -544,38 +680,15 @@ class ModbusAudioClient:
         return None
 
 
-def _import_gpiod():
-    """Import gpiod, optionally extending sys.path with local site-packages."""
+def _shared_gpio_pool(consumer: str):
+    """Process-wide GPIO pool from ``src/gpio_pool.py`` (next to this package)."""
 
-    try:
-        import gpiod  # type: ignore[import]
-    except ModuleNotFoundError:
-        search_paths: list[str] = []
-        extra_paths = os.environ.get("MODBUS_RS485_GPIO_PYTHONPATH", "")
-        if extra_paths:
-            search_paths.extend(part for part in extra_paths.split(":") if part)
-
-        project_root = Path(__file__).resolve().parents[2]
-        venv_dir = project_root / ".venv"
-        if venv_dir.exists():
-            for pattern in ("lib/python*/site-packages", "lib64/python*/site-packages"):
-                for candidate in venv_dir.glob(pattern):
-                    search_paths.append(str(candidate))
-
-        appended = False
-        for path_str in search_paths:
-            if not path_str:
-                continue
-            candidate = Path(path_str)
-            if not candidate.exists():
-                continue
-            if path_str not in sys.path:
-                sys.path.insert(0, path_str)
-            appended = True
-        if not appended:
-            raise
-        import gpiod  # type: ignore[import]  # noqa: F401
-    return gpiod  # type: ignore[name-defined]
+    src_dir = str(Path(__file__).resolve().parents[1])
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+    import gpio_pool  # type: ignore[import]
+
+    return gpio_pool.shared_pool(consumer)
 
 
 class _BaseLineDriver:
@@ -592,76 +705,27 @@ class _BaseLineDriver:
 
 
 class _GPIOLineHandle(_BaseLineDriver):
-    """Wrap a GPIO line so we can drive and read it consistently across libgpiod versions."""
+    """GPIO output line held open in the shared GPIO pool for the life of the process."""
 
     def __init__(self, *, chip: str, line_offset: int, consumer: str, initial_level: bool) -> None:
-        gpiod = _import_gpiod()
-
         self.chip_name = chip
         self.line_offset = line_offset
-        self._state: bool | None = None
         self._released = False
-        self._set_raw: Callable[[bool], None]
-        self._get_raw: Callable[[], bool]
-        self._release: Callable[[], None]
-
-        if hasattr(gpiod, "request_lines"):
-            from gpiod import line as line_mod  # type: ignore[import]
-
-            config = {
-                line_offset: gpiod.LineSettings(
-                    direction=line_mod.Direction.OUTPUT,
-                    output_value=line_mod.Value.ACTIVE if initial_level else line_mod.Value.INACTIVE,
-                )
-            }
-            request = gpiod.request_lines(chip, consumer=consumer, config=config)
-
-            def set_raw(level: bool) -> None:
-                request.set_value(line_offset, line_mod.Value.ACTIVE if level else line_mod.Value.INACTIVE)
-
-            def get_raw() -> bool:
-                return request.get_value(line_offset) == line_mod.Value.ACTIVE
-
-            self._set_raw = set_raw
-            self._get_raw = get_raw
-            self._release = request.release
-        else:  # pragma: no cover - legacy libgpiod v1 fallback
-            chip_obj = gpiod.Chip(chip)
-            line_obj = chip_obj.get_line(line_offset)
-            line_obj.request(consumer=consumer, type=gpiod.LINE_REQ_DIR_OUT)
-
-            def set_raw(level: bool) -> None:
-                line_obj.set_value(1 if level else 0)
-
-            def get_raw() -> bool:
-                return bool(line_obj.get_value())
-
-            def release() -> None:
-                try:
-                    line_obj.release()
-                finally:
-                    chip_obj.close()
-
-            self._set_raw = set_raw
-            self._get_raw = get_raw
-            self._release = release
-
+        self._lines = _shared_gpio_pool(consumer).claim_outputs(chip, {line_offset: initial_level})
         self.drive(initial_level, force=True)
 
     def drive(self, level: bool, *, force: bool = False) -> None:
-        if not force and self._state is level:
-            return
-        self._set_raw(level)
-        self._state = level
+        # The pool skips the ioctl when the line already has this level.
+        self._lines.drive(level, force=force)
 
     def read(self) -> int:
-        return int(self._get_raw())
+        return self._lines.read()[self.line_offset]
 
     def close(self) -> None:
         if self._released:
             return
         try:
-            self._release()
+            self._lines.close()
         finally:
             self._released = True
 
@@ -748,10 +812,8 @@ class _RS485Controller:
                     consumer=consumer,
                     initial_level=self._rx_level,
                 )
-            except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
-                raise ModbusAudioError(
-                    "gpiod is not installed; install it in the active interpreter or adjust MODBUS_RS485_GPIO_PYTHONPATH"
-                ) from exc
+            except RuntimeError as exc:  # pragma: no cover - gpiod missing or line busy
+                raise ModbusAudioError(f"RS485 GPIO line unavailable: {exc}") from exc
             self._log_debug(
                 "Configured GPIO line",
                 chip=chip,
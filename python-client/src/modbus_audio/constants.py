@@ -120,6 +120,16 @@ RS485_PINCTRL_BINARY = os.environ.get("MODBUS_RS485_PINCTRL_BINARY", RS485_PINCT
 RS485_PINCTRL_PIN = _env_int("MODBUS_RS485_PINCTRL_PIN", RS485_PINCTRL_PIN)
 RS485_PINCTRL_TIMEOUT = _env_float("MODBUS_RS485_PINCTRL_TIMEOUT", RS485_PINCTRL_TIMEOUT)
 
+# Cross-process bus arbitration per Modbus transaction (see ``arbiter.py``).
+BUS_ARBITRATION = True
+BUS_WAIT_TIMEOUT = 5.0
+# Queue directory mode; 0o1770 restricts the queue to a group shared by the daemons and the web user.
+BUS_DIR_MODE = 0o1777
+
+BUS_ARBITRATION = _env_bool("MODBUS_BUS_ARBITRATION", BUS_ARBITRATION)
+BUS_WAIT_TIMEOUT = _env_float("MODBUS_BUS_WAIT_TIMEOUT", BUS_WAIT_TIMEOUT)
+BUS_DIR_MODE = _env_int("MODBUS_BUS_DIR_MODE", BUS_DIR_MODE)
+
 
 @dataclass(frozen=True)
 class RegisterBlock:
@@ -0,0 +1,239 @@
+"""Prioritised transaction queue that lets several threads share one client.
+
+One I/O thread owns the pymodbus connection and serves submitted
+transactions in priority order (control writes, then user reads, then
+background polls), FIFO within a class. Pending reads of the same unit whose
+register ranges touch or overlap are merged into a single FC03 request and
+the result is sliced back to every submitter. The number of pending
+transactions is bounded: background submissions are rejected when the queue
+is full, everything else waits for room.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from .arbiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, PRIORITY_NAMES, PRIORITY_URGENT
+from .client import ModbusAudioError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import ModbusAudioClient
+
+# FC03 can return at most 125 registers per request.
+MAX_READ_REGISTERS = 125
+
+
+class TransactionQueueFull(ModbusAudioError):
+    """Raised when a background transaction is submitted to a full queue."""
+
+
+@dataclass(eq=False)
+class _Job:
+    priority: int
+    order: int
+    kind: str
+    future: Future
+    enqueued: float
+    unit: int | None = None
+    address: int = 0
+    quantity: int = 0
+    values: list[int] = field(default_factory=list)
+    fn: Callable[["ModbusAudioClient"], Any] | None = None
+
+    @property
+    def end(self) -> int:
+        return self.address + self.quantity
+
+
+class TransactionQueue:
+    """Serve transactions for ``client`` from a single I/O thread."""
+
+    def __init__(self, client: "ModbusAudioClient", *, limit: int = 64, merge_reads: bool = True) -> None:
+        self._client = client
+        self._limit = max(1, limit)
+        self._merge_reads = merge_reads
+        self._pending: list[_Job] = []
+        self._cond = threading.Condition()
+        self._order = itertools.count()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+        self._stats: dict[str, Any] = {
+            "reads": 0,
+            "mergedReads": 0,
+            "writes": 0,
+            "calls": 0,
+            "rejected": 0,
+            "maxDepth": 0,
+            "waitMaxMs": {name: 0.0 for name in PRIORITY_NAMES.values()},
+        }
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="modbus-io", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if threading.current_thread() is not thread:
+            thread.join(timeout)
+        self._thread = None
+        with self._cond:
+            abandoned, self._pending = self._pending, []
+        for job in abandoned:
+            if not job.future.done():
+                job.future.set_exception(ModbusAudioError("Modbus transaction queue stopped"))
+
+    def on_io_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+    def submit_read(
+        self,
+        address: int,
+        quantity: int,
+        unit: int | None = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> Future:
+        if quantity <= 0:
+            raise ValueError("Quantity must be greater than zero.")
+        return self._submit(_Job(priority, 0, "read", Future(), 0.0, unit=unit, address=address, quantity=quantity))
+
+    def submit_write(
+        self,
+        address: int,
+        values: Iterable[int],
+        unit: int | None = None,
+        priority: int = PRIORITY_URGENT,
+    ) -> Future:
+        return self._submit(_Job(priority, 0, "write", Future(), 0.0, unit=unit, address=address, values=list(values)))
+
+    def submit_call(
+        self,
+        fn: Callable[["ModbusAudioClient"], Any],
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> Future:
+        """Run ``fn(client)`` on the I/O thread, e.g. a route write followed by a remote read."""
+
+        return self._submit(_Job(priority, 0, "call", Future(), 0.0, fn=fn))
+
+    def _submit(self, job: _Job) -> Future:
+        with self._cond:
+            if self._thread is None or self._stopping:
+                raise ModbusAudioError("Modbus transaction queue is not running")
+            while len(self._pending) >= self._limit:
+                if job.priority >= PRIORITY_BACKGROUND:
+                    self._stats["rejected"] += 1
+                    raise TransactionQueueFull(f"Modbus transaction queue full ({self._limit} pending)")
+                self._cond.wait()
+                if self._stopping:
+                    raise ModbusAudioError("Modbus transaction queue stopped")
+            job.order = next(self._order)
+            job.enqueued = time.monotonic()
+            self._pending.append(job)
+            self._stats["maxDepth"] = max(self._stats["maxDepth"], len(self._pending))
+            self._cond.notify_all()
+        return job.future
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            snapshot = dict(self._stats)
+            snapshot["waitMaxMs"] = dict(self._stats["waitMaxMs"])
+            snapshot["pending"] = len(self._pending)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # I/O thread
+    # ------------------------------------------------------------------
+    def _take(self) -> list[_Job] | None:
+        """Pop the most urgent job plus every pending read it can be merged with."""
+
+        with self._cond:
+            while not self._pending and not self._stopping:
+                self._cond.wait()
+            if self._stopping:
+                return None
+            head = min(self._pending, key=lambda job: (job.priority, job.order))
+            self._pending.remove(head)
+            batch = [head]
+            if head.kind == "read" and self._merge_reads:
+                # Never pull a read ahead of a write or batch submitted before it.
+                barrier = min((job.order for job in self._pending if job.kind != "read"), default=None)
+                start, end = head.address, head.end
+                merged = True
+                while merged:
+                    merged = False
+                    for job in list(self._pending):
+                        if job.kind != "read" or job.unit != head.unit:
+                            continue
+                        if barrier is not None and job.order > barrier:
+                            continue
+                        if job.address > end or job.end < start:
+                            continue
+                        new_start, new_end = min(start, job.address), max(end, job.end)
+                        if new_end - new_start > MAX_READ_REGISTERS:
+                            continue
+                        start, end = new_start, new_end
+                        self._pending.remove(job)
+                        batch.append(job)
+                        merged = True
+            self._cond.notify_all()
+            now = time.monotonic()
+            for job in batch:
+                name = PRIORITY_NAMES.get(job.priority, str(job.priority))
+                waited = (now - job.enqueued) * 1000
+                self._stats["waitMaxMs"][name] = round(max(self._stats["waitMaxMs"].get(name, 0.0), waited), 2)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+            if batch is None:
+                return
+            head = batch[0]
+            try:
+                if head.kind == "read":
+                    self._execute_reads(batch)
+                elif head.kind == "write":
+                    with self._client.transaction(head.priority):
+                        self._client.write_registers(head.address, head.values, unit=head.unit)
+                    self._stats["writes"] += 1
+                    head.future.set_result(None)
+                else:
+                    assert head.fn is not None
+                    with self._client.transaction(head.priority):
+                        result = head.fn(self._client)
+                    self._stats["calls"] += 1
+                    head.future.set_result(result)
+            except BaseException as exc:  # noqa: BLE001 - delivered to the submitter
+                for job in batch:
+                    if not job.future.done():
+                        job.future.set_exception(exc)
+
+    def _execute_reads(self, batch: list[_Job]) -> None:
+        start = min(job.address for job in batch)
+        end = max(job.end for job in batch)
+        priority = min(job.priority for job in batch)
+        with self._client.transaction(priority):
+            values = self._client.read_registers(start, end - start, unit=batch[0].unit)
+        self._stats["reads"] += 1
+        self._stats["mergedReads"] += len(batch) - 1
+        for job in batch:
+            offset = job.address - start
+            job.future.set_result(values[offset : offset + job.quantity])
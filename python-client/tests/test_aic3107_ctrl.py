@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class FakeMessage(list):
+    def __init__(self, kind: str, addr: int, data: list[int]) -> None:
+        super().__init__(data)
+        self.kind = kind
+        self.addr = addr
+
+
+class FakeSMBus:
+    """Codec register file behind ``i2c_rdwr`` with auto-increment writes and reads."""
+
+    def __init__(self, bus: int = 1) -> None:
+        self.registers: dict[int, int] = {0x3E: 0x05, 0x3F: 0x06}
+        self.transfers: list[list[FakeMessage]] = []
+        self.fail = False
+        self._pointer = 0
+
+    def i2c_rdwr(self, *messages: FakeMessage) -> None:
+        if self.fail:
+            raise OSError(121, 'Remote I/O error')
+        self.transfers.append(list(messages))
+        for message in messages:
+            if message.kind == 'w':
+                self._pointer = message[0]
+                for offset, value in enumerate(message[1:]):
+                    self.registers[self._pointer + offset] = value
+            else:
+                message[:] = [self.registers.get(self._pointer + offset, 0) for offset in range(len(message))]
+
+    def close(self) -> None:
+        pass
+
+
+smbus2 = types.ModuleType('smbus2')
+smbus2.SMBus = FakeSMBus  # type: ignore[attr-defined]
+smbus2.i2c_msg = types.SimpleNamespace(  # type: ignore[attr-defined]
+    write=lambda addr, data: FakeMessage('w', addr, list(data)),
+    read=lambda addr, count: FakeMessage('r', addr, [0] * count),
+)
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'aic3107_ctrl.py'
+spec = importlib.util.spec_from_file_location('aic3107_ctrl', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+aic = importlib.util.module_from_spec(spec)
+sys.modules['aic3107_ctrl'] = aic
+with mock.patch.dict(sys.modules, {'smbus2': smbus2}):
+    spec.loader.exec_module(aic)  # type: ignore[attr-defined]
+
+
+class BurstPlanTest(unittest.TestCase):
+    def test_unchanged_registers_are_dropped_and_short_gaps_bridged(self) -> None:
+        shadow = {0x3D: 0x10, 0x3E: 0x05, 0x3F: 0x06, 0x40: 0x10, 0x6C: 0x11}
+        bursts = aic.plan_bursts({0x3D: 0x20, 0x40: 0x20, 0x6C: 0x11}, shadow)  # type: ignore[attr-defined]
+        self.assertEqual(bursts, [(0x3D, [0x20, 0x05, 0x06, 0x20])])
+
+    def test_unknown_or_long_gaps_split_bursts(self) -> None:
+        bursts = aic.plan_bursts({0x3D: 1, 0x40: 1}, {})  # type: ignore[attr-defined]
+        self.assertEqual(bursts, [(0x3D, [1]), (0x40, [1])])
+        bursts = aic.plan_bursts({0x3D: 1, 0x6C: 1}, {r: 0 for r in range(0x3D, 0x6D)})  # type: ignore[attr-defined]
+        self.assertEqual(bursts, [(0x3D, [1]), (0x6C, [1])])
+
+
+class VolumeRampTest(unittest.TestCase):
+    def test_ramp_is_even_and_ends_on_target(self) -> None:
+        ramp = aic.volume_ramp(100, 0, 0.02, min_interval=0.002)  # type: ignore[attr-defined]
+        self.assertEqual(len(ramp), 10)
+        self.assertEqual(ramp[-1], (0.02, 0))
+        self.assertEqual([value for _offset, value in ramp[:3]], [90, 80, 70])
+
+    def test_degenerate_ramps(self) -> None:
+        self.assertEqual(aic.volume_ramp(5, 5, 1.0), [])  # type: ignore[attr-defined]
+        self.assertEqual(aic.volume_ramp(5, 9, 0.0), [(0.0, 9)])  # type: ignore[attr-defined]
+        self.assertEqual([value for _offset, value in aic.volume_ramp(0, 3, 1.0)], [1, 2, 3])  # type: ignore[attr-defined]
+
+
+class AIC3107Test(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bus = FakeSMBus()
+        self.codec = aic.AIC3107(self.bus)  # type: ignore[attr-defined]
+        self.codec._transfer_retries = 1
+        self.addCleanup(self.codec.close)
+
+    def test_shadow_skips_rewrites_and_tracks_the_chip(self) -> None:
+        transactions = self.codec.transactions
+        self.codec.set_input('line1')
+        self.codec.mute(False)
+        self.assertEqual(self.codec.transactions, transactions)
+        self.codec.set_volume(20)
+        self.assertEqual(self.codec.transactions, transactions + 1)
+        # Left and right route registers go out as one burst bridged by the shadowed 0x3E/0x3F.
+        self.assertEqual(list(self.bus.transfers[-1][-1]), [0x3D, 0x99, 0x05, 0x06, 0x99])
+        self.assertEqual(self.codec.read_registers(0x3D, 4), [0x99, 0x05, 0x06, 0x99])
+
+    def test_fade_failure_is_raised_and_does_not_block_later_calls(self) -> None:
+        self.bus.fail = True
+        outcome: list[object] = []
+
+        def _fade() -> None:
+            for percent in (10, 90):
+                try:
+                    self.codec.set_volume(percent, fade=0.02)
+                except aic.AICError as exc:  # type: ignore[attr-defined]
+                    outcome.append(exc)
+
+        thread = threading.Thread(target=_fade)
+        thread.start()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(outcome), 2)
+
+        self.bus.fail = False
+        self.codec.set_volume(90, fade=0.01)
+        self.assertEqual(self.bus.registers[0x3D], 0x80 | 114)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'alsa_aic3107_ctrl.py'
+spec = importlib.util.spec_from_file_location('alsa_aic3107_ctrl', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+ctrl = importlib.util.module_from_spec(spec)
+sys.modules['alsa_aic3107_ctrl'] = ctrl
+spec.loader.exec_module(ctrl)  # type: ignore[attr-defined]
+
+SCONTROLS = '\n'.join(
+    f"Simple mixer control '{name}',0"
+    for name in ('HP', 'Left Line1L Mux', 'Right Line1R Mux', 'Left PGA Mixer Line1L', 'Right PGA Mixer Line1R')
+)
+
+
+class ControlMapCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        proc = self.root / 'asound'
+        (proc / 'card2' / 'pcm0p').mkdir(parents=True)
+        (proc / 'cards').write_text(
+            ' 0 [vc4hdmi        ]: vc4-hdmi - vc4-hdmi\n'
+            '                      vc4-hdmi\n'
+            ' 2 [soundcard      ]: simple-card - soundcard\n'
+            '                      soundcard\n'
+        )
+        self.calls: list[list[str]] = []
+        test = self
+
+        class FakeCard(ctrl.AlsaCard):  # type: ignore[name-defined, misc]
+            PROC_ROOT = str(proc)
+
+            def _run(self, args: list[str]) -> str:
+                test.calls.append(args)
+                return SCONTROLS if args == ['scontrols'] else ''
+
+        self.card_class = FakeCard
+        self.cache = ctrl.ControlMapCache(self.root / 'cache.json')  # type: ignore[attr-defined]
+
+    def test_second_run_skips_probing(self) -> None:
+        first = self.card_class(cache=self.cache)
+        self.assertEqual(first.card_index, 2)
+        self.assertEqual(self.calls, [['scontrols']])
+
+        self.calls.clear()
+        second = self.card_class(cache=self.cache)
+        self.assertEqual(self.calls, [])
+        self.assertEqual(second._controls, first._controls)
+        second.set_volume(40)
+        self.assertEqual(self.calls, [['sset', 'HP', '40%', 'unmute']])
+
+    def test_fingerprint_change_rebuilds_map(self) -> None:
+        self.card_class(cache=self.cache)
+        (self.root / 'asound' / 'card2' / 'pcm1c').mkdir()
+        self.calls.clear()
+        self.card_class(cache=self.cache)
+        self.assertEqual(self.calls, [['scontrols']])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
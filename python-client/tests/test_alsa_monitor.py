@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'alsa_monitor.py'
+spec = importlib.util.spec_from_file_location('alsa_monitor', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+monitor = importlib.util.module_from_spec(spec)
+sys.modules['alsa_monitor'] = monitor
+spec.loader.exec_module(monitor)  # type: ignore[attr-defined]
+
+import alsa_snapshot  # noqa: E402
+from alsa_snapshot import parse_blocks  # noqa: E402
+
+
+class MonitorEventTest(unittest.TestCase):
+    def test_event_names_map_to_simple_controls(self) -> None:
+        event = monitor.parse_event('node hw:2, #14 (2,0,0,HP DAC Playback Volume,0) VALUE')  # type: ignore[attr-defined]
+        self.assertEqual((event.numid, event.control, event.structural), (14, 'HP DAC', False))
+        mux = monitor.parse_event('card 2, #3 (2,0,0,Left Line1L Mux,0) VALUE')  # type: ignore[attr-defined]
+        self.assertEqual(mux.control, 'Left Line1L Mux')
+        self.assertTrue(monitor.parse_event('node hw:2, #30 (2,0,0,New Switch,0) ADD').structural)  # type: ignore[attr-defined]
+        self.assertIsNone(monitor.parse_event('Ready to listen...'))  # type: ignore[attr-defined]
+
+    def test_burst_is_held_until_max_latency(self) -> None:
+        coalescer = monitor.EventCoalescer(0.2)  # type: ignore[attr-defined]
+        for step in range(10):
+            coalescer.add('HP DAC', step * 0.01)
+        self.assertAlmostEqual(coalescer.deadline(), 0.11)
+        coalescer.add('PCM', 0.3)
+        self.assertAlmostEqual(coalescer.deadline(), 0.2)
+        self.assertEqual(coalescer.take(), (False, {'HP DAC', 'PCM'}))
+        self.assertIsNone(coalescer.deadline())
+
+    def test_isolated_clicks_refresh_without_waiting_for_debounce(self) -> None:
+        coalescer = monitor.EventCoalescer(0.2)  # type: ignore[attr-defined]
+        coalescer.add('HP DAC', 0.0)
+        self.assertAlmostEqual(coalescer.deadline(), 0.02)
+        coalescer.take()
+        coalescer.add('HP DAC', 5.0)
+        self.assertAlmostEqual(coalescer.deadline(), 5.02)
+
+    def test_blocks_keep_index_zero_only(self) -> None:
+        blocks = parse_blocks(
+            "Simple mixer control 'PCM',0\n  Mono: Playback 5 [4%]\n"
+            "Simple mixer control 'PCM',1\n  Mono: Playback 9 [7%]\n"
+        )
+        self.assertEqual(blocks, {'PCM': "Simple mixer control 'PCM',0\n  Mono: Playback 5 [4%]"})
+
+    def test_refreshing_named_controls_reads_scontents_once(self) -> None:
+        outputs = [
+            "Simple mixer control 'PCM',0\n  Mono: Playback 5 [4%]\nSimple mixer control 'HP DAC',0\n  Mono: Playback 1 [1%]\n",
+            "Simple mixer control 'PCM',0\n  Mono: Playback 9 [7%]\nSimple mixer control 'HP DAC',0\n  Mono: Playback 2 [2%]\n",
+        ]
+        commands: list[list[str]] = []
+
+        def _run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess:
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, outputs[len(commands) - 1], '')
+
+        model = alsa_snapshot.MixerModel('2')
+        with mock.patch.object(alsa_snapshot.subprocess, 'run', _run):
+            self.assertEqual(sorted(model.refresh()), ['HP DAC', 'PCM'])
+            self.assertEqual(model.refresh(['PCM', 'Missing']), ['PCM'])
+        self.assertEqual(commands, [['amixer', '-c', '2', 'scontents']] * 2)
+        self.assertIn('[7%]', model.blocks['PCM'])
+        self.assertIn('[1%]', model.blocks['HP DAC'])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'alsamixer.py'
+spec = importlib.util.spec_from_file_location('alsamixer', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+alsamixer = importlib.util.module_from_spec(spec)
+sys.modules['alsamixer'] = alsamixer
+spec.loader.exec_module(alsamixer)  # type: ignore[attr-defined]
+
+SCONTENTS = """\
+Simple mixer control 'HP DAC',0
+  Capabilities: pvolume pswitch
+  Playback channels: Front Left - Front Right
+  Limits: Playback 0 - 127
+  Mono:
+  Front Left: Playback 127 [100%] [0.00dB] [on]
+  Front Right: Playback 127 [100%] [0.00dB] [on]
+Simple mixer control 'PCM',0
+  Capabilities: pvolume
+  Front Left: Playback 90 [71%]
+Simple mixer control 'HP PGA Bypass',0
+  Capabilities: pvolume
+  Mono: Playback 40 [31%]
+Simple mixer control 'Left HP Mixer DACL1',0
+  Capabilities: pswitch pswitch-joined
+  Mono: Playback [off]
+Simple mixer control 'Right HP Mixer DACR1',0
+  Capabilities: pswitch pswitch-joined
+  Mono: Playback [off]
+Simple mixer control 'Left HP Mixer Line2L Bypass',0
+  Capabilities: pswitch pswitch-joined
+  Mono: Playback [on]
+Simple mixer control 'Right HP Mixer Line2R Bypass',0
+  Capabilities: pswitch pswitch-joined
+  Mono: Playback [on]
+Simple mixer control 'Right HP Mixer Line2R Bypass',1
+  Capabilities: pswitch pswitch-joined
+  Mono: Playback [off]
+"""
+
+
+class MixerPlanTest(unittest.TestCase):
+    def test_routing_and_volume_collapse_into_one_batch(self) -> None:
+        plan = alsamixer.MixerPlan(2, alsamixer.MixerSnapshot(2, SCONTENTS))  # type: ignore[attr-defined]
+        self.assertEqual(alsamixer.detect_outputs(plan), ['hp'])  # type: ignore[attr-defined]
+        alsamixer.route_line2_to(plan, 'hp')  # type: ignore[attr-defined]
+        alsamixer._plan_volume(plan, ['hp'], 'line2', 40)  # type: ignore[attr-defined]
+        self.assertEqual(plan.commands(), [
+            "sset 'Left HP Mixer DACL1' off",
+            "sset 'Right HP Mixer DACR1' off",
+            "sset 'Left HP Mixer Line2L Bypass' on",
+            "sset 'Right HP Mixer Line2R Bypass' on",
+            "sset 'HP DAC' 0% mute",
+            "sset 'PCM' 0%",
+            "sset 'HP PGA Bypass' 40%",
+        ])
+
+    def test_missing_required_control_is_reported(self) -> None:
+        plan = alsamixer.MixerPlan(2, alsamixer.MixerSnapshot(2, SCONTENTS))  # type: ignore[attr-defined]
+        with self.assertRaisesRegex(RuntimeError, 'Chybí ovladač: Left PGA Mixer Mic3L'):
+            alsamixer.route_mic_to(plan, 'hp')  # type: ignore[attr-defined]
+
+    def test_batch_errors_on_stderr_fall_back_to_per_control_sset(self) -> None:
+        plan = alsamixer.MixerPlan(2, alsamixer.MixerSnapshot(2, SCONTENTS))  # type: ignore[attr-defined]
+        plan.set('PCM', '0%')
+        plan.set('Line DAC', 'on')
+        commands: list[list[str]] = []
+
+        def _run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess:
+            commands.append(cmd)
+            if '--stdin' in cmd:
+                return subprocess.CompletedProcess(cmd, 0, '', "amixer: Unable to find simple control 'Line DAC',0\n")
+            if 'Line DAC' in cmd:
+                return subprocess.CompletedProcess(cmd, 1, '', "Unable to find simple control 'Line DAC',0")
+            return subprocess.CompletedProcess(cmd, 0, '', '')
+
+        with mock.patch.object(alsamixer.subprocess, 'run', _run):
+            with self.assertRaisesRegex(RuntimeError, 'Line DAC'):
+                plan.apply()
+        self.assertEqual(commands[1:], [['amixer', '-c', '2', 'sset', 'PCM', '0%'], ['amixer', '-c', '2', 'sset', 'Line DAC', 'on']])
+
+
+class MixerSnapshotTest(unittest.TestCase):
+    def test_reads_answer_from_one_snapshot(self) -> None:
+        controls = alsamixer.MixerSnapshot(2, SCONTENTS)  # type: ignore[attr-defined]
+        self.assertTrue(controls.is_percent_fader('HP DAC'))
+        self.assertFalse(controls.is_percent_fader('Left HP Mixer DACL1'))
+        self.assertTrue(controls.is_on('Right HP Mixer Line2R Bypass'))
+        self.assertEqual(controls.state('PCM'), 'Front Left: Playback 90 [71%]')
+        self.assertIsNone(controls.state('Line DAC'))
+        self.assertEqual(alsamixer.detect_active_source(2, controls), 'line2')  # type: ignore[attr-defined]
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
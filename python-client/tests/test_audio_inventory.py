@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'audio_inventory.py'
+spec = importlib.util.spec_from_file_location('audio_inventory', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+inventory = importlib.util.module_from_spec(spec)
+sys.modules['audio_inventory'] = inventory
+spec.loader.exec_module(inventory)  # type: ignore[attr-defined]
+
+CARDS = (
+    ' 0 [Headphones     ]: bcm2835_headpho - bcm2835 Headphones\n'
+    '                      bcm2835 Headphones\n'
+    ' 2 [soundcard      ]: simple-card - soundcard\n'
+    '                      soundcard\n'
+)
+PCM = (
+    '00-00: bcm2835 Headphones : bcm2835 Headphones : playback 8\n'
+    '02-00: tlv320aic3x-hifi tlv320aic3x-hifi-0 : tlv320aic3x-hifi tlv320aic3x-hifi-0 : playback 1 : capture 1\n'
+)
+
+
+class AudioInventoryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        (root / 'asound').mkdir()
+        (root / 'asound' / 'cards').write_text(CARDS)
+        (root / 'asound' / 'pcm').write_text(PCM)
+        (root / 'snd').mkdir()
+        self.inventory = inventory.AudioInventory(  # type: ignore[attr-defined]
+            root / 'asound', root / 'snd', cache_path=root / 'cache.json'
+        )
+
+    def test_builds_aplay_shaped_devices_and_reuses_cache(self) -> None:
+        names = {0: ['PCM Playback Volume'], 2: ['HP DAC Playback Volume', 'Left Line1L Mux']}
+        with mock.patch.object(inventory, 'read_control_names', side_effect=lambda dev: names[int(str(dev)[-1])]) as ioctl:
+            first = self.inventory.alsa()
+            second = self.inventory.alsa()
+        self.assertEqual(ioctl.call_count, 2)
+        self.assertEqual(first, second)
+        self.assertEqual([d['card'] for d in first['playback_devices']], [0, 2])
+        capture = first['capture_devices']
+        self.assertEqual(len(capture), 1)
+        self.assertEqual(capture[0]['card_name'], 'soundcard')
+        self.assertEqual(capture[0]['device_name'], 'tlv320aic3x-hifi tlv320aic3x-hifi-0')
+        self.assertEqual(capture[0]['controls'], names[2])
+
+    def test_unreadable_control_device_uses_fallback_uncached(self) -> None:
+        calls: list[int] = []
+        fallback = lambda card: calls.append(card) or ['Fallback']  # noqa: E731
+        self.inventory.alsa(controls_fallback=fallback)
+        self.inventory.alsa(controls_fallback=fallback)
+        self.assertEqual(calls, [0, 2, 0, 2])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import os
+import stat
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import unittest
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from modbus_audio.arbiter import (  # noqa: E402
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_URGENT,
+    BusArbiter,
+    BusArbitrationTimeout,
+)
+
+
+class BusArbiterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.base = Path(self._tmp.name)
+
+    def _arbiter(self, timeout: float = 5.0) -> BusArbiter:
+        return BusArbiter('/dev/ttyTEST', timeout=timeout, base_dir=self.base)
+
+    def _wait_for_queue(self, arbiter: BusArbiter, depth: int) -> None:
+        deadline = time.monotonic() + 2
+        while arbiter.queue_depth() < depth and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.assertEqual(arbiter.queue_depth(), depth)
+
+    def test_priority_then_fifo_order(self) -> None:
+        arbiter = self._arbiter()
+        order: list[str] = []
+        arbiter.acquire(PRIORITY_INTERACTIVE)
+
+        def _worker(name: str, priority: int) -> None:
+            with arbiter.transaction(priority):
+                order.append(name)
+
+        threads = []
+        for index, (name, priority) in enumerate((('poll-1', PRIORITY_BACKGROUND), ('poll-2', PRIORITY_BACKGROUND), ('jsvv', PRIORITY_URGENT))):
+            thread = threading.Thread(target=_worker, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            self._wait_for_queue(arbiter, index + 2)
+
+        arbiter.release()
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(order, ['jsvv', 'poll-1', 'poll-2'])
+        self.assertEqual(arbiter.queue_depth(), 0)
+        stats = arbiter.stats()
+        self.assertEqual(stats['background']['transactions'], 2)
+        self.assertGreater(stats['background']['waitMaxMs'], 0)
+
+    def test_reentrant_batch_and_timeout(self) -> None:
+        arbiter = self._arbiter(timeout=0.2)
+        with arbiter.transaction(PRIORITY_URGENT):
+            with arbiter.transaction():
+                self.assertTrue(arbiter.owned())
+            errors: list[Exception] = []
+
+            def _contender() -> None:
+                try:
+                    arbiter.acquire(PRIORITY_BACKGROUND)
+                except BusArbitrationTimeout as exc:
+                    errors.append(exc)
+
+            thread = threading.Thread(target=_contender)
+            thread.start()
+            thread.join(2)
+            self.assertEqual(len(errors), 1)
+        self.assertFalse(arbiter.owned())
+        self.assertEqual(arbiter.stats()['background']['timeouts'], 1)
+        self.assertEqual(arbiter.queue_depth(), 0)
+
+    def test_tickets_of_dead_processes_are_skipped(self) -> None:
+        arbiter = self._arbiter(timeout=0.5)
+        arbiter.acquire()
+        arbiter.release()
+        queue_dir = next(self.base.iterdir())
+        dead_pid = 2 ** 22 + 1
+        os.mkfifo(queue_dir / f'0-{0:020d}-{dead_pid}-000000.fifo')
+        started = time.monotonic()
+        arbiter.acquire(PRIORITY_BACKGROUND)
+        arbiter.release()
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(arbiter.queue_depth(), 0)
+
+    def test_queue_files_are_shared_regardless_of_umask(self) -> None:
+        previous = os.umask(0o077)
+        self.addCleanup(os.umask, previous)
+        arbiter = BusArbiter('/dev/ttyTEST', base_dir=self.base, mode=0o1770)
+        with arbiter.transaction():
+            queue_dir = next(self.base.iterdir())
+            ticket = next(queue_dir.glob('*.fifo'))
+            self.assertEqual(stat.S_IMODE(ticket.stat().st_mode), 0o660)
+        self.assertEqual(stat.S_IMODE(queue_dir.stat().st_mode), 0o1770)
+        self.assertEqual(stat.S_IMODE((queue_dir / 'bus.lock').stat().st_mode), 0o660)
+
+    @unittest.skipUnless(hasattr(os, 'geteuid') and os.geteuid() == 0, 'switching users needs root')
+    def test_arbiters_of_different_users_share_the_queue(self) -> None:
+        os.chmod(self.base, 0o755)
+        previous = os.umask(0o022)
+        self.addCleanup(os.umask, previous)
+        daemon = self._arbiter(timeout=2.0)
+        daemon.acquire(PRIORITY_BACKGROUND)
+        queue_dir = next(self.base.iterdir())
+        # A live ticket the other user may not write to, queued behind it.
+        foreign = queue_dir / f'9-{0:020d}-{os.getpid()}-000000.fifo'
+        os.mkfifo(foreign, 0o600)
+        os.chmod(foreign, 0o600)
+        self.addCleanup(foreign.unlink)
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            code = 1
+            try:
+                os.setgid(65534)
+                os.setuid(65534)
+                web = BusArbiter('/dev/ttyTEST', timeout=2.0, base_dir=self.base, mode=0o1770)
+                with web.transaction(PRIORITY_INTERACTIVE):
+                    code = 0
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                os._exit(code)
+
+        self._wait_for_queue(daemon, 3)
+        daemon.release()
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertEqual(daemon.queue_depth(), 1)
+        self.assertEqual(stat.S_IMODE(queue_dir.stat().st_mode), 0o1777)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
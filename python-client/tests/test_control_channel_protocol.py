@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import logging
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'daemons' / 'control_channel_worker.py'
+spec = importlib.util.spec_from_file_location('control_channel_worker_test', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+worker = importlib.util.module_from_spec(spec)
+sys.modules['control_channel_worker_test'] = worker
+spec.loader.exec_module(worker)  # type: ignore[attr-defined]
+
+
+class ControlChannelProtocolTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.socket_path = Path(self._tmp.name) / 'control.sock'
+        logger = logging.getLogger('control_channel.test')
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+        modbus = worker.ModbusConfig(
+            port='/dev/null',
+            method='rtu',
+            baudrate=57600,
+            parity='N',
+            stopbits=1,
+            bytesize=8,
+            timeout=0.1,
+            unit_id=1,
+            poll_interval=0.1,
+            dry_run=True,
+        )
+        config = worker.WorkerConfig(
+            socket_path=self.socket_path,
+            timeout=0.5,
+            log_file=None,
+            log_level='WARNING',
+            heartbeat_interval=5.0,
+            modbus=modbus,
+            idle_timeout=2.0,
+        )
+        supervisor = worker.ModbusSupervisor(worker.ModbusManager(modbus, logger), logger)
+        self.server = worker.ControlChannelServer(config, supervisor, logger)
+        self.server_task = asyncio.create_task(self.server.start())
+        while not self.socket_path.exists():
+            await asyncio.sleep(0.01)
+
+    async def asyncTearDown(self) -> None:
+        await self.server.stop()
+        await self.server_task
+        self._tmp.cleanup()
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
+        self.assertEqual(await reader.readline(), b'READY\n')
+        return reader, writer
+
+    async def test_legacy_request_closes_connection(self) -> None:
+        reader, writer = await self._connect()
+        writer.write(b'{"id": "a", "command": "status_modbus"}\n')
+        response = json.loads(await reader.readline())
+        self.assertTrue(response['ok'])
+        self.assertEqual(response['id'], 'a')
+        self.assertEqual(await reader.readline(), b'')
+        writer.close()
+
+    async def test_upgraded_connection_serves_pipelined_requests(self) -> None:
+        reader, writer = await self._connect()
+        writer.write(b'{"id": "h", "command": "hello", "protocol": 2}\n')
+        hello = json.loads(await reader.readline())
+        self.assertEqual(hello['details']['protocol'], 2)
+
+        for index in range(5):
+            writer.write(json.dumps({'id': str(index), 'command': 'status_modbus'}).encode() + b'\n')
+        await writer.drain()
+        ids = {json.loads(await reader.readline())['id'] for _ in range(5)}
+        self.assertEqual(ids, {'0', '1', '2', '3', '4'})
+        writer.close()
+
+    async def test_subscriber_receives_state_changes(self) -> None:
+        reader, writer = await self._connect()
+        writer.write(b'{"id": "s", "command": "subscribe"}\n')
+        ack = json.loads(await reader.readline())
+        self.assertTrue(ack['ok'])
+        self.assertEqual(ack['details']['current']['state'], 'IDLE')
+        subscription = ack['details']['subscription']
+
+        writer.write(b'{"id": "p", "command": "pause_modbus"}\n')
+        await writer.drain()
+        messages = [json.loads(await reader.readline()) for _ in range(2)]
+        event = next(message for message in messages if message.get('event') == 'status_changed')
+        self.assertEqual(event['subscription'], subscription)
+        self.assertEqual(event['state'], 'PAUSED')
+        self.assertTrue(any(message.get('id') == 'p' for message in messages))
+
+        writer.write(json.dumps({'id': 'u', 'command': 'unsubscribe', 'subscription': subscription}).encode() + b'\n')
+        self.assertTrue(json.loads(await reader.readline())['ok'])
+        writer.close()
+
+
+class ModbusPollerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_transmitting_keeps_the_fast_poll_interval(self) -> None:
+        logger = logging.getLogger('control_channel.test')
+        modbus = worker.ModbusConfig(
+            port='/dev/null',
+            method='rtu',
+            baudrate=57600,
+            parity='N',
+            stopbits=1,
+            bytesize=8,
+            timeout=0.1,
+            unit_id=1,
+            poll_interval=0.02,
+            dry_run=True,
+            poll_idle_max=1.0,
+            poll_fast_window=0.0,
+        )
+        manager = worker.ModbusManager(modbus, logger)
+        await manager.resume('test')
+        await asyncio.sleep(0.3)
+        polls = manager.poll_stats()['polls']
+        await manager.stop('test')
+        # Backing off (0.02, 0.04, 0.08, 0.16 s) would manage only about five polls.
+        self.assertGreaterEqual(polls, 9)
+
+
+class ChangeSubscriberTest(unittest.IsolatedAsyncioTestCase):
+    async def test_full_mailbox_coalesces_into_latest_event(self) -> None:
+        subscriber = worker.ChangeSubscriber('x', capacity=2)
+        for seq in range(5):
+            subscriber.offer({'seq': seq})
+        events = await subscriber.drain()
+        self.assertEqual([event['seq'] for event in events], [0, 4])
+        self.assertEqual(subscriber.coalesced, 3)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
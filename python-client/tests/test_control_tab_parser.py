@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import importlib.util
+import io
 import sys
+import time
 from pathlib import Path
 import unittest
 
@@ -38,5 +41,136 @@ class ControlTabParserTest(unittest.TestCase):
         self.assertEqual(crc, '3A')
 
 
+class FrameExtractorTest(unittest.TestCase):
+    def test_frames_split_across_reads(self) -> None:
+        extractor = control_tab.FrameExtractor()  # type: ignore[attr-defined]
+        self.assertEqual(extractor.feed(b'\r\n<<<:1:1:2'), [])
+        self.assertEqual(extractor.feed(b'=5>>3A<<'), [])
+        frames = extractor.feed(b'<\n<<<:1:1:2=6>>39<<<')
+        self.assertEqual(frames, [b'<<<:1:1:2=5>>3A<<<', b'<<<:1:1:2=6>>39<<<'])
+        self.assertEqual(extractor.dropped, 3)
+
+    def test_noise_and_oversized_frames_are_dropped(self) -> None:
+        extractor = control_tab.FrameExtractor(capacity=64, max_frame=32)  # type: ignore[attr-defined]
+        noise = b'x' * 1000
+        frames = extractor.feed(noise + b'<<<:' + b'y' * 100 + b'<<<:1:1:2=5>>3A<<<')
+        self.assertEqual(frames, [b'<<<:1:1:2=5>>3A<<<'])
+        self.assertEqual(extractor.dropped, len(noise) + 104)
+
+
+class TxSchedulerTest(unittest.TestCase):
+    def test_ack_jumps_ahead_and_texts_coalesce_per_field(self) -> None:
+        written: list[str] = []
+        scheduler = control_tab.TxScheduler(written.append)  # type: ignore[attr-defined]
+        scheduler.send_text(1, 'text-1-old')
+        scheduler.send_text(2, 'text-2')
+        scheduler.schedule_animation(1, [(0.0, 'anim-1-a'), (0.0, 'anim-1-b'), (30.0, 'anim-1-late')])
+        scheduler.send_ack('ack')
+        scheduler.start()
+        scheduler.stop()
+
+        self.assertEqual(written, ['ack', 'text-2', 'anim-1-b'])
+        stats = scheduler.stats()
+        self.assertEqual(stats['acks'], 1)
+        self.assertEqual(stats['coalesced'], 2)
+
+    def test_animation_frames_follow_their_delays(self) -> None:
+        written: list[str] = []
+        scheduler = control_tab.TxScheduler(written.append)  # type: ignore[attr-defined]
+        scheduler.start()
+        scheduler.schedule_animation(3, [(0.0, 'a'), (0.05, 'b')])
+        deadline = time.monotonic() + 2.0
+        while len(written) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        scheduler.stop()
+        self.assertEqual(written, ['a', 'b'])
+
+
+class ResponseCacheTest(unittest.TestCase):
+    TEXT_RESPONSE = {'action': 'text', 'text': {'fieldId': 1, 'text': 'Klid'}, 'cache': {'ttl': 60}}
+
+    def test_only_marked_responses_of_allowed_types_are_stored(self) -> None:
+        cache = control_tab.ResponseCache()  # type: ignore[attr-defined]
+        self.assertTrue(cache.store((1, 1, 3, '?1?'), self.TEXT_RESPONSE))
+        self.assertFalse(cache.store((1, 1, 3, '?2?'), {'action': 'text'}))
+        self.assertFalse(cache.store((1, 1, 2, '5'), {'action': 'ack', 'cache': {'ttl': 60}}))
+        self.assertEqual(cache.get((1, 1, 3, '?1?')), self.TEXT_RESPONSE)
+        self.assertIsNone(cache.get((1, 1, 3, '?2?')))
+
+    def test_invalidation_by_spec_and_all(self) -> None:
+        cache = control_tab.ResponseCache()  # type: ignore[attr-defined]
+        cache.store((1, 1, 3, '?1?'), self.TEXT_RESPONSE)
+        cache.store((2, 1, 3, '?1?'), self.TEXT_RESPONSE)
+        cache.store((2, 1, 1, ''), {'action': 'ack', 'cache': {'ttl': 60}})
+        self.assertEqual(cache.invalidate({'screen': 2, 'eventType': 3}), 1)
+        self.assertIsNotNone(cache.get((1, 1, 3, '?1?')))
+        self.assertEqual(cache.invalidate('all'), 2)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_listener_answers_hit_locally_and_queues_refresh(self) -> None:
+        cache = control_tab.ResponseCache()  # type: ignore[attr-defined]
+        listener = control_tab.ControlTabListener(  # type: ignore[attr-defined]
+            sink=control_tab.BackendSink(None, None, 1),
+            transport=None,
+            poll_interval=0.05,
+            graceful_timeout=1.0,
+            retry_backoff=0.25,
+            cache=cache,
+        )
+        body = '1:1:3=?1?'
+        raw = f'<<<:{body}>>{control_tab.xor_crc(body)}<<<'  # type: ignore[attr-defined]
+        cache.store((1, 1, 3, '?1?'), self.TEXT_RESPONSE)
+
+        listener._handle_frame(raw)  # type: ignore[attr-defined]
+        listener._handle_frame(raw)  # type: ignore[attr-defined]
+
+        listener._tx.start()  # type: ignore[attr-defined]
+        with contextlib.redirect_stdout(io.StringIO()):
+            listener._tx.stop()  # type: ignore[attr-defined]
+        stats = listener._tx.stats()  # type: ignore[attr-defined]
+        self.assertEqual((stats['texts'], stats['coalesced']), (1, 1))
+        _frame, _payload, origin, served = listener._queue.get_nowait()  # type: ignore[attr-defined]
+        self.assertEqual((origin, served), ('cache', self.TEXT_RESPONSE))
+        self.assertTrue(listener._queue.empty())  # type: ignore[attr-defined]
+
+
+class OptimisticAckTest(unittest.TestCase):
+    def _listener(self, rules: str) -> object:
+        return control_tab.ControlTabListener(  # type: ignore[attr-defined]
+            sink=control_tab.BackendSink(None, None, 1),
+            transport=None,
+            poll_interval=0.05,
+            graceful_timeout=1.0,
+            retry_backoff=0.25,
+            optimistic_ack=control_tab.OptimisticAckRules(rules),  # type: ignore[attr-defined]
+        )
+
+    @staticmethod
+    def _button(screen: int, panel: int, button: int) -> str:
+        body = f'{screen}:{panel}:2={button}'
+        return f'<<<:{body}>>{control_tab.xor_crc(body)}<<<'  # type: ignore[attr-defined]
+
+    def test_rules_select_screens_and_panels(self) -> None:
+        listener = self._listener('3:*,1:2')
+        listener._handle_frame(self._button(3, 7, 1))  # type: ignore[attr-defined]
+        listener._handle_frame(self._button(1, 1, 1))  # type: ignore[attr-defined]
+        origins = [listener._queue.get_nowait()[2] for _ in range(2)]  # type: ignore[attr-defined]
+        self.assertEqual(origins, ['optimistic', 'backend'])
+        self.assertEqual(listener._tx.stats()['pending'], 1)  # type: ignore[attr-defined]
+
+    def test_rejection_sends_follow_up_nack(self) -> None:
+        listener = self._listener('*')
+        listener._handle_frame(self._button(1, 1, 4))  # type: ignore[attr-defined]
+        frame = listener._queue.get_nowait()[0]  # type: ignore[attr-defined]
+        listener._settle_optimistic(frame, {'action': 'ack', 'ack': {'status': 0}})  # type: ignore[attr-defined]
+        written: list[str] = []
+        listener._tx._write = written.append  # type: ignore[attr-defined]
+        listener._tx.start()  # type: ignore[attr-defined]
+        listener._tx.stop()  # type: ignore[attr-defined]
+        self.assertEqual([message.strip()[:13] for message in written], ['>>>:1:1:2=1>>', '>>>:1:1:2=0>>'])
+        stats = listener._tx.stats()  # type: ignore[attr-defined]
+        self.assertEqual(stats['paths']['optimistic']['count'], 1)
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
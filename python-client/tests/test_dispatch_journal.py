@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'daemons' / '_journal.py'
+spec = importlib.util.spec_from_file_location('dispatch_journal_test', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+journal_module = importlib.util.module_from_spec(spec)
+sys.modules['dispatch_journal_test'] = journal_module
+spec.loader.exec_module(journal_module)  # type: ignore[attr-defined]
+
+DispatchJournal = journal_module.DispatchJournal
+
+
+class DispatchJournalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_replays_only_unacknowledged_entries(self) -> None:
+        journal = DispatchJournal(self.directory, commit_interval=0)
+        self.assertEqual(journal.open(), [])
+        journal.append('a', {'priority': 'P2'})
+        journal.append('b', {'priority': 'P1'})
+        journal.ack('a')
+        self.assertTrue(journal.sync())
+        journal.close()
+
+        reopened = DispatchJournal(self.directory, commit_interval=0)
+        pending = reopened.open()
+        reopened.close()
+
+        self.assertEqual([entry['id'] for entry in pending], ['b'])
+        self.assertEqual(pending[0]['priority'], 'P1')
+
+    def test_compacts_fully_acknowledged_segments(self) -> None:
+        journal = DispatchJournal(self.directory, segment_bytes=4096, commit_interval=0)
+        journal.open()
+        padding = 'x' * 1024
+        for index in range(12):
+            journal.append(f'id-{index}', {'pad': padding})
+        self.assertTrue(journal.sync())
+        self.assertGreater(len(list(self.directory.glob('journal-*.log'))), 1)
+
+        for index in range(12):
+            journal.ack(f'id-{index}')
+        journal.append('tail', {'pad': ''})
+        self.assertTrue(journal.sync())
+        journal.close()
+
+        self.assertEqual(len(list(self.directory.glob('journal-*.log'))), 1)
+        reopened = DispatchJournal(self.directory, commit_interval=0)
+        self.assertEqual([entry['id'] for entry in reopened.open()], ['tail'])
+        reopened.close()
+
+    def test_failed_fsync_is_retried_before_sync_reports_success(self) -> None:
+        journal = DispatchJournal(self.directory, commit_interval=0, retry_interval=0.05)
+        journal.open()
+        self.addCleanup(journal.close)
+        real_fsync = journal_module.os.fsync
+        failures = [OSError(5, 'Input/output error')] * 2
+
+        def _fsync(fd: int) -> None:
+            if failures:
+                raise failures.pop()
+            real_fsync(fd)
+
+        with mock.patch.object(journal_module.os, 'fsync', _fsync):
+            journal.append('a', {'priority': 'P1'})
+            self.assertFalse(journal.sync(timeout=0.02))
+            self.assertTrue(journal.sync(timeout=2.0))
+        journal.close()
+
+        reopened = DispatchJournal(self.directory, commit_interval=0)
+        self.assertEqual([entry['id'] for entry in reopened.open()], ['a'])
+        reopened.close()
+
+    def test_unserialisable_entries_fail_sync(self) -> None:
+        journal = DispatchJournal(self.directory, commit_interval=0)
+        journal.open()
+        self.addCleanup(journal.close)
+        journal.append('bad', {'payload': object()})
+        journal.append('good', {'priority': 'P2'})
+        self.assertFalse(journal.sync())
+        journal.ack('good')
+        self.assertTrue(journal.sync())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
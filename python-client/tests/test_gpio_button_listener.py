@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import contextlib
+import importlib.util
+import logging
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Iterator, Optional
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'daemons' / 'gpio_button_listener.py'
+spec = importlib.util.spec_from_file_location('gpio_button_listener', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+gpio = importlib.util.module_from_spec(spec)
+sys.modules['gpio_button_listener'] = gpio
+spec.loader.exec_module(gpio)  # type: ignore[attr-defined]
+
+
+class PipeSource(gpio.EdgeEventSource):  # type: ignore[name-defined,misc]
+    """Event-driven fake: each written ``line,value`` record is one edge."""
+
+    name = 'pipe'
+
+    def __init__(self, levels: dict[int, int], kernel_debounce: bool = True) -> None:
+        self.kernel_debounce = kernel_debounce
+        self._levels = levels
+        self.read_fd, self.write_fd = os.pipe()
+
+    def filenos(self) -> list[int]:
+        return [self.read_fd]
+
+    def read_values(self) -> dict[int, int]:
+        return dict(self._levels)
+
+    def read_events(self, ready: list[int]) -> list[object]:
+        data = os.read(self.read_fd, 4096).decode()
+        now = time.monotonic()
+        events = []
+        for record in data.split(';'):
+            if record:
+                line, value = record.split(',')
+                events.append(gpio.EdgeEvent(int(line), int(value), now))  # type: ignore[attr-defined]
+        return events
+
+    def push(self, line: int, value: int) -> None:
+        os.write(self.write_fd, f'{line},{value};'.encode())
+
+    def close(self) -> None:
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+def _engine(source: object, presses: list[object], debounce: float = 0.05) -> object:
+    return gpio.ButtonEventEngine(  # type: ignore[attr-defined]
+        source, {17: 'A1', 22: 'B2'}, 1, debounce, presses.append, logging.getLogger('test')
+    )
+
+
+class ButtonEventEngineTest(unittest.TestCase):
+    def test_software_debounce_ignores_bounce_and_holds(self) -> None:
+        source = PipeSource({17: 0, 22: 1}, kernel_debounce=False)
+        self.addCleanup(source.close)
+        presses: list[object] = []
+        engine = _engine(source, presses)
+        self.addCleanup(engine.close)
+        self.assertEqual(engine.arm(source.read_values()), [22])
+
+        event = gpio.EdgeEvent  # type: ignore[attr-defined]
+        self.assertEqual(engine.feed([event(17, 1, 0.0), event(17, 0, 0.01)], now=0.01), [])
+        self.assertEqual(engine.feed([event(17, 1, 0.02)], now=0.02), [])
+        self.assertAlmostEqual(engine.next_timeout(0.03), 0.04)
+        fired = engine.expire(0.08)
+        self.assertEqual([(press.line, press.sequence) for press in fired], [(17, 'A1')])
+        # Held button and the line that started active do not fire again.
+        self.assertEqual(engine.feed([event(17, 1, 0.1), event(22, 1, 0.1)], now=0.2), [])
+        self.assertEqual(engine.expire(1.0), [])
+        self.assertIsNone(engine.next_timeout(1.0))
+
+    def test_kernel_debounced_edges_fire_immediately(self) -> None:
+        source = PipeSource({17: 0, 22: 0})
+        self.addCleanup(source.close)
+        presses: list[object] = []
+        engine = _engine(source, presses)
+        self.addCleanup(engine.close)
+        engine.arm(source.read_values())
+        event = gpio.EdgeEvent  # type: ignore[attr-defined]
+        fired = engine.feed([event(22, 1, 1.0), event(17, 1, 1.0), event(22, 0, 1.1), event(22, 1, 1.2)], now=1.25)
+        self.assertEqual([press.line for press in fired], [22, 17, 22])
+        self.assertAlmostEqual(fired[0].detect_latency, 0.25)
+
+    def test_run_blocks_on_descriptors_until_woken(self) -> None:
+        source = PipeSource({17: 0, 22: 0})
+        self.addCleanup(source.close)
+        presses: list[object] = []
+        engine = _engine(source, presses)
+        self.addCleanup(engine.close)
+        engine.arm(source.read_values())
+        stop = threading.Event()
+        thread = threading.Thread(target=engine.run, args=(stop,))
+        thread.start()
+        time.sleep(0.2)
+        self.assertEqual(engine.wakeups, 0)
+        source.push(17, 1)
+        deadline = time.monotonic() + 2
+        while not presses and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stop.set()
+        engine.wake()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([(press.line, press.sequence) for press in presses], [(17, 'A1')])
+
+
+class FakeModbusClient:
+    def __init__(self) -> None:
+        self.writes: list[tuple[float, int, list[int], object]] = []
+        self.transactions: list[list[int]] = []
+        self.failures = 0
+        self.closed_in_transaction: list[bool] = []
+        self._open: Optional[list[int]] = None
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        self._open = []
+        try:
+            yield
+        finally:
+            self.transactions.append(self._open)
+            self._open = None
+
+    def write_registers(self, address: int, values: list[int], unit: object = None) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise OSError('no response')
+        self.writes.append((time.monotonic(), address, list(values), unit))
+        if self._open is not None:
+            self._open.append(address)
+
+    def close(self) -> None:
+        self.closed_in_transaction.append(self._open is not None)
+
+
+class ModbusPressDispatcherTest(unittest.TestCase):
+    def test_plan_is_written_directly_with_timed_repeats(self) -> None:
+        config = gpio.ButtonConfig(  # type: ignore[attr-defined]
+            chip='gpiochip0', line=17, chip_hint=None, active_value=1, debounce_seconds=0.0, poll_interval=0.05,
+            backend='auto', sequence='A1', priority=None, remote=None, repeat=None, repeat_delay=None, targets=[],
+            python_bin=sys.executable, python_path=None, log_level=logging.INFO, buttons={17: 'A1', 22: 'B2'},
+            dispatch='inprocess',
+        )
+        plan = {'routePayload': [2, 1, 0xFEFE, 0, 0, 0], 'register': 0x10, 'commandWords': [1, 7, 1, 0, 0], 'remoteUnit': 0x81}
+        plans = {17: dict(plan, repeat=2, repeatDelay=0.2), 22: dict(plan, repeat=1, repeatDelay=0.0, commandWords=[1, 8, 2, 0, 0])}
+        client = FakeModbusClient()
+        connects: list[int] = []
+
+        def _connect() -> FakeModbusClient:
+            connects.append(1)
+            return client
+
+        dispatcher = gpio.ModbusPressDispatcher(  # type: ignore[attr-defined]
+            config, logging.getLogger('test'), lambda: None, plans, _connect, 0x4000
+        )
+        dispatcher.start()
+        self.assertEqual(connects, [1])
+        now = time.monotonic()
+        press = gpio.ButtonPress  # type: ignore[attr-defined]
+        self.assertTrue(dispatcher.submit(press(17, 'A1', now, now)))
+        self.assertFalse(dispatcher.submit(press(17, 'A1', now, now)))
+        time.sleep(0.05)
+        # The second button is not held back by the first button's pending repeat.
+        self.assertTrue(dispatcher.submit(press(22, 'B2', now, now)))
+        time.sleep(0.35)
+        dispatcher.stop()
+
+        writes = [(address, values[1]) for _at, address, values, _unit in client.writes]
+        self.assertEqual(writes, [(0x4000, 1), (0x10, 7), (0x4000, 1), (0x10, 8), (0x10, 7)])
+        self.assertGreaterEqual(client.writes[-1][0] - client.writes[1][0], 0.19)
+        # Route and first command share a bus transaction; the repeat goes alone.
+        self.assertEqual(client.transactions, [[0x4000, 0x10], [0x4000, 0x10]])
+        stats = dispatcher.stats()
+        self.assertEqual(stats['presses'], 2)
+        self.assertEqual(stats['writes'], 5)
+        self.assertTrue(dispatcher.submit(press(17, 'A1', now, now)))
+
+    def test_failed_routed_write_drops_the_client_after_the_transaction(self) -> None:
+        config = gpio.ButtonConfig(  # type: ignore[attr-defined]
+            chip='gpiochip0', line=17, chip_hint=None, active_value=1, debounce_seconds=0.0, poll_interval=0.05,
+            backend='auto', sequence='A1', priority=None, remote=None, repeat=None, repeat_delay=None, targets=[],
+            python_bin=sys.executable, python_path=None, log_level=logging.INFO, buttons={17: 'A1'},
+            dispatch='inprocess',
+        )
+        plan = {'routePayload': [2, 1, 0xFEFE, 0, 0, 0], 'register': 0x10, 'commandWords': [1, 7, 1, 0, 0], 'remoteUnit': 0x81}
+        client = FakeModbusClient()
+        client.failures = 1
+        dispatcher = gpio.ModbusPressDispatcher(  # type: ignore[attr-defined]
+            config, logging.getLogger('test'), lambda: None, {17: dict(plan, repeat=1, repeatDelay=0.0)}, lambda: client, 0x4000
+        )
+        self.assertFalse(dispatcher._write_routed(plan))
+        self.assertEqual(client.closed_in_transaction, [False])
+        self.assertEqual(client.transactions, [[]])
+        self.assertEqual(dispatcher.stats()['errors'], 1)
+        self.assertTrue(dispatcher._write_routed(plan))
+        self.assertEqual(client.transactions[-1], [0x4000, 0x10])
+
+
+class ButtonConfigParsingTest(unittest.TestCase):
+    def test_button_map(self) -> None:
+        self.assertEqual(gpio.parse_button_map('0=28A9, 3:1B;0x10=4'), {0: '28A9', 3: '1B', 16: '4'})  # type: ignore[attr-defined]
+        with self.assertRaises(SystemExit):
+            gpio.parse_button_map('1=A,1=B')  # type: ignore[attr-defined]
+        with self.assertRaises(SystemExit):
+            gpio.parse_button_map('17')  # type: ignore[attr-defined]
+
+    def test_gpiomon_output(self) -> None:
+        self.assertEqual(gpio.parse_gpiomon_line('17 rising'), (17, 1))  # type: ignore[attr-defined]
+        self.assertEqual(gpio.parse_gpiomon_line('4 0'), (4, 0))  # type: ignore[attr-defined]
+        self.assertIsNone(gpio.parse_gpiomon_line('event: RISING EDGE'))  # type: ignore[attr-defined]
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
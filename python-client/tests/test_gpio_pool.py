@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import enum
+import importlib.util
+import os
+import selectors
+import sys
+import threading
+import time
+import types
+import unittest
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'src' / 'gpio_pool.py'
+spec = importlib.util.spec_from_file_location('gpio_pool', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+gpio_pool = importlib.util.module_from_spec(spec)
+sys.modules['gpio_pool'] = gpio_pool
+spec.loader.exec_module(gpio_pool)  # type: ignore[attr-defined]
+
+
+class Value(enum.Enum):
+    INACTIVE = 0
+    ACTIVE = 1
+
+
+class Direction(enum.Enum):
+    INPUT = 1
+    OUTPUT = 2
+
+
+class Edge(enum.Enum):
+    NONE = 0
+    RISING = 1
+    FALLING = 2
+    BOTH = 3
+
+
+class EventType(enum.Enum):
+    RISING_EDGE = 1
+    FALLING_EDGE = 2
+
+
+class FakeRequest:
+    """libgpiod v2 request stand-in; edges are queued with ``push`` and signalled on a pipe."""
+
+    def __init__(self, chip: str, config: dict, output_values: dict) -> None:
+        self.chip = chip
+        self.config = config
+        self.values = {offset: Value.INACTIVE for lines in config for offset in lines}
+        self.values.update(output_values)
+        self.set_calls: list[dict] = []
+        self.events: list[types.SimpleNamespace] = []
+        self.released = False
+        self._read_fd, self._write_fd = os.pipe()
+
+    @property
+    def fd(self) -> int:
+        return self._read_fd
+
+    def push(self, offset: int, rising: bool, timestamp_ns: int) -> None:
+        event_type = EventType.RISING_EDGE if rising else EventType.FALLING_EDGE
+        self.events.append(types.SimpleNamespace(line_offset=offset, event_type=event_type, timestamp_ns=timestamp_ns))
+        os.write(self._write_fd, b'x')
+
+    def set_values(self, values: dict) -> None:
+        self.set_calls.append(dict(values))
+        self.values.update(values)
+
+    def get_values(self, offsets: list[int]) -> list[Value]:
+        return [self.values[offset] for offset in offsets]
+
+    def wait_edge_events(self, timeout: float) -> bool:
+        return bool(self.events)
+
+    def read_edge_events(self) -> list[types.SimpleNamespace]:
+        events, self.events = self.events, []
+        os.read(self._read_fd, 4096)
+        return events
+
+    def release(self) -> None:
+        self.released = True
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+def fake_gpiod() -> types.SimpleNamespace:
+    module = types.SimpleNamespace(requests=[])
+
+    def request_lines(chip: str, consumer: str, config: dict, output_values: dict) -> FakeRequest:
+        request = FakeRequest(chip, config, output_values)
+        module.requests.append(request)
+        return request
+
+    module.request_lines = request_lines
+    module.LineSettings = lambda **kwargs: types.SimpleNamespace(**kwargs)
+    module.line = types.SimpleNamespace(Value=Value, Direction=Direction, Edge=Edge)
+    module.EdgeEvent = types.SimpleNamespace(Type=EventType)
+    return module
+
+
+class GpioPoolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gpiod = fake_gpiod()
+        self.pool = gpio_pool.GpioPool('test', gpiod_module=self.gpiod)  # type: ignore[attr-defined]
+        self.addCleanup(self.pool.close)
+
+    def test_lines_of_one_chip_share_one_request_and_keep_levels(self) -> None:
+        relay = self.pool.claim_outputs('gpiochip0', {16: True})
+        self.pool.claim_outputs('gpiochip0', {20: False, 21: False})
+        self.assertEqual(len(self.gpiod.requests), 2)
+        first, current = self.gpiod.requests
+        self.assertTrue(first.released)
+        self.assertEqual(sorted(offset for lines in current.config for offset in lines), [16, 20, 21])
+        self.assertEqual(current.values[16], Value.ACTIVE)
+        self.assertEqual(relay.read(), {16: 1})
+
+    def test_drive_sets_several_outputs_in_one_call_and_skips_unchanged(self) -> None:
+        self.pool.claim_outputs('gpiochip0', {20: False, 21: False})
+        request = self.gpiod.requests[-1]
+        self.pool.drive('gpiochip0', {20: True, 21: True})
+        self.pool.drive('gpiochip0', {20: True, 21: False})
+        self.pool.drive('gpiochip0', {20: True})
+        self.assertEqual(request.set_calls, [{20: Value.ACTIVE, 21: Value.ACTIVE}, {21: Value.INACTIVE}])
+        stats = self.pool.stats()
+        self.assertEqual(stats['drive']['count'], 2)
+        self.assertEqual(stats['skippedDrives'], 2)
+
+    def test_edges_are_buffered_per_line(self) -> None:
+        buttons = self.pool.claim_inputs('gpiochip0', [5], edge='both')
+        door = self.pool.claim_inputs('gpiochip0', [6], edge='both')
+        request = self.gpiod.requests[-1]
+        request.push(6, True, 1_000)
+        request.push(5, False, 2_000)
+        self.assertEqual([(edge.line, edge.value) for edge in buttons.wait_edges(timeout=0.5)], [(5, 0)])
+        self.assertEqual([(edge.line, edge.value) for edge in door.read_edges()], [(6, 1)])
+        self.assertEqual(door.wait_edges(timeout=0.01), [])
+        self.assertEqual(self.pool.stats()['edge']['count'], 2)
+
+    def test_button_fds_survive_an_output_claim_on_the_same_chip(self) -> None:
+        buttons = self.pool.claim_inputs('gpiochip0', [5], edge='both', debounce=0.01)
+        selector = selectors.DefaultSelector()
+        self.addCleanup(selector.close)
+        fds = buttons.filenos()
+        for fd in fds:
+            selector.register(fd, selectors.EVENT_READ)
+        # An RS485 direction line on the same chip is claimed and released per transceiver.
+        for _ in range(2):
+            rs485 = self.pool.claim_outputs('gpiochip0', {17: False})
+            rs485.drive(True)
+            rs485.close()
+        self.assertEqual(len(self.gpiod.requests), 5)
+        self.assertEqual(buttons.filenos(), fds)
+        self.gpiod.requests[-1].push(5, False, 3_000)
+        self.assertTrue(selector.select(0.5))
+        self.assertEqual([(edge.line, edge.value) for edge in buttons.read_edges()], [(5, 0)])
+        self.assertEqual(selector.select(0), [])
+
+    def test_edges_drained_by_another_user_wake_the_handle(self) -> None:
+        buttons = self.pool.claim_inputs('gpiochip0', [5], edge='both')
+        door = self.pool.claim_inputs('gpiochip0', [6], edge='both')
+        selector = selectors.DefaultSelector()
+        self.addCleanup(selector.close)
+        for fd in buttons.filenos():
+            selector.register(fd, selectors.EVENT_READ)
+        self.gpiod.requests[-1].push(5, True, 1_000)
+        self.assertEqual(door.read_edges(), [])
+        self.assertTrue(selector.select(0.5))
+        self.assertEqual([edge.line for edge in buttons.read_edges()], [5])
+        self.assertEqual(selector.select(0), [])
+
+    def test_concurrent_waiters_each_get_their_edges(self) -> None:
+        handles = {line: self.pool.claim_inputs('gpiochip0', [line], edge='both') for line in (5, 6)}
+        request = self.gpiod.requests[-1]
+        received: dict[int, list[int]] = {}
+
+        def _wait(line: int) -> None:
+            received[line] = [edge.line for edge in handles[line].wait_edges(timeout=2.0)]
+
+        threads = [threading.Thread(target=_wait, args=(line,)) for line in handles]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        request.push(6, True, 1_000)
+        request.push(5, True, 2_000)
+        for thread in threads:
+            thread.join(2.5)
+        self.assertEqual(received, {5: [5], 6: [6]})
+
+    def test_conflicting_claims_and_unknown_lines_are_rejected(self) -> None:
+        self.pool.claim_outputs('gpiochip0', {16: False})
+        with self.assertRaises(gpio_pool.GpioPoolError):  # type: ignore[attr-defined]
+            self.pool.claim_inputs('gpiochip0', [16])
+        with self.assertRaises(gpio_pool.GpioPoolError):  # type: ignore[attr-defined]
+            self.pool.drive('gpiochip0', {17: True})
+
+    def test_release_drops_lines_and_last_release_frees_the_chip(self) -> None:
+        relay = self.pool.claim_outputs('gpiochip0', {16: True})
+        led = self.pool.claim_outputs('gpiochip0', {20: False})
+        led.close()
+        self.assertEqual(self.pool.stats()['chips'], {'gpiochip0': [16]})
+        self.assertEqual(self.gpiod.requests[-1].values[16], Value.ACTIVE)
+        relay.close()
+        self.assertEqual(self.pool.stats()['chips'], {})
+        self.assertTrue(self.gpiod.requests[-1].released)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
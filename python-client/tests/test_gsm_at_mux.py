@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import importlib.util
+import queue
+import sys
+import unittest
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'daemons' / 'gsm_listener.py'
+spec = importlib.util.spec_from_file_location('gsm_listener', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+gsm = importlib.util.module_from_spec(spec)
+sys.modules['gsm_listener'] = gsm
+spec.loader.exec_module(gsm)  # type: ignore[attr-defined]
+
+
+class FakeSerial:
+    """Serial stand-in: commands written are recorded, scripted replies are read back."""
+
+    def __init__(self, replies: dict[str, list[str]]) -> None:
+        self.is_open = True
+        self.written: list[str] = []
+        self._replies = replies
+        self._lines: queue.Queue[bytes] = queue.Queue()
+
+    def push(self, *lines: str) -> None:
+        for line in lines:
+            self._lines.put(line.encode() + b'\r\n')
+
+    def write(self, data: bytes) -> None:
+        command = data.decode().strip()
+        self.written.append(command)
+        self.push(*self._replies.get(command, []))
+
+    def flush(self) -> None:
+        pass
+
+    def readline(self) -> bytes:
+        try:
+            return self._lines.get(timeout=0.02)
+        except queue.Empty:
+            return b''
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class AtMultiplexerTest(unittest.TestCase):
+    def _client(self, replies: dict[str, list[str]]) -> tuple[object, FakeSerial]:
+        client = gsm.Sim7600ATClient('/dev/null', 115200, 8, 'N', 1, 0.02, 0.1)  # type: ignore[attr-defined]
+        fake = FakeSerial(replies)
+        client._serial = fake  # type: ignore[attr-defined]
+        client._start_reader()  # type: ignore[attr-defined]
+        self.addCleanup(client.close)
+        return client, fake
+
+    def test_urc_during_command_is_not_swallowed(self) -> None:
+        client, _fake = self._client({'AT+CSQ': ['+CSQ: 21,99', 'RING', '+CLIP: "+420123456789",145', 'OK']})
+        response = client.execute('AT+CSQ')
+        self.assertTrue(response.ok)
+        self.assertEqual(response.lines, ['+CSQ: 21,99'])
+        self.assertEqual(client.parse_signal_quality(response), 21)
+        self.assertEqual(client.read_urc(0.5), 'RING')
+        self.assertTrue(client.read_urc(0.5).startswith('+CLIP:'))
+
+    def test_urc_sharing_the_command_prefix_reaches_the_listener(self) -> None:
+        client, _fake = self._client({
+            'AT+CLIP=1': ['+CLIP: "+420123456789",145,"",,"",0', 'OK'],
+            'AT+CREG?': ['+CREG: 1', '+CREG: 0,1', 'OK'],
+        })
+        enabled = client.execute('AT+CLIP=1')
+        self.assertEqual((enabled.ok, enabled.lines), (True, []))
+        self.assertTrue(client.read_urc(0.5).startswith('+CLIP: "+420123456789"'))
+        registration = client.execute('AT+CREG?')
+        self.assertEqual(registration.lines, ['+CREG: 0,1'])
+        self.assertEqual(client.read_urc(0.5), '+CREG: 1')
+
+    def test_commands_are_serialised_and_time_out(self) -> None:
+        client, fake = self._client({'ATH': ['OK']})
+        silent = client.submit('AT+CPIN?', timeout=0.1)
+        hangup = client.submit('ATH')
+        self.assertTrue(silent.result(timeout=2).timed_out)
+        self.assertTrue(hangup.result(timeout=2).ok)
+        self.assertEqual(fake.written, ['AT+CPIN?', 'ATH'])
+
+    def test_no_carrier_completes_answer_and_reaches_listener(self) -> None:
+        client, _fake = self._client({'ATA': ['NO CARRIER']})
+        self.assertFalse(client.answer())
+        self.assertEqual(client.read_urc(0.5), 'NO CARRIER')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
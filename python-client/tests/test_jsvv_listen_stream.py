@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'jsvv_control.py'
+spec = importlib.util.spec_from_file_location('jsvv_control', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+jsvv_control = importlib.util.module_from_spec(spec)
+sys.modules['jsvv_control'] = jsvv_control
+spec.loader.exec_module(jsvv_control)  # type: ignore[attr-defined]
+
+from jsvv import JSVVClient  # noqa: E402
+from jsvv import client as jsvv_client  # noqa: E402
+
+
+class FakeSerial:
+    def __init__(self, lines: list[bytes], **kwargs: object) -> None:
+        self.lines = list(lines)
+        self.timeout = kwargs.get('timeout')
+        self.is_open = True
+
+    def readline(self) -> bytes:
+        return self.lines.pop(0) if self.lines else b''
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+class FlushTrackingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushed: list[str] = []
+
+    def flush(self) -> None:
+        super().flush()
+        self.flushed.append(self.getvalue())
+
+
+class ListenStreamTest(unittest.TestCase):
+    def _run(self, lines: list[bytes], *argv: str) -> tuple[int, FlushTrackingStream]:
+        fake_serial = SimpleNamespace(Serial=lambda **kwargs: FakeSerial(lines, **kwargs))
+        stdout = FlushTrackingStream()
+        with mock.patch.object(jsvv_client, 'serial', fake_serial), \
+                mock.patch.object(sys, 'argv', ['jsvv_control.py', '--port', '/dev/ttyTEST', 'listen', '--stream', *argv]), \
+                mock.patch.object(sys, 'stdout', stdout):
+            with self.assertRaises(SystemExit) as exit_ctx:
+                jsvv_control.main()  # type: ignore[attr-defined]
+        return exit_ctx.exception.code, stdout
+
+    def test_each_frame_is_one_flushed_json_line(self) -> None:
+        frames = [JSVVClient.build_frame('STOP'), JSVVClient.build_frame('VERBAL', [1]), JSVVClient.build_frame('TEST')]
+        code, stdout = self._run([frame.encode('ascii') for frame in frames], '--max-frames', '0', '--until-timeout')
+        self.assertEqual(code, 0)
+
+        output = stdout.getvalue()
+        self.assertTrue(output.endswith('\n'))
+        lines = output.splitlines()
+        self.assertEqual(len(lines), len(frames) + 1)
+        records = [json.loads(line) for line in lines]
+
+        for record, frame in zip(records, frames):
+            self.assertEqual((record['status'], record['command'], record['event']), ('ok', 'listen', 'frame'))
+            self.assertEqual(record['data']['raw'], frame.rstrip('\n'))
+            self.assertTrue(record['data']['crcOk'])
+        self.assertEqual(records[-1], {
+            'status': 'ok',
+            'command': 'listen',
+            'data': {'count': len(frames), 'port': '/dev/ttyTEST', 'stream': True},
+        })
+
+        # Every line, the summary included, reaches the consumer as soon as it is written.
+        expected = [''.join(line + '\n' for line in lines[:index + 1]) for index in range(len(lines))]
+        self.assertEqual([snapshot for snapshot in stdout.flushed if snapshot], expected)
+
+    def test_max_frames_closes_the_stream_with_a_summary(self) -> None:
+        frames = [JSVVClient.build_frame('STOP').encode('ascii')] * 3
+        code, stdout = self._run(frames, '--max-frames', '2')
+        self.assertEqual(code, 0)
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([record.get('event') for record in records], ['frame', 'frame', None])
+        self.assertEqual(records[-1]['data']['count'], 2)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'mixer_control.py'
+spec = importlib.util.spec_from_file_location('mixer_control', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+mixer = importlib.util.module_from_spec(spec)
+sys.modules['mixer_control'] = mixer
+spec.loader.exec_module(mixer)  # type: ignore[attr-defined]
+
+CURRENT = """
+state.soundcard {
+	control.1 {
+		iface MIXER
+		name 'HP DAC Playback Volume'
+		value.0 100
+		value.1 100
+		comment { access 'read write' type INTEGER count 2 range '0 - 127' }
+	}
+	control.2 {
+		iface MIXER
+		name 'Left Line1L Mux'
+		value Line1L
+		comment { access 'read write' type ENUMERATED count 1 item.0 Line1L item.1 'Mic 3L' }
+	}
+	control.3 {
+		iface MIXER
+		name 'Left HP Mixer DACL1 Switch'
+		value true
+		comment { access 'read write' type BOOLEAN count 1 }
+	}
+	control.4 {
+		iface CARD
+		name Jack
+		value true
+		comment { access read type BOOLEAN count 1 }
+	}
+}
+"""
+
+PRESET = """
+state.soundcard {
+	control.9 { iface MIXER name 'HP DAC Playback Volume' value.0 100 value.1 100 }
+	control.2 { iface MIXER name 'Left Line1L Mux' value 'Mic 3L' }
+	control.3 { iface MIXER name 'Left HP Mixer DACL1 Switch' value false }
+	control.4 { iface CARD name Jack value false }
+}
+"""
+
+
+class PresetDiffTest(unittest.TestCase):
+    def test_only_changed_writable_controls_are_set(self) -> None:
+        current = mixer.parse_state(CURRENT)  # type: ignore[attr-defined]
+        self.assertEqual(current[('MIXER', 'HP DAC Playback Volume', 0, 0, 0)].values, ('100', '100'))
+        changes, unsupported = mixer.diff_states(current, mixer.parse_state(PRESET))  # type: ignore[attr-defined]
+        self.assertEqual(unsupported, [])
+        self.assertEqual(
+            mixer.cset_commands(changes),  # type: ignore[attr-defined]
+            ['cset numid=2 "\'Mic 3L\'"', 'cset numid=3 "off"'],
+        )
+
+    def test_stdin_errors_fail_the_batch_despite_exit_code_zero(self) -> None:
+        failed = subprocess.CompletedProcess([], 0, '', 'amixer: Cannot find the given element from control hw:2\n')
+        with mock.patch.object(mixer.subprocess, 'run', return_value=failed):
+            self.assertEqual(
+                mixer.apply_commands('amixer', '2', ['cset numid=99 "off"']),  # type: ignore[attr-defined]
+                (1, 'amixer: Cannot find the given element from control hw:2'),
+            )
+        clean = subprocess.CompletedProcess([], 0, '', '')
+        with mock.patch.object(mixer.subprocess, 'run', return_value=clean):
+            self.assertEqual(mixer.apply_commands('amixer', '2', ['cset numid=3 "off"']), (0, ''))  # type: ignore[attr-defined]
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
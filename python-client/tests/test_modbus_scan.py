@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'modbus_scan.py'
+spec = importlib.util.spec_from_file_location('modbus_scan', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+scan = importlib.util.module_from_spec(spec)
+sys.modules['modbus_scan'] = scan
+spec.loader.exec_module(scan)  # type: ignore[attr-defined]
+
+
+class FakeBus:
+    """Serial port stand-in with Modbus devices that answer only at their own serial format."""
+
+    def __init__(self, devices: dict[int, int], baudrate: int, parity: str, traffic: bytes = b'') -> None:
+        self.devices = devices
+        self.expected = (baudrate, parity)
+        self.traffic = traffic
+        self.baudrate = 9600
+        self.parity = 'N'
+        self.stopbits = 1
+        self.bytesize = 8
+        self.timeout = 0.0
+        self.written: list[bytes] = []
+        self._rx = bytearray()
+        self.closed = False
+        # Always readable, so a silent device costs no wall time: read() then returns nothing.
+        self._idle_read, self._idle_write = os.pipe()
+        os.write(self._idle_write, b'x')
+
+    def fileno(self) -> int:
+        return self._idle_read
+
+    def apply_settings(self, settings: dict) -> None:
+        for key, value in settings.items():
+            setattr(self, key, value)
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._rx)
+
+    def reset_input_buffer(self) -> None:
+        self._rx.clear()
+        if (self.baudrate, self.parity) == self.expected:
+            self._rx.extend(self.traffic)
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        if (self.baudrate, self.parity) != self.expected or not scan.crc_ok(data):  # type: ignore[attr-defined]
+            return
+        unit, function = data[0], data[1]
+        if unit not in self.devices:
+            return
+        if function == 0x04:
+            reply = bytes((unit, 0x84, 0x01))
+        else:
+            reply = bytes((unit, function, 2)) + self.devices[unit].to_bytes(2, 'big')
+        self._rx.extend(b'\x00' + scan.with_crc(reply))  # type: ignore[attr-defined]
+
+    def read(self, size: int) -> bytes:
+        data = bytes(self._rx[:size])
+        del self._rx[:size]
+        return data
+
+    def close(self) -> None:
+        self.closed = True
+        os.close(self._idle_read)
+        os.close(self._idle_write)
+
+
+class ModbusScanTest(unittest.TestCase):
+    def _scanner(self, bus: FakeBus, **kwargs: object) -> tuple[object, list[dict]]:
+        events: list[dict] = []
+        formats = scan.format_order([9600, 19200, 57600], ['N', 'E'], [1], [8])  # type: ignore[attr-defined]
+        options = dict(register=0x4035, count=1, turnaround=0.0, listen=0.0, emit=events.append)
+        options.update(kwargs)
+        scanner = scan.PortScanner(  # type: ignore[attr-defined]
+            '/dev/ttyFAKE', formats, list(range(1, 57)), [0x03, 0x04], serial_factory=lambda port: bus, **options
+        )
+        return scanner, events
+
+    def test_crc_and_request_frame(self) -> None:
+        request = scan.build_read_request(1, 0x03, 0x0000, 1)  # type: ignore[attr-defined]
+        self.assertEqual(request.hex(), '010300000001840a')
+        self.assertIsNone(scan.parse_reply(request[:-1] + b'\x00', 1, 0x03))  # type: ignore[attr-defined]
+
+    def test_extract_frames_splits_request_and_reply(self) -> None:
+        request = scan.build_read_request(9, 0x03, 0x4035, 1)  # type: ignore[attr-defined]
+        reply = scan.with_crc(bytes((9, 0x03, 2, 0, 1)))  # type: ignore[attr-defined]
+        self.assertEqual(scan.extract_frames(b'\xff' + request + reply), [request, reply])  # type: ignore[attr-defined]
+
+    def test_reply_timeout_follows_baud_rate(self) -> None:
+        slow = scan.SerialFormat(9600, 'E', 1, 8)  # type: ignore[attr-defined]
+        fast = scan.SerialFormat(115200, 'N', 1, 8)  # type: ignore[attr-defined]
+        self.assertAlmostEqual(slow.silent_interval, 3.5 * 11 / 9600)
+        self.assertEqual(fast.silent_interval, 0.00175)
+        self.assertLess(fast.reply_timeout(7, 0.0), slow.reply_timeout(7, 0.0))
+
+    def test_priors_order_units_and_formats(self) -> None:
+        with mock.patch.dict('os.environ', {'MODBUS_UNIT_ID': '7'}, clear=False):
+            order = scan.unit_order(range(1, 57), observed=[12])  # type: ignore[attr-defined]
+        self.assertEqual(order[:4], [12, 7, 1, 55])
+        self.assertEqual(len(order), 56)
+        formats = scan.format_order([9600, 57600], ['E', 'N'], [1], [8])  # type: ignore[attr-defined]
+        self.assertEqual((formats[0].baudrate, formats[0].parity), (57600, 'N'))
+
+    def test_scan_stops_at_the_working_format_and_reports_units(self) -> None:
+        bus = FakeBus({55: 0x0102, 3: 7}, 19200, 'E')
+        scanner, events = self._scanner(bus)
+        summary = scanner.run()
+        found = [event for event in events if event['event'] == 'found']
+        self.assertEqual([(event['unit'], event['function']) for event in found], [(55, 3), (55, 4), (3, 3), (3, 4)])
+        self.assertEqual(found[0]['registers'], [0x0102])
+        self.assertEqual(found[1]['exception'], 1)
+        self.assertTrue(all((event['baudrate'], event['parity']) == (19200, 'E') for event in found))
+        # Formats after the working one are not probed, silent units get a single probe.
+        self.assertEqual(summary['found'], 4)
+        self.assertEqual(summary['probes'], 56 * 5 + 56 + 2)
+        self.assertTrue(bus.closed)
+        self.assertEqual(events[-1]['event'], 'done')
+
+    def test_passive_listen_picks_format_and_units(self) -> None:
+        traffic = scan.build_read_request(9, 0x03, 0x4035, 1) + scan.with_crc(bytes((9, 0x03, 2, 0, 1)))  # type: ignore[attr-defined]
+        bus = FakeBus({9: 1}, 57600, 'E', traffic=traffic)
+        scanner, events = self._scanner(bus, listen=0.01, first_only=True)
+        scanner.run()
+        detected = [event for event in events if event['event'] == 'detected']
+        self.assertEqual((detected[0]['baudrate'], detected[0]['parity'], detected[0]['units']), (57600, 'E', [9]))
+        self.assertEqual(scanner.probes, 1)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from modbus_audio import (  # noqa: E402
+    PRIORITY_BACKGROUND,
+    PRIORITY_URGENT,
+    BusArbiter,
+    ModbusAudioClient,
+    SerialSettings,
+    TransactionQueueFull,
+)
+
+
+class _Response:
+    def __init__(self, registers: list[int] | None = None) -> None:
+        self.registers = registers or []
+
+    def isError(self) -> bool:  # noqa: N802 - pymodbus API
+        return False
+
+
+class FakePymodbus:
+    """Records requests; reads return the register addresses as values."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int, int]] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.entered = threading.Event()
+
+    def read_holding_registers(self, address: int, count: int = 1, slave: int = 0) -> _Response:
+        self.entered.set()
+        self.gate.wait(2)
+        self.calls.append(('read', address, count))
+        return _Response(list(range(address, address + count)))
+
+    def write_registers(self, address: int, values: list[int], slave: int = 0) -> _Response:
+        self.calls.append(('write', address, len(values)))
+        return _Response()
+
+    def close(self) -> None:
+        pass
+
+
+class TransactionQueueTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        arbiter = BusArbiter('/dev/ttyTEST', base_dir=Path(tmp.name))
+        self.client = ModbusAudioClient(SerialSettings(port='/dev/ttyTEST'), unit_id=55, arbiter=arbiter)
+        self.fake = FakePymodbus()
+        self.client._client = self.fake  # type: ignore[attr-defined]
+        self.client.start_io_thread(limit=8)
+        self.addCleanup(self.client.stop_io_thread)
+
+    def _block_io_thread(self) -> object:
+        self.fake.gate.clear()
+        blocker = self.client.submit_read(0x1000, 1)
+        self.assertTrue(self.fake.entered.wait(2))
+        return blocker
+
+    def test_priority_order_and_adjacent_reads_merge(self) -> None:
+        blocker = self._block_io_thread()
+        poll = self.client.submit_read(0x4036, 2, priority=PRIORITY_BACKGROUND)
+        user = self.client.submit_read(0x4038, 1)
+        zones = self.client.submit_read(0x4030, 6)
+        write = self.client.submit_write(0x4035, [2])
+        self.fake.gate.set()
+
+        self.assertEqual(poll.result(2), [0x4036, 0x4037])
+        self.assertEqual(user.result(2), [0x4038])
+        self.assertEqual(zones.result(2), list(range(0x4030, 0x4036)))
+        self.assertIsNone(write.result(2))
+        blocker.result(2)  # type: ignore[attr-defined]
+        self.assertEqual(self.fake.calls, [('read', 0x1000, 1), ('write', 0x4035, 1), ('read', 0x4030, 9)])
+        stats = self.client.io_stats()
+        assert stats is not None
+        self.assertEqual(stats['mergedReads'], 2)
+        self.assertEqual(stats['reads'], 2)
+
+    def test_reads_submitted_after_a_write_are_not_merged_ahead_of_it(self) -> None:
+        blocker = self._block_io_thread()
+        first = self.client.submit_read(0x4036, 1)
+        write = self.client.submit_write(0x4037, [1], priority=PRIORITY_BACKGROUND)
+        later = self.client.submit_read(0x4037, 1)
+        self.fake.gate.set()
+        for future in (blocker, first, write, later):
+            future.result(2)  # type: ignore[attr-defined]
+        self.assertEqual(
+            self.fake.calls,
+            [('read', 0x1000, 1), ('read', 0x4036, 1), ('read', 0x4037, 1), ('write', 0x4037, 1)],
+        )
+
+    def test_sync_api_from_other_threads_and_bounded_queue(self) -> None:
+        self.assertEqual(self.client.read_registers(0x4036, 2), [0x4036, 0x4037])
+        self.client.write_register(0x4035, 1)
+        batch = self.client.submit(lambda client: client.read_register(0x10) + 1, priority=PRIORITY_URGENT)
+        self.assertEqual(batch.result(2), 0x11)
+
+        blocker = self._block_io_thread()
+        pending = [self.client.submit_read(0x2000 + 10 * index, 1) for index in range(8)]
+        with self.assertRaises(TransactionQueueFull):
+            self.client.submit_read(0x3000, 1, priority=PRIORITY_BACKGROUND)
+        self.fake.gate.set()
+        for future in [blocker, *pending]:
+            future.result(2)  # type: ignore[attr-defined]
+        stats = self.client.io_stats()
+        assert stats is not None
+        self.assertEqual(stats['rejected'], 1)
+        self.assertEqual(stats['maxDepth'], 8)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -73,6 +73,22 @@ class PrioritySchedulerTest(unittest.TestCase):
 
         scheduler.stop()
 
+    def test_delayed_task_does_not_block_ready_lower_priority(self) -> None:
+        scheduler = PriorityScheduler()
+        parked = DispatchTask(payload={'command': 'PARKED'}, raw_message='P', priority='P1', duplicate=False)
+        parked.next_attempt_at = time.monotonic() + 5.0
+        ready = DispatchTask(payload={'command': 'READY'}, raw_message='R', priority='P3', duplicate=False)
+        scheduler.put(parked)
+        scheduler.put(ready)
+
+        start = time.monotonic()
+        retrieved = scheduler.get()
+
+        self.assertIs(retrieved, ready)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        scheduler.stop()
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
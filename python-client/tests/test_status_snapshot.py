@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'daemons' / '_status_shm.py'
+spec = importlib.util.spec_from_file_location('status_shm_test', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+status_shm = importlib.util.module_from_spec(spec)
+sys.modules['status_shm_test'] = status_shm
+spec.loader.exec_module(status_shm)  # type: ignore[attr-defined]
+
+
+class StatusSnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'control.status'
+        self.writer = status_shm.StatusSnapshotWriter(self.path)
+        self.writer.open()
+
+    def tearDown(self) -> None:
+        self.writer.close()
+        self._tmp.cleanup()
+
+    def test_round_trip(self) -> None:
+        self.writer.publish(
+            state='TRANSMITTING',
+            dry_run=False,
+            last_poll=1700000000.5,
+            status_register=0x0102,
+            error_register=None,
+            last_error='timeout',
+        )
+        snapshot = status_shm.read_status_snapshot(self.path)
+        assert snapshot is not None
+        self.assertEqual(snapshot['state'], 'TRANSMITTING')
+        self.assertEqual(snapshot['statusRegister'], 0x0102)
+        self.assertIsNone(snapshot['errorRegister'])
+        self.assertEqual(snapshot['lastError'], 'timeout')
+        self.assertEqual(snapshot['lastPollAt'], 1700000000.5)
+        self.assertEqual(snapshot['sequence'] % 2, 0)
+
+    def test_reader_rejects_snapshot_mid_update(self) -> None:
+        self.writer.publish(
+            state='IDLE', dry_run=True, last_poll=None, status_register=None, error_register=None, last_error=None
+        )
+        with open(self.path, 'r+b') as handle:
+            handle.seek(status_shm.SEQUENCE_OFFSET)
+            handle.write(status_shm.SEQUENCE.pack(7))
+        self.assertIsNone(status_shm.read_status_snapshot(self.path, attempts=3))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
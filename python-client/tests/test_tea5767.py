@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class FakeMessage(list):
+    def __init__(self, kind: str, data: list[int]) -> None:
+        super().__init__(data)
+        self.kind = kind
+
+
+class FakeTuner:
+    """TEA5767 stand-in: reads report the last written PLL and no signal."""
+
+    def __init__(self, bus_id: int = 1) -> None:
+        self.control = [0x2F, 0xB9, 0x10, 0x10, 0x00]
+        self.writes: list[list[int]] = []
+
+    def i2c_rdwr(self, *messages: FakeMessage) -> None:
+        for message in messages:
+            if message.kind == 'w':
+                self.control = list(message)
+                self.writes.append(list(message))
+            else:
+                message[:] = [0x80 | (self.control[0] & 0x3F), self.control[1], 0x00, 0x00, 0x00]
+
+    def close(self) -> None:
+        pass
+
+
+smbus2 = types.ModuleType('smbus2')
+smbus2.SMBus = FakeTuner  # type: ignore[attr-defined]
+smbus2.i2c_msg = types.SimpleNamespace(  # type: ignore[attr-defined]
+    write=lambda addr, data: FakeMessage('w', list(data)),
+    read=lambda addr, count: FakeMessage('r', [0] * count),
+)
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / 'tools' / 'tea5767.py'
+spec = importlib.util.spec_from_file_location('tea5767', MODULE_PATH)
+assert spec and spec.loader  # for type checkers
+tea = importlib.util.module_from_spec(spec)
+sys.modules['tea5767'] = tea
+with mock.patch.dict(sys.modules, {'smbus2': smbus2}):
+    spec.loader.exec_module(tea)  # type: ignore[attr-defined]
+
+
+def station(frequency: float, level: int, stereo: bool = True, if_counter: int = 0x37) -> object:
+    return tea.Station(frequency, tea.frequency_to_pll(frequency), level, stereo, if_counter)  # type: ignore[attr-defined]
+
+
+class Tea5767Test(unittest.TestCase):
+    def test_pll_bytes(self) -> None:
+        pll = tea.frequency_to_pll(101.1)  # type: ignore[attr-defined]
+        self.assertEqual(pll, 12369)
+        self.assertEqual(tea.build_pll_bytes(pll, False), [0x30, 0x51, 0x10, 0x10, 0x00])  # type: ignore[attr-defined]
+        self.assertEqual(tea.build_pll_bytes(pll, True)[0], 0xB0)  # type: ignore[attr-defined]
+        search = tea.build_pll_bytes(pll, True, search=True, search_up=True, stop_level='high')  # type: ignore[attr-defined]
+        self.assertEqual(search[0], 0xF0)
+        self.assertEqual(search[2], 0x10 | 0x80 | 0x60)
+        self.assertAlmostEqual(tea.pll_to_frequency(pll), 101.1, places=2)  # type: ignore[attr-defined]
+
+    def test_rank_keeps_valid_peaks_strongest_first(self) -> None:
+        candidates = [
+            station(94.1, 9),
+            station(94.2, 12),
+            station(94.3, 10),
+            station(101.1, 12, stereo=False),
+            station(105.0, 15, if_counter=0x20),
+            station(107.5, 3),
+        ]
+        ranked = tea.rank_stations(candidates, min_level=5)  # type: ignore[attr-defined]
+        self.assertEqual([item.frequency_mhz for item in ranked], [94.2, 101.1])
+
+    def test_station_map_json_round_trip(self) -> None:
+        station_map = tea.StationMap([station(94.2, 12), station(101.1, 9, stereo=False)], 'search', 1700000000.0, 812.34)  # type: ignore[attr-defined]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'rozhlas' / 'fm-stations.json'
+            tea.save_station_map(path, station_map)  # type: ignore[attr-defined]
+            data = json.loads(path.read_text(encoding='utf-8'))
+            self.assertEqual([item['rank'] for item in data['stations']], [1, 2])
+            loaded = tea.load_station_map(path)  # type: ignore[attr-defined]
+        self.assertEqual(loaded.stations, station_map.stations)
+        self.assertEqual((loaded.mode, loaded.duration_ms), ('search', 812.3))
+        with self.assertRaises(ValueError):
+            tea.StationMap.from_json({'version': 0})  # type: ignore[attr-defined]
+
+    def test_scan_restores_the_frequency_read_from_the_chip(self) -> None:
+        with tea.TEA5767() as radio:  # type: ignore[attr-defined]
+            before = radio.read().pll
+            radio.scan(mode='sweep', settle=0.0)
+            bus = radio._bus
+            self.assertEqual(bus.writes[-1], tea.build_pll_bytes(before, False))  # type: ignore[attr-defined]
+            self.assertEqual(len(bus.writes), 206 + 1)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
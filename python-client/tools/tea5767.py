@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
 
-"""Simple CLI for controlling a TEA5767 FM receiver (mute and frequency)."""
+"""CLI and driver for a TEA5767 FM receiver (mute, frequency, band scan and station map)."""
 
 from __future__ import annotations
 
 import argparse
+import json
+import os
 import sys
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Sequence
 
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from cache_paths import cache_dir, cache_path  # noqa: E402
+
 try:
     from smbus2 import SMBus, i2c_msg  # type: ignore import
 except ModuleNotFoundError as exc:  # pragma: no cover - environment dependent
@@ -20,6 +30,16 @@ I2C_ADDRESS_DEFAULT = 0x60
 IF_OFFSET_HZ = 225_000
 PLL_REF_DIVIDER = 8_192  # 32768 / 4
 
+BAND_START_MHZ = 87.5
+BAND_END_MHZ = 108.0
+CHANNEL_STEP_MHZ = 0.1
+# IF counter window (0x31-0x3E) of a correctly tuned station, see the TEA5767 data sheet.
+IF_COUNTER_MIN = 0x31
+IF_COUNTER_MAX = 0x3E
+SEARCH_STOP_LEVELS = {"low": 0x20, "mid": 0x40, "high": 0x60}
+SCAN_MODES = ("auto", "search", "sweep")
+STATION_CACHE_VERSION = 1
+
 
 @dataclass(slots=True)
 class RadioState:
@@ -27,6 +47,70 @@ class RadioState:
     pll: int
     raw: Sequence[int]
 
+    @property
+    def ready(self) -> bool:
+        return bool(self.raw[0] & 0x80)
+
+    @property
+    def band_limit(self) -> bool:
+        return bool(self.raw[0] & 0x40)
+
+    @property
+    def stereo(self) -> bool:
+        return bool(self.raw[2] & 0x80)
+
+    @property
+    def if_counter(self) -> int:
+        return self.raw[2] & 0x7F
+
+    @property
+    def level(self) -> int:
+        return (self.raw[3] >> 4) & 0x0F
+
+
+@dataclass(slots=True)
+class Station:
+    frequency_mhz: float
+    pll: int
+    level: int
+    stereo: bool
+    if_counter: int
+
+
+@dataclass(slots=True)
+class StationMap:
+    stations: list[Station] = field(default_factory=list)
+    mode: str = "sweep"
+    scanned_at: float = 0.0
+    duration_ms: float = 0.0
+
+    def to_json(self) -> dict:
+        return {
+            "version": STATION_CACHE_VERSION,
+            "mode": self.mode,
+            "scannedAt": self.scanned_at,
+            "durationMs": round(self.duration_ms, 1),
+            "stations": [
+                {"rank": rank, **asdict(station)} for rank, station in enumerate(self.stations, start=1)
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "StationMap":
+        if data.get("version") != STATION_CACHE_VERSION:
+            raise ValueError("Unsupported station cache version.")
+        stations = [
+            Station(
+                frequency_mhz=float(item["frequency_mhz"]),
+                pll=int(item["pll"]),
+                level=int(item["level"]),
+                stereo=bool(item["stereo"]),
+                if_counter=int(item["if_counter"]),
+            )
+            for item in data.get("stations", [])
+        ]
+        return cls(stations, str(data.get("mode", "sweep")), float(data.get("scannedAt", 0)), float(data.get("durationMs", 0)))
+
 
 def frequency_to_pll(freq_mhz: float) -> int:
     freq_hz = int(round(freq_mhz * 1_000_000))
@@ -41,25 +125,18 @@ def pll_to_frequency(pll: int) -> float:
     return freq_hz / 1_000_000.0
 
 
-def read_state(bus_id: int, address: int) -> RadioState:
-    with SMBus(bus_id) as bus:
-        read = i2c_msg.read(address, 5)
-        bus.i2c_rdwr(read)
-        data = list(read)
-    if len(data) != 5:
-        raise RuntimeError("Unexpected response length from TEA5767.")
-    pll = ((data[0] & 0x3F) << 8) | data[1]
-    freq_mhz = pll_to_frequency(pll)
-    return RadioState(frequency_mhz=freq_mhz, pll=pll, raw=data)
+def snap_to_channel(freq_mhz: float) -> float:
+    return round(round(freq_mhz / CHANNEL_STEP_MHZ) * CHANNEL_STEP_MHZ, 2)
 
 
-def build_control_bytes(freq_mhz: float, mute: bool) -> list[int]:
-    pll = frequency_to_pll(freq_mhz)
-    byte0 = ((pll >> 8) & 0x3F) | (0x80 if mute else 0x00)  # MUTE flag lives in bit 7
+def build_pll_bytes(pll: int, mute: bool, *, search: bool = False, search_up: bool = True, stop_level: str = "mid") -> list[int]:
+    byte0 = ((pll >> 8) & 0x3F) | (0x80 if mute else 0x00) | (0x40 if search else 0x00)  # MUTE bit 7, SM bit 6
     byte1 = pll & 0xFF
 
-    # Byte2: HLSI (bit4) = 1 for high-side injection; keep other bits cleared.
+    # Byte2: HLSI (bit4) = 1 for high-side injection; search direction (bit7) and stop level (bits 6-5) in search mode.
     byte2 = 0x10
+    if search:
+        byte2 |= (0x80 if search_up else 0x00) | SEARCH_STOP_LEVELS[stop_level]
 
     # Byte3: XTAL (bit4) = 1 for 32.768 kHz reference.
     byte3 = 0x10
@@ -70,18 +147,183 @@ def build_control_bytes(freq_mhz: float, mute: bool) -> list[int]:
     return [byte0, byte1, byte2, byte3, byte4]
 
 
+def build_control_bytes(freq_mhz: float, mute: bool) -> list[int]:
+    return build_pll_bytes(frequency_to_pll(freq_mhz), mute)
+
+
+def rank_stations(candidates: Sequence[Station], min_level: int = 0) -> list[Station]:
+    """Keep valid, locally strongest candidates and order them by level, then stereo."""
+
+    valid = [
+        station
+        for station in candidates
+        if station.level >= min_level and IF_COUNTER_MIN <= station.if_counter <= IF_COUNTER_MAX
+    ]
+    # A strong station also shows up on the neighbouring channels; keep only the peak.
+    peaks: list[Station] = []
+    for station in sorted(valid, key=lambda item: (-item.level, not item.stereo, item.frequency_mhz)):
+        if all(abs(station.frequency_mhz - kept.frequency_mhz) > 0.15 for kept in peaks):
+            peaks.append(station)
+    return peaks
+
+
+class TEA5767:
+    """TEA5767 on one I2C bus handle kept open for the lifetime of the object."""
+
+    def __init__(self, bus_id: int = 1, address: int = I2C_ADDRESS_DEFAULT) -> None:
+        self.address = address
+        self._bus = SMBus(bus_id)
+        self._control: list[int] | None = None
+
+    def __enter__(self) -> "TEA5767":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._bus is not None:
+            self._bus.close()
+            self._bus = None  # type: ignore[assignment]
+
+    def write(self, control_bytes: Sequence[int]) -> None:
+        self._bus.i2c_rdwr(i2c_msg.write(self.address, bytes(control_bytes)))
+        self._control = list(control_bytes)
+
+    def read(self) -> RadioState:
+        read = i2c_msg.read(self.address, 5)
+        self._bus.i2c_rdwr(read)
+        data = list(read)
+        if len(data) != 5:
+            raise RuntimeError("Unexpected response length from TEA5767.")
+        pll = ((data[0] & 0x3F) << 8) | data[1]
+        return RadioState(frequency_mhz=pll_to_frequency(pll), pll=pll, raw=data)
+
+    def tune_pll(self, pll: int, mute: bool = False) -> None:
+        """Retune with a single 5-byte write (e.g. to a PLL value from the station map)."""
+
+        self.write(build_pll_bytes(pll, mute))
+
+    def set_mute(self, mute: bool) -> float:
+        pll = self._control_pll()
+        self.tune_pll(pll, mute)
+        return pll_to_frequency(pll)
+
+    def _control_pll(self) -> int:
+        if self._control is not None:
+            return ((self._control[0] & 0x3F) << 8) | self._control[1]
+        return self.read().pll
+
+    def measure(self, pll: int, settle: float) -> Station:
+        self.tune_pll(pll, mute=True)
+        time.sleep(settle)
+        state = self.read()
+        return Station(snap_to_channel(pll_to_frequency(pll)), pll, state.level, state.stereo, state.if_counter)
+
+    def sweep(self, settle: float = 0.02) -> list[Station]:
+        """Measure every 100 kHz channel of the band: one write and one read per channel."""
+
+        stations: list[Station] = []
+        channels = int(round((BAND_END_MHZ - BAND_START_MHZ) / CHANNEL_STEP_MHZ)) + 1
+        for index in range(channels):
+            stations.append(self.measure(frequency_to_pll(BAND_START_MHZ + index * CHANNEL_STEP_MHZ), settle))
+        return stations
+
+    def search(self, stop_level: str = "mid", settle: float = 0.02, timeout: float = 1.0) -> list[Station]:
+        """Let the chip's search mode find stations, walking up the band from its bottom edge."""
+
+        found: list[Station] = []
+        freq = BAND_START_MHZ
+        while freq < BAND_END_MHZ:
+            self.write(
+                build_pll_bytes(frequency_to_pll(freq + CHANNEL_STEP_MHZ), True, search=True, search_up=True, stop_level=stop_level)
+            )
+            deadline = time.monotonic() + timeout
+            state = self.read()
+            while not state.ready:
+                if time.monotonic() > deadline:
+                    raise TimeoutError("TEA5767 search did not finish in time.")
+                time.sleep(0.005)
+                state = self.read()
+            if state.band_limit:
+                break
+            # The search stops near the station; re-measure on the channel grid.
+            station = self.measure(frequency_to_pll(snap_to_channel(state.frequency_mhz)), settle)
+            found.append(station)
+            freq = max(station.frequency_mhz, freq + CHANNEL_STEP_MHZ)
+        return found
+
+    def scan(self, mode: str = "auto", stop_level: str = "mid", settle: float = 0.02, min_level: int = 5) -> StationMap:
+        """Build a ranked station map; ``auto`` uses search mode and sweeps if it finds nothing.
+
+        The tuner is retuned to the frequency it was on before the scan. The
+        chip does not report its mute bit, so the mute state is restored only
+        when this instance wrote it; otherwise the tuner comes back unmuted.
+        """
+
+        if mode not in SCAN_MODES:
+            raise ValueError(f"Unknown scan mode {mode!r}.")
+        muted = bool(self._control[0] & 0x80) if self._control is not None else False
+        previous = build_pll_bytes(self.read().pll, muted)
+        started = time.monotonic()
+        used = mode
+        candidates: list[Station] = []
+        try:
+            if mode in {"auto", "search"}:
+                try:
+                    candidates = self.search(stop_level, settle)
+                    used = "search"
+                except TimeoutError:
+                    if mode == "search":
+                        raise
+            if mode == "sweep" or (mode == "auto" and not rank_stations(candidates, min_level)):
+                candidates = self.sweep(settle)
+                used = "sweep"
+        finally:
+            self.write(previous)
+        return StationMap(
+            stations=rank_stations(candidates, min_level),
+            mode=used,
+            scanned_at=time.time(),
+            duration_ms=(time.monotonic() - started) * 1000,
+        )
+
+
+def default_station_cache() -> Path:
+    # The station map is the scan result rather than a disposable cache, so an empty override keeps the default.
+    return cache_path("FM_STATIONS_CACHE", "fm-stations.json") or cache_dir() / "fm-stations.json"
+
+
+def load_station_map(path: Path) -> StationMap | None:
+    try:
+        return StationMap.from_json(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_station_map(path: Path, station_map: StationMap) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(station_map.to_json(), indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def read_state(bus_id: int, address: int) -> RadioState:
+    with TEA5767(bus_id, address) as radio:
+        return radio.read()
+
+
 def write_control(bus_id: int, address: int, freq_mhz: float, mute: bool) -> None:
-    control_bytes = build_control_bytes(freq_mhz, mute)
-    with SMBus(bus_id) as bus:
-        msg = i2c_msg.write(address, bytes(control_bytes))
-        bus.i2c_rdwr(msg)
+    with TEA5767(bus_id, address) as radio:
+        radio.write(build_control_bytes(freq_mhz, mute))
 
 
 def command_status(args: argparse.Namespace) -> None:
     state = read_state(args.bus, args.address)
     print(f"Frequency : {state.frequency_mhz:.2f} MHz")
-    print("Ready flag: {}".format("yes" if state.raw[0] & 0x80 else "no"))
-    print("Stereo    : {}".format("yes" if state.raw[2] & 0x80 else "no"))
+    print("Ready flag: {}".format("yes" if state.ready else "no"))
+    print("Stereo    : {}".format("yes" if state.stereo else "no"))
+    print(f"Level     : {state.level}/15")
     print(f"Raw bytes : {' '.join(f'0x{byte:02X}' for byte in state.raw)}")
 
 
@@ -102,14 +344,51 @@ def command_set(args: argparse.Namespace) -> None:
 
 
 def command_mute(args: argparse.Namespace, mute: bool) -> None:
-    state = read_state(args.bus, args.address)
-    write_control(args.bus, args.address, state.frequency_mhz, mute)
+    with TEA5767(args.bus, args.address) as radio:
+        frequency = radio.set_mute(mute)
     action = "Muted" if mute else "Unmuted"
-    print(f"{action} TEA5767 at {state.frequency_mhz:.2f} MHz.")
+    print(f"{action} TEA5767 at {frequency:.2f} MHz.")
+
+
+def _print_station_map(station_map: StationMap, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(station_map.to_json()))
+        return
+    print(f"{len(station_map.stations)} stations ({station_map.mode}, {station_map.duration_ms / 1000:.1f} s):")
+    for rank, station in enumerate(station_map.stations, start=1):
+        print(f"{rank:3d}. {station.frequency_mhz:6.2f} MHz  level {station.level:2d}/15  {'stereo' if station.stereo else 'mono'}")
+
+
+def command_scan(args: argparse.Namespace) -> None:
+    with TEA5767(args.bus, args.address) as radio:
+        station_map = radio.scan(args.mode, args.stop_level, args.settle / 1000, args.min_level)
+    save_station_map(args.cache, station_map)
+    _print_station_map(station_map, args.json)
+
+
+def command_stations(args: argparse.Namespace) -> None:
+    station_map = load_station_map(args.cache)
+    if station_map is None:
+        with TEA5767(args.bus, args.address) as radio:
+            station_map = radio.scan()
+        save_station_map(args.cache, station_map)
+    _print_station_map(station_map, args.json)
+
+
+def command_station(args: argparse.Namespace) -> None:
+    station_map = load_station_map(args.cache)
+    if station_map is None or not station_map.stations:
+        raise ValueError(f"No station map in {args.cache}; run the scan command first.")
+    if not 1 <= args.rank <= len(station_map.stations):
+        raise ValueError(f"Station rank must be between 1 and {len(station_map.stations)}.")
+    station = station_map.stations[args.rank - 1]
+    with TEA5767(args.bus, args.address) as radio:
+        radio.tune_pll(station.pll, args.mute)
+    print(f"Set TEA5767 to {station.frequency_mhz:.2f} MHz ({'muted' if args.mute else 'playing'}).")
 
 
 def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Control TEA5767 FM tuner (mute/unmute/set frequency).")
+    parser = argparse.ArgumentParser(description="Control TEA5767 FM tuner (mute/unmute/set frequency/scan).")
     parser.add_argument("--bus", type=int, default=1, help="I2C bus number (default: 1).")
     parser.add_argument("--address", type=lambda value: int(value, 0), default=I2C_ADDRESS_DEFAULT, help="I2C address (default: 0x60).")
 
@@ -130,6 +409,26 @@ def build_parser() -> argparse.ArgumentParser:
     unmute_parser = subparsers.add_parser("unmute", help="Unmute the tuner without changing frequency.")
     unmute_parser.set_defaults(func=lambda parsed: command_mute(parsed, False))
 
+    scan_parser = subparsers.add_parser("scan", help="Scan the FM band and store a ranked station map.")
+    scan_parser.add_argument("--mode", choices=SCAN_MODES, default="auto", help="auto = chip search mode, sweep if it finds nothing.")
+    scan_parser.add_argument("--stop-level", choices=sorted(SEARCH_STOP_LEVELS), default="mid", help="Search mode stop level (default: mid).")
+    scan_parser.add_argument("--settle", type=float, default=20.0, help="Settle time per measured channel in ms (default: 20).")
+    scan_parser.add_argument("--min-level", type=int, default=5, help="Lowest ADC level (0-15) kept as a station (default: 5).")
+    scan_parser.set_defaults(func=command_scan)
+
+    stations_parser = subparsers.add_parser("stations", help="Print the cached station map (scans when there is none).")
+    stations_parser.set_defaults(func=command_stations)
+
+    station_parser = subparsers.add_parser("station", help="Tune to a station from the cached map by rank.")
+    station_parser.add_argument("rank", type=int, help="Station rank from the map (1 = strongest).")
+    station_parser.add_argument("--mute", action="store_true", help="Mute audio after tuning.")
+    station_parser.set_defaults(func=command_station)
+
+    for map_parser in (scan_parser, stations_parser, station_parser):
+        map_parser.add_argument("--cache", type=Path, default=default_station_cache(), help="Station map file (default: env FM_STATIONS_CACHE or ~/.cache/rozhlas/fm-stations.json).")
+    for map_parser in (scan_parser, stations_parser):
+        map_parser.add_argument("--json", action="store_true", help="Print the station map as JSON.")
+
     return parser
 
 
@@ -139,12 +438,12 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     try:
         args.func(args)
+    except (ValueError, TimeoutError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
     except OSError as exc:
         print(f"ERROR: I2C communication failed: {exc}", file=sys.stderr)
         return 1
-    except ValueError as exc:
-        print(f"ERROR: {exc}", file=sys.stderr)
-        return 1
 
     return 0
 
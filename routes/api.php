@@ -126,6 +126,8 @@
     Route::group(['prefix' => 'fm'], static function () {
         Route::get('/frequency', [FmController::class, 'show']);
         Route::post('/frequency', [FmController::class, 'update']);
+        Route::get('/stations', [FmController::class, 'stations']);
+        Route::post('/stations', [FmController::class, 'refreshStations']);
     });
 
     Route::post('/manual-control/events', ManualControlController::class);
@@ -0,0 +1,80 @@
+<?php
+
+declare(strict_types=1);
+
+namespace Tests\Unit;
+
+use App\Services\ControlChannelTransport;
+use Tests\TestCase;
+
+class ControlChannelTransportTest extends TestCase
+{
+    /** @var resource|null */
+    private $worker = null;
+    private string $socketPath = '';
+
+    protected function tearDown(): void
+    {
+        if (is_resource($this->worker)) {
+            proc_terminate($this->worker);
+            proc_close($this->worker);
+        }
+        if ($this->socketPath !== '' && file_exists($this->socketPath)) {
+            unlink($this->socketPath);
+        }
+        parent::tearDown();
+    }
+
+    public function test_subscribe_stops_without_traffic_when_stop_callback_returns_true(): void
+    {
+        $endpoint = $this->startSilentWorker();
+        $transport = new ControlChannelTransport($endpoint, 100, 1, 1000, null, false);
+
+        $events = 0;
+        $checks = 0;
+        $start = microtime(true);
+        $ack = $transport->subscribe(
+            function () use (&$events): bool {
+                $events++;
+                return true;
+            },
+            null,
+            function () use (&$checks): bool {
+                return ++$checks > 2;
+            },
+        );
+
+        $this->assertTrue($ack['ok']);
+        $this->assertSame(0, $events);
+        $this->assertSame(3, $checks);
+        $this->assertLessThan(2.0, microtime(true) - $start);
+    }
+
+    /**
+     * Start a worker stand-in that acknowledges the subscription and then
+     * never sends anything.
+     */
+    private function startSilentWorker(): string
+    {
+        $this->socketPath = sys_get_temp_dir() . '/control-channel-test-' . getmypid() . '.sock';
+        @unlink($this->socketPath);
+
+        $script = <<<'PHP'
+$server = stream_socket_server('unix://' . $argv[1], $errno, $errstr);
+$client = stream_socket_accept($server, 10);
+fwrite($client, "READY\n");
+$request = json_decode((string) fgets($client), true);
+fwrite($client, json_encode(['id' => $request['id'] ?? null, 'ok' => true, 'details' => ['subscription' => 1]]) . "\n");
+sleep(10);
+PHP;
+
+        $this->worker = proc_open([PHP_BINARY, '-r', $script, $this->socketPath], [], $pipes);
+        $deadline = microtime(true) + 5;
+        while (!file_exists($this->socketPath) && microtime(true) < $deadline) {
+            usleep(10_000);
+        }
+        $this->assertFileExists($this->socketPath);
+
+        return 'unix://' . $this->socketPath;
+    }
+}
@@ -0,0 +1,66 @@
+<?php
+
+declare(strict_types=1);
+
+namespace Tests\Unit;
+
+use App\Libraries\PythonClient;
+use App\Services\FmRadioService;
+use Mockery;
+use Mockery\MockInterface;
+use RuntimeException;
+use Tests\TestCase;
+
+class FmRadioServiceTest extends TestCase
+{
+    private string $cachePath;
+
+    protected function setUp(): void
+    {
+        parent::setUp();
+        $this->cachePath = tempnam(sys_get_temp_dir(), 'fm-stations');
+        unlink($this->cachePath);
+        config(['audio.fm_tuner.stations_cache' => $this->cachePath]);
+    }
+
+    protected function tearDown(): void
+    {
+        Mockery::close();
+        @unlink($this->cachePath);
+        parent::tearDown();
+    }
+
+    public function test_reading_stations_never_scans(): void
+    {
+        /** @var MockInterface&PythonClient $client */
+        $client = Mockery::mock(PythonClient::class);
+        $client->shouldNotReceive('scanFmStations');
+        $service = new FmRadioService($client);
+
+        $this->assertNull($service->getStations());
+
+        file_put_contents($this->cachePath, json_encode(['version' => 1, 'stations' => [['rank' => 1, 'frequency_mhz' => 94.2]]]));
+        $stations = $service->getStations();
+        $this->assertTrue($stations['cached']);
+        $this->assertSame(94.2, $stations['stations'][0]['frequency_mhz']);
+    }
+
+    public function test_refresh_runs_the_scan_through_the_python_client(): void
+    {
+        /** @var MockInterface&PythonClient $client */
+        $client = Mockery::mock(PythonClient::class);
+        $client->shouldReceive('scanFmStations')
+            ->once()
+            ->with($this->cachePath, 1, '0x60', Mockery::type('float'), 'tools/tea5767.py')
+            ->andReturn(['success' => true, 'stderr' => [], 'json' => ['version' => 1, 'stations' => []]]);
+        $client->shouldReceive('scanFmStations')
+            ->andReturn(['success' => false, 'stderr' => ['ERROR: I2C communication failed'], 'json' => null]);
+        $service = new FmRadioService($client);
+
+        $this->assertFalse($service->refreshStations()['cached']);
+
+        $this->expectException(RuntimeException::class);
+        $this->expectExceptionMessage('I2C communication failed');
+        $service->refreshStations();
+    }
+}